@@ -3,5 +3,6 @@
 #
 
 from .destination import Destination
+from .record_batches import RecordBatch, batch_input_messages
 
-__all__ = ["Destination"]
+__all__ = ["Destination", "RecordBatch", "batch_input_messages"]
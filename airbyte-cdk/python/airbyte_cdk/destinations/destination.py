@@ -4,23 +4,39 @@
 
 import argparse
 import io
+import json
 import logging
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping
+from typing import IO, Any, Iterable, List, Mapping, Optional
 
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pydantic import ValidationError
 
 logger = logging.getLogger("airbyte")
 
+INPUT_BUFFER_SIZE = 1024 * 1024
+
+
+def _is_record_envelope(record: Any) -> bool:
+    return (
+        isinstance(record, dict)
+        and isinstance(record.get("stream"), str)
+        and isinstance(record.get("data"), dict)
+        and type(record.get("emitted_at")) is int
+        and isinstance(record.get("namespace", ""), (str, type(None)))
+    )
+
 
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
+    # configure whether every input message is validated against the Airbyte protocol models. When disabled, only the envelope of the
+    # records (type, stream, namespace, emitted_at) is checked and the data is passed as is to the destination.
+    validate_input_messages: bool = False
 
     @abstractmethod
     def write(
@@ -34,11 +50,43 @@ class Destination(Connector, ABC):
 
     def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
         """Reads from stdin, converting to Airbyte messages"""
+        parse_line = self._parse_message if self.validate_input_messages else self._parse_message_envelope
         for line in input_stream:
-            try:
-                yield AirbyteMessage.parse_raw(line)
-            except ValidationError:
+            message = parse_line(line)
+            if message is None:
                 logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
+            else:
+                yield message
+
+    @staticmethod
+    def _parse_message(line: str) -> Optional[AirbyteMessage]:
+        try:
+            return AirbyteMessage.parse_raw(line)
+        except ValidationError:
+            return None
+
+    @staticmethod
+    def _parse_message_envelope(line: str) -> Optional[AirbyteMessage]:
+        """
+        Validating every record through pydantic is the bottleneck of Python destinations. Records are therefore built without validating
+        their data: only the fields of the envelope are checked. Other messages are rare so they are fully validated, as are records
+        whose envelope needs to be coerced.
+        """
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return None
+        if (
+            isinstance(message, dict)
+            and len(message) == 2
+            and message.get("type") == Type.RECORD.value
+            and _is_record_envelope(message.get("record"))
+        ):
+            return AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(**message["record"]))
+        try:
+            return AirbyteMessage.parse_obj(message)
+        except ValidationError:
+            return None
 
     def _run_write(
         self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
@@ -108,10 +156,18 @@ class Destination(Connector, ABC):
         if cmd == "check":
             yield self._run_check(config=config)
         elif cmd == "write":
-            # Wrap in UTF-8 to override any other input encodings
-            wrapped_stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+            # Wrap in UTF-8 to override any other input encodings. stdin is read in large chunks to limit the number of reads.
+            wrapped_stdin = io.TextIOWrapper(self._buffered_stdin(), encoding="utf-8")
             yield from self._run_write(config=config, configured_catalog_path=parsed_args.catalog, input_stream=wrapped_stdin)
 
+    @staticmethod
+    def _buffered_stdin() -> IO[bytes]:
+        stdin = sys.stdin.buffer
+        if isinstance(stdin, io.BufferedReader):
+            # Buffer the raw stream instead of the already buffered stdin so the bytes are not copied through two buffers
+            return io.BufferedReader(stdin.raw, buffer_size=INPUT_BUFFER_SIZE)
+        return stdin
+
     def run(self, args: List[str]):
         init_uncaught_exception_handler(logger)
         parsed_args = self.parse_args(args)
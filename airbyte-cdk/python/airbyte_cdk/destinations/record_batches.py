@@ -0,0 +1,50 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+
+
+@dataclass
+class RecordBatch:
+    """
+    Records of a single stream, in the order they were received
+    """
+
+    stream: str
+    namespace: Optional[str]
+    records: List[AirbyteRecordMessage] = field(default_factory=list)
+
+
+def batch_input_messages(input_messages: Iterable[AirbyteMessage], batch_size: int) -> Iterable[Union[RecordBatch, AirbyteMessage]]:
+    """
+    Group the records of the input messages into batches per stream so that destinations can write them in bulk.
+
+    A batch is emitted as soon as it contains batch_size records. Any other message (state, trace, etc.) is emitted as is after all the
+    pending batches so that a state message is only received once every record preceding it has been handed to the destination.
+
+    :param input_messages: The messages received by the destination
+    :param batch_size: The maximum number of records per batch
+    :return: Batches of records and non-record messages, in order
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive but was {batch_size}")
+
+    batches: Dict[Tuple[Optional[str], str], RecordBatch] = {}
+    for message in input_messages:
+        if message.type == Type.RECORD and message.record is not None:
+            key = (message.record.namespace, message.record.stream)
+            batch = batches.get(key)
+            if batch is None:
+                batch = batches[key] = RecordBatch(message.record.stream, message.record.namespace)
+            batch.records.append(message.record)
+            if len(batch.records) >= batch_size:
+                yield batches.pop(key)
+        else:
+            yield from batches.values()
+            batches.clear()
+            yield message
+    yield from batches.values()
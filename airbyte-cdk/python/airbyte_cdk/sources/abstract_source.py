@@ -2,9 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Full, Queue
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -22,15 +28,78 @@ from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.streams.http.transport import get_default_transport
+from airbyte_cdk.sources.streams.parent_record_cache import parent_record_cache_scope
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
+from airbyte_cdk.utils.instrumentation import Instrumentation, Stage, get_instrumentation
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
+_QUEUE_PUT_TIMEOUT_SECONDS = 1
+DEFAULT_STATE_CHECKPOINT_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class _StreamReadDone:
+    """
+    Sentinel put on the queue by a worker once it is done reading a stream, with the error that interrupted the read if any.
+    """
+
+    stream_name: str
+    error: Optional[BaseException] = None
+
+
+_ConcurrentReadItem = Union[AirbyteMessage, _StreamReadDone]
+_StreamKey = Tuple[str, Optional[str]]
+
+
+class _QueuedMessageRouter:
+    """
+    Routes the messages of the message repository to the stream they belong to when streams are read concurrently.
+
+    Every worker drains the same message repository, so the state of a stream could otherwise be drained by the worker of another stream
+    and be emitted after the status of its own stream. The state messages of a stream are kept aside until the worker of this stream
+    drains the queue. The other messages do not identify their stream and are emitted by the worker draining them.
+    """
+
+    def __init__(self, message_repository: MessageRepository) -> None:
+        self._message_repository = message_repository
+        self._lock = threading.Lock()
+        self._pending_messages: Dict[_StreamKey, List[AirbyteMessage]] = defaultdict(list)
+
+    def consume_queue(self, stream_name: str, namespace: Optional[str]) -> List[AirbyteMessage]:
+        """
+        :return: The messages queued for the stream along with the queued messages that do not belong to a specific stream
+        """
+        stream_key = (stream_name, namespace)
+        with self._lock:
+            for message in self._message_repository.consume_queue():
+                self._pending_messages[self._get_stream_key(message) or stream_key].append(message)
+            return self._pending_messages.pop(stream_key, [])
+
+    def consume_remaining_messages(self) -> List[AirbyteMessage]:
+        """
+        :return: Every message not consumed yet, for instance the messages of streams that were already read
+        """
+        with self._lock:
+            messages = [message for messages in self._pending_messages.values() for message in messages]
+            self._pending_messages.clear()
+            messages.extend(self._message_repository.consume_queue())
+        return messages
+
+    @staticmethod
+    def _get_stream_key(message: AirbyteMessage) -> Optional[_StreamKey]:
+        if message.type == MessageType.STATE and message.state and message.state.stream:
+            stream_descriptor = message.state.stream.stream_descriptor
+            return stream_descriptor.name, stream_descriptor.namespace
+        return None
+
 
 class AbstractSource(Source, ABC):
     """
@@ -59,9 +128,13 @@ class AbstractSource(Source, ABC):
         :return: A list of the streams in this source connector.
         """
 
+    DEFAULT_CONCURRENT_READ_QUEUE_SIZE = 10_000
+
     # Stream name to instance map for applying output object transformation
     _stream_to_instance_map: Dict[str, Stream] = {}
     _slice_logger: SliceLogger = DebugSliceLogger()
+    # Set while streams are read concurrently so each worker only emits the queued messages of its own stream
+    _queued_message_router: Optional[_QueuedMessageRouter] = None
 
     @property
     def name(self) -> str:
@@ -97,56 +170,255 @@ class AbstractSource(Source, ABC):
         # TODO assert all streams exist in the connector
         # get the streams once in case the connector needs to make any queries to generate them
         stream_instances = {s.name: s for s in self.streams(config)}
-        state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
+        state_manager = ConnectorStateManager(
+            stream_instance_map=stream_instances,
+            state=state,
+            checkpoint_interval_seconds=self.state_checkpoint_interval_seconds,
+            checkpoint_interval_bytes=self.state_checkpoint_interval_bytes,
+        )
         self._stream_to_instance_map = stream_instances
-        with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    if not self.raise_exception_on_missing_stream:
-                        continue
-                    raise KeyError(
-                        f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
-                        f"Refresh the schema in replication settings and remove this stream from future sync attempts."
-                    )
-
-                try:
-                    self._apply_log_level_to_stream_logger(logger, stream_instance)
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    stream_is_available, reason = stream_instance.check_availability(logger, self)
-                    if not stream_is_available:
-                        logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
-                        continue
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
-                except AirbyteTracedException as e:
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    raise e
-                except Exception as e:
-                    yield from self._emit_queued_messages()
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
-
+        instrumentation = get_instrumentation()
+        # The records of the parent streams are shared by the substreams of the sync
+        with parent_record_cache_scope(), create_timer(self.name) as timer:
+            if self.max_concurrent_streams > 1:
+                messages: Iterator[AirbyteMessage] = self._read_streams_concurrently(
+                    logger, catalog, stream_instances, state_manager, internal_config
+                )
+            else:
+                messages = self._read_configured_streams(logger, catalog, stream_instances, state_manager, internal_config, timer)
+            if instrumentation.enabled:
+                messages = self._with_instrumentation_reports(messages, instrumentation)
+            yield from messages
+
+        connection_pool_stats = get_default_transport().stats
+        if connection_pool_stats.requests:
+            logger.info(f"HTTP connection pool usage: {json.dumps(connection_pool_stats.as_dict())}")
         logger.info(f"Finished syncing {self.name}")
 
+    def _read_configured_streams(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        for configured_stream in catalog.streams:
+            yield from self._read_configured_stream(logger, configured_stream, stream_instances, state_manager, internal_config, timer)
+
+    @staticmethod
+    def _with_instrumentation_reports(messages: Iterator[AirbyteMessage], instrumentation: Instrumentation) -> Iterator[AirbyteMessage]:
+        """
+        Emits the report of the instrumentation between the messages every time it is due and once all the messages were emitted
+        """
+        try:
+            for message in messages:
+                yield message
+                if instrumentation.is_report_due():
+                    yield instrumentation.report()
+        except Exception:
+            # Reporting even if the sync failed, as this is when knowing where the time went is the most useful
+            yield instrumentation.report()
+            raise
+        yield instrumentation.report()
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Generator[AirbyteMessage, None, None]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance:
+            if not self.raise_exception_on_missing_stream:
+                return
+            raise KeyError(
+                f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
+                f"Refresh the schema in replication settings and remove this stream from future sync attempts."
+            )
+
+        try:
+            self._apply_log_level_to_stream_logger(logger, stream_instance)
+            timer.start_event(f"Syncing stream {configured_stream.stream.name}")
+            stream_is_available, reason = stream_instance.check_availability(logger, self)
+            if not stream_is_available:
+                logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
+                return
+            logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
+        except AirbyteTracedException as e:
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            raise e
+        except Exception as e:
+            yield from self._emit_queued_messages(stream_instance)
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event()
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads the configured streams on a pool of at most `max_concurrent_streams` worker threads.
+
+        Each worker reads one stream at a time and puts its messages on a bounded queue which is the only output channel. Messages of a
+        given stream are therefore emitted in the same order as in a sequential read, including the stream status and state messages,
+        while messages of different streams are interleaved. The state messages queued on the message repository are emitted by the worker
+        of their stream, whichever worker drains them. If a stream fails, the streams that were not started are skipped, the
+        streams being read are interrupted and marked as INCOMPLETE, and the first error is raised once every worker has stopped.
+        """
+        queue: Queue[_ConcurrentReadItem] = Queue(maxsize=self.DEFAULT_CONCURRENT_READ_QUEUE_SIZE)
+        stop_event = threading.Event()
+        consumer_gone_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent_streams, thread_name_prefix="streamreader")
+        queued_message_router = _QueuedMessageRouter(self.message_repository) if self.message_repository else None
+        self._queued_message_router = queued_message_router
+        futures = [
+            executor.submit(
+                self._read_configured_stream_to_queue,
+                logger,
+                configured_stream,
+                stream_instances,
+                state_manager,
+                internal_config,
+                queue,
+                stop_event,
+                consumer_gone_event,
+            )
+            for configured_stream in catalog.streams
+        ]
+
+        error: Optional[BaseException] = None
+        streams_done = 0
+        try:
+            while streams_done < len(catalog.streams):
+                item = queue.get()
+                if isinstance(item, AirbyteMessage):
+                    yield item
+                elif isinstance(item, _StreamReadDone):
+                    streams_done += 1
+                    if item.error and not error:
+                        error = item.error
+                        stop_event.set()
+            if queued_message_router:
+                yield from queued_message_router.consume_remaining_messages()
+        finally:
+            stop_event.set()
+            consumer_gone_event.set()
+            # `shutdown(cancel_futures=True)` is only available from python 3.9
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            self._queued_message_router = None
+        if error:
+            raise error
+
+    def _read_configured_stream_to_queue(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        queue: "Queue[_ConcurrentReadItem]",
+        stop_event: threading.Event,
+        consumer_gone_event: threading.Event,
+    ) -> None:
+        """
+        Reads a single configured stream and puts its messages on the queue. This method is meant to be called from a worker thread.
+        """
+        error: Optional[BaseException] = None
+        try:
+            if stop_event.is_set():
+                return
+            with create_timer(self.name) as timer:
+                messages = self._read_configured_stream(logger, configured_stream, stream_instances, state_manager, internal_config, timer)
+                has_started = False
+                for message in messages:
+                    if stop_event.is_set():
+                        messages.close()
+                        if has_started:
+                            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED because another stream failed")
+                            self._put_unless_consumer_gone(
+                                queue,
+                                consumer_gone_event,
+                                stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE),
+                            )
+                        return
+                    has_started = True
+                    self._put_unless_consumer_gone(queue, consumer_gone_event, message)
+        except BaseException as e:
+            error = e
+        finally:
+            self._put_unless_consumer_gone(queue, consumer_gone_event, _StreamReadDone(configured_stream.stream.name, error))
+
+    @staticmethod
+    def _put_unless_consumer_gone(
+        queue: "Queue[_ConcurrentReadItem]", consumer_gone_event: threading.Event, item: _ConcurrentReadItem
+    ) -> None:
+        # The main thread consumes the queue until every worker is done, unless the consumer of `read` stopped iterating. In that case,
+        # the worker should not block forever on a full queue.
+        while not consumer_gone_event.is_set():
+            try:
+                queue.put(item, timeout=_QUEUE_PUT_TIMEOUT_SECONDS)
+                return
+            except Full:
+                continue
+
+    @property
+    def max_concurrent_streams(self) -> int:
+        """
+        The maximum number of streams read at the same time. By default, streams are read one after the other.
+
+        Sources can override this property to read several streams concurrently on a bounded pool of worker threads. As every worker
+        sends requests to the API, this value is also the concurrency limit used to stay within the API quotas.
+        """
+        return 1
+
+    @property
+    def state_checkpoint_interval_seconds(self) -> Optional[float]:
+        """
+        Time after which the state of a stream is checkpointed while it is read, unless a checkpoint was already emitted for another
+        reason. It only applies to the streams defining a `state_checkpoint_interval`, as the state of the other streams can't be
+        checkpointed before a slice was fully read. Return None to only checkpoint after a number of records.
+        """
+        return DEFAULT_STATE_CHECKPOINT_INTERVAL_SECONDS
+
+    @property
+    def state_checkpoint_interval_bytes(self) -> Optional[int]:
+        """
+        Estimated size of the records after which the state of a stream is checkpointed while it is read, unless a checkpoint was
+        already emitted for another reason. Like `state_checkpoint_interval_seconds`, it only applies to the streams defining a
+        `state_checkpoint_interval`. By default, the size of the records doesn't trigger checkpoints.
+        """
+        return None
+
     @property
     def raise_exception_on_missing_stream(self) -> bool:
         return True
@@ -198,8 +470,10 @@ class AbstractSource(Source, ABC):
                     logger.info(f"Marking stream {stream_name} as RUNNING")
                     # If we just read the first record of the stream, emit the transition to the RUNNING state
                     yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.RUNNING)
-            yield from self._emit_queued_messages()
+            yield from self._emit_queued_messages(stream_instance)
             yield record
+        # Messages queued after the last record, like the state emitted by the cursor of a StreamFacade, belong to this stream
+        yield from self._emit_queued_messages(stream_instance)
 
         logger.info(f"Read {record_counter} records from {stream_name} stream")
 
@@ -223,7 +497,10 @@ class AbstractSource(Source, ABC):
         stream_name = configured_stream.stream.name
         stream_state = state_manager.get_stream_state(stream_name, stream_instance.namespace)
 
-        if stream_state and "state" in dir(stream_instance):
+        if isinstance(stream_instance, StreamFacade):
+            # The cursor of the facade checkpoints the state through the state manager as its partitions complete
+            stream_instance.set_initial_state(stream_state, state_manager, self.per_stream_state_enabled)
+        elif stream_state and "state" in dir(stream_instance):
             stream_instance.state = stream_state  # type: ignore # we check that state in the dir(stream_instance)
             logger.info(f"Setting state of {stream_name} stream to {stream_state}")
 
@@ -246,18 +523,16 @@ class AbstractSource(Source, ABC):
                 stream_state=stream_state,
                 cursor_field=configured_stream.cursor_field or None,
             )
-            record_counter = 0
             for message_counter, record_data_or_message in enumerate(records, start=1):
                 message = self._get_message(record_data_or_message, stream_instance)
-                yield from self._emit_queued_messages()
+                yield from self._emit_queued_messages(stream_instance)
                 yield message
                 if message.type == MessageType.RECORD:
                     record = message.record
                     stream_state = stream_instance.get_updated_state(stream_state, record.data)
                     checkpoint_interval = stream_instance.state_checkpoint_interval
-                    record_counter += 1
-                    if checkpoint_interval and record_counter % checkpoint_interval == 0:
-                        yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+                    if state_manager.observe_record(stream_instance.name, stream_instance.namespace, record.data, checkpoint_interval):
+                        yield from self._checkpoint_state(stream_instance, stream_state, state_manager)
 
                     total_records_counter += 1
                     # This functionality should ideally live outside of this method
@@ -267,18 +542,24 @@ class AbstractSource(Source, ABC):
                         # Break from slice loop to save state and exit from _read_incremental function.
                         break
 
-            yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+            yield from self._checkpoint_state(stream_instance, stream_state, state_manager)
             if internal_config.is_limit_reached(total_records_counter):
                 return
 
         if not has_slices:
             # Safety net to ensure we always emit at least one state message even if there are no slices
-            checkpoint = self._checkpoint_state(stream_instance, stream_state, state_manager)
-            yield checkpoint
+            yield from self._checkpoint_state(stream_instance, stream_state, state_manager)
 
-    def _emit_queued_messages(self) -> Iterable[AirbyteMessage]:
+    def _emit_queued_messages(self, stream: Optional[Stream] = None) -> Iterable[AirbyteMessage]:
+        """
+        :param stream: The stream being read. When streams are read concurrently, only the queued messages of this stream are emitted.
+        """
         if self.message_repository:
-            yield from self.message_repository.consume_queue()
+            queued_message_router = self._queued_message_router
+            if queued_message_router and stream:
+                yield from queued_message_router.consume_queue(stream.name, stream.namespace)
+            else:
+                yield from self.message_repository.consume_queue()
         return
 
     def _read_full_refresh(
@@ -297,16 +578,26 @@ class AbstractSource(Source, ABC):
                 if internal_config.is_limit_reached(total_records_counter):
                     return
 
-    def _checkpoint_state(self, stream: Stream, stream_state: Mapping[str, Any], state_manager: ConnectorStateManager) -> AirbyteMessage:
+    def _checkpoint_state(
+        self, stream: Stream, stream_state: Mapping[str, Any], state_manager: ConnectorStateManager
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Emits the state of the stream unless it was already emitted and no record was emitted since
+        """
         # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
         # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
         # instance's deprecated get_updated_state() method.
-        try:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream.state)  # type: ignore # we know the field might not exist...
-
-        except AttributeError:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream_state)
-        return state_manager.create_state_message(stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled)
+        with get_instrumentation().measure(Stage.CHECKPOINT, stream.name):
+            try:
+                state_manager.update_state_for_stream(stream.name, stream.namespace, stream.state)  # type: ignore # we know the field might not exist...
+
+            except AttributeError:
+                state_manager.update_state_for_stream(stream.name, stream.namespace, stream_state)
+            state_message = state_manager.create_state_message_if_changed(
+                stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled
+            )
+        if state_message:
+            yield state_message
 
     @staticmethod
     def _apply_log_level_to_stream_logger(logger: logging.Logger, stream_instance: Stream) -> None:
@@ -3,12 +3,20 @@
 #
 
 import copy
-from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
+import json
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteMessage, AirbyteStateBlob, AirbyteStateMessage, AirbyteStateType, AirbyteStreamState, StreamDescriptor
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.streams import Stream
 from pydantic import Extra
+from pydantic.json import pydantic_encoder
+
+# The size of the records is estimated from one record out of this number as serializing every record would double the cost of emitting it
+RECORD_SIZE_SAMPLE_EVERY = 64
 
 
 class HashableStreamDescriptor(StreamDescriptor):
@@ -22,15 +30,47 @@ class HashableStreamDescriptor(StreamDescriptor):
         frozen = True
 
 
+class _CheckpointTracker:
+    """
+    What was emitted for a stream since its state was last checkpointed
+    """
+
+    __slots__ = ("records", "estimated_bytes", "record_size", "last_checkpoint_time", "last_emitted_state")
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.estimated_bytes = 0
+        self.record_size = 0
+        self.last_checkpoint_time = time.monotonic()
+        # Serialized form of the state last emitted
+        self.last_emitted_state: Optional[str] = None
+
+
 class ConnectorStateManager:
     """
     ConnectorStateManager consolidates the various forms of a stream's incoming state message (STREAM / GLOBAL / LEGACY) under a common
     interface. It also provides methods to extract and update state
+
+    It also decides when the state of a stream should be checkpointed while the stream is read: after a number of records, an elapsed
+    time or an estimated number of bytes of records emitted since the last checkpoint, whichever comes first. A state message is not
+    emitted again if neither the state nor the records emitted changed since the previous one.
     """
 
     def __init__(
-        self, stream_instance_map: Mapping[str, Stream], state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None
+        self,
+        stream_instance_map: Mapping[str, Stream],
+        state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
+        checkpoint_interval_seconds: Optional[float] = None,
+        checkpoint_interval_bytes: Optional[int] = None,
     ):
+        """
+        :param stream_instance_map: The streams of the source by name
+        :param state: The incoming state
+        :param checkpoint_interval_seconds: If defined, the state of a stream which can be checkpointed while it is read is checkpointed
+          once this time elapsed since the last checkpoint
+        :param checkpoint_interval_bytes: If defined, the state of a stream which can be checkpointed while it is read is checkpointed
+          once records of about this size were emitted since the last checkpoint
+        """
         shared_state, per_stream_states = self._extract_from_state_message(state, stream_instance_map)
 
         # We explicitly throw an error if we receive a GLOBAL state message that contains a shared_state because API sources are
@@ -44,6 +84,19 @@ class ConnectorStateManager:
                 "state messages with shared_state will not be processed correctly. "
             )
         self.per_stream_states = per_stream_states
+        # Plain values of the states by stream name, the form of the legacy state, kept up to date so that creating a state message does
+        # not convert every state blob
+        self._legacy_state: Dict[str, Mapping[str, Any]] = {
+            descriptor.name: state.dict() if state else {} for descriptor, state in per_stream_states.items()
+        }
+        # Serialized form of the states by stream name and namespace, to tell cheaply whether the state of a stream changed since it was
+        # last emitted
+        self._serialized_states: Dict[Tuple[str, Optional[str]], Optional[str]] = {}
+        self._checkpoint_interval_seconds = checkpoint_interval_seconds
+        self._checkpoint_interval_bytes = checkpoint_interval_bytes
+        self._checkpoint_trackers: Dict[Tuple[str, Optional[str]], _CheckpointTracker] = {}
+        # Streams can be read concurrently so updating the state of a stream must not conflict with the creation of a state message
+        self._lock = threading.Lock()
 
     def get_stream_state(self, stream_name: str, namespace: Optional[str]) -> MutableMapping[str, Any]:
         """
@@ -65,7 +118,96 @@ class ConnectorStateManager:
         :param value: A stream state mapping that is being updated for a stream
         """
         stream_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
-        self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
+        # The state is copied through the form it is emitted in so that the stream can keep updating its state while the message is
+        # emitted. The blob does not declare any field so there is nothing to validate.
+        serialized_state = self._serialize(value)
+        state_value = json.loads(serialized_state) if serialized_state is not None else dict(value)
+        state_blob = AirbyteStateBlob.construct(**state_value)
+        with self._lock:
+            self.per_stream_states[stream_descriptor] = state_blob
+            self._legacy_state[stream_name] = state_value
+            self._serialized_states[(stream_name, namespace)] = serialized_state
+
+    def observe_record(
+        self, stream_name: str, namespace: Optional[str], record_data: Mapping[str, Any], checkpoint_interval: Optional[int]
+    ) -> bool:
+        """
+        Keeps track of a record emitted for a stream.
+
+        :param stream_name: The name of the stream the record was emitted for
+        :param namespace: The namespace of the stream if it exists
+        :param record_data: The data of the record
+        :param checkpoint_interval: The number of records after which the state of the stream should be checkpointed. If None, the
+          stream can't be checkpointed while a slice is read, whatever the time elapsed or the size of the records.
+        :return: True if the state of the stream should be checkpointed now
+        """
+        tracker = self._get_checkpoint_tracker(stream_name, namespace)
+        tracker.records += 1
+        if not checkpoint_interval:
+            # The records of the stream are not sorted so its state can only be checkpointed once a slice was fully read
+            return False
+        if tracker.records >= checkpoint_interval:
+            return True
+        if self._checkpoint_interval_bytes:
+            if tracker.records % RECORD_SIZE_SAMPLE_EVERY == 1:
+                tracker.record_size = len(json.dumps(record_data, default=str))
+            tracker.estimated_bytes += tracker.record_size
+            if tracker.estimated_bytes >= self._checkpoint_interval_bytes:
+                return True
+        if self._checkpoint_interval_seconds:
+            return time.monotonic() - tracker.last_checkpoint_time >= self._checkpoint_interval_seconds
+        return False
+
+    def create_state_message_if_changed(
+        self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool
+    ) -> Optional[AirbyteMessage]:
+        """
+        Same as `create_state_message` but returns None if the state of the stream did not change and no record of the stream was
+        emitted since the last state message returned for the stream.
+
+        :param stream_name: The name of the stream for the message that is being created
+        :param namespace: The namespace of the stream for the message that is being created
+        :param send_per_stream_state: Decides which state format the message should be generated as
+        :return: The Airbyte state message to be emitted by the connector during a sync if it should be
+        """
+        tracker = self._get_checkpoint_tracker(stream_name, namespace)
+        with self._lock:
+            serialized_state = self._get_serialized_state(stream_name, namespace)
+            if tracker.last_emitted_state is not None and tracker.records == 0 and tracker.last_emitted_state == serialized_state:
+                return None
+            message = self._create_state_message(stream_name, namespace, send_per_stream_state)
+        tracker.records = 0
+        tracker.estimated_bytes = 0
+        tracker.last_checkpoint_time = time.monotonic()
+        tracker.last_emitted_state = serialized_state
+        return message
+
+    def _get_serialized_state(self, stream_name: str, namespace: Optional[str]) -> Optional[str]:
+        key = (stream_name, namespace)
+        if key not in self._serialized_states:
+            # The incoming states are only serialized if they are emitted again
+            stream_state = self.per_stream_states.get(HashableStreamDescriptor(name=stream_name, namespace=namespace))
+            self._serialized_states[key] = self._serialize(stream_state.dict() if stream_state else {})
+        return self._serialized_states[key]
+
+    @staticmethod
+    def _serialize(stream_state: Mapping[str, Any]) -> Optional[str]:
+        """
+        :return: The state as it is serialized in state messages, or None if it can't be serialized, in which case it is considered to
+          have changed each time a state message is created
+        """
+        try:
+            return json.dumps(stream_state, default=pydantic_encoder)
+        except (TypeError, ValueError):
+            return None
+
+    def _get_checkpoint_tracker(self, stream_name: str, namespace: Optional[str]) -> _CheckpointTracker:
+        key = (stream_name, namespace)
+        tracker = self._checkpoint_trackers.get(key)
+        if tracker is None:
+            with self._lock:
+                tracker = self._checkpoint_trackers.setdefault(key, _CheckpointTracker())
+        return tracker
 
     def create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         """
@@ -75,6 +217,10 @@ class ConnectorStateManager:
         :param send_per_stream_state: Decides which state format the message should be generated as
         :return: The Airbyte state message to be emitted by the connector during a sync
         """
+        with self._lock:
+            return self._create_state_message(stream_name, namespace, send_per_stream_state)
+
+    def _create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         if send_per_stream_state:
             hashable_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
             stream_state = self.per_stream_states.get(hashable_descriptor) or AirbyteStateBlob()
@@ -85,15 +231,16 @@ class ConnectorStateManager:
                 StreamDescriptor(name=stream_name) if namespace is None else StreamDescriptor(name=stream_name, namespace=namespace)
             )
 
-            return AirbyteMessage(
+            # The messages are constructed without validation as all their fields are already of the expected types
+            return AirbyteMessage.construct(
                 type=MessageType.STATE,
-                state=AirbyteStateMessage(
+                state=AirbyteStateMessage.construct(
                     type=AirbyteStateType.STREAM,
-                    stream=AirbyteStreamState(stream_descriptor=stream_descriptor, stream_state=stream_state),
+                    stream=AirbyteStreamState.construct(stream_descriptor=stream_descriptor, stream_state=stream_state),
                     data=dict(self._get_legacy_state()),
                 ),
             )
-        return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=dict(self._get_legacy_state())))
+        return AirbyteMessage.construct(type=MessageType.STATE, state=AirbyteStateMessage.construct(data=dict(self._get_legacy_state())))
 
     @classmethod
     def _extract_from_state_message(
@@ -167,9 +314,9 @@ class ConnectorStateManager:
     def _get_legacy_state(self) -> Mapping[str, Any]:
         """
         Using the current per-stream state, creates a mapping of all the stream states for the connector being synced
-        :return: A deep copy of the mapping of stream name to stream state value
+        :return: A read-only view of the mapping of stream name to stream state value
         """
-        return {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
+        return MappingProxyType(self._legacy_state)
 
     @staticmethod
     def _is_legacy_dict_state(state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]]) -> bool:
@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import functools
+import hashlib
+import json
+import pkgutil
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Any, Mapping, Optional
+
+import yaml
+from jsonschema.validators import validator_for
+
+COMPILED_MANIFEST_FORMAT_VERSION = 1
+COMPILED_MANIFEST_SUFFIX = ".compiled.json"
+
+
+@functools.lru_cache(maxsize=None)
+def _read_declarative_component_schema() -> bytes:
+    try:
+        raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
+    if raw_component_schema is None:
+        raise RuntimeError("Failed to read manifest component json schema required for validation")
+    return raw_component_schema
+
+
+@functools.lru_cache(maxsize=None)
+def get_declarative_component_schema_validator() -> Any:
+    """
+    Parsing declarative_component_schema.yaml and checking it is a valid json schema takes longer than validating most manifests, so
+    it is only done once per process.
+
+    :return: The validator of the manifests against the declarative component schema
+    """
+    declarative_component_schema = yaml.load(_read_declarative_component_schema(), Loader=yaml.SafeLoader)
+    validator_class = validator_for(declarative_component_schema)
+    validator_class.check_schema(declarative_component_schema)
+    return validator_class(declarative_component_schema)
+
+
+@functools.lru_cache(maxsize=None)
+def get_declarative_component_schema_digest() -> str:
+    """
+    :return: Digest of the declarative component schema the manifests are validated against
+    """
+    return hashlib.sha256(_read_declarative_component_schema()).hexdigest()
+
+
+def get_manifest_digest(manifest_content: bytes) -> str:
+    """
+    :param manifest_content: Content of the file defining the manifest
+    :return: Digest identifying the manifest a compiled manifest was created from
+    """
+    return hashlib.sha256(manifest_content).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledManifest:
+    """
+    Manifest whose references are resolved, whose types and parameters are propagated and which was validated against the declarative
+    component schema. ManifestDeclarativeSource does all of this every time a connector starts, which takes a significant time for large
+    manifests. A compiled manifest is created once, when the connector is built, and the source is created from it directly.
+
+    A compiled manifest is only valid for the version of the CDK and the declarative component schema it was compiled with, as they
+    define how the manifest is resolved and validated.
+
+    Attributes:
+        manifest (Mapping[str, Any]): The resolved and validated manifest
+        cdk_version (str): Version of the CDK the manifest was compiled with
+        schema_digest (str): Digest of the declarative component schema the manifest was validated against
+        source_digest (Optional[str]): Digest of the file the manifest was compiled from, used to detect outdated compiled manifests
+    """
+
+    manifest: Mapping[str, Any]
+    cdk_version: str
+    schema_digest: str
+    source_digest: Optional[str] = None
+
+    @classmethod
+    def create(cls, manifest: Mapping[str, Any], source_digest: Optional[str] = None) -> "CompiledManifest":
+        """
+        :param manifest: The resolved and validated manifest
+        :param source_digest: Digest of the file the manifest was compiled from
+        :return: The manifest compiled with the current CDK
+        """
+        return cls(
+            manifest=manifest,
+            cdk_version=metadata.version("airbyte_cdk"),
+            schema_digest=get_declarative_component_schema_digest(),
+            source_digest=source_digest,
+        )
+
+    def is_up_to_date(self, source_digest: Optional[str] = None) -> bool:
+        """
+        :param source_digest: If defined, digest of the file the manifest should have been compiled from
+        :return: True if the manifest was compiled with the current CDK and from the given file
+        """
+        return (
+            self.cdk_version == metadata.version("airbyte_cdk")
+            and self.schema_digest == get_declarative_component_schema_digest()
+            and (source_digest is None or self.source_digest == source_digest)
+        )
+
+    def dumps(self) -> str:
+        return json.dumps(
+            {
+                "format_version": COMPILED_MANIFEST_FORMAT_VERSION,
+                "cdk_version": self.cdk_version,
+                "schema_digest": self.schema_digest,
+                "source_digest": self.source_digest,
+                "manifest": self.manifest,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def loads(cls, content: str) -> "CompiledManifest":
+        """
+        :param content: A compiled manifest serialized with `dumps`
+        :return: The compiled manifest
+        """
+        compiled_manifest = json.loads(content)
+        if compiled_manifest.get("format_version") != COMPILED_MANIFEST_FORMAT_VERSION:
+            raise ValueError(f"Unsupported compiled manifest format version {compiled_manifest.get('format_version')}")
+        return cls(
+            manifest=compiled_manifest["manifest"],
+            cdk_version=compiled_manifest["cdk_version"],
+            schema_digest=compiled_manifest["schema_digest"],
+            source_digest=compiled_manifest.get("source_digest"),
+        )
+
+
+def get_compiled_manifest_path(path_to_yaml: str) -> str:
+    """
+    :param path_to_yaml: Path to the yaml file describing the source
+    :return: Path to the compiled manifest of the yaml file, which is next to it
+    """
+    for extension in (".yaml", ".yml"):
+        if path_to_yaml.endswith(extension):
+            return path_to_yaml[: -len(extension)] + COMPILED_MANIFEST_SUFFIX
+    return path_to_yaml + COMPILED_MANIFEST_SUFFIX
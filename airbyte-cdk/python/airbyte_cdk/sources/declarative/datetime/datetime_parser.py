@@ -3,7 +3,122 @@
 #
 
 import datetime
-from typing import Union
+import functools
+import re
+from typing import List, Optional, Pattern, Tuple, Union
+
+# Patterns matching the same values as the directives of datetime.strptime
+_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "f": r"(?P<f>[0-9]{1,6})",
+    "z": r"(?P<z>[+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|(?-i:Z))",
+}
+# Fixed width patterns of the directives, in the order in which the values they match sort like the datetimes they represent
+_ORDERED_DIRECTIVE_PATTERNS = [
+    ("Y", r"[0-9]{4}"),
+    ("m", r"(?:1[0-2]|0[1-9])"),
+    ("d", r"(?:3[01]|[12][0-9]|0[1-9])"),
+    ("H", r"(?:2[0-3]|[01][0-9])"),
+    ("M", r"[0-5][0-9]"),
+    ("S", r"[0-5][0-9]"),
+    ("f", r"[0-9]{6}"),
+]
+_FORMAT_TOKENS = re.compile(r"%(.)|([^%]+)", re.DOTALL)
+_WHITESPACE = re.compile(r"(\s+)")
+
+_FormatToken = Tuple[str, str]
+
+
+class _CompiledFormat:
+    """
+    Parser of the values of a format only made of numeric directives. It matches the same values as datetime.strptime with a single
+    regular expression instead of going through the generic, locale aware, implementation of strptime.
+    """
+
+    def __init__(self, pattern: Pattern[str], ordered_pattern: Optional[Pattern[str]]):
+        self._pattern = pattern
+        self._ordered_pattern = ordered_pattern
+
+    def parse(self, date: str) -> Optional[datetime.datetime]:
+        """
+        :return: The datetime represented by the value, in UTC if the format has no time zone, or None if the value doesn't match the format
+        """
+        match = self._pattern.fullmatch(date)
+        if match is None:
+            return None
+        values = match.groupdict()
+        fraction = values.get("f")
+        offset = values.get("z")
+        return datetime.datetime(
+            int(values.get("Y") or 1900),
+            int(values.get("m") or 1),
+            int(values.get("d") or 1),
+            int(values.get("H") or 0),
+            int(values.get("M") or 0),
+            int(values.get("S") or 0),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=_parse_offset(offset) if offset else datetime.timezone.utc,
+        )
+
+    def is_ordered(self, date: str) -> bool:
+        return self._ordered_pattern is not None and self._ordered_pattern.fullmatch(date) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_offset(offset: str) -> datetime.timezone:
+    # Same rules as datetime.strptime for the %z directive. Values usually have a few distinct offsets, so their time zones are cached
+    if offset == "Z":
+        return datetime.timezone.utc
+    if offset[3] == ":":
+        offset = offset[:3] + offset[4:]
+        if len(offset) > 5:
+            if offset[5] != ":":
+                raise ValueError(f"Inconsistent use of : in {offset}")
+            offset = offset[:5] + offset[6:]
+    seconds = int(offset[1:3]) * 3600 + int(offset[3:5]) * 60 + int(offset[5:7] or 0)
+    microseconds = int(offset[8:].ljust(6, "0")) if len(offset) > 8 else 0
+    if offset[0] == "-":
+        seconds, microseconds = -seconds, -microseconds
+    return datetime.timezone(datetime.timedelta(seconds=seconds, microseconds=microseconds))
+
+
+def _literal_pattern(literal: str) -> str:
+    # Like datetime.strptime, whitespace in the format matches any whitespace in the value
+    return "".join(r"\s+" if part.isspace() else re.escape(part) for part in _WHITESPACE.split(literal) if part)
+
+
+def _ordered_pattern(tokens: List[_FormatToken], directives: List[str]) -> Optional[Pattern[str]]:
+    ordered_directives = [directive for directive, _ in _ORDERED_DIRECTIVE_PATTERNS]
+    if not directives or directives != ordered_directives[: len(directives)]:
+        return None
+    ordered_patterns = dict(_ORDERED_DIRECTIVE_PATTERNS)
+    pattern = ""
+    for directive, literal in tokens:
+        pattern += ordered_patterns[directive] if directive and directive != "%" else re.escape(literal or "%")
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_format(format: str) -> Optional[_CompiledFormat]:
+    """
+    :return: The parser of the format, or None if the format has directives which can only be parsed by datetime.strptime
+    """
+    tokens: List[_FormatToken] = _FORMAT_TOKENS.findall(format)
+    if sum(len(literal) or 2 for _, literal in tokens) != len(format):
+        # A stray % at the end of the format
+        return None
+    directives = [directive for directive, _ in tokens if directive and directive != "%"]
+    if any(directive not in _DIRECTIVE_PATTERNS for directive in directives) or len(set(directives)) != len(directives):
+        return None
+    pattern = ""
+    for directive, literal in tokens:
+        pattern += _DIRECTIVE_PATTERNS[directive] if directive and directive != "%" else _literal_pattern(literal or "%")
+    return _CompiledFormat(re.compile(pattern, re.IGNORECASE), _ordered_pattern(tokens, directives))
 
 
 class DatetimeParser:
@@ -14,6 +129,9 @@ class DatetimeParser:
 
     %s is part of the list of format codes required by  the 1989 C standard, but it is unreliable because it always return a datetime in the system's timezone.
     Instead of using the directive directly, we can use datetime.fromtimestamp and dt.timestamp()
+
+    Formats only made of numeric directives, like the ISO 8601 and RFC 3339 formats, are parsed by a regular expression compiled once per
+    format instead of datetime.strptime.
     """
 
     _UNIX_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
@@ -30,11 +148,30 @@ class DatetimeParser:
         elif format == "%ms":
             return self._UNIX_EPOCH + datetime.timedelta(milliseconds=int(date))
 
+        compiled_format = _compile_format(format)
+        if compiled_format:
+            parsed_datetime = compiled_format.parse(str(date))
+            if parsed_datetime is None:
+                raise ValueError(f"time data {str(date)!r} does not match format {format!r}")
+            return parsed_datetime
+
         parsed_datetime = datetime.datetime.strptime(str(date), format)
         if self._is_naive(parsed_datetime):
             return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
         return parsed_datetime
 
+    def is_lexicographically_ordered(self, date: Union[str, int], format: str) -> bool:
+        """
+        Values of some formats, like "%Y-%m-%dT%H:%M:%SZ", sort like the datetimes they represent. This allows to compare them without
+        parsing them.
+
+        :param date: The value to check
+        :param format: The format of the value
+        :return: True if the value can be compared to the other values of the format for which this returns True as strings
+        """
+        compiled_format = _compile_format(format)
+        return isinstance(date, str) and compiled_format is not None and compiled_format.is_ordered(date)
+
     def format(self, dt: datetime.datetime, format: str) -> str:
         # strftime("%s") is unreliable because it ignores the time zone information and assumes the time zone of the system it's running on
         # It's safer to use the timestamp() method than the %s directive
@@ -0,0 +1,244 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import re
+import threading
+from dataclasses import InitVar, dataclass
+from typing import Any, ClassVar, Dict, Generator, Iterable, Iterator, List, Mapping, Union
+from weakref import WeakKeyDictionary, WeakSet
+
+import dpath.util
+import requests
+from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+from requests.utils import guess_json_utf
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+_END_OF_DOCUMENT = ""
+# Returned instead of the value holding the records so that it is left out of the document
+_RECORDS = object()
+
+
+class _JsonStreamReader:
+    """
+    Reads JSON values one at a time from an iterator of text chunks.
+
+    Only the part of the document that was not consumed yet is kept in memory. Values are parsed using the C scanner of the json module
+    so reading the elements of an array is nearly as fast as json.loads.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> str:
+        """
+        Skip the whitespaces and return the next character without consuming it
+
+        :return: The next character or an empty string at the end of the document
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]  # the pattern always matches
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                return _END_OF_DOCUMENT
+
+    def consume(self, expected: str) -> None:
+        if self.peek() != expected:
+            raise self.error(f"Expecting '{expected}' delimiter")
+        self._position += 1
+
+    def read_value(self) -> Any:
+        while True:
+            self.peek()
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # The value might be truncated at the end of the buffer
+                if self._read_more():
+                    continue
+                raise
+            if end == len(self._buffer) and self._read_more():
+                # A number could continue in the next chunk
+                continue
+            self._position = end
+            return value
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _read_more(self) -> bool:
+        """
+        Read at least as many characters as there are left to consume so that parsing a value spanning several chunks is done in
+        amortized linear time.
+
+        :return: False if the end of the document was reached before anything could be read
+        """
+        if self._exhausted:
+            return False
+        parts = [self._buffer[self._position :]]
+        left_to_read = max(len(parts[0]), 1)
+        while left_to_read > 0:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                break
+            parts.append(chunk)
+            left_to_read -= len(chunk)
+        self._buffer = "".join(parts)
+        self._position = 0
+        return len(parts) > 1
+
+
+@dataclass
+class StreamingJsonDecoder(Decoder):
+    """
+    Decoder strategy parsing the json-encoded content of a response incrementally.
+
+    When used by a DpathExtractor, the records located at the field path are parsed one at a time instead of loading the whole body at
+    once. The fields outside of the field path are kept so that other components using a StreamingJsonDecoder, like the paginator, can
+    still read them (a cursor to the next page for instance) without parsing the response a second time. The records are not kept so the
+    document decoded from such a response does not contain the field path. If the body was streamed and no document could be kept, for
+    instance because the records were not all read, the decoded document is empty.
+
+    Usage syntax:
+
+    ```yaml
+        record_selector:
+          type: RecordSelector
+          extractor:
+            type: DpathExtractor
+            field_path: ["data"]
+            decoder:
+              type: StreamingJsonDecoder
+        paginator:
+          type: DefaultPaginator
+          decoder:
+            type: StreamingJsonDecoder
+    ```
+
+    Attributes:
+        chunk_size (int): Number of bytes of the body decoded at once
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+    chunk_size: int = 64 * 1024
+
+    # Documents parsed while extracting records, keyed by response so that they can be shared between components without them
+    # outliving the response
+    _documents: ClassVar["WeakKeyDictionary[requests.Response, Any]"] = WeakKeyDictionary()
+    # Responses whose body was streamed while extracting records so that it can't be read again
+    _streamed_responses: ClassVar["WeakSet[requests.Response]"] = WeakSet()
+    _documents_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def decode(self, response: requests.Response) -> Union[Mapping[str, Any], List[Any]]:
+        with self._documents_lock:
+            if response in self._documents:
+                return self._documents[response]  # type: ignore[no-any-return]
+            if response in self._streamed_responses:
+                return {}
+        try:
+            reader = _JsonStreamReader(self._iter_text(response))
+            document = reader.read_value()
+            if reader.peek() != _END_OF_DOCUMENT:
+                raise reader.error("Extra data")
+            return document  # type: ignore[no-any-return]
+        except json.JSONDecodeError:
+            return {}
+
+    def iterate_records(self, response: requests.Response, field_path: List[str]) -> Iterable[Any]:
+        """
+        Parse the response incrementally and yield the records located at the field path, following the semantics of DpathExtractor:
+        an array is iterated over, any other truthy value is returned as a single record.
+
+        Once the records are consumed, the document without the records is available through `decode`.
+
+        :param response: The response to decode
+        :param field_path: Path to the records. Segments must not be globs
+        :raise json.JSONDecodeError: If the response is not a valid JSON document
+        """
+        reader = _JsonStreamReader(self._iter_text(response))
+        document = yield from self._read_records(reader, field_path)
+        if reader.peek() != _END_OF_DOCUMENT:
+            raise reader.error("Extra data")
+        with self._documents_lock:
+            self._documents[response] = {} if document is _RECORDS else document
+
+    def _read_records(self, reader: _JsonStreamReader, field_path: List[str]) -> Generator[Any, None, Any]:
+        """
+        :return: The value read without the records, or _RECORDS if the value holds the records
+        """
+        next_character = reader.peek()
+        if not field_path:
+            if next_character != "[":
+                value = reader.read_value()
+                if value:
+                    yield value
+                return _RECORDS
+            reader.consume("[")
+            if reader.peek() == "]":
+                reader.consume("]")
+                return _RECORDS
+            while True:
+                yield reader.read_value()
+                if reader.peek() == "]":
+                    reader.consume("]")
+                    return _RECORDS
+                reader.consume(",")
+
+        if next_character != "{":
+            # The path goes through something else than an object so the value is fully parsed and searched like DpathExtractor would
+            value = reader.read_value()
+            extracted = dpath.util.get(value, field_path, default=[])
+            if isinstance(extracted, list):
+                yield from extracted
+            elif extracted:
+                yield extracted
+            return _RECORDS
+
+        reader.consume("{")
+        document: Dict[str, Any] = {}
+        if reader.peek() == "}":
+            reader.consume("}")
+            return document
+        while True:
+            key = reader.read_value()
+            if not isinstance(key, str):
+                raise reader.error("Expecting property name enclosed in double quotes")
+            reader.consume(":")
+            if key == field_path[0] and key not in document:
+                value = yield from self._read_records(reader, field_path[1:])
+                if value is not _RECORDS:
+                    document[key] = value
+            else:
+                document[key] = reader.read_value()
+            if reader.peek() == "}":
+                reader.consume("}")
+                return document
+            reader.consume(",")
+
+    def _iter_text(self, response: requests.Response) -> Iterator[str]:
+        chunks = self._iter_bytes(response)
+        first_chunk = next(chunks, b"")
+        # Same as requests.Response.json
+        encoding = response.encoding or guess_json_utf(first_chunk) or "utf-8"  # type: ignore[no-untyped-call]
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        yield decoder.decode(first_chunk)
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    def _iter_bytes(self, response: requests.Response) -> Iterator[bytes]:
+        if isinstance(response._content, bytes):  # type: ignore[attr-defined]
+            # The body was already downloaded because the request was not sent with stream=True
+            content: bytes = response._content  # type: ignore[attr-defined]
+            return (content[start : start + self.chunk_size] for start in range(0, len(content), self.chunk_size))
+        with self._documents_lock:
+            self._streamed_responses.add(response)
+        return iter(response.iter_content(chunk_size=self.chunk_size))
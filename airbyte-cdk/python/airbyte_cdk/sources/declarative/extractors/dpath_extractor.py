@@ -2,17 +2,21 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterable, Iterator, List, Mapping, Union
 
 import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config
 
+_GLOB_CHARACTERS = frozenset("*?[")
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -24,6 +28,10 @@ class DpathExtractor(RecordExtractor):
     If the field path points to an empty object, an empty array is returned.
     If the field path points to a non-existing path, an empty array is returned.
 
+    If the decoder is a StreamingJsonDecoder and the field path does not contain globs, the records are parsed incrementally as they are
+    iterated over instead of decoding the whole response first. As with JsonDecoder, a response which is not valid JSON has no records.
+    If the invalid part only comes after some records were read, an error is raised instead of silently returning part of the records.
+
     Examples of instantiating this transform:
     ```
       extractor:
@@ -63,12 +71,17 @@ class DpathExtractor(RecordExtractor):
             if isinstance(self.field_path[path_index], str):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
 
-    def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+    def extract_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
+        path = [path.eval(self.config) for path in self.field_path]  # type: ignore # field_path elements are always InterpolatedString
+        if isinstance(self.decoder, StreamingJsonDecoder) and all(
+            isinstance(segment, str) and not _GLOB_CHARACTERS.intersection(segment) for segment in path
+        ):
+            return self._iterate_records(self.decoder, response, path)
+
         response_body = self.decoder.decode(response)
         if len(self.field_path) == 0:
             extracted = response_body
         else:
-            path = [path.eval(self.config) for path in self.field_path]
             if "*" in path:
                 extracted = dpath.util.values(response_body, path)
             else:
@@ -79,3 +92,14 @@ class DpathExtractor(RecordExtractor):
             return [extracted]
         else:
             return []
+
+    @staticmethod
+    def _iterate_records(decoder: StreamingJsonDecoder, response: requests.Response, path: List[str]) -> Iterator[Mapping[str, Any]]:
+        has_records = False
+        try:
+            for record in decoder.iterate_records(response, path):
+                has_records = True
+                yield record
+        except json.JSONDecodeError as exception:
+            if has_records:
+                raise ValueError(f"The response could not be parsed after some of its records were read: {exception}") from exception
@@ -33,4 +33,5 @@ class RecordFilter:
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> List[Mapping[str, Any]]:
         kwargs = {"stream_state": stream_state, "stream_slice": stream_slice, "next_page_token": next_page_token}
-        return [record for record in records if self._filter_interpolator.eval(self.config, record=record, **kwargs)]
+        keep = self._filter_interpolator.eval_for_records(self.config, records, **kwargs)
+        return [record for record, is_kept in zip(records, keep) if is_kept]
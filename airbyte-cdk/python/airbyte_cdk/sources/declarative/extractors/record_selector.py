@@ -3,6 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass, field
+from itertools import islice
 from typing import Any, List, Mapping, Optional
 
 import requests
@@ -11,6 +12,7 @@ from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordEx
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
+from airbyte_cdk.utils.instrumentation import Stage, get_instrumentation
 
 
 @dataclass
@@ -19,10 +21,15 @@ class RecordSelector(HttpSelector):
     Responsible for translating an HTTP response into a list of records by extracting records from the response and optionally filtering
     records based on a heuristic.
 
+    The records are filtered and transformed in chunks of `chunk_size` records so that an extractor producing records lazily, like a
+    DpathExtractor with a StreamingJsonDecoder, is not read entirely before the first records are processed.
+
     Attributes:
         extractor (RecordExtractor): The record extractor responsible for extracting records from a response
         record_filter (RecordFilter): The record filter responsible for filtering extracted records
         transformations (List[RecordTransformation]): The transformations to be done on the records
+        name (str): Name of the stream. Only used to instrument the selection of the records
+        chunk_size (int): Maximum number of records filtered and transformed at once
     """
 
     extractor: RecordExtractor
@@ -30,6 +37,8 @@ class RecordSelector(HttpSelector):
     parameters: InitVar[Mapping[str, Any]]
     record_filter: Optional[RecordFilter] = None
     transformations: List[RecordTransformation] = field(default_factory=lambda: [])
+    name: str = ""
+    chunk_size: int = 1000
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._parameters = parameters
@@ -41,10 +50,19 @@ class RecordSelector(HttpSelector):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> List[Record]:
-        all_data = self.extractor.extract_records(response)
-        filtered_data = self._filter(all_data, stream_state, stream_slice, next_page_token)
-        self._transform(filtered_data, stream_state, stream_slice)
-        return [Record(data, stream_slice) for data in filtered_data]
+        instrumentation = get_instrumentation()
+        extracted_data = iter(self.extractor.extract_records(response))
+        records: List[Record] = []
+        while True:
+            with instrumentation.measure(Stage.DECODE, self.name):
+                data = list(islice(extracted_data, self.chunk_size))
+            with instrumentation.measure(Stage.RECORD_FILTER, self.name):
+                filtered_data = self._filter(data, stream_state, stream_slice, next_page_token)
+            with instrumentation.measure(Stage.TRANSFORMATION, self.name):
+                self._transform(filtered_data, stream_state, stream_slice)
+            records.extend(Record(record_data, stream_slice) for record_data in filtered_data)
+            if len(data) < self.chunk_size:
+                return records
 
     def _filter(
         self,
@@ -65,6 +83,6 @@ class RecordSelector(HttpSelector):
         stream_state: StreamState,
         stream_slice: Optional[StreamSlice] = None,
     ) -> None:
-        for record in records:
-            for transformation in self.transformations:
-                transformation.transform(record, config=self.config, stream_state=stream_state, stream_slice=stream_slice)
+        # Each transformation is applied to the whole page at once so that the work not depending on the record is only done once
+        for transformation in self.transformations:
+            transformation.transform_records(records, config=self.config, stream_state=stream_state, stream_slice=stream_slice)
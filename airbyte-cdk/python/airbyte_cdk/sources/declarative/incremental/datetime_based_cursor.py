@@ -3,6 +3,7 @@
 #
 
 import datetime
+from collections import OrderedDict
 from dataclasses import InitVar, dataclass, field
 from typing import Any, Iterable, List, Mapping, Optional, Union
 
@@ -17,6 +18,9 @@ from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, S
 from airbyte_cdk.sources.message import MessageRepository
 from isodate import Duration, parse_duration
 
+# Number of parsed cursor values kept, mostly for the values compared to every record like the state and the most recent record
+_PARSED_DATES_CACHE_SIZE = 16
+
 
 @dataclass
 class DatetimeBasedCursor(Cursor):
@@ -89,6 +93,7 @@ class DatetimeBasedCursor(Cursor):
         self.partition_field_start = InterpolatedString.create(self.partition_field_start or "start_time", parameters=parameters)
         self.partition_field_end = InterpolatedString.create(self.partition_field_end or "end_time", parameters=parameters)
         self._parser = DatetimeParser()
+        self._parsed_dates: "OrderedDict[Union[str, int], datetime.datetime]" = OrderedDict()
 
         # If datetime format is not specified then start/end datetime should inherit it from the stream slicer
         if not self.start_datetime.datetime_format:
@@ -188,6 +193,19 @@ class DatetimeBasedCursor(Cursor):
         return comparator(cursor_date, default_date)
 
     def parse_date(self, date: str) -> datetime.datetime:
+        if not isinstance(date, (str, int)):
+            return self._parse_date(date)
+        parsed_date = self._parsed_dates.get(date)
+        if parsed_date is not None:
+            self._parsed_dates.move_to_end(date)
+            return parsed_date
+        parsed_date = self._parse_date(date)
+        self._parsed_dates[date] = parsed_date
+        if len(self._parsed_dates) > _PARSED_DATES_CACHE_SIZE:
+            self._parsed_dates.popitem(last=False)
+        return parsed_date
+
+    def _parse_date(self, date: str) -> datetime.datetime:
         for datetime_format in self.cursor_datetime_formats + [self.datetime_format]:
             try:
                 return self._parser.parse(date, datetime_format)
@@ -280,8 +298,14 @@ class DatetimeBasedCursor(Cursor):
         first_cursor_value = first.get(cursor_field)
         second_cursor_value = second.get(cursor_field)
         if first_cursor_value and second_cursor_value:
+            if self._is_lexicographically_ordered(first_cursor_value) and self._is_lexicographically_ordered(second_cursor_value):
+                return bool(first_cursor_value >= second_cursor_value)
             return self.parse_date(first_cursor_value) >= self.parse_date(second_cursor_value)
         elif first_cursor_value:
             return True
         else:
             return False
+
+    def _is_lexicographically_ordered(self, cursor_value: Any) -> bool:
+        # The values matching the first format are parsed with this format so they can be compared as strings if the format allows it
+        return self._parser.is_lexicographically_ordered(cursor_value, self.cursor_datetime_formats[0])
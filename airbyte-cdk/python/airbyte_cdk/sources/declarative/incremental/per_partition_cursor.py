@@ -2,8 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import base64
 import json
-from typing import Any, Callable, Iterable, Mapping, Optional
+import sys
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
@@ -32,6 +36,8 @@ class PerPartitionStreamSlice(StreamSlice):
     def __init__(self, partition: Mapping[str, Any], cursor_slice: Mapping[str, Any]):
         self._partition = partition
         self._cursor_slice = cursor_slice
+        # Set by the PerPartitionCursor so that the partition is serialized once per slice instead of once per record and request
+        self._partition_key: Optional[str] = None
         if partition.keys() & cursor_slice.keys():
             raise ValueError("Keys for partition and incremental sync cursor should not overlap")
         self._stream_slice = dict(partition) | dict(cursor_slice)
@@ -113,63 +119,164 @@ class PerPartitionCursor(Cursor):
     Between record #3 and #4 | Duplication | #1, #2
 
     Therefore, we need to manage state per partition.
+
+    Partitions are identified by an interned key. The state of each partition is kept between checkpoints and only recomputed for the
+    partitions whose slices were closed since, so that checkpointing often stays cheap when there are many partitions.
+
+    To bound memory and the size of the state, `max_partitions` can limit the number of partitions having their own cursor. When a new
+    partition exceeds that number, the least recently sliced partition is evicted and its state is merged into a global state which is
+    the earliest state of the evicted partitions. The evicted partitions are listed in the state so that they start from this global
+    state when they are sliced again, including in the following syncs, which can lead to records being synced again but never to
+    records being missed. Partitions never seen before start without state. Slices are expected to be closed before `max_partitions`
+    other partitions are sliced.
     """
 
     _NO_STATE = {}
     _NO_CURSOR_STATE = {}
     _KEY = 0
     _VALUE = 1
+    _STATES_KEY = "states"
+    _COMPRESSED_STATES_KEY = "compressed_states"
+    _GLOBAL_STATE_KEY = "state"
+    _EVICTED_PARTITIONS_KEY = "evicted_partitions"
+    _COMPRESSED_EVICTED_PARTITIONS_KEY = "compressed_evicted_partitions"
 
-    def __init__(self, cursor_factory: CursorFactory, partition_router: StreamSlicer):
+    def __init__(
+        self,
+        cursor_factory: CursorFactory,
+        partition_router: StreamSlicer,
+        max_partitions: Optional[int] = None,
+        compress_state: bool = False,
+    ):
+        """
+        :param max_partitions: Maximum number of partitions having their own cursor. If None, the number of partitions is not bounded
+        :param compress_state: If True, the states of the partitions and the evicted partitions are emitted as zlib compressed, base64
+          encoded JSON strings which are usually several times smaller
+        """
+        if max_partitions is not None and max_partitions < 1:
+            raise ValueError(f"PerPartitionCursor needs to track at least one partition but max_partitions was {max_partitions}")
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
-        self._cursor_per_partition = {}
+        self._max_partitions = max_partitions
+        self._compress_state = compress_state
+        # Ordered from the least to the most recently sliced partition
+        self._cursor_per_partition: "OrderedDict[str, Cursor]" = OrderedDict()
         self._partition_serializer = PerPartitionKeySerializer()
+        # State of the partitions as emitted, for the partitions having a non-empty state
+        self._state_per_partition: Dict[str, Mapping[str, Any]] = {}
+        # Partitions whose state might have changed since the last call to get_stream_state, as an ordered set
+        self._partitions_to_checkpoint: Dict[str, None] = {}
+        # None as long as no partition was evicted
+        self._global_state: Optional[StreamState] = None
+        # Partitions evicted during this sync or previous ones and not sliced since, from their key to the partition
+        self._evicted_partitions: Dict[str, Mapping[str, Any]] = {}
 
     def stream_slices(self) -> Iterable[PerPartitionStreamSlice]:
         slices = self._partition_router.stream_slices()
         for partition in slices:
-            cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
-            if not cursor:
-                cursor = self._create_cursor(self._NO_CURSOR_STATE)
-                self._cursor_per_partition[self._to_partition_key(partition)] = cursor
+            partition_key = self._to_partition_key(partition)
+            cursor = self._cursor_per_partition.get(partition_key)
+            if cursor:
+                self._cursor_per_partition.move_to_end(partition_key)
+            else:
+                cursor = self._create_cursor(self._get_initial_cursor_state(partition_key))
+                self._add_cursor(partition_key, cursor)
 
             for cursor_slice in cursor.stream_slices():
-                yield PerPartitionStreamSlice(partition, cursor_slice)
+                stream_slice = PerPartitionStreamSlice(partition, cursor_slice)
+                stream_slice._partition_key = partition_key
+                yield stream_slice
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         if not stream_state:
             return
 
-        for state in stream_state["states"]:
-            self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(state["cursor"])
+        if self._GLOBAL_STATE_KEY in stream_state:
+            self._global_state = stream_state[self._GLOBAL_STATE_KEY]
+        for partition in self._read_list(stream_state, self._EVICTED_PARTITIONS_KEY, self._COMPRESSED_EVICTED_PARTITIONS_KEY):
+            self._evicted_partitions[self._to_partition_key(partition)] = partition
+        for state in self._read_list(stream_state, self._STATES_KEY, self._COMPRESSED_STATES_KEY):
+            self._add_cursor(self._to_partition_key(state["partition"]), self._create_cursor(state["cursor"]))
 
     def close_slice(self, stream_slice: StreamSlice, most_recent_record: Optional[Record]) -> None:
+        partition_key = self._get_partition_key(stream_slice)
         try:
             cursor_most_recent_record = (
                 Record(most_recent_record.data, stream_slice.cursor_slice) if most_recent_record else most_recent_record
             )
-            self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].close_slice(
-                stream_slice.cursor_slice, cursor_most_recent_record
-            )
+            self._cursor_per_partition[partition_key].close_slice(stream_slice.cursor_slice, cursor_most_recent_record)
         except KeyError as exception:
             raise ValueError(
                 f"Partition {str(exception)} could not be found in current state based on the record. This is unexpected because "
                 f"we should only update state for partition that where emitted during `stream_slices`"
             )
+        self._partitions_to_checkpoint[partition_key] = None
 
     def get_stream_state(self) -> StreamState:
-        states = []
-        for partition_tuple, cursor in self._cursor_per_partition.items():
-            cursor_state = cursor.get_stream_state()
-            if cursor_state:
-                states.append(
-                    {
-                        "partition": self._to_dict(partition_tuple),
-                        "cursor": cursor_state,
-                    }
-                )
-        return {"states": states}
+        for partition_key in self._partitions_to_checkpoint:
+            self._update_state_for_partition(partition_key)
+        self._partitions_to_checkpoint.clear()
+
+        stream_state: Dict[str, Any] = {}
+        self._write_list(stream_state, list(self._state_per_partition.values()), self._STATES_KEY, self._COMPRESSED_STATES_KEY)
+        if self._global_state:
+            stream_state[self._GLOBAL_STATE_KEY] = self._global_state
+            self._write_list(
+                stream_state,
+                list(self._evicted_partitions.values()),
+                self._EVICTED_PARTITIONS_KEY,
+                self._COMPRESSED_EVICTED_PARTITIONS_KEY,
+            )
+        return stream_state
+
+    @staticmethod
+    def _read_list(stream_state: StreamState, key: str, compressed_key: str) -> List[Any]:
+        if compressed_key in stream_state:
+            return json.loads(zlib.decompress(base64.b64decode(stream_state[compressed_key])))
+        return stream_state.get(key, [])
+
+    def _write_list(self, stream_state: Dict[str, Any], values: List[Any], key: str, compressed_key: str) -> None:
+        if self._compress_state:
+            stream_state[compressed_key] = base64.b64encode(zlib.compress(json.dumps(values).encode("utf-8"))).decode("ascii")
+        else:
+            stream_state[key] = values
+
+    def _get_initial_cursor_state(self, partition_key: str) -> StreamState:
+        if self._global_state and partition_key in self._evicted_partitions:
+            return self._global_state
+        return self._NO_CURSOR_STATE
+
+    def _add_cursor(self, partition_key: str, cursor: Cursor) -> None:
+        self._evicted_partitions.pop(partition_key, None)
+        self._cursor_per_partition[partition_key] = cursor
+        self._cursor_per_partition.move_to_end(partition_key)
+        self._partitions_to_checkpoint[partition_key] = None
+        while self._max_partitions is not None and len(self._cursor_per_partition) > self._max_partitions:
+            self._evict_least_recently_sliced_partition()
+
+    def _evict_least_recently_sliced_partition(self) -> None:
+        partition_key, cursor = self._cursor_per_partition.popitem(last=False)
+        state = self._state_per_partition.pop(partition_key, None)
+        self._evicted_partitions[partition_key] = state["partition"] if state else self._to_dict(partition_key)
+        self._partitions_to_checkpoint.pop(partition_key, None)
+        cursor_state = cursor.get_stream_state()
+        if self._global_state is None:
+            self._global_state = cursor_state
+        elif self._global_state and (
+            not cursor_state or cursor.is_greater_than_or_equal(Record(self._global_state, None), Record(cursor_state, None))
+        ):
+            # The global state is the earliest state of the evicted partitions so that none of them misses records
+            self._global_state = cursor_state
+
+    def _update_state_for_partition(self, partition_key: str) -> None:
+        cursor = self._cursor_per_partition.get(partition_key)
+        cursor_state = cursor.get_stream_state() if cursor else None
+        if not cursor_state:
+            self._state_per_partition.pop(partition_key, None)
+            return
+        state = self._state_per_partition.get(partition_key)
+        partition = state["partition"] if state else self._to_dict(partition_key)
+        self._state_per_partition[partition_key] = {"partition": partition, "cursor": cursor_state}
 
     def _get_state_for_partition(self, partition: Mapping[str, Any]) -> Optional[StreamState]:
         cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
@@ -182,10 +289,18 @@ class PerPartitionCursor(Cursor):
     def _is_new_state(stream_state):
         return not bool(stream_state)
 
-    def _to_partition_key(self, partition) -> tuple:
-        return self._partition_serializer.to_partition_key(partition)
+    def _to_partition_key(self, partition) -> str:
+        return sys.intern(self._partition_serializer.to_partition_key(partition))
+
+    def _get_partition_key(self, stream_slice: StreamSlice) -> str:
+        partition_key = getattr(stream_slice, "_partition_key", None)
+        if partition_key is None:
+            partition_key = self._to_partition_key(stream_slice.partition)
+            if isinstance(stream_slice, PerPartitionStreamSlice):
+                stream_slice._partition_key = partition_key
+        return partition_key
 
-    def _to_dict(self, partition_key: tuple) -> StreamSlice:
+    def _to_dict(self, partition_key: str) -> StreamSlice:
         return self._partition_serializer.to_partition(partition_key)
 
     def select_state(self, stream_slice: Optional[PerPartitionStreamSlice] = None) -> Optional[StreamState]:
@@ -211,7 +326,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_params(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_params(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_params(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -224,7 +339,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_headers(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_headers(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_headers(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -237,7 +352,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_body_data(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_data(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_body_data(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -250,7 +365,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_body_json(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_json(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_body_json(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -272,7 +387,7 @@ class PerPartitionCursor(Cursor):
         return Record(record.data, record.associated_slice.cursor_slice)
 
     def _get_cursor(self, record: Record) -> Cursor:
-        partition_key = self._to_partition_key(record.associated_slice.partition)
+        partition_key = self._get_partition_key(record.associated_slice)
         if partition_key not in self._cursor_per_partition:
             raise ValueError("Invalid state as stream slices that are emitted should refer to an existing cursor")
         cursor = self._cursor_per_partition[partition_key]
@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Final, List, Mapping
+from typing import Any, Final, Iterable, List, Mapping
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.types import Config
@@ -42,7 +42,27 @@ class InterpolatedBoolean:
             evaluated = self._interpolation.eval(
                 self.condition, config, self._default, parameters=self._parameters, **additional_parameters
             )
-            if evaluated in FALSE_VALUES:
-                return False
-            # The presence of a value is generally regarded as truthy, so we treat it as such
-            return True
+            return self._to_bool(evaluated)
+
+    def eval_for_records(self, config: Config, records: Iterable[Mapping[str, Any]], **additional_parameters: Any) -> List[bool]:
+        """
+        Interpolates the predicate condition string for each record, exposing the record as `record` in the context.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param records: The records to evaluate the condition against
+        :param additional_parameters: Optional parameters used for interpolation
+        :return: The result of the condition for each record, in the same order as the records
+        """
+        if isinstance(self.condition, bool):
+            return [self.condition for _ in records]
+        evaluated = self._interpolation.eval_for_records(
+            self.condition, config, records, self._default, parameters=self._parameters, **additional_parameters
+        )
+        return [self._to_bool(value) for value in evaluated]
+
+    @staticmethod
+    def _to_bool(evaluated: Any) -> bool:
+        if evaluated in FALSE_VALUES:
+            return False
+        # The presence of a value is generally regarded as truthy, so we treat it as such
+        return True
@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.types import Config
@@ -39,6 +39,17 @@ class InterpolatedString:
         """
         return self._interpolation.eval(self.string, config, self.default, parameters=self._parameters, **kwargs)
 
+    def eval_for_records(self, config: Config, records: Iterable[Mapping[str, Any]], **kwargs: Any) -> List[Any]:
+        """
+        Interpolates the input string for each record, exposing the record as `record` in the context.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param records: The records to evaluate the string against
+        :param kwargs: Optional parameters used for interpolation
+        :return: The interpolated values, in the same order as the records
+        """
+        return self._interpolation.eval_for_records(self.string, config, records, self.default, parameters=self._parameters, **kwargs)
+
     def __eq__(self, other):
         if not isinstance(other, InterpolatedString):
             return False
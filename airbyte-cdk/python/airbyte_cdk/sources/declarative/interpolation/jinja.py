@@ -3,16 +3,42 @@
 #
 
 import ast
-from typing import Any, Optional, Tuple, Type
+import copy
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
+# Templates and literals are evaluated for every record or request so the result of their compilation is cached
+_CACHE_SIZE = 4096
+_IMMUTABLE_LITERAL_TYPES = (str, bytes, int, float, complex, bool, type(None))
+_NOT_A_LITERAL = object()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_literal(value: str) -> Any:
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return _NOT_A_LITERAL
+
+
+def _is_static(s: str) -> bool:
+    """
+    :return: True if rendering the string as a template would return it unchanged
+    """
+    if "{{" in s or "{%" in s or "{#" in s:
+        return False
+    # Jinja also normalizes the newlines and strips a single trailing newline when rendering
+    return "\r" not in s and not s.endswith("\n")
+
 
 class JinjaInterpolation(Interpolation):
     """
@@ -49,6 +75,7 @@ class JinjaInterpolation(Interpolation):
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
     def __init__(self):
+        self._compiled_templates: "OrderedDict[str, Tuple[Template, FrozenSet[str]]]" = OrderedDict()
         self._environment = Environment()
         self._environment.filters.update(**filters)
         self._environment.globals.update(**macros)
@@ -66,6 +93,44 @@ class JinjaInterpolation(Interpolation):
         valid_types: Optional[Tuple[Type[Any]]] = None,
         **additional_parameters,
     ):
+        context = self._create_context(config, **additional_parameters)
+        return self._eval_with_context(input_str, context, default, valid_types)
+
+    def eval_for_records(
+        self,
+        input_str: str,
+        config: Config,
+        records: Iterable[Mapping[str, Any]],
+        default: Optional[str] = None,
+        valid_types: Optional[Tuple[Type[Any]]] = None,
+        **additional_parameters: Any,
+    ) -> List[Any]:
+        """
+        Interpolates the input string once per record, exposing each record as `record` in the context. The result is the same as calling
+        `eval` for every record but the context is only built once for the whole batch and the template is only rendered once if it does
+        not reference the record.
+
+        :param input_str: The string to interpolate
+        :param config: The user-provided configuration as specified by the source's spec
+        :param records: The records to evaluate the string against
+        :param default: Default value to return if the evaluation returns an empty string
+        :param valid_types: The types the evaluated value can be literal evaluated to
+        :param additional_parameters: Optional parameters used for interpolation
+        :return: The interpolated values, in the same order as the records
+        """
+        records = list(records)
+        context = self._create_context(config, record=None, **additional_parameters)
+        if records and not self._references_record(input_str, default):
+            value = self._eval_with_context(input_str, context, default, valid_types)
+            if isinstance(value, _IMMUTABLE_LITERAL_TYPES):
+                return [value] * len(records)
+        values = []
+        for record in records:
+            context["record"] = record
+            values.append(self._eval_with_context(input_str, context, default, valid_types))
+        return values
+
+    def _create_context(self, config: Config, **additional_parameters: Any) -> Dict[str, Any]:
         context = {"config": config, **additional_parameters}
 
         for alias, equivalent in self.ALIASES.items():
@@ -76,7 +141,11 @@ class JinjaInterpolation(Interpolation):
                 )
             elif equivalent in context:
                 context[alias] = context[equivalent]
+        return context
 
+    def _eval_with_context(
+        self, input_str: str, context: Mapping[str, Any], default: Optional[str], valid_types: Optional[Tuple[Type[Any]]]
+    ) -> Any:
         try:
             if isinstance(input_str, str):
                 result = self._eval(input_str, context)
@@ -90,24 +159,54 @@ class JinjaInterpolation(Interpolation):
         # If result is empty or resulted in an undefined error, evaluate and return the default string
         return self._literal_eval(self._eval(default, context), valid_types)
 
+    def _references_record(self, *templates: Optional[str]) -> bool:
+        for template in templates:
+            if isinstance(template, str) and not _is_static(template) and "record" in self._compile(template)[1]:
+                return True
+        return False
+
     def _literal_eval(self, result, valid_types: Optional[Tuple[Type[Any]]]):
-        try:
-            evaluated = ast.literal_eval(result)
-        except (ValueError, SyntaxError):
-            return result
+        if isinstance(result, str):
+            evaluated = _parse_literal(result)
+            if evaluated is _NOT_A_LITERAL:
+                return result
+            if not isinstance(evaluated, _IMMUTABLE_LITERAL_TYPES):
+                # The cached value must not be modified by the caller
+                evaluated = copy.deepcopy(evaluated)
+        else:
+            try:
+                evaluated = ast.literal_eval(result)
+            except (ValueError, SyntaxError):
+                return result
         if not valid_types or (valid_types and isinstance(evaluated, valid_types)):
             return evaluated
         return result
 
     def _eval(self, s: str, context):
         try:
-            ast = self._environment.parse(s)
-            undeclared = meta.find_undeclared_variables(ast)
+            if _is_static(s):
+                return s
+            template, undeclared = self._compile(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)
+            return template.render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+    def _compile(self, s: str) -> Tuple[Template, FrozenSet[str]]:
+        """
+        :return: The compiled template along with the variables it uses that are not defined within the template
+        """
+        compiled_template = self._compiled_templates.get(s)
+        if compiled_template is not None:
+            self._compiled_templates.move_to_end(s)
+            return compiled_template
+        ast = self._environment.parse(s)
+        compiled_template = self._environment.from_string(ast), frozenset(meta.find_undeclared_variables(ast))
+        self._compiled_templates[s] = compiled_template
+        if len(self._compiled_templates) > _CACHE_SIZE:
+            self._compiled_templates.popitem(last=False)
+        return compiled_template
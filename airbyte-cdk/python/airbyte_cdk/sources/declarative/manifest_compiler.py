@@ -0,0 +1,45 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import argparse
+import sys
+from typing import List, Optional
+
+from airbyte_cdk.sources.declarative.compiled_manifest import get_compiled_manifest_path, get_manifest_digest
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+
+
+def compile_manifest_file(path_to_yaml: str, output_path: Optional[str] = None) -> str:
+    """
+    Resolve and validate the manifest of a yaml file and write the result next to it, where YamlDeclarativeSource reads it from. This
+    is meant to be run when the connector is built, with the version of the CDK the connector runs with. The compiled manifest has to be
+    included in the package data of the connector, like the yaml file.
+
+    :param path_to_yaml: Path to the yaml file describing the source
+    :param output_path: Path of the compiled manifest. Defaults to the path YamlDeclarativeSource reads it from.
+    :return: The path of the compiled manifest
+    """
+    with open(path_to_yaml, "rb") as yaml_file:
+        content = yaml_file.read()
+    source = ManifestDeclarativeSource(YamlDeclarativeSource._parse(content.decode()))
+    compiled_manifest = source.compile(get_manifest_digest(content))
+
+    output_path = output_path or get_compiled_manifest_path(path_to_yaml)
+    with open(output_path, "w") as compiled_manifest_file:
+        compiled_manifest_file.write(compiled_manifest.dumps())
+    return output_path
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile the manifest of a low-code connector to speed up the start of the connector")
+    parser.add_argument("path_to_yaml", help="Path to the yaml file describing the source")
+    parser.add_argument("--output", help="Path of the compiled manifest. Defaults to the yaml file path with the .compiled.json extension")
+    parsed_args = parser.parse_args(args)
+    output_path = compile_manifest_file(parsed_args.path_to_yaml, parsed_args.output)
+    print(f"Compiled {parsed_args.path_to_yaml} to {output_path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
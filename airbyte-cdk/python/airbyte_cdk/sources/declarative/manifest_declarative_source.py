@@ -4,12 +4,10 @@
 
 import json
 import logging
-import pkgutil
 import re
 from importlib import metadata
 from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
-import yaml
 from airbyte_cdk.models import (
     AirbyteConnectionStatus,
     AirbyteMessage,
@@ -18,6 +16,7 @@ from airbyte_cdk.models import (
     ConnectorSpecification,
 )
 from airbyte_cdk.sources.declarative.checks.connection_checker import ConnectionChecker
+from airbyte_cdk.sources.declarative.compiled_manifest import CompiledManifest, get_declarative_component_schema_validator
 from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
@@ -29,8 +28,7 @@ from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.core import Stream
 from airbyte_cdk.sources.utils.slice_logger import AlwaysLogSliceLogger, DebugSliceLogger, SliceLogger
-from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
+from jsonschema.exceptions import ValidationError, best_match
 
 
 class ManifestDeclarativeSource(DeclarativeSource):
@@ -40,38 +38,60 @@ class ManifestDeclarativeSource(DeclarativeSource):
 
     def __init__(
         self,
-        source_config: ConnectionDefinition,
+        source_config: Union[ConnectionDefinition, CompiledManifest],
         debug: bool = False,
         emit_connector_builder_messages: bool = False,
         component_factory: Optional[ModelToComponentFactory] = None,
     ):
         """
-        :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
+        :param source_config(Union[Mapping[str, Any], CompiledManifest]): The manifest of low-code components that describe the source connector,
+            or the manifest compiled when the connector was built to skip resolving and validating it
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
-        # For ease of use we don't require the type to be specified at the top level manifest, but it should be included during processing
-        manifest = dict(source_config)
-        if "type" not in manifest:
-            manifest["type"] = "DeclarativeSource"
-
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
+        if isinstance(source_config, CompiledManifest):
+            if not source_config.is_up_to_date():
+                raise ValueError(
+                    f"The manifest was compiled with airbyte-cdk {source_config.cdk_version} and has to be compiled again with the current "
+                    f"version {metadata.version('airbyte_cdk')}"
+                )
+            self._source_config = source_config.manifest
+        else:
+            self._source_config = self._resolve_manifest(source_config)
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
 
-        self._validate_source()
+        if not isinstance(source_config, CompiledManifest):
+            # Compiled manifests were validated when they were compiled
+            self._validate_source()
+
+    @staticmethod
+    def _resolve_manifest(source_config: ConnectionDefinition) -> Mapping[str, Any]:
+        # For ease of use we don't require the type to be specified at the top level manifest, but it should be included during processing
+        manifest = dict(source_config)
+        if "type" not in manifest:
+            manifest["type"] = "DeclarativeSource"
+
+        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+        return ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
         return self._source_config
 
+    def compile(self, source_digest: Optional[str] = None) -> CompiledManifest:
+        """
+        :param source_digest: Digest of the file the manifest was read from, used to detect when the compiled manifest is outdated
+        :return: The resolved and validated manifest of the source, from which the source can be created again without resolving and
+            validating it
+        """
+        return CompiledManifest.create(self._source_config, source_digest)
+
     @property
     def message_repository(self) -> Union[None, MessageRepository]:
         return self._message_repository
@@ -148,23 +168,15 @@ class ManifestDeclarativeSource(DeclarativeSource):
         """
         Validates the connector manifest against the declarative component schema
         """
-        try:
-            raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
-            if raw_component_schema is not None:
-                declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
-            else:
-                raise RuntimeError("Failed to read manifest component json schema required for validation")
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
+        validator = get_declarative_component_schema_validator()
 
         streams = self._source_config.get("streams")
         if not streams:
             raise ValidationError(f"A valid manifest should have at least one stream defined. Got {streams}")
 
-        try:
-            validate(self._source_config, declarative_component_schema)
-        except ValidationError as e:
-            raise ValidationError("Validation against json schema defined in declarative_component_schema.yaml schema failed") from e
+        error = best_match(validator.iter_errors(self._source_config))
+        if error is not None:
+            raise ValidationError("Validation against json schema defined in declarative_component_schema.yaml schema failed") from error
 
         cdk_version = metadata.version("airbyte_cdk")
         cdk_major, cdk_minor, cdk_patch = self._get_version_parts(cdk_version, "airbyte-cdk")
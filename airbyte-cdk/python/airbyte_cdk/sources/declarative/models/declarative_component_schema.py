@@ -694,6 +694,15 @@ class LegacySessionTokenAuthenticator(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal['StreamingJsonDecoder']
+    chunk_size: Optional[int] = Field(
+        65536,
+        description='Number of bytes of the response decoded at once.',
+        title='Chunk Size',
+    )
+
+
 class WaitTimeFromHeader(BaseModel):
     type: Literal['WaitTimeFromHeader']
     header: str = Field(
@@ -806,7 +815,7 @@ class CursorPagination(BaseModel):
         ],
         title='Stop Condition',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -933,7 +942,7 @@ class DefaultPaginator(BaseModel):
         description='Strategy defining how records are paginated.',
         title='Pagination Strategy',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -956,7 +965,7 @@ class DpathExtractor(BaseModel):
         ],
         title='Field Path',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -1074,6 +1083,17 @@ class DeclarativeStream(BaseModel):
         description='Component used to fetch data incrementally based on a time field in the data.',
         title='Incremental Sync',
     )
+    max_partitions: Optional[int] = Field(
+        None,
+        description='Maximum number of partitions having their own state when the stream has both an incremental sync and a partition router. When exceeded, the least recently synced partitions share a state which is the earliest of their states, so their records can be synced again. If not set, the number of partitions is not bounded.',
+        examples=[10000],
+        title='Maximum Number of Partitions',
+    )
+    compress_state: Optional[bool] = Field(
+        False,
+        description='If true and the stream has both an incremental sync and a partition router, the states of the partitions are emitted as a compressed string which is usually several times smaller.',
+        title='Compress State',
+    )
     name: Optional[str] = Field(
         '', description='The stream name.', example=['Users'], title='Name'
     )
@@ -23,7 +23,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import InterpolatedStri
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import Cursor, CursorFactory, DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -79,6 +79,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SessionTokenAuthenticator as SessionTokenAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitUntilTimeFromHeader as WaitUntilTimeFromHeaderModel
@@ -188,6 +189,7 @@ class ModelToComponentFactory:
             LegacySessionTokenAuthenticatorModel: self.create_legacy_session_token_authenticator,
             SimpleRetrieverModel: self.create_simple_retriever,
             SpecModel: self.create_spec,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             SubstreamPartitionRouterModel: self.create_substream_partition_router,
             WaitTimeFromHeaderModel: self.create_wait_time_from_header,
             WaitUntilTimeFromHeaderModel: self.create_wait_until_time_from_header,
@@ -585,6 +587,8 @@ class ModelToComponentFactory:
                     lambda: self._create_component_from_model(model=incremental_sync_model, config=config),
                 ),
                 partition_router=stream_slicer,
+                max_partitions=model.max_partitions,
+                compress_state=model.compress_state or False,
             )
         elif model.incremental_sync:
             return self._create_component_from_model(model=model.incremental_sync, config=config) if model.incremental_sync else None
@@ -844,7 +848,7 @@ class ModelToComponentFactory:
         return RequestOption(field_name=model.field_name, inject_into=inject_into, parameters={})
 
     def create_record_selector(
-        self, model: RecordSelectorModel, config: Config, *, transformations: List[RecordTransformation], **kwargs: Any
+        self, model: RecordSelectorModel, config: Config, *, transformations: List[RecordTransformation], name: str = "", **kwargs: Any
     ) -> RecordSelector:
         extractor = self._create_component_from_model(model=model.extractor, config=config)
         record_filter = self._create_component_from_model(model.record_filter, config=config) if model.record_filter else None
@@ -855,6 +859,7 @@ class ModelToComponentFactory:
             record_filter=record_filter,
             transformations=transformations,
             parameters=model.parameters or {},
+            name=name,
         )
 
     @staticmethod
@@ -890,7 +895,11 @@ class ModelToComponentFactory:
         transformations: List[RecordTransformation],
     ) -> SimpleRetriever:
         requester = self._create_component_from_model(model=model.requester, config=config, name=name)
-        record_selector = self._create_component_from_model(model=model.record_selector, config=config, transformations=transformations)
+        if isinstance(requester, HttpRequester) and self._reads_response_incrementally(model):
+            requester.stream_response = True
+        record_selector = self._create_component_from_model(
+            model=model.record_selector, config=config, transformations=transformations, name=name
+        )
         url_base = model.requester.url_base if hasattr(model.requester, "url_base") else requester.get_url_base()
         stream_slicer = stream_slicer or SinglePartitionRouter(parameters={})
         cursor = stream_slicer if isinstance(stream_slicer, Cursor) else None
@@ -929,6 +938,24 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
+    @staticmethod
+    def _reads_response_incrementally(model: SimpleRetrieverModel) -> bool:
+        """
+        A streamed response can only be read once so it is only requested when the records are extracted with a StreamingJsonDecoder
+        and the paginator either does not read the response or reads it with a StreamingJsonDecoder too
+        """
+        extractor = model.record_selector.extractor
+        if not isinstance(extractor, DpathExtractorModel) or not isinstance(extractor.decoder, StreamingJsonDecoderModel):
+            return False
+        if model.paginator is None or isinstance(model.paginator, NoPaginationModel):
+            return True
+        if not isinstance(model.paginator, DefaultPaginatorModel):
+            return False
+        strategy = model.paginator.pagination_strategy
+        return isinstance(strategy, PageIncrementModel) or (
+            isinstance(strategy, CursorPaginationModel) and isinstance(strategy.decoder, StreamingJsonDecoderModel)
+        )
+
     @staticmethod
     def create_spec(model: SpecModel, config: Config, **kwargs: Any) -> Spec:
         return Spec(
@@ -938,6 +965,12 @@ class ModelToComponentFactory:
             parameters={},
         )
 
+    @staticmethod
+    def create_streaming_json_decoder(model: StreamingJsonDecoderModel, config: Config, **kwargs: Any) -> StreamingJsonDecoder:
+        if model.chunk_size is not None:
+            return StreamingJsonDecoder(chunk_size=model.chunk_size, parameters={})
+        return StreamingJsonDecoder(parameters={})
+
     def create_substream_partition_router(
         self, model: SubstreamPartitionRouterModel, config: Config, **kwargs: Any
     ) -> SubstreamPartitionRouter:
@@ -12,6 +12,7 @@ from airbyte_cdk.sources.declarative.requesters.request_option import RequestOpt
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.streams.parent_record_cache import read_parent_records
 
 
 @dataclass
@@ -131,9 +132,8 @@ class SubstreamPartitionRouter(StreamSlicer):
                     empty_parent_slice = True
                     parent_slice = parent_stream_slice
 
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
+                    # The parent records are shared with the other children of the parent and read ahead while the slices are processed
+                    for parent_record in read_parent_records(parent_stream, parent_stream_slice):
                         # Skip non-records (eg AirbyteLogMessage)
                         if isinstance(parent_record, AirbyteMessage):
                             if parent_record.type == Type.RECORD:
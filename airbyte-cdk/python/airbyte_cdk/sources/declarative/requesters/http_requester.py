@@ -25,9 +25,12 @@ from airbyte_cdk.sources.declarative.requesters.request_options.interpolated_req
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod, Requester
 from airbyte_cdk.sources.declarative.types import Config, StreamSlice, StreamState
 from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
+from airbyte_cdk.sources.streams.call_rate import APIBudget, get_default_api_budget
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.http import BODY_REQUEST_METHODS
 from airbyte_cdk.sources.streams.http.rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from airbyte_cdk.sources.streams.http.transport import HttpTransport, get_default_transport
+from airbyte_cdk.utils.instrumentation import Stage, get_instrumentation
 from airbyte_cdk.utils.mapping_helpers import combine_mappings
 from requests.auth import AuthBase
 
@@ -46,6 +49,10 @@ class HttpRequester(Requester):
         authenticator (DeclarativeAuthenticator): Authenticator defining how to authenticate to the source
         error_handler (Optional[ErrorHandler]): Error handler defining how to detect and handle errors
         config (Config): The user-provided configuration as specified by the source's spec
+        transport (Optional[HttpTransport]): Connection pools used to send the requests. Defaults to the transport shared by every stream
+        api_budget (Optional[APIBudget]): Call rate policies the requests must respect. Defaults to the budget shared by every stream
+        stream_response (bool): Whether the body of the responses is downloaded while it is read instead of when the response is received.
+            Only set it when the body is read once, by components decoding it incrementally
     """
 
     name: str
@@ -59,6 +66,9 @@ class HttpRequester(Requester):
     error_handler: Optional[ErrorHandler] = None
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
+    transport: Optional[HttpTransport] = None
+    api_budget: Optional[APIBudget] = None
+    stream_response: bool = False
 
     _DEFAULT_MAX_RETRY = 5
     _DEFAULT_RETRY_FACTOR = 5
@@ -78,6 +88,7 @@ class HttpRequester(Requester):
         self._parameters = parameters
         self.decoder = JsonDecoder(parameters={})
         self._session = requests.Session()
+        (self.transport or get_default_transport()).mount(self._session)
 
         if isinstance(self._authenticator, AuthBase):
             self._session.auth = self._authenticator
@@ -430,8 +441,8 @@ class HttpRequester(Requester):
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
 
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)  # type: ignore # we don't pass in kwargs to the backoff handler
-        backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self._DEFAULT_RETRY_FACTOR)
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, stream_name=self.name)(self._send)  # type: ignore # we don't pass in kwargs to the backoff handler
+        backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self._DEFAULT_RETRY_FACTOR, stream_name=self.name)
         # backoff handlers wrap _send, so it will always return a response
         return backoff_handler(user_backoff_handler)(request, log_formatter=log_formatter)  # type: ignore
 
@@ -461,8 +472,14 @@ class HttpRequester(Requester):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request)
-        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
+        api_budget = self.api_budget or get_default_api_budget()
+        api_budget.acquire_call(request)
+        with get_instrumentation().measure(Stage.HTTP_REQUEST, self.name):
+            response: requests.Response = self._session.send(request, stream=self.stream_response)
+        api_budget.update_from_response(request, response)
+        # Logging the body of a streamed response would download it before it is decoded
+        body = None if self.stream_response else response.text
+        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": body})
         if log_formatter:
             formatter = log_formatter
             self.message_repository.log_message(
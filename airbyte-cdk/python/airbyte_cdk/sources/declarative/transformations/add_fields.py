@@ -10,6 +10,31 @@ from airbyte_cdk.sources.declarative.interpolation.interpolated_string import In
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import Config, FieldPointer, Record, StreamSlice, StreamState
 
+_MISSING = object()
+
+
+def _set_value(record: Mapping[str, Any], path: FieldPointer, value: Any) -> None:
+    """
+    Equivalent of dpath.util.new(record, path, value). Walking nested objects is done directly as dpath is slow because it handles any
+    kind of container. Paths going through anything else than objects are delegated to dpath.
+    """
+    if not isinstance(path, list):
+        dpath.util.new(record, path, value)
+        return
+    current: Any = record
+    for segment in path[:-1]:
+        if type(current) is not dict or type(segment) is not str:
+            dpath.util.new(record, path, value)
+            return
+        child = current.get(segment, _MISSING)
+        if child is _MISSING:
+            child = current[segment] = {}
+        current = child
+    if type(current) is not dict or type(path[-1]) is not str:
+        dpath.util.new(record, path, value)
+        return
+    current[path[-1]] = value
+
 
 @dataclass(frozen=True)
 class AddedFieldDefinition:
@@ -112,9 +137,23 @@ class AddFields(RecordTransformation):
         kwargs = {"record": record, "stream_state": stream_state, "stream_slice": stream_slice}
         for parsed_field in self._parsed_fields:
             value = parsed_field.value.eval(config, **kwargs)
-            dpath.util.new(record, parsed_field.path, value)
+            _set_value(record, parsed_field.path, value)
 
         return record
 
+    def transform_records(
+        self,
+        records: List[Mapping[str, Any]],
+        config: Optional[Config] = None,
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> None:
+        # Each field is evaluated for the whole page before moving to the next one. Since a field is added to every record before the
+        # next field is evaluated, the values of the previous fields are still available to the next ones.
+        for parsed_field in self._parsed_fields:
+            values = parsed_field.value.eval_for_records(config or {}, records, stream_state=stream_state, stream_slice=stream_slice)
+            for record, value in zip(records, values):
+                _set_value(record, parsed_field.path, value)
+
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
@@ -10,6 +10,49 @@ import dpath.util
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import Config, FieldPointer, StreamSlice, StreamState
 
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+def _is_literal_pointer(pointer: FieldPointer) -> bool:
+    """
+    :return: True if the pointer only matches the path made of its segments, meaning its segments are not globs
+    """
+    return (
+        isinstance(pointer, list)
+        and len(pointer) > 0
+        and all(type(segment) is str and segment and not _GLOB_CHARACTERS.intersection(segment) for segment in pointer)
+    )
+
+
+def _delete_with_dpath(record: Mapping[str, Any], pointer: FieldPointer) -> None:
+    # the dpath library by default doesn't delete fields from arrays
+    try:
+        dpath.util.delete(record, pointer)
+    except dpath.exceptions.PathNotFound:
+        # if the (potentially nested) property does not exist, silently skip
+        pass
+
+
+def _delete_literal_pointer(record: Mapping[str, Any], pointer: FieldPointer) -> None:
+    """
+    Equivalent of dpath.util.delete(record, pointer) for a pointer which is not a glob. dpath walks the whole record to find the paths
+    matching the pointer which is slow on large records so nested objects are walked directly. Paths going through anything else than
+    objects are delegated to dpath.
+    """
+    current = record
+    for segment in pointer[:-1]:
+        if type(current) is not dict:
+            _delete_with_dpath(record, pointer)
+            return
+        if segment not in current:
+            return
+        current = current[segment]
+    # dpath handles objects having a 0 key like lists
+    if type(current) is not dict or 0 in current:
+        _delete_with_dpath(record, pointer)
+        return
+    current.pop(pointer[-1], None)
+
 
 @dataclass
 class RemoveFields(RecordTransformation):
@@ -41,6 +84,9 @@ class RemoveFields(RecordTransformation):
     field_pointers: List[FieldPointer]
     parameters: InitVar[Mapping[str, Any]]
 
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        self._is_literal_pointer = [_is_literal_pointer(pointer) for pointer in self.field_pointers]
+
     def transform(
         self,
         record: Mapping[str, Any],
@@ -52,12 +98,10 @@ class RemoveFields(RecordTransformation):
         :param record: The record to be transformed
         :return: the input record with the requested fields removed
         """
-        for pointer in self.field_pointers:
-            # the dpath library by default doesn't delete fields from arrays
-            try:
-                dpath.util.delete(record, pointer)
-            except dpath.exceptions.PathNotFound:
-                # if the (potentially nested) property does not exist, silently skip
-                pass
+        for pointer, is_literal_pointer in zip(self.field_pointers, self._is_literal_pointer):
+            if is_literal_pointer:
+                _delete_literal_pointer(record, pointer)
+            else:
+                _delete_with_dpath(record, pointer)
 
         return record
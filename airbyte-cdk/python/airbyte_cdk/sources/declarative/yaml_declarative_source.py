@@ -2,31 +2,63 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import logging
 import pkgutil
+from typing import Optional
 
 import yaml
+from airbyte_cdk.sources.declarative.compiled_manifest import CompiledManifest, get_compiled_manifest_path, get_manifest_digest
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 
+logger = logging.getLogger("airbyte")
+
 
 class YamlDeclarativeSource(ManifestDeclarativeSource):
-    """Declarative source defined by a yaml file"""
+    """
+    Declarative source defined by a yaml file
+
+    If the manifest was compiled when the connector was built (see airbyte_cdk.sources.declarative.manifest_compiler), the source is
+    created from the compiled manifest next to the yaml file, as long as it is up to date, instead of resolving and validating the manifest.
+    """
 
     def __init__(self, path_to_yaml, debug: bool = False):
         """
         :param path_to_yaml: Path to the yaml file describing the source
         """
         self._path_to_yaml = path_to_yaml
-        source_config = self._read_and_parse_yaml_file(path_to_yaml)
+        source_config = self._read_compiled_manifest(path_to_yaml) or self._read_and_parse_yaml_file(path_to_yaml)
         super().__init__(source_config, debug)
 
     def _read_and_parse_yaml_file(self, path_to_yaml_file) -> ConnectionDefinition:
-        package = self.__class__.__module__.split(".")[0]
-
-        yaml_config = pkgutil.get_data(package, path_to_yaml_file)
+        yaml_config = self._read_file(path_to_yaml_file)
         decoded_yaml = yaml_config.decode()
         return self._parse(decoded_yaml)
 
+    def _read_compiled_manifest(self, path_to_yaml_file: str) -> Optional[CompiledManifest]:
+        try:
+            compiled_manifest_content = self._read_file(get_compiled_manifest_path(path_to_yaml_file))
+        except OSError:
+            return None
+        try:
+            compiled_manifest = CompiledManifest.loads(compiled_manifest_content.decode())
+        except (json.JSONDecodeError, ValueError, KeyError, AttributeError, TypeError) as exception:
+            # The manifest is still valid so a corrupted or incompatible compiled manifest only slows the start down
+            logger.warning(f"The compiled manifest of {path_to_yaml_file} could not be read, compile the manifest again: {exception}")
+            return None
+        if not compiled_manifest.is_up_to_date(get_manifest_digest(self._read_file(path_to_yaml_file))):
+            logger.warning(f"The compiled manifest of {path_to_yaml_file} is outdated, compile the manifest again to speed up the start")
+            return None
+        return compiled_manifest
+
+    def _read_file(self, path: str) -> bytes:
+        package = self.__class__.__module__.split(".")[0]
+        content = pkgutil.get_data(package, path)
+        if content is None:
+            raise FileNotFoundError(f"Could not read {path} from package {package}")
+        return content
+
     def _emit_manifest_debug_message(self, extra_args: dict):
         extra_args["path_to_yaml"] = self._path_to_yaml
         self.logger.debug("declarative source created from parsed YAML manifest", extra=extra_args)
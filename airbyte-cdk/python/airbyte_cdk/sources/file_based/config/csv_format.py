@@ -142,6 +142,12 @@ class CsvFormat(BaseModel):
         description="How to infer the types of the columns. If none, inference default to strings.",
         airbyte_hidden=True,
     )
+    values_contain_no_line_breaks: bool = Field(
+        title="Values Contain No Line Breaks",
+        default=False,
+        description="Whether every value of the files fits on a single line. Files are only split into byte ranges when this is true, as a quoted value containing a line break could be split across two ranges.",
+        airbyte_hidden=True,
+    )
 
     @validator("delimiter")
     def validate_delimiter(cls, v: str) -> str:
@@ -59,6 +59,26 @@ class FileBasedStreamConfig(BaseModel):
         description="When enabled, syncs will not validate or structure records against the stream's schema.",
         default=False,
     )
+    partitions_to_prefetch: int = Field(
+        title="Partitions To Prefetch",
+        description="The number of file partitions read and parsed ahead of the partition whose records are being synced. A file is a single partition unless it is split according to Bytes Per File Partition. Files are read one after the other when 0. Prefetching requires the stream reader to be safe to use from several threads.",
+        default=0,
+        ge=0,
+        airbyte_hidden=True,
+    )
+    max_prefetched_records: int = Field(
+        title="Max Prefetched Records",
+        description="The maximum number of records held in memory for the files, or file partitions, being read when files are prefetched.",
+        default=10_000,
+        gt=0,
+        airbyte_hidden=True,
+    )
+    bytes_per_file_partition: Optional[int] = Field(
+        title="Bytes Per File Partition",
+        description="Files larger than this number of bytes are split into partitions of about this size, which are prefetched like files. CSV and JSONL files are split on line breaks so their records should not span multiple lines, and CSV files are only split if their format states that values contain no line breaks. Files are not split if not set.",
+        gt=0,
+        airbyte_hidden=True,
+    )
 
     @validator("input_schema", pre=True)
     def validate_input_schema(cls, v: Optional[str]) -> Optional[str]:
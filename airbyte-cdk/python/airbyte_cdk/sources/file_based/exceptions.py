@@ -20,6 +20,7 @@ class FileBasedSourceError(Enum):
         "Error opening file. Please check the credentials provided in the config and verify that they provide permission to read files."
     )
     ERROR_PARSING_RECORD = "Error parsing record. This could be due to a mismatch between the config's file type and the actual file type, or because the file or record is not parseable."
+    ERROR_PARSING_RECORD_TOO_LARGE = "A record spans more bytes than the maximum size of a record. Please verify that the file is a valid JSONL file, with one JSON object per line."
     ERROR_PARSING_USER_PROVIDED_SCHEMA = "The provided schema could not be transformed into valid JSON Schema."
     ERROR_VALIDATING_RECORD = "One or more records do not pass the schema validation policy. Please modify your input schema, or select a more lenient validation policy."
     ERROR_PARSING_RECORD_MISMATCHED_COLUMNS = "A header field has resolved to `None`. This indicates that the CSV has more rows than the number of header fields. If you input your schema or headers, please verify that the number of columns corresponds to the number of columns in your CSV's rows."
@@ -7,12 +7,15 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
 from io import IOBase
-from typing import Iterable, List, Optional, Set
+from typing import Iterable, Iterator, List, Optional, Set
 
 from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from wcmatch.glob import GLOBSTAR, globmatch
 
+# Files with these extensions are decompressed when opened, so offsets in the file read do not match offsets in the remote file
+COMPRESSED_FILE_EXTENSIONS = (".bz2", ".gz", ".lz4", ".xz", ".zip", ".zst")
+
 
 class FileReadMode(Enum):
     READ = "r"
@@ -56,6 +59,43 @@ class AbstractFileBasedStreamReader(ABC):
         """
         ...
 
+    def open_file_range(self, file: RemoteFile, start: int, logger: logging.Logger) -> IOBase:
+        """
+        Return a binary file handle reading the file from byte `start`.
+
+        The default implementation seeks the handle returned by `open_file`. Sources able to request a range of a file, for example with
+        the Range header of an HTTP request, can override it so the bytes before `start` are not transferred.
+        """
+        fp = self.open_file(file, FileReadMode.READ_BINARY, None, logger)
+        fp.seek(start)
+        return fp
+
+    def can_read_byte_ranges(self, file: RemoteFile) -> bool:
+        """
+        Whether the file can be split into byte ranges read with `open_file_range`. The size of the file has to be known, and compressed
+        files cannot be split as they are decompressed when opened.
+        """
+        return file.size is not None and not file.uri.lower().endswith(COMPRESSED_FILE_EXTENSIONS)
+
+    def read_lines_in_range(self, file: RemoteFile, start: int, end: int, logger: logging.Logger) -> Iterator[bytes]:
+        """
+        Yield the lines of the file starting in the byte range [start, end).
+
+        The line the range starts in the middle of is left to the previous range, and the last line starting in the range is read until
+        its end, so contiguous ranges yield every line of the file exactly once.
+        """
+        # Reading from the byte before the range tells if a line starts exactly at `start`
+        position = max(start - 1, 0)
+        with self.open_file_range(file, position, logger) as fp:
+            if start > 0:
+                position += len(fp.readline())
+            while position < end:
+                line = fp.readline()
+                if not line:
+                    return
+                position += len(line)
+                yield line
+
     @abstractmethod
     def get_matching_files(
         self,
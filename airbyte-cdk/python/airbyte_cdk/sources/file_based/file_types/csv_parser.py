@@ -3,14 +3,20 @@
 #
 
 import csv
+import io
 import json
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from functools import partial
 from io import IOBase
-from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set
+from itertools import islice
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
@@ -19,9 +25,18 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFile
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING, SchemaType
+from airbyte_cdk.utils.constants import ENV_CSV_ENGINE
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 DIALECT_NAME = "_config_dialect"
+ARROW_CSV_ENGINE = "arrow"
+
+# Values of each column of consecutive rows of a file, by header
+_ColumnBatch = Dict[str, List[Any]]
+
+# Files of a stream can be read concurrently, so a dialect is only unregistered once no file uses it anymore
+_dialect_lock = threading.Lock()
+_dialect_users: Dict[str, int] = defaultdict(int)
 
 
 class _CsvReader:
@@ -36,49 +51,122 @@ class _CsvReader:
         config_format = _extract_format(config)
         lineno = 0
 
-        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
-        # We don't unregister the dialect because we are lazily parsing each csv file to generate records
-        # This will potentially be a problem if we ever process multiple streams concurrently
-        dialect_name = config.name + DIALECT_NAME
-        csv.register_dialect(
-            dialect_name,
-            delimiter=config_format.delimiter,
-            quotechar=config_format.quote_char,
-            escapechar=config_format.escape_char,
-            doublequote=config_format.double_quote,
-            quoting=csv.QUOTE_MINIMAL,
-        )
+        dialect_name = self._register_dialect(config, config_format)
         with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
             headers = self._get_headers(fp, config_format, dialect_name)
 
-            rows_to_skip = (
-                config_format.skip_rows_before_header
-                + (1 if config_format.header_definition.has_header_row() else 0)
-                + config_format.skip_rows_after_header
-            )
+            rows_to_skip = self._rows_to_skip(config_format)
             self._skip_rows(fp, rows_to_skip)
             lineno += rows_to_skip
 
             reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
             try:
-                for row in reader:
-                    lineno += 1
-
-                    # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
-                    # than headers or more headers dans columns
-                    if None in row:
-                        raise RecordParseError(
-                            FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS,
-                            filename=file.uri,
-                            lineno=lineno,
-                        )
-                    if None in row.values():
-                        raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS, filename=file.uri, lineno=lineno)
-                    yield row
+                yield from self._check_rows(reader, file, lineno)
             finally:
                 # due to RecordParseError or GeneratorExit
+                self._unregister_dialect(dialect_name)
+
+    def read_data_in_range(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+        start: int,
+        end: int,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yield the rows of the file starting in the byte range [start, end). Ranges are aligned on lines so the values must not contain line
+        breaks. The headers are read from the beginning of the file, and line numbers in errors are relative to the start of the range.
+        """
+        config_format = _extract_format(config)
+        encoding = config_format.encoding or "utf8"
+
+        dialect_name = self._register_dialect(config, config_format)
+        try:
+            with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
+                headers = self._get_headers(fp, config_format, dialect_name)
+            with stream_reader.open_file_range(file, 0, logger) as fp:
+                # The rows skipped and the header rows can span multiple ranges so the rows are only read from the first line after them
+                data_start = sum(len(fp.readline()) for _ in range(self._rows_to_skip(config_format)))
+
+            start = max(start, data_start)
+            if start >= end:
+                return
+            lines = (line.decode(encoding) for line in stream_reader.read_lines_in_range(file, start, end, logger))
+            reader = csv.DictReader(lines, dialect=dialect_name, fieldnames=headers)  # type: ignore
+            yield from self._check_rows(reader, file, 0)
+        finally:
+            # due to RecordParseError or GeneratorExit
+            self._unregister_dialect(dialect_name)
+
+    @staticmethod
+    def _check_rows(reader: csv.DictReader, file: RemoteFile, lineno: int) -> Generator[Dict[str, Any], None, None]:  # type: ignore
+        for row in reader:
+            lineno += 1
+
+            # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
+            # than headers or more headers dans columns
+            if None in row:
+                raise RecordParseError(
+                    FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS,
+                    filename=file.uri,
+                    lineno=lineno,
+                )
+            if None in row.values():
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS, filename=file.uri, lineno=lineno)
+            yield row
+
+    def read_batches(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+        batch_size: int,
+    ) -> Generator[_ColumnBatch, None, None]:
+        """
+        Yield the rows of `read_data` as batches of at most `batch_size` rows, by column. The rows read before an error are yielded before
+        the error is raised.
+        """
+        yield from _to_column_batches(self.read_data(config, file, stream_reader, logger, file_read_mode), batch_size)
+
+    @staticmethod
+    def _register_dialect(config: FileBasedStreamConfig, config_format: CsvFormat) -> str:
+        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
+        # We don't unregister the dialect because we are lazily parsing each csv file to generate records
+        # This will potentially be a problem if we ever process multiple streams concurrently
+        dialect_name = config.name + DIALECT_NAME
+        with _dialect_lock:
+            csv.register_dialect(
+                dialect_name,
+                delimiter=config_format.delimiter,
+                quotechar=config_format.quote_char,
+                escapechar=config_format.escape_char,
+                doublequote=config_format.double_quote,
+                quoting=csv.QUOTE_MINIMAL,
+            )
+            _dialect_users[dialect_name] += 1
+        return dialect_name
+
+    @staticmethod
+    def _unregister_dialect(dialect_name: str) -> None:
+        with _dialect_lock:
+            _dialect_users[dialect_name] -= 1
+            if _dialect_users[dialect_name] <= 0:
+                del _dialect_users[dialect_name]
                 csv.unregister_dialect(dialect_name)
 
+    @staticmethod
+    def _rows_to_skip(config_format: CsvFormat) -> int:
+        return (
+            config_format.skip_rows_before_header
+            + (1 if config_format.header_definition.has_header_row() else 0)
+            + config_format.skip_rows_after_header
+        )
+
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
@@ -117,11 +205,81 @@ class _CsvReader:
             fp.readline()
 
 
+class _ArrowCsvReader(_CsvReader):
+    """
+    Reads the rows of the CSV files in blocks with the streaming CSV reader of pyarrow, which tokenizes the rows in native code.
+
+    The headers are parsed by _CsvReader and every value is read as a string so the values are the same as the ones read by _CsvReader.
+    When pyarrow cannot read the file, for instance because a row does not have as many values as there are headers or because the stream
+    reader only opens files as text, the rest of the file is read by _CsvReader so the rows and the errors raised stay the same.
+    """
+
+    BLOCK_SIZE = 4 * 1024 * 1024
+
+    def read_batches(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+        batch_size: int,
+    ) -> Generator[_ColumnBatch, None, None]:
+        config_format = _extract_format(config)
+        rows_read = 0
+        try:
+            with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+                if not isinstance(fp, io.TextIOBase):
+                    for batch in self._read_arrow_batches(fp, config, config_format):
+                        yield batch
+                        rows_read += _number_of_rows(batch)
+                    return
+        except (pa.ArrowException, ValueError) as exception:
+            logger.info(f"Could not read {file.uri} with pyarrow, reading it from row {rows_read} with the csv module: {exception}")
+
+        rows = islice(self.read_data(config, file, stream_reader, logger, file_read_mode), rows_read, None)
+        yield from _to_column_batches(rows, batch_size)
+
+    def _read_arrow_batches(self, fp: IOBase, config: FileBasedStreamConfig, config_format: CsvFormat) -> Iterator[_ColumnBatch]:
+        encoding = config_format.encoding or "utf8"
+        dialect_name = self._register_dialect(config, config_format)
+        try:
+            text_fp = io.TextIOWrapper(fp, encoding=encoding)  # type: ignore  # the file is opened in binary mode
+            headers = self._get_headers(text_fp, config_format, dialect_name)
+            text_fp.detach()
+        finally:
+            self._unregister_dialect(dialect_name)
+
+        reader = pa_csv.open_csv(
+            fp,
+            read_options=pa_csv.ReadOptions(
+                column_names=headers, skip_rows=self._rows_to_skip(config_format), encoding=encoding, block_size=self.BLOCK_SIZE
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=config_format.delimiter,
+                quote_char=config_format.quote_char,
+                double_quote=config_format.double_quote,
+                escape_char=config_format.escape_char or False,
+                newlines_in_values=True,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={header: pa.string() for header in headers}, strings_can_be_null=False, quoted_strings_can_be_null=False
+            ),
+        )
+        for record_batch in reader:
+            # Converting through numpy is an order of magnitude faster than `to_pylist` for strings
+            yield {
+                name: _translate_newlines(column).to_numpy(zero_copy_only=False).tolist()
+                for name, column in zip(record_batch.schema.names, record_batch.columns)
+            }
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
+    _BATCH_SIZE = 1_000
 
     def __init__(self, csv_reader: Optional[_CsvReader] = None):
-        self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._csv_reader = csv_reader if csv_reader else _default_csv_reader()
 
     async def infer_schema(
         self,
@@ -171,6 +329,39 @@ class CsvParser(FileTypeParser):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]],
+    ) -> Iterable[Dict[str, Any]]:
+        data_generator = self._csv_reader.read_batches(config, file, stream_reader, logger, self.file_read_mode, self._BATCH_SIZE)
+        yield from self._batches_to_records(data_generator, config, logger, discovered_schema)
+
+    def can_parse_byte_ranges(self, config: FileBasedStreamConfig) -> bool:
+        config_format = _extract_format(config)
+        # The start of a range can't tell whether a line break closes a row or is part of a quoted value, so ranges can only be parsed
+        # when the values are known to fit on a single line
+        if not config_format.values_contain_no_line_breaks:
+            return False
+        # Ranges are aligned on the line breaks found in the bytes of the file, which requires line breaks to be encoded as a single byte
+        encoding = config_format.encoding or "utf8"
+        return len("\n\n".encode(encoding)) - len("\n".encode(encoding)) == 1
+
+    def parse_records_in_range(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+        start: int,
+        end: int,
+    ) -> Iterable[Dict[str, Any]]:
+        rows = self._csv_reader.read_data_in_range(config, file, stream_reader, logger, self.file_read_mode, start, end)
+        yield from self._batches_to_records(_to_column_batches(rows, self._BATCH_SIZE), config, logger, discovered_schema)
+
+    def _batches_to_records(
+        self,
+        data_generator: Generator[_ColumnBatch, None, None],
+        config: FileBasedStreamConfig,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
     ) -> Iterable[Dict[str, Any]]:
         config_format = _extract_format(config)
         if discovered_schema:
@@ -178,10 +369,9 @@ class CsvParser(FileTypeParser):
             deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
         else:
             deduped_property_types = {}
-        cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
-        data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
-        for row in data_generator:
-            yield CsvParser._to_nullable(cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null)
+        cast_values = not config.schemaless and bool(deduped_property_types)
+        for batch in data_generator:
+            yield from CsvParser._to_records(batch, deduped_property_types, config_format, logger, cast_values)
         data_generator.close()
 
     @property
@@ -189,15 +379,64 @@ class CsvParser(FileTypeParser):
         return FileReadMode.READ
 
     @staticmethod
-    def _get_cast_function(
-        deduped_property_types: Mapping[str, str], config_format: CsvFormat, logger: logging.Logger, schemaless: bool
-    ) -> Callable[[Mapping[str, str]], Mapping[str, str]]:
-        # Only cast values if the schema is provided
-        if deduped_property_types and not schemaless:
-            return partial(CsvParser._cast_types, deduped_property_types=deduped_property_types, config_format=config_format, logger=logger)
-        else:
-            # If no schema is provided, yield the rows as they are
-            return _no_cast
+    def _to_records(
+        batch: _ColumnBatch, deduped_property_types: Mapping[str, str], config_format: CsvFormat, logger: logging.Logger, cast_values: bool
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Cast and nullify the values of the batch column by column, then yield them row by row. The records are the same as the ones
+        `_cast_types` and `_to_nullable` return for each row.
+        """
+        number_of_rows = _number_of_rows(batch)
+        columns: Dict[str, List[Any]] = {}
+        warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+        for key, values in batch.items():
+            prop_type = deduped_property_types.get(key)
+            if cast_values:
+                if prop_type not in TYPE_PYTHON_MAPPING or prop_type is None:
+                    # Like `_cast_types`, columns which are not in the schema are not output
+                    continue
+                values = CsvParser._cast_column(key, values, prop_type, config_format, warnings_by_row)
+            if config_format.null_values and (config_format.strings_can_be_null or prop_type != "string"):
+                null_values = config_format.null_values
+                values = [None if value in null_values else value for value in values]
+            columns[key] = values
+
+        keys = list(columns.keys())
+        for row_index, row in enumerate(zip(*columns.values()) if columns else (() for _ in range(number_of_rows))):
+            if row_index in warnings_by_row:
+                logger.warning(f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[row_index])}")
+            yield dict(zip(keys, row))
+
+    @staticmethod
+    def _cast_column(
+        key: str, values: List[str], prop_type: str, config_format: CsvFormat, warnings_by_row: Dict[int, List[str]]
+    ) -> List[Any]:
+        """
+        Cast the values of a column the way `_cast_types` casts each value. The whole column is cast at once and the values are only cast
+        one by one if one of them cannot be cast, to know which ones.
+        """
+        _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+        try:
+            if python_type == str:
+                return values
+            elif python_type in (int, float):
+                return [python_type(value) for value in values]
+            elif python_type == bool:
+                bool_by_value = {
+                    **{value: False for value in config_format.false_values},
+                    **{value: True for value in config_format.true_values},
+                }
+                return [bool_by_value[value] for value in values]
+        except (KeyError, ValueError):
+            pass
+
+        cast_values = []
+        for row_index, value in enumerate(values):
+            cast_value, warning = CsvParser._cast_value(key, value, prop_type, config_format)
+            if warning:
+                warnings_by_row[row_index].append(warning)
+            cast_values.append(cast_value)
+        return cast_values
 
     @staticmethod
     def _to_nullable(
@@ -259,42 +498,11 @@ class CsvParser(FileTypeParser):
 
         for key, value in row.items():
             prop_type = deduped_property_types.get(key)
-            cast_value: Any = value
 
             if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
-                _, python_type = TYPE_PYTHON_MAPPING[prop_type]
-
-                if python_type is None:
-                    if value == "":
-                        cast_value = None
-                    else:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == bool:
-                    try:
-                        cast_value = _value_to_bool(value, config_format.true_values, config_format.false_values)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == dict:
-                    try:
-                        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
-                        cast_value = json.loads(value)
-                    except json.JSONDecodeError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == list:
-                    try:
-                        cast_value = _value_to_list(value)
-                    except (ValueError, json.JSONDecodeError):
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type:
-                    try:
-                        cast_value = _value_to_python_type(value, python_type)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
+                cast_value, warning = CsvParser._cast_value(key, value, prop_type, config_format)
+                if warning:
+                    warnings.append(warning)
                 result[key] = cast_value
 
         if warnings:
@@ -303,6 +511,47 @@ class CsvParser(FileTypeParser):
             )
         return result
 
+    @staticmethod
+    def _cast_value(key: str, value: str, prop_type: str, config_format: CsvFormat) -> Tuple[Any, Optional[str]]:
+        """
+        Cast the value to the python type of `prop_type`. If it cannot be cast, the value is returned as is with a warning.
+        """
+        _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+        cast_value: Any = value
+
+        if python_type is None:
+            if value == "":
+                cast_value = None
+            else:
+                return value, _format_warning(key, value, prop_type)
+
+        elif python_type == bool:
+            try:
+                cast_value = _value_to_bool(value, config_format.true_values, config_format.false_values)
+            except ValueError:
+                return value, _format_warning(key, value, prop_type)
+
+        elif python_type == dict:
+            try:
+                # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
+                cast_value = json.loads(value)
+            except json.JSONDecodeError:
+                return value, _format_warning(key, value, prop_type)
+
+        elif python_type == list:
+            try:
+                cast_value = _value_to_list(value)
+            except (ValueError, json.JSONDecodeError):
+                return value, _format_warning(key, value, prop_type)
+
+        elif python_type:
+            try:
+                cast_value = _value_to_python_type(value, python_type)
+            except ValueError:
+                return value, _format_warning(key, value, prop_type)
+
+        return cast_value, None
+
 
 class _TypeInferrer(ABC):
     @abstractmethod
@@ -417,8 +666,44 @@ def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
 
-def _no_cast(row: Mapping[str, str]) -> Mapping[str, str]:
-    return row
+def _number_of_rows(batch: _ColumnBatch) -> int:
+    return len(next(iter(batch.values()))) if batch else 0
+
+
+def _to_column_batches(rows: Iterator[Dict[str, Any]], batch_size: int) -> Generator[_ColumnBatch, None, None]:
+    batch: List[Dict[str, Any]] = []
+    try:
+        for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield _to_column_batch(batch)
+                batch = []
+    except RecordParseError:
+        # The rows read before the error are still synced
+        if batch:
+            yield _to_column_batch(batch)
+        raise
+    if batch:
+        yield _to_column_batch(batch)
+
+
+def _to_column_batch(rows: List[Dict[str, Any]]) -> _ColumnBatch:
+    return {key: [row[key] for row in rows] for key in rows[0]}
+
+
+def _translate_newlines(column: pa.Array) -> pa.Array:
+    """
+    Files read as text by _CsvReader translate the line endings in the values to `\\n`, so the values read by pyarrow are translated as well
+    """
+    if not pc.any(pc.match_substring(column, "\r")).as_py():
+        return column
+    return pc.replace_substring(pc.replace_substring(column, "\r\n", "\n"), "\r", "\n")
+
+
+def _default_csv_reader() -> _CsvReader:
+    if os.environ.get(ENV_CSV_ENGINE, "").lower() == ARROW_CSV_ENGINE:
+        return _ArrowCsvReader()
+    return _CsvReader()
 
 
 def _extract_format(config: FileBasedStreamConfig) -> CsvFormat:
@@ -61,6 +61,28 @@ class FileTypeParser(ABC):
         """
         ...
 
+    def can_parse_byte_ranges(self, config: FileBasedStreamConfig) -> bool:
+        """
+        Whether the files can be split into byte ranges parsed independently with `parse_records_in_range`.
+        """
+        return False
+
+    def parse_records_in_range(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+        start: int,
+        end: int,
+    ) -> Iterable[Record]:
+        """
+        Parse and emit each record starting in the byte range [start, end) of the file, so that parsing contiguous ranges covering the
+        file emits each record of the file once. Only called if `can_parse_byte_ranges` is true.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot parse byte ranges of files")
+
     @property
     @abstractmethod
     def file_read_mode(self) -> FileReadMode:
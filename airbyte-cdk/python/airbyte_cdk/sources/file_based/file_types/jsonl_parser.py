@@ -4,7 +4,8 @@
 
 import json
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Union
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
@@ -13,10 +14,75 @@ from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeP
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import PYTHON_TYPE_MAPPING, SchemaType, merge_schemas
 
+_STRUCTURAL_CHARACTER = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL_CHARACTER = re.compile(r'["\\]')
+
+
+class _MultilineJsonAccumulator:
+    """
+    Accumulates the lines of a JSON document spread over multiple lines. Only the characters of each new line are scanned to know if the
+    brackets of the document are balanced, so the document is only parsed once it could be complete instead of every time a line is added.
+    """
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+        self.size = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def __bool__(self) -> bool:
+        return bool(self._lines)
+
+    def append(self, line: Union[bytes, str]) -> None:
+        if isinstance(line, bytes):
+            line = line.decode(json.detect_encoding(line))
+        self._lines.append(line)
+        self.size += len(line)
+        self._scan(line)
+
+    def may_be_complete(self) -> bool:
+        return self._depth <= 0 and not self._in_string
+
+    def document(self) -> str:
+        return "".join(self._lines)
+
+    def _scan(self, line: str) -> None:
+        position = 0
+        if self._escaped:
+            position = 1
+            self._escaped = False
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL_CHARACTER.search(line, position)
+                if not match:
+                    return
+                if match.group() == "\\":
+                    position = match.end() + 1
+                    if position > len(line):
+                        self._escaped = True
+                        return
+                    continue
+                self._in_string = False
+            else:
+                match = _STRUCTURAL_CHARACTER.search(line, position)
+                if not match:
+                    return
+                character = match.group()
+                if character == '"':
+                    self._in_string = True
+                elif character in "{[":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+            position = match.end()
+
 
 class JsonlParser(FileTypeParser):
 
     MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
+    # Bounds the memory used to accumulate a record spread over multiple lines, which also happens if a line cannot be parsed
+    MAX_BYTES_PER_MULTILINE_RECORD = 50_000_000
     ENCODING = "utf8"
 
     async def infer_schema(
@@ -58,6 +124,31 @@ class JsonlParser(FileTypeParser):
         """
         yield from self._parse_jsonl_entries(file, stream_reader, logger)
 
+    def can_parse_byte_ranges(self, config: FileBasedStreamConfig) -> bool:
+        return True
+
+    def parse_records_in_range(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+        start: int,
+        end: int,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Ranges are aligned on lines so, unlike `parse_records`, json objects over multiple lines are not supported. Line numbers in errors
+        are relative to the start of the range.
+        """
+        for line_number, line in enumerate(stream_reader.read_lines_in_range(file, start, end, logger), start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line.decode(self.ENCODING))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_number)
+
     @classmethod
     def _infer_schema_for_record(cls, record: Dict[str, Any]) -> Dict[str, Any]:
         record_schema = {}
@@ -87,23 +178,37 @@ class JsonlParser(FileTypeParser):
             has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
 
-            accumulator = None
-            for line in fp:
-                if not accumulator:
-                    accumulator = self._instantiate_accumulator(line)
+            accumulator = _MultilineJsonAccumulator()
+            for line_number, line in enumerate(fp, start=1):
                 read_bytes += len(line)
-                accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
-                try:
-                    record = json.loads(accumulator)
-                    if had_json_parsing_error and not has_warned_for_multiline_json_object:
-                        logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
-                        has_warned_for_multiline_json_object = True
-
-                    yield record
-                    yielded_at_least_once = True
-                    accumulator = self._instantiate_accumulator(line)
-                except json.JSONDecodeError:
-                    had_json_parsing_error = True
+                if not accumulator:
+                    try:
+                        yield json.loads(line)
+                        yielded_at_least_once = True
+                    except json.JSONDecodeError:
+                        had_json_parsing_error = True
+                        accumulator.append(line)
+                else:
+                    accumulator.append(line)
+
+                if accumulator and accumulator.may_be_complete():
+                    document = accumulator.document()
+                    try:
+                        record = json.loads(document)
+                    except json.JSONDecodeError as error:
+                        if error.pos < len(document.rstrip()):
+                            # Adding lines would not fix the document so nothing else in the file can be parsed
+                            break
+                    else:
+                        if not has_warned_for_multiline_json_object:
+                            logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
+                            has_warned_for_multiline_json_object = True
+                        yield record
+                        yielded_at_least_once = True
+                        accumulator = _MultilineJsonAccumulator()
+
+                if accumulator.size > self.MAX_BYTES_PER_MULTILINE_RECORD:
+                    raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD_TOO_LARGE, filename=file.uri, lineno=line_number)
 
                 if read_limit and yielded_at_least_once and read_bytes >= self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
                     logger.warning(
@@ -114,10 +219,3 @@ class JsonlParser(FileTypeParser):
 
             if had_json_parsing_error and not yielded_at_least_once:
                 raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
-
-    @staticmethod
-    def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
-        if isinstance(line, bytes):
-            return bytes("", json.detect_encoding(line))
-        elif isinstance(line, str):
-            return ""
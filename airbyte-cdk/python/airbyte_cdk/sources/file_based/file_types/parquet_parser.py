@@ -9,8 +9,9 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional
 from urllib.parse import unquote
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
-from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat, ValidationPolicy
 from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, FileBasedSourceError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
@@ -22,6 +23,8 @@ from pyarrow import Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    # Number of rows converted at once. Row groups can hold millions of rows so they are read in batches to keep the memory usage flat.
+    BATCH_SIZE = 10_000
 
     async def infer_schema(
         self,
@@ -53,6 +56,35 @@ class ParquetParser(FileTypeParser):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]],
+    ) -> Iterable[Dict[str, Any]]:
+        yield from self._parse_row_groups(config, file, stream_reader, logger, discovered_schema)
+
+    def can_parse_byte_ranges(self, config: FileBasedStreamConfig) -> bool:
+        return True
+
+    def parse_records_in_range(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+        start: int,
+        end: int,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Parse the row groups whose first page starts in the byte range [start, end).
+        """
+        yield from self._parse_row_groups(config, file, stream_reader, logger, discovered_schema, range(start, end))
+
+    def _parse_row_groups(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+        byte_range: Optional[range] = None,
     ) -> Iterable[Dict[str, Any]]:
         parquet_format = config.format
         if not isinstance(parquet_format, ParquetFormat):
@@ -60,17 +92,47 @@ class ParquetParser(FileTypeParser):
             raise ConfigValidationError(FileBasedSourceError.CONFIG_VALIDATION_ERROR)
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
             reader = pq.ParquetFile(fp)
+            row_groups = None
+            if byte_range is not None:
+                row_groups = [i for i in range(reader.num_row_groups) if self._row_group_offset(reader.metadata.row_group(i)) in byte_range]
+                if not row_groups:
+                    return
             partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-            for row_group in range(reader.num_row_groups):
-                batch = reader.read_row_group(row_group)
-                for row in range(batch.num_rows):
-                    yield {
-                        **{
-                            column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                            for column in batch.column_names
-                        },
-                        **partition_columns,
-                    }
+            columns = self._columns_to_read(reader.schema_arrow, config, discovered_schema)
+            for batch in reader.iter_batches(batch_size=self.BATCH_SIZE, row_groups=row_groups, columns=columns):
+                column_names = batch.schema.names
+                column_values = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                for row in zip(*column_values):
+                    yield {**dict(zip(column_names, row)), **partition_columns}
+
+    @staticmethod
+    def _row_group_offset(row_group: pq.RowGroupMetaData) -> int:
+        """
+        Return the offset of the first page of the row group in the file.
+        """
+        offsets: List[int] = []
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            offsets.append(column.dictionary_page_offset if column.has_dictionary_page else column.data_page_offset)
+        return min(offsets)
+
+    @staticmethod
+    def _columns_to_read(
+        parquet_schema: pa.Schema, config: FileBasedStreamConfig, discovered_schema: Optional[Mapping[str, SchemaType]]
+    ) -> Optional[List[str]]:
+        """
+        Return the columns of the file that are in the catalog, or None if all the columns have to be read.
+
+        The other validation policies check the records against the schema of the stream to detect schema changes, so the records of these
+        streams must keep the columns that are not in the catalog.
+        """
+        if config.validation_policy != ValidationPolicy.emit_record:
+            return None
+        if config.schemaless or not discovered_schema or "properties" not in discovered_schema:
+            return None
+        columns = [column for column in parquet_schema.names if column in discovered_schema["properties"]]
+        # Without any column, the rows of the file could not be read so all the columns are read as if there was no catalog
+        return columns or None
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -118,23 +180,69 @@ class ParquetParser(FileTypeParser):
         if pa.types.is_null(parquet_value.type):
             return None
 
-        # Convert duration to seconds, then convert to the appropriate unit
         if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
-            else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
+            return ParquetParser._duration_to_output_value(parquet_value.as_py(), parquet_value.type.unit)
         else:
             return parquet_value.as_py()
 
+    @staticmethod
+    def _to_output_values(parquet_array: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a pyarrow array to the values that can be output by the source, the same way _to_output_value converts a scalar.
+        Null values are output as None.
+        """
+        parquet_type = parquet_array.type
+
+        # Arrow formats dates the same way as isoformat, but not times and timestamps as it does not strip trailing zero fractions
+        if pa.types.is_date(parquet_type):
+            return pc.cast(parquet_array, pa.string()).to_pylist()  # type: ignore[no-any-return]
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type):
+            return [None if value is None else value.isoformat() for value in parquet_array.to_pylist()]
+
+        if parquet_type == pa.month_day_nano_interval():
+            return [None if value is None else list(value) for value in parquet_array.to_pylist()]
+
+        # Casting to string validates and decodes the utf-8 binary strings
+        if ParquetParser._is_binary(parquet_type):
+            return pc.cast(parquet_array, pa.string()).to_pylist()  # type: ignore[no-any-return]
+
+        if pa.types.is_decimal(parquet_type):
+            if parquet_format.decimal_as_float:
+                return parquet_array.to_pylist()  # type: ignore[no-any-return]
+            return [None if value is None else str(value) for value in parquet_array.to_pylist()]
+
+        # Each value of a dictionary column is output with its index and the values of the dictionary
+        if pa.types.is_dictionary(parquet_type):
+            dictionary_values = parquet_array.dictionary.to_pylist()
+            return [
+                None if index is None else {"indices": index, "values": dictionary_values} for index in parquet_array.indices.to_pylist()
+            ]
+        if pa.types.is_map(parquet_type):
+            return [None if value is None else dict(value) for value in parquet_array.to_pylist()]
+
+        if pa.types.is_null(parquet_type):
+            return [None] * len(parquet_array)
+
+        if pa.types.is_duration(parquet_type):
+            unit = parquet_type.unit
+            return [None if value is None else ParquetParser._duration_to_output_value(value, unit) for value in parquet_array.to_pylist()]
+        return parquet_array.to_pylist()  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _duration_to_output_value(duration: Any, unit: str) -> Any:
+        # Convert duration to seconds, then convert to the appropriate unit
+        duration_seconds = duration.total_seconds()
+        if unit == "s":
+            return duration_seconds
+        elif unit == "ms":
+            return duration_seconds * 1000
+        elif unit == "us":
+            return duration_seconds * 1_000_000
+        elif unit == "ns":
+            return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        else:
+            raise ValueError(f"Unknown duration unit: {unit}")
+
     @staticmethod
     def parquet_type_to_schema_type(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Mapping[str, str]:
         """
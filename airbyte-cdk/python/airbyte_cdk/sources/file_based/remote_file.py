@@ -3,6 +3,7 @@
 #
 
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -14,3 +15,15 @@ class RemoteFile(BaseModel):
 
     uri: str
     last_modified: datetime
+    # Size of the file in bytes, if the stream reader knows it when listing files
+    size: Optional[int] = None
+
+
+class FilePartition(BaseModel):
+    """
+    The records of a file starting in the byte range [start, end), or all the records of the file if `end` is not set.
+    """
+
+    file: RemoteFile
+    start: int = 0
+    end: Optional[int] = None
@@ -7,7 +7,7 @@ import itertools
 import traceback
 from copy import deepcopy
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
@@ -21,10 +21,12 @@ from airbyte_cdk.sources.file_based.exceptions import (
     SchemaInferenceError,
     StopSyncPerValidationPolicy,
 )
-from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.remote_file import FilePartition, RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType, merge_schemas, schemaless_schema
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams import IncrementalMixin
 from airbyte_cdk.sources.streams.core import JsonSchema
@@ -46,6 +48,11 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     def __init__(self, cursor: AbstractFileBasedCursor, **kwargs: Any):
         super().__init__(**kwargs)
         self._cursor = cursor
+        self._prefetcher = (
+            FilePrefetcher(self._prefetch_partition, self.config.partitions_to_prefetch, self.config.max_prefetched_records)
+            if self.config.partitions_to_prefetch
+            else None
+        )
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -66,6 +73,10 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         files_to_read = self._cursor.get_files_to_sync(all_files, self.logger)
         sorted_files_to_read = sorted(files_to_read, key=lambda f: (f.last_modified, f.uri))
         slices = [{"files": list(group[1])} for group in itertools.groupby(sorted_files_to_read, lambda f: f.last_modified)]
+        if self._prefetcher:
+            # Files are prefetched across slices as files are often grouped in slices of a single file
+            parser = self.get_parser()
+            self._prefetcher.schedule(partition for file in sorted_files_to_read for partition in self._get_partitions(parser, file))
         return slices
 
     def read_records_from_slice(self, stream_slice: StreamSlice) -> Iterable[AirbyteMessage]:
@@ -74,6 +85,12 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
         If an error is encountered reading records from a file, log a message and do not attempt
         to sync the rest of the file.
+
+        When `partitions_to_prefetch` is configured, the next files are read and parsed on other threads while the records of a file are
+        yielded. Records are still yielded, and files added to the cursor, in the order of the files.
+
+        When `bytes_per_file_partition` is configured, large files are split into partitions read one after the other, or prefetched like
+        files. A file is only added to the cursor once all its partitions were read.
         """
         schema = self.catalog_schema
         if schema is None:
@@ -87,7 +104,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             n_skipped = line_no = 0
 
             try:
-                for record in parser.parse_records(self.config, file, self.stream_reader, self.logger, schema):
+                for record in self._parse_records(parser, file, schema):
                     line_no += 1
                     if self.config.schemaless:
                         record = {"data": record}
@@ -141,6 +158,50 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         ),
                     )
 
+    def _parse_records(self, parser: FileTypeParser, file: RemoteFile, schema: Mapping[str, SchemaType]) -> Iterable[Dict[str, Any]]:
+        partitions = self._get_partitions(parser, file)
+        if self._prefetcher:
+            return self._parse_prefetched_records(self._prefetcher, partitions)
+        return itertools.chain.from_iterable(self._parse_partition(parser, partition, schema) for partition in partitions)
+
+    @staticmethod
+    def _parse_prefetched_records(prefetcher: FilePrefetcher, partitions: List[FilePartition]) -> Iterable[Dict[str, Any]]:
+        try:
+            for partition in partitions:
+                yield from prefetcher.parse_records(partition)
+        except GeneratorExit:
+            # The records are not all read, because the sync stopped for instance, so the prefetched files won't be read either. An error
+            # parsing the file doesn't stop the prefetching as the next files are still read
+            prefetcher.cancel()
+            raise
+
+    def _parse_partition(
+        self, parser: FileTypeParser, partition: FilePartition, schema: Optional[Mapping[str, SchemaType]]
+    ) -> Iterable[Dict[str, Any]]:
+        if partition.end is None:
+            return parser.parse_records(self.config, partition.file, self.stream_reader, self.logger, schema)
+        return parser.parse_records_in_range(
+            self.config, partition.file, self.stream_reader, self.logger, schema, partition.start, partition.end
+        )
+
+    def _prefetch_partition(self, partition: FilePartition) -> Iterable[Dict[str, Any]]:
+        return self._parse_partition(self.get_parser(), partition, self.catalog_schema)
+
+    def _get_partitions(self, parser: FileTypeParser, file: RemoteFile) -> List[FilePartition]:
+        bytes_per_partition = self.config.bytes_per_file_partition
+        if (
+            not bytes_per_partition
+            or file.size is None
+            or file.size <= bytes_per_partition
+            or not self.stream_reader.can_read_byte_ranges(file)
+            or not parser.can_parse_byte_ranges(self.config)
+        ):
+            return [FilePartition(file=file)]
+        return [
+            FilePartition(file=file, start=start, end=min(start + bytes_per_partition, file.size))
+            for start in range(0, file.size, bytes_per_partition)
+        ]
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import deque
+from queue import Full, Queue
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Union
+
+from airbyte_cdk.sources.file_based.remote_file import FilePartition
+
+ParsePartition = Callable[[FilePartition], Iterable[Dict[str, Any]]]
+
+
+class _EndOfPartition:
+    pass
+
+
+_END_OF_PARTITION = _EndOfPartition()
+_QueueItem = Union[List[Dict[str, Any]], Exception, _EndOfPartition]
+
+
+class _PrefetchedPartition:
+    """
+    A file partition parsed on its own thread. Its records are handed over in chunks through a bounded queue so the thread waits for the
+    records to be read once the queue is full.
+    """
+
+    _CHUNK_SIZE = 100
+    _PUT_TIMEOUT_SECONDS = 0.1
+
+    def __init__(self, partition: FilePartition, parse_partition: ParsePartition, max_records: int):
+        self.partition = partition
+        self._parse_partition = parse_partition
+        self._chunk_size = min(self._CHUNK_SIZE, max_records)
+        self._queue: Queue[_QueueItem] = Queue(maxsize=max(1, max_records // self._chunk_size))
+        self._cancelled = threading.Event()
+        # The thread is a daemon so a sync failing while files are prefetched does not wait for them before exiting
+        self._thread = threading.Thread(target=self._parse, name=f"prefetch-{partition.file.uri}", daemon=True)
+        self._thread.start()
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of the partition, then raise the exception the parsing raised, if any. Stops the parsing if the records are not
+        all read.
+        """
+        try:
+            while True:
+                item = self._queue.get()
+                if isinstance(item, _EndOfPartition):
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield from item
+        finally:
+            self.cancel()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def _parse(self) -> None:
+        chunk: List[Dict[str, Any]] = []
+        end: _QueueItem = _END_OF_PARTITION
+        try:
+            for record in self._parse_partition(self.partition):
+                chunk.append(record)
+                if len(chunk) >= self._chunk_size:
+                    if not self._put(chunk):
+                        return
+                    chunk = []
+        except Exception as exception:
+            # The records parsed before the error are handed over first, as they would have been when reading the file sequentially
+            end = exception
+        if chunk and not self._put(chunk):
+            return
+        self._put(end)
+
+    def _put(self, item: _QueueItem) -> bool:
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=self._PUT_TIMEOUT_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+
+class FilePrefetcher:
+    """
+    Reads and parses the file partitions scheduled to be synced ahead of the partition whose records are being read, so reading a file
+    from the file system overlaps with processing the records of the previous one.
+
+    Partitions are expected to be read in the order they were scheduled in. Scheduled partitions which are not read are skipped, and
+    partitions which were not scheduled are parsed when they are read.
+    """
+
+    def __init__(self, parse_partition: ParsePartition, partitions_to_prefetch: int, max_prefetched_records: int):
+        """
+        :param parse_partition: Function returning the records of a file partition. It is called from several threads at once.
+        :param partitions_to_prefetch: Number of partitions parsed ahead of the partition being read
+        :param max_prefetched_records: Maximum number of records held in memory, split between the partition being read and the
+        prefetched ones
+        """
+        if partitions_to_prefetch < 1:
+            raise ValueError(f"partitions_to_prefetch should be at least 1 but was {partitions_to_prefetch}")
+        self._parse_partition = parse_partition
+        self._partitions_to_prefetch = partitions_to_prefetch
+        self._max_records_per_partition = max(1, max_prefetched_records // (partitions_to_prefetch + 1))
+        self._scheduled_partitions: Deque[FilePartition] = deque()
+        self._prefetched_partitions: Deque[_PrefetchedPartition] = deque()
+
+    def schedule(self, partitions: Iterable[FilePartition]) -> None:
+        """
+        Replace the partitions to prefetch by `partitions`, in the order they will be read in.
+        """
+        self.cancel()
+        self._scheduled_partitions = deque(partitions)
+
+    def parse_records(self, partition: FilePartition) -> Iterator[Dict[str, Any]]:
+        while self._prefetched_partitions and self._prefetched_partitions[0].partition != partition:
+            self._prefetched_partitions.popleft().cancel()
+        if self._prefetched_partitions:
+            prefetched_partition = self._prefetched_partitions.popleft()
+        else:
+            if partition in self._scheduled_partitions:
+                while self._scheduled_partitions.popleft() != partition:
+                    pass
+            prefetched_partition = _PrefetchedPartition(partition, self._parse_partition, self._max_records_per_partition)
+        self._prefetch()
+        return prefetched_partition.records()
+
+    def cancel(self) -> None:
+        """
+        Stop parsing the prefetched partitions and forget the partitions scheduled.
+        """
+        while self._prefetched_partitions:
+            self._prefetched_partitions.popleft().cancel()
+        self._scheduled_partitions.clear()
+
+    def _prefetch(self) -> None:
+        while self._scheduled_partitions and len(self._prefetched_partitions) < self._partitions_to_prefetch:
+            partition = self._scheduled_partitions.popleft()
+            self._prefetched_partitions.append(_PrefetchedPartition(partition, self._parse_partition, self._max_records_per_partition))
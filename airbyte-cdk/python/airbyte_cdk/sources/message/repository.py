@@ -13,7 +13,7 @@ from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
 
 _LOGGER = logging.getLogger("MessageRepository")
-_SUPPORTED_MESSAGE_TYPES = {Type.CONTROL, Type.LOG}
+_SUPPORTED_MESSAGE_TYPES = {Type.CONTROL, Type.LOG, Type.STATE}
 LogMessage = dict[str, JsonType]
 
 _SEVERITY_BY_LOG_LEVEL = {
@@ -76,8 +76,8 @@ class InMemoryMessageRepository(MessageRepository):
 
     def emit_message(self, message: AirbyteMessage) -> None:
         """
-        :param message: As of today, only AirbyteControlMessages are supported given that supporting other types of message will need more
-          work and therefore this work has been postponed
+        :param message: As of today, only AirbyteControlMessages, AirbyteLogMessages and AirbyteStateMessages are supported given that
+          supporting other types of message will need more work and therefore this work has been postponed
         """
         if message.type not in _SUPPORTED_MESSAGE_TYPES:
             raise ValueError(f"As of today, only {_SUPPORTED_MESSAGE_TYPES} are supported as part of the InMemoryMessageRepository")
@@ -90,8 +90,13 @@ class InMemoryMessageRepository(MessageRepository):
             )
 
     def consume_queue(self) -> Iterable[AirbyteMessage]:
-        while self._message_queue:
-            yield self._message_queue.popleft()
+        # The queue can be consumed by multiple threads at the same time so it could be emptied between a check and the pop
+        while True:
+            try:
+                message = self._message_queue.popleft()
+            except IndexError:
+                return
+            yield message
 
 
 class LogAppenderMessageRepositoryDecorator(MessageRepository):
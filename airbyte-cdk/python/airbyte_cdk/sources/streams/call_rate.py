@@ -0,0 +1,423 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any, Deque, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+logger = logging.getLogger("airbyte")
+
+# Reset headers holding a value greater than this are timestamps rather than a number of seconds
+_MINIMUM_RESET_TIMESTAMP = 10**9
+
+
+class CallRateLimitHit(Exception):
+    """
+    Raised when a call can't be made without exceeding the rate of a policy
+    """
+
+    def __init__(self, error: str, time_to_wait: float):
+        """
+        :param error: Description of the limit which was hit
+        :param time_to_wait: Number of seconds to wait before the call can be made
+        """
+        super().__init__(error)
+        self.time_to_wait = time_to_wait
+
+
+@dataclass(frozen=True)
+class Rate:
+    """
+    A maximum number of calls allowed during an interval
+    """
+
+    limit: int
+    interval: timedelta
+
+
+class HttpRequestMatcher:
+    """
+    Matches the requests sent to an endpoint. Every criterion which is defined must match.
+    """
+
+    def __init__(
+        self,
+        method: Optional[str] = None,
+        url_pattern: Optional[str] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+    ):
+        """
+        :param method: HTTP method of the requests, e.g. "GET"
+        :param url_pattern: Regular expression matching the whole URL of the requests, without the query parameters
+        :param params: Query parameters the requests must have
+        :param headers: Headers the requests must have
+        """
+        self._method = method.upper() if method else None
+        self._url_pattern = re.compile(url_pattern) if url_pattern else None
+        self._params = {str(key): str(value) for key, value in (params or {}).items()}
+        self._headers = {str(key).lower(): str(value) for key, value in (headers or {}).items()}
+
+    def __call__(self, request: requests.PreparedRequest) -> bool:
+        if self._method and request.method != self._method:
+            return False
+        url = urlsplit(request.url or "")
+        if self._url_pattern and not self._url_pattern.fullmatch(url._replace(query="", fragment="").geturl()):
+            return False
+        if self._params:
+            params = dict(parse_qsl(url.query))
+            if any(params.get(key) != value for key, value in self._params.items()):
+                return False
+        if self._headers:
+            headers = {key.lower(): value for key, value in request.headers.items()}
+            if any(headers.get(key) != value for key, value in self._headers.items()):
+                return False
+        return True
+
+
+class AbstractCallRatePolicy(ABC):
+    """
+    Limits the rate of the calls matching the policy. A policy can be used by several threads at once.
+    """
+
+    def __init__(self, matchers: Optional[Iterable[HttpRequestMatcher]] = None):
+        """
+        :param matchers: The calls the policy applies to. A policy without matchers applies to every call.
+        """
+        self._matchers = list(matchers or [])
+        self._lock = threading.Lock()
+        self._blocked_until: Optional[float] = None
+
+    def matches(self, request: requests.PreparedRequest) -> bool:
+        return not self._matchers or any(matcher(request) for matcher in self._matchers)
+
+    def try_acquire(self, request: requests.PreparedRequest, weight: int = 1) -> None:
+        """
+        Count the call if it is allowed by the policy
+
+        :param request: The request about to be sent
+        :param weight: The number of calls the request counts for
+        :raise CallRateLimitHit: If the call is not allowed yet
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._blocked_until is not None:
+                if now < self._blocked_until:
+                    raise CallRateLimitHit("The API reported that no calls are left", self._blocked_until - now)
+                self._blocked_until = None
+            self._try_acquire(now, weight)
+
+    def update(self, available_calls: Optional[int], reset_in_seconds: Optional[float]) -> None:
+        """
+        Align the policy with the quota reported by the API
+
+        :param available_calls: Number of calls the API allows before the quota is reset
+        :param reset_in_seconds: Number of seconds before the quota is reset
+        """
+        with self._lock:
+            now = time.monotonic()
+            if available_calls is not None and available_calls <= 0 and reset_in_seconds is not None and reset_in_seconds > 0:
+                self._blocked_until = now + reset_in_seconds
+            self._update(now, available_calls, reset_in_seconds)
+
+    @abstractmethod
+    def _try_acquire(self, now: float, weight: int) -> None:
+        """
+        Called with the lock held
+
+        :raise CallRateLimitHit: If the call is not allowed yet
+        """
+
+    @abstractmethod
+    def _update(self, now: float, available_calls: Optional[int], reset_in_seconds: Optional[float]) -> None:
+        """
+        Called with the lock held
+        """
+
+
+class UnlimitedCallRatePolicy(AbstractCallRatePolicy):
+    """
+    Allows every call matching the policy, unless the API reports that no calls are left. Useful to exclude some endpoints from the
+    other policies of a budget, or to only rely on the rate limit headers of the API.
+    """
+
+    def _try_acquire(self, now: float, weight: int) -> None:
+        pass
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in_seconds: Optional[float]) -> None:
+        pass
+
+
+class FixedWindowCallRatePolicy(AbstractCallRatePolicy):
+    """
+    Allows `call_limit` calls per period. The count of calls is reset at the end of each period, the first period starting when the
+    policy is created.
+    """
+
+    def __init__(self, period: timedelta, call_limit: int, matchers: Optional[Iterable[HttpRequestMatcher]] = None):
+        """
+        :param period: Duration of a window
+        :param call_limit: Number of calls allowed per window
+        :param matchers: The calls the policy applies to
+        """
+        super().__init__(matchers)
+        self._period = period.total_seconds()
+        self._call_limit = call_limit
+        self._calls = 0
+        self._next_reset = time.monotonic() + self._period
+
+    def _try_acquire(self, now: float, weight: int) -> None:
+        if weight > self._call_limit:
+            raise ValueError(f"The weight of the call ({weight}) exceeds the call limit of the policy ({self._call_limit})")
+        if now >= self._next_reset:
+            # Skip the windows during which no call was made
+            elapsed_periods = (now - self._next_reset) // self._period + 1
+            self._next_reset += elapsed_periods * self._period
+            self._calls = 0
+        if self._calls + weight > self._call_limit:
+            raise CallRateLimitHit(f"The limit of {self._call_limit} calls per {self._period} seconds is reached", self._next_reset - now)
+        self._calls += weight
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in_seconds: Optional[float]) -> None:
+        if reset_in_seconds is not None:
+            self._next_reset = now + max(reset_in_seconds, 0)
+        if available_calls is not None:
+            self._calls = min(max(self._call_limit - available_calls, 0), self._call_limit)
+
+
+class MovingWindowCallRatePolicy(AbstractCallRatePolicy):
+    """
+    Allows at most `limit` calls during any `interval` for each rate. Unlike a fixed window, the calls can't be bunched at the end of a
+    window and at the beginning of the next one.
+    """
+
+    def __init__(self, rates: List[Rate], matchers: Optional[Iterable[HttpRequestMatcher]] = None):
+        """
+        :param rates: The rates which must all be respected, e.g. 10 calls per second and 1000 calls per hour
+        :param matchers: The calls the policy applies to
+        """
+        if not rates:
+            raise ValueError("A moving window policy requires at least one rate")
+        super().__init__(matchers)
+        self._rates = rates
+        # For each rate, the time and weight of the calls made during the last interval and the sum of their weights
+        self._calls: List[Deque[Tuple[float, int]]] = [deque() for _ in rates]
+        self._weights = [0 for _ in rates]
+
+    def _try_acquire(self, now: float, weight: int) -> None:
+        time_to_wait = 0.0
+        for index, rate in enumerate(self._rates):
+            if weight > rate.limit:
+                raise ValueError(f"The weight of the call ({weight}) exceeds the limit of the rate {rate}")
+            self._evict(index, now)
+            excess = self._weights[index] + weight - rate.limit
+            if excess > 0:
+                time_to_wait = max(time_to_wait, self._time_until_released(index, excess, now))
+        if time_to_wait > 0:
+            raise CallRateLimitHit("The limit of a moving window is reached", time_to_wait)
+        for index in range(len(self._rates)):
+            self._add(index, now, weight)
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in_seconds: Optional[float]) -> None:
+        if available_calls is None:
+            return
+        for index, rate in enumerate(self._rates):
+            self._evict(index, now)
+            # Account for the calls made by other clients sharing the quota
+            missing_weight = rate.limit - available_calls - self._weights[index]
+            if missing_weight > 0:
+                self._add(index, now, missing_weight)
+
+    def _evict(self, index: int, now: float) -> None:
+        calls = self._calls[index]
+        window_start = now - self._rates[index].interval.total_seconds()
+        while calls and calls[0][0] <= window_start:
+            self._weights[index] -= calls.popleft()[1]
+
+    def _time_until_released(self, index: int, weight: int, now: float) -> float:
+        released = 0
+        for call_time, call_weight in self._calls[index]:
+            released += call_weight
+            if released >= weight:
+                return call_time + self._rates[index].interval.total_seconds() - now
+        return self._rates[index].interval.total_seconds()
+
+    def _add(self, index: int, now: float, weight: int) -> None:
+        self._calls[index].append((now, weight))
+        self._weights[index] += weight
+
+
+class TokenBucketCallRatePolicy(AbstractCallRatePolicy):
+    """
+    Allows bursts of up to `capacity` calls while limiting the average rate to `rate` calls per second. The bucket starts full.
+    """
+
+    def __init__(self, rate: float, capacity: int, matchers: Optional[Iterable[HttpRequestMatcher]] = None):
+        """
+        :param rate: Number of tokens added to the bucket per second
+        :param capacity: Maximum number of tokens in the bucket, i.e. the size of the largest burst
+        :param matchers: The calls the policy applies to
+        """
+        if rate <= 0:
+            raise ValueError("The rate of a token bucket must be positive")
+        super().__init__(matchers)
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+
+    def _try_acquire(self, now: float, weight: int) -> None:
+        if weight > self._capacity:
+            raise ValueError(f"The weight of the call ({weight}) exceeds the capacity of the bucket ({self._capacity})")
+        self._refill(now)
+        if self._tokens < weight:
+            raise CallRateLimitHit("The token bucket is empty", (weight - self._tokens) / self._rate)
+        self._tokens -= weight
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in_seconds: Optional[float]) -> None:
+        if available_calls is not None:
+            self._refill(now)
+            self._tokens = min(self._tokens, float(max(available_calls, 0)))
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+
+class APIBudget:
+    """
+    Call rate policies shared by the streams of a source. Streams acquire a call from the budget before sending each request, waiting
+    for the policy matching the request to allow it. The first matching policy is used and requests matching no policy are not limited.
+
+    Since the policies are consulted before the requests are sent, the calls are spread according to the quota instead of being sent in
+    bursts followed by long backoffs once the API starts responding with 429.
+    """
+
+    def __init__(self, policies: Iterable[AbstractCallRatePolicy]):
+        """
+        :param policies: The policies of the budget, by decreasing priority
+        """
+        self._policies = list(policies)
+
+    def get_matching_policy(self, request: requests.PreparedRequest) -> Optional[AbstractCallRatePolicy]:
+        for policy in self._policies:
+            if policy.matches(request):
+                return policy
+        return None
+
+    def acquire_call(self, request: requests.PreparedRequest, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Wait until the request can be sent without exceeding the budget
+
+        :param request: The request about to be sent
+        :param block: If False, raise instead of waiting
+        :param timeout: Maximum number of seconds to wait. Waits as long as needed if None.
+        :raise CallRateLimitHit: If the call is not allowed and waiting is not possible
+        """
+        policy = self.get_matching_policy(request)
+        if not policy:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                policy.try_acquire(request)
+                return
+            except CallRateLimitHit as limit_hit:
+                if not block or (deadline is not None and time.monotonic() + limit_hit.time_to_wait > deadline):
+                    raise
+                logger.debug(f"{limit_hit} for {request.method} {request.url}. Waiting {limit_hit.time_to_wait:.3f} seconds")
+                time.sleep(limit_hit.time_to_wait)
+
+    def update_from_response(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """
+        Override to align the policies with the rate limit information returned by the API
+
+        :param request: The request which was sent
+        :param response: The response received
+        """
+
+
+class HttpAPIBudget(APIBudget):
+    """
+    Budget reading the remaining number of calls and the time until the quota is reset from the headers of the responses, so that the
+    calls made by other clients of the same account or a quota smaller than the one configured are accounted for.
+
+    The reset header can either hold a number of seconds or a unix timestamp. A response with a rate limit status code means no calls are
+    left until the quota is reset.
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[AbstractCallRatePolicy],
+        ratelimit_remaining_header: str = "X-RateLimit-Remaining",
+        ratelimit_reset_header: str = "X-RateLimit-Reset",
+        status_codes_for_ratelimit_hit: Iterable[int] = (HTTPStatus.TOO_MANY_REQUESTS.value,),
+    ):
+        """
+        :param policies: The policies of the budget, by decreasing priority
+        :param ratelimit_remaining_header: Header holding the number of calls left
+        :param ratelimit_reset_header: Header holding when the quota is reset
+        :param status_codes_for_ratelimit_hit: Status codes returned by the API when the quota is exceeded
+        """
+        super().__init__(policies)
+        self._ratelimit_remaining_header = ratelimit_remaining_header
+        self._ratelimit_reset_header = ratelimit_reset_header
+        self._status_codes_for_ratelimit_hit = set(status_codes_for_ratelimit_hit)
+
+    def update_from_response(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        policy = self.get_matching_policy(request)
+        if not policy:
+            return
+        available_calls = self._parse_number(response.headers.get(self._ratelimit_remaining_header))
+        reset_in_seconds = self._parse_number(response.headers.get(self._ratelimit_reset_header))
+        if reset_in_seconds is not None and reset_in_seconds > _MINIMUM_RESET_TIMESTAMP:
+            reset_in_seconds -= time.time()
+        if response.status_code in self._status_codes_for_ratelimit_hit:
+            available_calls = 0
+        if available_calls is not None or reset_in_seconds is not None:
+            policy.update(None if available_calls is None else int(available_calls), reset_in_seconds)
+
+    @staticmethod
+    def _parse_number(value: Optional[str]) -> Optional[float]:
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+
+_default_api_budget = APIBudget(policies=[])
+_default_api_budget_lock = threading.Lock()
+
+
+def get_default_api_budget() -> APIBudget:
+    """
+    :return: The budget used by the HTTP streams and requesters which are not given one explicitly. It doesn't limit any call unless it
+      was replaced using `set_default_api_budget`.
+    """
+    with _default_api_budget_lock:
+        return _default_api_budget
+
+
+def set_default_api_budget(api_budget: APIBudget) -> None:
+    """
+    Replace the budget used by the HTTP streams and requesters which are not given one explicitly. Unlike the transport, the default
+    budget is looked up before each request so it also applies to the streams which were already created.
+
+    :param api_budget: The new default budget
+    """
+    global _default_api_budget
+    with _default_api_budget_lock:
+        _default_api_budget = api_budget
@@ -28,7 +28,7 @@ class AbstractStream(ABC):
     Source connectors that wish to leverage concurrency need to implement this new interface. An example will be available shortly
 
     Current restrictions on sources that implement this interface. Not all of these restrictions will be lifted in the future, but most will as we iterate on the design.
-    - Only full refresh is supported. This will be addressed in the future.
+    - The sync mode is not passed to the read method. Streams are read incrementally if they are instantiated with a cursor, and in full refresh mode otherwise.
     - The read method does not accept a cursor_field. Streams must be internally aware of the cursor field to use. User-defined cursor fields can be implemented by modifying the connector's main method to instantiate the streams with the configured cursor field.
     - Streams cannot return user-friendly messages by overriding Stream.get_error_display_message. This will be addressed in the future.
     - The Stream's behavior cannot depend on a namespace
@@ -39,7 +39,7 @@ class AbstractStream(ABC):
     @abstractmethod
     def read(self) -> Iterable[Record]:
         """
-        Read a stream in full refresh mode
+        Read a stream. The stream is read in incremental mode if it has a cursor, and in full refresh mode otherwise.
         :return: The stream's records
         """
 
@@ -6,11 +6,12 @@ import copy
 import json
 import logging
 from functools import lru_cache
-from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteStream, SyncMode
-from airbyte_cdk.sources import AbstractSource, Source
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
@@ -20,6 +21,7 @@ from airbyte_cdk.sources.streams.concurrent.availability_strategy import (
     StreamAvailable,
     StreamUnavailable,
 )
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, NoopCursor
 from airbyte_cdk.sources.streams.concurrent.exceptions import ExceptionWithDisplayMessage
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
@@ -29,6 +31,10 @@ from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from deprecated.classic import deprecated
 
+if TYPE_CHECKING:
+    # AbstractSource sets the initial state of the facades it reads
+    from airbyte_cdk.sources.abstract_source import AbstractSource
+
 """
 This module contains adapters to help enabling concurrency on Stream objects without needing to migrate to AbstractStream
 """
@@ -41,15 +47,26 @@ class StreamFacade(Stream):
 
     All methods either delegate to the wrapped AbstractStream or provide a default implementation.
     The default implementations define restrictions imposed on Streams migrated to the new interface. For instance, only source-defined cursors are supported.
+
+    The sync mode is decided when the facade is created: the stream is read incrementally if it is created with a cursor, and in full refresh mode otherwise.
+    When reading the stream incrementally, AbstractSource sets the incoming state and the state manager on the cursor with `set_initial_state`.
     """
 
     @classmethod
-    def create_from_stream(cls, stream: Stream, source: AbstractSource, logger: logging.Logger, max_workers: int) -> Stream:
+    def create_from_stream(
+        cls,
+        stream: Stream,
+        source: "AbstractSource",
+        logger: logging.Logger,
+        max_workers: int,
+        cursor: Optional[Cursor] = None,
+    ) -> Stream:
         """
         Create a ConcurrentStream from a Stream object.
         :param source: The source
         :param stream: The stream
         :param max_workers: The maximum number of worker thread to use
+        :param cursor: The cursor used to track the state of the stream. If None, the stream is read in full refresh mode
         :return:
         """
         pk = cls._get_primary_key_from_stream(stream.primary_key)
@@ -61,9 +78,12 @@ class StreamFacade(Stream):
             )
 
         message_repository = source.message_repository
+        cursor = cursor or NoopCursor()
         return StreamFacade(
             ThreadBasedConcurrentStream(
-                partition_generator=StreamPartitionGenerator(stream, message_repository),
+                partition_generator=StreamPartitionGenerator(
+                    stream, message_repository, [cursor_field] if cursor_field is not None else None, cursor
+                ),
                 max_workers=max_workers,
                 name=stream.name,
                 json_schema=stream.get_json_schema(),
@@ -73,7 +93,9 @@ class StreamFacade(Stream):
                 slice_logger=source._slice_logger,
                 message_repository=message_repository,
                 logger=logger,
-            )
+                cursor=cursor,
+            ),
+            cursor,
         )
 
     @classmethod
@@ -102,11 +124,13 @@ class StreamFacade(Stream):
         else:
             return stream.cursor_field
 
-    def __init__(self, stream: AbstractStream):
+    def __init__(self, stream: AbstractStream, cursor: Optional[Cursor] = None):
         """
         :param stream: The underlying AbstractStream
+        :param cursor: The cursor of the underlying AbstractStream. If None, only full refresh is supported
         """
         self._abstract_stream = stream
+        self._cursor = cursor or NoopCursor()
 
     def read_full_refresh(
         self,
@@ -131,12 +155,40 @@ class StreamFacade(Stream):
         stream_slice: Optional[Mapping[str, Any]] = None,
         stream_state: Optional[Mapping[str, Any]] = None,
     ) -> Iterable[StreamData]:
-        if sync_mode == SyncMode.full_refresh:
-            for record in self._abstract_stream.read():
-                yield record.data
-        else:
-            # Incremental reads are not supported
+        if sync_mode == SyncMode.incremental and not self.supports_incremental:
+            # Incremental reads are only supported if the stream has a cursor
             raise NotImplementedError
+        for record in self._abstract_stream.read():
+            yield record.data
+
+    def get_updated_state(
+        self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        """
+        The state is tracked by the cursor which only moves forward once every partition before the records were processed
+        :param current_stream_state: (ignored)
+        :param latest_record: (ignored)
+        :return: The state of the cursor
+        """
+        return dict(self._cursor.state)
+
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        """
+        :return: The state of the cursor, which is the state checkpointed by the source
+        """
+        return dict(self._cursor.state)
+
+    def set_initial_state(
+        self, stream_state: Mapping[str, Any], connector_state_manager: ConnectorStateManager, send_per_stream_state: bool
+    ) -> None:
+        """
+        Set the incoming state and the state manager on the cursor before the stream is read incrementally
+        :param stream_state: The incoming state of the stream
+        :param connector_state_manager: The state manager used to create the state messages
+        :param send_per_stream_state: Whether the state messages are per-stream or legacy state messages
+        """
+        self._cursor.set_initial_state(stream_state, connector_state_manager, send_per_stream_state)
 
     @property
     def name(self) -> str:
@@ -165,8 +217,7 @@ class StreamFacade(Stream):
 
     @property
     def supports_incremental(self) -> bool:
-        # Only full refresh is supported
-        return False
+        return not isinstance(self._cursor, NoopCursor)
 
     def check_availability(self, logger: logging.Logger, source: Optional["Source"] = None) -> Tuple[bool, Optional[str]]:
         """
@@ -210,15 +261,29 @@ class StreamPartition(Partition):
     In the long-run, it would be preferable to update the connectors, but we don't have the tooling or need to justify the effort at this time.
     """
 
-    def __init__(self, stream: Stream, _slice: Optional[Mapping[str, Any]], message_repository: MessageRepository):
+    def __init__(
+        self,
+        stream: Stream,
+        _slice: Optional[Mapping[str, Any]],
+        message_repository: MessageRepository,
+        sync_mode: SyncMode = SyncMode.full_refresh,
+        cursor_field: Optional[List[str]] = None,
+        state: Optional[MutableMapping[str, Any]] = None,
+    ):
         """
         :param stream: The stream to delegate to
         :param _slice: The partition's stream_slice
         :param message_repository: The message repository to use to emit non-record messages
+        :param sync_mode: The sync mode used to read the stream
+        :param cursor_field: The cursor field passed to the stream when reading incrementally
+        :param state: The incoming state passed to the stream when reading incrementally
         """
         self._stream = stream
         self._slice = _slice
         self._message_repository = message_repository
+        self._sync_mode = sync_mode
+        self._cursor_field = cursor_field
+        self._state = state
 
     def read(self) -> Iterable[Record]:
         """
@@ -227,11 +292,16 @@ class StreamPartition(Partition):
         Otherwise, the message will be emitted on the message repository.
         """
         try:
-            for record_data in self._stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=copy.deepcopy(self._slice)):
+            for record_data in self._stream.read_records(
+                sync_mode=self._sync_mode,
+                cursor_field=self._cursor_field,
+                stream_slice=copy.deepcopy(self._slice),
+                stream_state=self._state,
+            ):
                 if isinstance(record_data, Mapping):
                     data_to_return = dict(record_data)
-                    self._stream.transformer.transform(data_to_return, self._stream.get_json_schema())
-                    yield Record(data_to_return)
+                    self._stream.transformer.transform(data_to_return, self._stream.get_json_schema(), self._stream.name)
+                    yield Record(data_to_return, self)
                 else:
                     self._message_repository.emit_message(record_data)
         except Exception as e:
@@ -264,17 +334,33 @@ class StreamPartitionGenerator(PartitionGenerator):
     In the long-run, it would be preferable to update the connectors, but we don't have the tooling or need to justify the effort at this time.
     """
 
-    def __init__(self, stream: Stream, message_repository: MessageRepository):
+    def __init__(
+        self,
+        stream: Stream,
+        message_repository: MessageRepository,
+        cursor_field: Optional[List[str]] = None,
+        cursor: Optional[Cursor] = None,
+    ):
         """
         :param stream: The stream to delegate to
         :param message_repository: The message repository to use to emit non-record messages
+        :param cursor_field: The cursor field used when generating the partitions of an incremental sync
+        :param cursor: The cursor whose state when the generation starts is used to generate the partitions of an incremental sync
         """
         self.message_repository = message_repository
         self._stream = stream
+        self._cursor_field = cursor_field
+        self._cursor = cursor
 
     def generate(self, sync_mode: SyncMode) -> Iterable[Partition]:
-        for s in self._stream.stream_slices(sync_mode=sync_mode):
-            yield StreamPartition(self._stream, copy.deepcopy(s), self.message_repository)
+        state: Optional[MutableMapping[str, Any]] = None
+        if sync_mode == SyncMode.incremental:
+            state = dict(self._cursor.state) if self._cursor else None
+            stream_slices = self._stream.stream_slices(sync_mode=sync_mode, cursor_field=self._cursor_field, stream_state=state)
+        else:
+            stream_slices = self._stream.stream_slices(sync_mode=sync_mode)
+        for s in stream_slices:
+            yield StreamPartition(self._stream, copy.deepcopy(s), self.message_repository, sync_mode, self._cursor_field, state)
 
 
 @deprecated("This class is experimental. Use at your own risk.")
@@ -0,0 +1,194 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Mapping, MutableMapping, Optional
+
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+
+
+class Cursor(ABC):
+    """
+    A cursor keeps track of the records read by a concurrent stream in order to emit its state.
+
+    Partitions are processed concurrently so their records are observed in no particular order. The ThreadBasedConcurrentStream calls
+    the methods of the cursor from the thread consuming the records, but implementations should still be thread-safe.
+    """
+
+    @abstractmethod
+    def register_partition(self, partition: Partition) -> None:
+        """
+        Indicate that a partition was generated and will be processed. Partitions are registered in the order they were generated.
+        :param partition: The partition to process
+        """
+
+    @abstractmethod
+    def observe(self, record: Record) -> None:
+        """
+        Indicate to the cursor that the record has been emitted
+        :param record: The record that was emitted
+        """
+
+    @abstractmethod
+    def close_partition(self, partition: Partition) -> None:
+        """
+        Indicate to the cursor that the partition has been successfully processed
+        :param partition: The partition that was processed
+        """
+
+    @property
+    @abstractmethod
+    def state(self) -> Mapping[str, Any]:
+        """
+        :return: The state of the stream covering every record read so far that can safely be checkpointed
+        """
+
+    def set_initial_state(
+        self, stream_state: Mapping[str, Any], connector_state_manager: ConnectorStateManager, send_per_stream_state: bool
+    ) -> None:
+        """
+        Called by the source before the stream is read incrementally, as the incoming state and the state manager are only known then.
+        :param stream_state: The incoming state of the stream
+        :param connector_state_manager: The state manager used to create the state messages
+        :param send_per_stream_state: Whether the state messages are per-stream or legacy state messages
+        """
+
+
+class NoopCursor(Cursor):
+    """
+    Cursor used for streams that are read in full refresh mode. It does not track anything.
+    """
+
+    def register_partition(self, partition: Partition) -> None:
+        pass
+
+    def observe(self, record: Record) -> None:
+        pass
+
+    def close_partition(self, partition: Partition) -> None:
+        pass
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        return {}
+
+
+class _PartitionProgress:
+    def __init__(self) -> None:
+        self.most_recent_cursor_value: Optional[Any] = None
+        self.is_closed = False
+
+
+class ConcurrentCursor(Cursor):
+    """
+    Thread-safe cursor tracking the most recent cursor value of the records read by a concurrent stream.
+
+    Partitions can complete in any order. To avoid losing data if the sync fails, the state only moves forward up to the low-water
+    mark of the partitions, meaning the state only reflects the records of the partitions which completed along with every partition
+    generated before them. For instance, if the partitions are daily slices and the 2nd one completes before the 1st one, the state will
+    only be updated once the 1st one completes. This assumes the partitions are generated in the order of the cursor.
+
+    Every time the low-water mark moves forward, a state message is created by the state manager the source set with
+    `set_initial_state` and emitted on the message repository. As the source creates its state messages through the same state manager,
+    a state is not emitted twice.
+
+    The state of the stream has the form {<cursor_field>: <most recent cursor value>}. Other fields of the incoming state are preserved.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        stream_namespace: Optional[str],
+        message_repository: MessageRepository,
+        cursor_field: str,
+    ) -> None:
+        """
+        :param stream_name: The name of the stream
+        :param stream_namespace: The namespace of the stream
+        :param message_repository: The message repository to emit the state messages on
+        :param cursor_field: The name of the field used as a cursor. Nested cursor fields are not supported.
+        """
+        self._stream_name = stream_name
+        self._stream_namespace = stream_namespace
+        self._state: MutableMapping[str, Any] = {}
+        self._message_repository = message_repository
+        self._connector_state_manager: Optional[ConnectorStateManager] = None
+        self._send_per_stream_state = True
+        self._cursor_field = cursor_field
+        self._lock = threading.Lock()
+        # Partitions that were not processed yet, along with every partition that were processed after them, in the order they were
+        # generated. The first partition of this dict is the low-water mark.
+        self._partitions: "OrderedDict[Partition, _PartitionProgress]" = OrderedDict()
+
+    def set_initial_state(
+        self, stream_state: Mapping[str, Any], connector_state_manager: ConnectorStateManager, send_per_stream_state: bool
+    ) -> None:
+        with self._lock:
+            self._state = dict(stream_state)
+            self._connector_state_manager = connector_state_manager
+            self._send_per_stream_state = send_per_stream_state
+
+    def register_partition(self, partition: Partition) -> None:
+        with self._lock:
+            self._partitions[partition] = _PartitionProgress()
+
+    def observe(self, record: Record) -> None:
+        cursor_value = record.data.get(self._cursor_field)
+        if cursor_value is None:
+            return
+        with self._lock:
+            progress = self._partitions.get(record.partition) if record.partition is not None else None
+            if progress is None:
+                raise ValueError(
+                    f"Record for stream {self._stream_name} was not produced by a registered partition. This is indicative of a bug in the CDK. Please contact support."
+                )
+            if progress.most_recent_cursor_value is None or cursor_value > progress.most_recent_cursor_value:
+                progress.most_recent_cursor_value = cursor_value
+
+    def close_partition(self, partition: Partition) -> None:
+        with self._lock:
+            if partition not in self._partitions:
+                raise ValueError(
+                    f"Partition {partition} of stream {self._stream_name} was closed without being registered. This is indicative of a bug in the CDK. Please contact support."
+                )
+            self._partitions[partition].is_closed = True
+            state_has_changed = False
+            while self._partitions:
+                low_water_mark_partition, progress = next(iter(self._partitions.items()))
+                if not progress.is_closed:
+                    break
+                del self._partitions[low_water_mark_partition]
+                state_has_changed |= self._update_state(progress.most_recent_cursor_value)
+            if state_has_changed:
+                self._emit_state_message()
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        with self._lock:
+            return dict(self._state)
+
+    def _update_state(self, cursor_value: Optional[Any]) -> bool:
+        if cursor_value is None:
+            return False
+        current_cursor_value = self._state.get(self._cursor_field)
+        if current_cursor_value is not None and cursor_value <= current_cursor_value:
+            return False
+        self._state[self._cursor_field] = cursor_value
+        return True
+
+    def _emit_state_message(self) -> None:
+        if self._connector_state_manager is None:
+            # The stream is not read by a source, which will checkpoint the state of the cursor once the stream is read
+            return
+        self._connector_state_manager.update_state_for_stream(self._stream_name, self._stream_namespace, self._state)
+        state_message = self._connector_state_manager.create_state_message_if_changed(
+            self._stream_name, self._stream_namespace, send_per_stream_state=self._send_per_stream_state
+        )
+        if state_message:
+            self._message_repository.emit_message(state_message)
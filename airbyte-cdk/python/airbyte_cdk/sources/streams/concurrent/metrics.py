@@ -0,0 +1,155 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from queue import Empty, Full, Queue
+from typing import Any, Mapping, Optional
+
+from airbyte_cdk.sources.streams.concurrent.partitions.types import QueueItem
+
+
+class ConcurrentStreamMetrics:
+    """
+    Metrics collected while reading a concurrent stream, meant to help sizing the number of workers and the size of the queue.
+
+    - The queue depth is sampled every time the main thread consumes an item.
+    - The worker utilization is the ratio of time the workers spent running tasks over the time they were available.
+    - The producer stall time is the time the workers spent waiting because the queue was full. A high value means the records are not
+      consumed fast enough and adding more workers will not speed up the sync.
+    - The consumer wait time is the time the main thread spent waiting because the queue was empty. A high value means the workers do not
+      produce records fast enough and adding more workers might speed up the sync.
+
+    Only the slow paths (blocked queue operations and task completion) take a lock, so collecting the metrics has a negligible cost.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int) -> None:
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        self._start_time = time.perf_counter()
+        self._end_time: Optional[float] = None
+        self._queue_depth_samples = 0
+        self._queue_depth_sum = 0
+        self.max_queue_depth = 0
+        self.worker_busy_time = 0.0
+        self.producer_stall_time = 0.0
+        self.consumer_wait_time = 0.0
+        self.tasks_completed = 0
+
+    def observe_queue_depth(self, depth: int) -> None:
+        # Only called by the main thread
+        self._queue_depth_samples += 1
+        self._queue_depth_sum += depth
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def add_worker_busy_time(self, duration: float) -> None:
+        with self._lock:
+            self.worker_busy_time += duration
+            self.tasks_completed += 1
+
+    def add_producer_stall_time(self, duration: float) -> None:
+        with self._lock:
+            self.producer_stall_time += duration
+
+    def add_consumer_wait_time(self, duration: float) -> None:
+        # Only called by the main thread
+        self.consumer_wait_time += duration
+
+    def stop(self) -> None:
+        self._end_time = time.perf_counter()
+
+    @property
+    def elapsed_time(self) -> float:
+        return (self._end_time or time.perf_counter()) - self._start_time
+
+    @property
+    def average_queue_depth(self) -> float:
+        return self._queue_depth_sum / self._queue_depth_samples if self._queue_depth_samples else 0.0
+
+    @property
+    def worker_utilization(self) -> float:
+        available_time = self.elapsed_time * self._max_workers
+        return min(self.worker_busy_time / available_time, 1.0) if available_time else 0.0
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return {
+            "elapsed_time_seconds": round(self.elapsed_time, 3),
+            "max_workers": self._max_workers,
+            "tasks_completed": self.tasks_completed,
+            "worker_utilization": round(self.worker_utilization, 3),
+            "max_queue_size": self._max_queue_size,
+            "max_queue_depth": self.max_queue_depth,
+            "average_queue_depth": round(self.average_queue_depth, 3),
+            "producer_stall_time_seconds": round(self.producer_stall_time, 3),
+            "consumer_wait_time_seconds": round(self.consumer_wait_time, 3),
+        }
+
+
+class QueueClosed(Exception):
+    """
+    Raised when putting an item on a MeteredQueue that was closed because its consumer stopped reading.
+    """
+
+
+class MeteredQueue(Queue[QueueItem]):
+    """
+    Bounded queue recording the time producers and consumers spend blocked on it.
+
+    When the queue is full, producers block until the consumer catches up which provides backpressure and bounds the memory used by
+    records read ahead of the consumer. If the consumer stops reading, it closes the queue so that the blocked producers are released.
+    """
+
+    _CLOSED_CHECK_INTERVAL_SECONDS = 0.1
+
+    def __init__(self, maxsize: int, metrics: ConcurrentStreamMetrics) -> None:
+        super().__init__(maxsize)
+        self._metrics = metrics
+        self._closed = threading.Event()
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def put(self, item: QueueItem, block: bool = True, timeout: Optional[float] = None) -> None:
+        if self._closed.is_set():
+            raise QueueClosed()
+        try:
+            super().put(item, block=False)
+        except Full:
+            if not block:
+                raise
+            start = time.perf_counter()
+            try:
+                self._put_while_open(item, timeout)
+            finally:
+                self._metrics.add_producer_stall_time(time.perf_counter() - start)
+
+    def _put_while_open(self, item: QueueItem, timeout: Optional[float]) -> None:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            wait_time = self._CLOSED_CHECK_INTERVAL_SECONDS
+            if deadline is not None:
+                wait_time = min(wait_time, max(deadline - time.perf_counter(), 0))
+            try:
+                super().put(item, block=True, timeout=wait_time)
+                return
+            except Full:
+                if self._closed.is_set():
+                    raise QueueClosed()
+                if deadline is not None and time.perf_counter() >= deadline:
+                    raise
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> QueueItem:
+        self._metrics.observe_queue_depth(self.qsize())
+        try:
+            return super().get(block=False)
+        except Empty:
+            if not block:
+                raise
+            start = time.perf_counter()
+            try:
+                return super().get(block=True, timeout=timeout)
+            finally:
+                self._metrics.add_consumer_wait_time(time.perf_counter() - start)
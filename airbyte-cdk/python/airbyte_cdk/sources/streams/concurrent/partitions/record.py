@@ -2,7 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+if TYPE_CHECKING:
+    from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 
 
 class Record:
@@ -10,8 +13,13 @@ class Record:
     Represents a record read from a stream.
     """
 
-    def __init__(self, data: Mapping[str, Any]):
+    def __init__(self, data: Mapping[str, Any], partition: Optional["Partition"] = None):
+        """
+        :param data: The record's data
+        :param partition: The partition the record was read from
+        """
         self.data = data
+        self.partition = partition
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Record):
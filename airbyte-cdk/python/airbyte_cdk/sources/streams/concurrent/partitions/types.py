@@ -23,7 +23,13 @@ class PartitionCompleteSentinel:
         self.partition = partition
 
 
+class TaskFailedSentinel:
+    """
+    A sentinel object indicating a task raised an exception and the stream cannot be read successfully.
+    """
+
+
 """
 Typedef representing the items that can be added to the ThreadBasedConcurrentStream
 """
-QueueItem = Union[Record, Partition, PartitionCompleteSentinel, PARTITIONS_GENERATED_SENTINEL, Partition]
+QueueItem = Union[Record, Partition, PartitionCompleteSentinel, TaskFailedSentinel, PARTITIONS_GENERATED_SENTINEL, Partition]
@@ -3,23 +3,31 @@
 #
 
 import concurrent
+import json
+import threading
 import time
+from collections import deque
 from concurrent.futures import Future
 from functools import lru_cache
 from logging import Logger
-from queue import Queue
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Deque, Iterable, List, Mapping, Optional, Set
 
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
 from airbyte_cdk.sources.streams.concurrent.availability_strategy import AbstractAvailabilityStrategy, StreamAvailability
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, NoopCursor
+from airbyte_cdk.sources.streams.concurrent.metrics import ConcurrentStreamMetrics, MeteredQueue, QueueClosed
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PARTITIONS_GENERATED_SENTINEL, PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PARTITIONS_GENERATED_SENTINEL,
+    PartitionCompleteSentinel,
+    TaskFailedSentinel,
+)
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 
 
@@ -27,6 +35,7 @@ class ThreadBasedConcurrentStream(AbstractStream):
 
     DEFAULT_TIMEOUT_SECONDS = 900
     DEFAULT_MAX_QUEUE_SIZE = 10_000
+    # Deprecated: the main thread blocks on the queue instead of sleeping
     DEFAULT_SLEEP_TIME = 0.1
 
     def __init__(
@@ -43,9 +52,20 @@ class ThreadBasedConcurrentStream(AbstractStream):
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
         max_concurrent_tasks: int = DEFAULT_MAX_QUEUE_SIZE,
-        sleep_time: float = DEFAULT_SLEEP_TIME,
+        sleep_time: Optional[float] = None,
         namespace: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
     ):
+        """
+        :param max_workers: The number of threads reading partitions
+        :param timeout_seconds: The maximum time to wait for the next record before failing the sync
+        :param max_concurrent_tasks: The maximum number of partitions submitted to the workers at the same time. The other partitions wait
+          in memory until a partition completes.
+        :param sleep_time: Deprecated and ignored. The main thread waits for the workers on the queue instead of sleeping.
+        :param max_queue_size: The maximum number of items in the queue between the workers and the main thread. The workers block while the
+          queue is full so the records read ahead of the consumer do not grow unbounded.
+        """
         self._stream_partition_generator = partition_generator
         self._max_workers = max_workers
         self._threadpool = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="workerpool")
@@ -59,81 +79,156 @@ class ThreadBasedConcurrentStream(AbstractStream):
         self._message_repository = message_repository
         self._timeout_seconds = timeout_seconds
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._sleep_time = sleep_time
         self._namespace = namespace
+        self._cursor = cursor or NoopCursor()
+        self._max_queue_size = max_queue_size
+        self._metrics = ConcurrentStreamMetrics(self._max_workers, self._max_queue_size)
+        self._futures_lock = threading.Lock()
+        self._pending_futures: Set[Future[Any]] = set()
+        self._failed_futures: List[Future[Any]] = []
+        if sleep_time is not None:
+            self._logger.warning(f"The sleep_time of stream {name} is ignored as the main thread does not sleep anymore. It will be removed.")
 
     def read(self) -> Iterable[Record]:
         """
-        Read all data from the stream (only full-refresh is supported at the moment)
+        Read all data from the stream. The stream is read in incremental mode if it has a cursor, and in full refresh mode otherwise.
 
         Algorithm:
         1. Submit a future to generate the stream's partition to process.
           - This has to be done asynchronously because we sometimes need to submit requests to the API to generate all partitions (eg for substreams).
-          - The future will add the partitions to process on a work queue
-        2. Continuously poll work from the work queue until all partitions are generated and processed
-          - If the next work item is a partition, submit a future to process it.
+          - The future will add the partitions to process on a bounded work queue
+        2. Continuously get work from the work queue until all partitions are generated and processed
+          - If the next work item is a partition, submit a future to process it if less than max_concurrent_tasks partitions are being processed.
+            Otherwise, keep it aside until a partition completes.
             - The future will add the records to emit on the work queue
-            - Add the partitions to the partitions_to_done dict so we know it needs to complete for the sync to succeed
-          - If the next work item is a record, yield the record
+            - Add the partition to the partitions_not_done set so we know it needs to complete for the sync to succeed
+            - Register the partition on the cursor
+          - If the next work item is a record, observe it with the cursor and yield the record
           - If the next work item is PARTITIONS_GENERATED_SENTINEL, all the partitions were generated
           - If the next work item is a PartitionCompleteSentinel, a partition is done processing
-            - Update the value in partitions_to_done to True so we know the partition is completed
+            - Remove the partition from partitions_not_done so we know the partition is completed
+            - Close the partition on the cursor so it can update the state
+            - Submit the next partition kept aside, if any
+          - If the next work item is a TaskFailedSentinel, a task raised an exception and the read stops
+
+        The number of partitions being processed is tracked with counters updated when partitions are submitted and completed, so the main
+        thread never polls nor scans the submitted tasks.
         """
-        self._logger.debug(f"Processing stream slices for {self.name} (sync_mode: full_refresh)")
-        futures: List[Future[Any]] = []
-        queue: Queue[QueueItem] = Queue()
+        sync_mode = SyncMode.full_refresh if isinstance(self._cursor, NoopCursor) else SyncMode.incremental
+        self._logger.debug(f"Processing stream slices for {self.name} (sync_mode: {sync_mode.value})")
+        self._metrics = ConcurrentStreamMetrics(self._max_workers, self._max_queue_size)
+        self._failed_futures = []
+        queue = MeteredQueue(self._max_queue_size, self._metrics)
         partition_generator = PartitionEnqueuer(queue, PARTITIONS_GENERATED_SENTINEL)
         partition_reader = PartitionReader(queue)
 
-        # Submit partition generation tasks
-        self._submit_task(futures, partition_generator.generate_partitions, self._stream_partition_generator, SyncMode.full_refresh)
-
-        # True -> partition is done
-        # False -> partition is not done
-        partitions_to_done: Dict[Partition, bool] = {}
-
-        finished_partitions = False
-        while record_or_partition := queue.get(block=True, timeout=self._timeout_seconds):
-            if record_or_partition == PARTITIONS_GENERATED_SENTINEL:
-                # All partitions were generated
-                finished_partitions = True
-            elif isinstance(record_or_partition, PartitionCompleteSentinel):
-                # All records for a partition were generated
-                if record_or_partition.partition not in partitions_to_done:
-                    raise RuntimeError(
-                        f"Received sentinel for partition {record_or_partition.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{partitions_to_done}"
-                    )
-                partitions_to_done[record_or_partition.partition] = True
-            elif isinstance(record_or_partition, Record):
-                # Emit records
-                yield record_or_partition
-            elif isinstance(record_or_partition, Partition):
-                # A new partition was generated and must be processed
-                partitions_to_done[record_or_partition] = False
-                if self._slice_logger.should_log_slice_message(self._logger):
-                    self._message_repository.emit_message(self._slice_logger.create_slice_log_message(record_or_partition.to_slice()))
-                self._submit_task(futures, partition_reader.process_partition, record_or_partition)
-            if finished_partitions and all(partitions_to_done.values()):
-                # All partitions were generated and process. We're done here
-                break
-        self._check_for_errors(futures)
-
-    def _submit_task(self, futures: List[Future[Any]], function: Callable[..., Any], *args: Any) -> None:
-        # Submit a task to the threadpool, waiting if there are too many pending tasks
-        self._wait_while_too_many_pending_futures(futures)
-        futures.append(self._threadpool.submit(function, *args))
-
-    def _wait_while_too_many_pending_futures(self, futures: List[Future[Any]]) -> None:
-        # Wait until the number of pending tasks is < self._max_concurrent_tasks
-        while True:
-            pending_futures = [f for f in futures if not f.done()]
-            if len(pending_futures) < self._max_concurrent_tasks:
-                break
-            self._logger.info("Main thread is sleeping because the task queue is full...")
-            time.sleep(self._sleep_time)
+        try:
+            # Submit partition generation tasks
+            self._submit_task(queue, partition_generator.generate_partitions, self._stream_partition_generator, sync_mode)
+
+            partitions_not_done: Set[Partition] = set()
+            partitions_to_submit: Deque[Partition] = deque()
+            running_partitions = 0
+
+            finished_partitions = False
+            task_failed = False
+            while record_or_partition := queue.get(block=True, timeout=self._timeout_seconds):
+                if record_or_partition == PARTITIONS_GENERATED_SENTINEL:
+                    # All partitions were generated
+                    finished_partitions = True
+                elif isinstance(record_or_partition, PartitionCompleteSentinel):
+                    # All records for a partition were generated
+                    if record_or_partition.partition not in partitions_not_done:
+                        raise RuntimeError(
+                            f"Received sentinel for partition {record_or_partition.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{partitions_not_done}"
+                        )
+                    partitions_not_done.remove(record_or_partition.partition)
+                    self._cursor.close_partition(record_or_partition.partition)
+                    running_partitions -= 1
+                    if partitions_to_submit:
+                        self._submit_task(queue, partition_reader.process_partition, partitions_to_submit.popleft())
+                        running_partitions += 1
+                elif isinstance(record_or_partition, Record):
+                    # Emit records
+                    self._cursor.observe(record_or_partition)
+                    yield record_or_partition
+                elif isinstance(record_or_partition, Partition):
+                    # A new partition was generated and must be processed
+                    partitions_not_done.add(record_or_partition)
+                    self._cursor.register_partition(record_or_partition)
+                    if self._slice_logger.should_log_slice_message(self._logger):
+                        self._message_repository.emit_message(self._slice_logger.create_slice_log_message(record_or_partition.to_slice()))
+                    if running_partitions < self._max_concurrent_tasks:
+                        self._submit_task(queue, partition_reader.process_partition, record_or_partition)
+                        running_partitions += 1
+                    else:
+                        partitions_to_submit.append(record_or_partition)
+                elif isinstance(record_or_partition, TaskFailedSentinel):
+                    # A task failed. The error is raised when checking the futures
+                    task_failed = True
+                    break
+                if finished_partitions and not partitions_not_done:
+                    # All partitions were generated and process. We're done here
+                    break
+            if task_failed:
+                # Release the workers blocked on the full queue and drop the tasks not started so the pending tasks complete promptly
+                queue.close()
+                for future in self._pending_futures_snapshot():
+                    future.cancel()
+            concurrent.futures.wait(self._pending_futures_snapshot(), timeout=self._timeout_seconds)
+            self._check_for_errors(self._failed_futures + self._pending_futures_snapshot())
+        finally:
+            # Unblock the workers waiting on the queue if the read stopped before all the partitions were processed
+            queue.close()
+            self._metrics.stop()
+            self._logger.info(f"Concurrency metrics for stream {self.name}: {json.dumps(self._metrics.as_dict())}")
+
+    @property
+    def metrics(self) -> ConcurrentStreamMetrics:
+        """
+        :return: The metrics of the last read. They are meant to help sizing max_workers and max_queue_size.
+        """
+        return self._metrics
+
+    def _submit_task(self, queue: MeteredQueue, function: Callable[..., Any], *args: Any) -> None:
+        future = self._threadpool.submit(self._run_task, queue, function, *args)
+        with self._futures_lock:
+            self._pending_futures.add(future)
+        future.add_done_callback(self._on_task_done)
+
+    def _run_task(self, queue: MeteredQueue, function: Callable[..., Any], *args: Any) -> None:
+        # Executed by a worker thread
+        start = time.perf_counter()
+        try:
+            function(*args)
+        except Exception:
+            try:
+                queue.put(TaskFailedSentinel())
+            except QueueClosed:
+                pass
+            raise
+        finally:
+            self._metrics.add_worker_busy_time(time.perf_counter() - start)
+
+    def _on_task_done(self, future: Future[Any]) -> None:
+        # Completed futures are not kept around so that the memory does not grow with the number of partitions
+        with self._futures_lock:
+            self._pending_futures.discard(future)
+            if not future.cancelled() and future.exception() is not None:
+                self._failed_futures.append(future)
+
+    def _pending_futures_snapshot(self) -> List[Future[Any]]:
+        with self._futures_lock:
+            return list(self._pending_futures)
 
     def _check_for_errors(self, futures: List[Future[Any]]) -> None:
-        exceptions_from_futures = [f for f in [future.exception() for future in futures] if f is not None]
+        # `exception()` blocks until the future is done so it is only called on the futures already done
+        exceptions_from_futures = [
+            exception
+            for exception in [future.exception() for future in futures if future.done() and not future.cancelled()]
+            # Tasks interrupted because the read stopped are not errors by themselves
+            if exception is not None and not isinstance(exception, QueueClosed)
+        ]
         if exceptions_from_futures:
             raise RuntimeError(f"Failed reading from stream {self.name} with errors: {exceptions_from_futures}")
         futures_not_done = [f for f in futures if not f.done()]
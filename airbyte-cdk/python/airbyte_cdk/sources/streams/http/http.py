@@ -7,27 +7,37 @@ import logging
 import os
 import urllib
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
 import requests_cache
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
+from airbyte_cdk.sources.streams.call_rate import APIBudget, get_default_api_budget
 from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
+from airbyte_cdk.sources.streams.parent_record_cache import read_parent_records
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.instrumentation import Stage, get_instrumentation
 from requests.auth import AuthBase
 
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .transport import HttpTransport, get_default_transport
+
+if TYPE_CHECKING:
+    from airbyte_cdk.sources import Source
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
 
+_RequestKey = Tuple[Optional[str], Optional[str], Any]
+
 
 class HttpStream(Stream, ABC):
     """
@@ -36,13 +46,28 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
+    # If True, the first response received while checking the availability of the stream is used by the next read instead of sending
+    # the same request again
+    reuse_availability_check_response = True
 
     # TODO: remove legacy HttpAuthenticator authenticator references
-    def __init__(self, authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None):
+    def __init__(
+        self,
+        authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None,
+        transport: Optional[HttpTransport] = None,
+        api_budget: Optional[APIBudget] = None,
+    ):
+        """
+        :param authenticator: The authenticator used to authenticate the requests of the stream
+        :param transport: The connection pools used to send the requests of the stream. Defaults to the transport shared by every stream.
+        :param api_budget: The call rate policies the requests of the stream must respect. Defaults to the budget shared by every stream.
+        """
+        self._api_budget = api_budget
         if self.use_cache:
             self._session = self.request_cache()
         else:
             self._session = requests.Session()
+        (transport or get_default_transport()).mount(self._session)
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
@@ -50,6 +75,9 @@ class HttpStream(Stream, ABC):
         elif authenticator:
             self._authenticator = authenticator
 
+        self._is_checking_availability = False
+        self._availability_check_response: Optional[Tuple[_RequestKey, requests.Response]] = None
+
     @property
     def cache_filename(self) -> str:
         """
@@ -118,6 +146,23 @@ class HttpStream(Stream, ABC):
     def availability_strategy(self) -> Optional[AvailabilityStrategy]:
         return HttpAvailabilityStrategy()
 
+    def check_availability(self, logger: logging.Logger, source: Optional["Source"] = None) -> Tuple[bool, Optional[str]]:
+        with self._keep_availability_check_response():
+            return super().check_availability(logger, source)
+
+    @contextmanager
+    def _keep_availability_check_response(self) -> Iterator[None]:
+        """
+        Keep the first response received while in this context so that the read following the availability check does not request the
+        same page again
+        """
+        self._availability_check_response = None
+        self._is_checking_availability = self.reuse_availability_check_response
+        try:
+            yield
+        finally:
+            self._is_checking_availability = False
+
     @abstractmethod
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """
@@ -329,7 +374,11 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request, **request_kwargs)
+        api_budget = self._api_budget or get_default_api_budget()
+        api_budget.acquire_call(request)
+        with get_instrumentation().measure(Stage.HTTP_REQUEST, self.name):
+            response: requests.Response = self._session.send(request, **request_kwargs)
+        api_budget.update_from_response(request, response)
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
@@ -383,8 +432,8 @@ class HttpStream(Stream, ABC):
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
 
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)
-        backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, stream_name=self.name)(self._send)
+        backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor, stream_name=self.name)
         return backoff_handler(user_backoff_handler)(request, request_kwargs)
 
     @classmethod
@@ -446,7 +495,11 @@ class HttpStream(Stream, ABC):
         stream_state: Optional[Mapping[str, Any]] = None,
     ) -> Iterable[StreamData]:
         yield from self._read_pages(
-            lambda req, res, state, _slice: self.parse_response(res, stream_slice=_slice, stream_state=state), stream_slice, stream_state
+            lambda req, res, state, _slice: get_instrumentation().measure_iterable(
+                Stage.PARSE_RESPONSE, self.name, self.parse_response(res, stream_slice=_slice, stream_state=state)
+            ),
+            stream_slice,
+            stream_state,
         )
 
     def _read_pages(
@@ -487,9 +540,33 @@ class HttpStream(Stream, ABC):
         )
         request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
 
-        response = self._send_request(request, request_kwargs)
+        response = self._pop_availability_check_response(request)
+        if response is None:
+            response = self._send_request(request, request_kwargs)
+            # The body of streamed responses is consumed by the availability check so they can't be read again
+            if self._is_checking_availability and self._availability_check_response is None and not request_kwargs.get("stream"):
+                self._availability_check_response = (self._request_key(request), response)
         return request, response
 
+    def _pop_availability_check_response(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """
+        :return: The response kept by the availability check if the request is the same as the one sent during the check. The response
+          is only reused once, by the first request following the check.
+        """
+        if self._is_checking_availability or self._availability_check_response is None:
+            return None
+        request_key, response = self._availability_check_response
+        self._availability_check_response = None
+        if request_key != self._request_key(request):
+            return None
+        self.logger.debug("Reusing the response received while checking the availability of the stream", extra={"url": request.url})
+        return response
+
+    @staticmethod
+    def _request_key(request: requests.PreparedRequest) -> _RequestKey:
+        # Headers are not compared as they can change without changing the response, like an access token being refreshed
+        return request.method, request.url, request.body
+
 
 class HttpSubStream(HttpStream, ABC):
     def __init__(self, parent: HttpStream, **kwargs: Any):
@@ -499,6 +576,16 @@ class HttpSubStream(HttpStream, ABC):
         super().__init__(**kwargs)
         self.parent = parent
 
+    @contextmanager
+    def _keep_availability_check_response(self) -> Iterator[None]:
+        # Slicing the stream during the check reads the first page of the parent stream which is also needed by the next read
+        with super()._keep_availability_check_response():
+            if isinstance(self.parent, HttpStream):
+                with self.parent._keep_availability_check_response():
+                    yield
+            else:
+                yield
+
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: Optional[List[str]] = None, stream_state: Optional[Mapping[str, Any]] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
@@ -508,9 +595,8 @@ class HttpSubStream(HttpStream, ABC):
 
         # iterate over all parent stream_slices
         for stream_slice in parent_stream_slices:
-            parent_records = self.parent.read_records(
-                sync_mode=SyncMode.full_refresh, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
-            )
+            # the records are shared with the other substreams of the parent and read ahead while the slices are processed
+            parent_records = read_parent_records(self.parent, stream_slice, cursor_field=cursor_field, stream_state=stream_state)
 
             # iterate over all parent records with current stream_slice
             for record in parent_records:
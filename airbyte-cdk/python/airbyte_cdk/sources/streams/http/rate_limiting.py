@@ -8,6 +8,7 @@ import time
 from typing import Any, Callable, Mapping, Optional
 
 import backoff
+from airbyte_cdk.utils.instrumentation import Stage, get_instrumentation
 from requests import PreparedRequest, RequestException, Response, codes, exceptions
 
 from .exceptions import DefaultBackoffException, UserDefinedBackoffException
@@ -27,9 +28,10 @@ SendRequestCallableType = Callable[[PreparedRequest, Mapping[str, Any]], Respons
 
 
 def default_backoff_handler(
-    max_tries: Optional[int], factor: float, **kwargs: Any
+    max_tries: Optional[int], factor: float, stream_name: str = "", **kwargs: Any
 ) -> Callable[[SendRequestCallableType], SendRequestCallableType]:
     def log_retry_attempt(details: Mapping[str, Any]) -> None:
+        get_instrumentation().observe(Stage.BACKOFF, stream_name, details["wait"])
         _, exc, _ = sys.exc_info()
         if isinstance(exc, RequestException) and exc.response:
             logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
@@ -61,7 +63,9 @@ def default_backoff_handler(
     )
 
 
-def user_defined_backoff_handler(max_tries: Optional[int], **kwargs: Any) -> Callable[[SendRequestCallableType], SendRequestCallableType]:
+def user_defined_backoff_handler(
+    max_tries: Optional[int], stream_name: str = "", **kwargs: Any
+) -> Callable[[SendRequestCallableType], SendRequestCallableType]:
     def sleep_on_ratelimit(details: Mapping[str, Any]) -> None:
         _, exc, _ = sys.exc_info()
         if isinstance(exc, UserDefinedBackoffException):
@@ -69,7 +73,9 @@ def user_defined_backoff_handler(max_tries: Optional[int], **kwargs: Any) -> Cal
                 logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
             retry_after = exc.backoff
             logger.info(f"Retrying. Sleeping for {retry_after} seconds")
-            time.sleep(retry_after + 1)  # extra second to cover any fractions of second
+            sleep_seconds = retry_after + 1  # extra second to cover any fractions of second
+            get_instrumentation().observe(Stage.BACKOFF, stream_name, sleep_seconds)
+            time.sleep(sleep_seconds)
 
     def log_give_up(details: Mapping[str, Any]) -> None:
         _, exc, _ = sys.exc_info()
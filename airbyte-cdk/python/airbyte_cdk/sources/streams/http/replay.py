@@ -0,0 +1,168 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import base64
+import json
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+from .transport import HttpTransport, get_default_transport, set_default_transport
+
+# The recorded body is the decoded content of the response so these headers would not describe it anymore
+_HEADERS_NOT_RECORDED = {"content-encoding", "content-length", "transfer-encoding"}
+
+_RequestKey = Tuple[str, str, Optional[str]]
+
+
+class UnrecordedRequestError(Exception):
+    """
+    Raised when replaying traffic if a request was not recorded, which means the connector does not send the same requests anymore
+    """
+
+
+def _request_key(request: requests.PreparedRequest) -> _RequestKey:
+    body: Optional[str]
+    if isinstance(request.body, bytes):
+        body = request.body.decode("utf-8", errors="replace")
+    elif request.body is None or isinstance(request.body, str):
+        body = request.body
+    else:
+        # Streamed bodies like files or generators can't be read without consuming them so their string representation is used
+        body = str(request.body)
+    return str(request.method), str(request.url), body
+
+
+def _encode_body(body: bytes) -> Mapping[str, str]:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body": base64.b64encode(body).decode("ascii"), "body_encoding": "base64"}
+
+
+def _decode_body(recorded_response: Mapping[str, Any]) -> bytes:
+    if recorded_response.get("body_encoding") == "base64":
+        return base64.b64decode(recorded_response["body"])
+    return str(recorded_response["body"]).encode("utf-8")
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Transport adapter sending the requests through another adapter and appending every request and its response to a file, one JSON
+    object per line. The file can then be replayed by ReplayAdapter to run a connector without the API it reads from.
+
+    Request headers are not recorded as they usually contain credentials, but the URL and body of the requests, and the responses, are
+    recorded as is and should be reviewed before the file is shared.
+    """
+
+    def __init__(self, path: str, adapter: Optional[BaseAdapter] = None):
+        """
+        :param path: File the requests and responses are appended to
+        :param adapter: Adapter sending the requests. Defaults to a requests.adapters.HTTPAdapter.
+        """
+        super().__init__()
+        self._path = path
+        self._adapter = adapter or HTTPAdapter()
+        self._lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        response = self._adapter.send(request, **kwargs)
+        method, url, body = _request_key(request)
+        interaction = {
+            "request": {"method": method, "url": url, "body": body},
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {name: value for name, value in response.headers.items() if name.lower() not in _HEADERS_NOT_RECORDED},
+                # Reading the content keeps it on the response so the caller can still read it, even when the request was streamed
+                **_encode_body(response.content),
+            },
+        }
+        with self._lock:
+            with open(self._path, "a", encoding="utf-8") as recording:
+                recording.write(json.dumps(interaction) + "\n")
+        return response
+
+    def close(self) -> None:
+        self._adapter.close()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter answering the requests with the responses recorded by RecordingAdapter, without sending them.
+
+    A request is answered with the responses recorded for the same method, URL and body, in the order they were recorded. Once they were
+    all replayed, the last one is replayed again so a connector retrying a request gets the same response every time.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: File the requests and responses were recorded to
+        """
+        super().__init__()
+        self._lock = threading.Lock()
+        self._responses: Dict[_RequestKey, Deque[Mapping[str, Any]]] = defaultdict(deque)
+        with open(path, "r", encoding="utf-8") as recording:
+            for line in recording:
+                if line.strip():
+                    interaction = json.loads(line)
+                    recorded_request = interaction["request"]
+                    key = (recorded_request["method"], recorded_request["url"], recorded_request.get("body"))
+                    self._responses[key].append(interaction["response"])
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        key = _request_key(request)
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise UnrecordedRequestError(f"No response was recorded for {key[0]} {key[1]}")
+            recorded_response = responses.popleft() if len(responses) > 1 else responses[0]
+
+        raw_response = HTTPResponse(
+            body=BytesIO(_decode_body(recorded_response)),
+            headers=recorded_response["headers"],
+            status=recorded_response["status"],
+            reason=recorded_response.get("reason"),
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw_response)
+
+
+@contextmanager
+def _default_transport(transport: HttpTransport) -> Iterator[HttpTransport]:
+    previous_transport = get_default_transport()
+    set_default_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_default_transport(previous_transport)
+
+
+@contextmanager
+def record_http_traffic(path: str) -> Iterator[HttpTransport]:
+    """
+    Record the requests sent by the streams created in the context, and their responses, to a file.
+
+    :param path: File the requests and responses are appended to
+    """
+    with _default_transport(HttpTransport(adapter_factory=lambda: RecordingAdapter(path))) as transport:
+        yield transport
+
+
+@contextmanager
+def replay_http_traffic(path: str) -> Iterator[HttpTransport]:
+    """
+    Answer the requests of the streams created in the context with the responses recorded by record_http_traffic, without sending them.
+
+    :param path: File the requests and responses were recorded to
+    """
+    with _default_transport(HttpTransport(adapter_factory=lambda: ReplayAdapter(path))) as transport:
+        yield transport
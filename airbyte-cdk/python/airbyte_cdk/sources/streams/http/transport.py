@@ -0,0 +1,254 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import socket
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple, cast
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, BaseAdapter, HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+if TYPE_CHECKING:
+    from urllib3._base_connection import BaseHTTPConnection
+
+# Connections above this number are closed once they are released, so it should be at least the number of threads sending requests to
+# the same host
+DEFAULT_POOL_MAXSIZE = 32
+# Number of hosts for which a pool of connections is kept
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_KEEP_ALIVE_IDLE_SECONDS = 60
+DEFAULT_KEEP_ALIVE_INTERVAL_SECONDS = 20
+DEFAULT_KEEP_ALIVE_PROBES = 3
+
+SocketOption = Tuple[int, int, int]
+
+
+class ConnectionPoolStats:
+    """
+    Counters describing how the connections of an HttpTransport are used. A reused connection is a request which did not need a new
+    TCP connection and TLS handshake. A discarded connection is a connection which was closed after being used because the pool was
+    full, meaning the pool is too small for the number of concurrent requests.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.connections_discarded = 0
+
+    def record_connection(self, reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self.connections_reused += 1
+            else:
+                self.connections_created += 1
+
+    def record_discarded_connection(self) -> None:
+        with self._lock:
+            self.connections_discarded += 1
+
+    @property
+    def requests(self) -> int:
+        return self.connections_created + self.connections_reused
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.connections_reused / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connections_discarded": self.connections_discarded,
+            "reuse_ratio": round(self.reuse_ratio, 3),
+        }
+
+
+class _InstrumentedPoolMixin:
+    _stats: ConnectionPoolStats
+    pool: Any
+
+    def _get_conn(self, timeout: Optional[float] = None) -> "BaseHTTPConnection":
+        connection: HTTPConnection = super()._get_conn(timeout)  # type: ignore[misc]
+        # Connections taken from the pool keep their socket open while new or dropped connections have to connect again
+        self._stats.record_connection(reused=connection.sock is not None)
+        return connection
+
+    def _put_conn(self, conn: Optional["BaseHTTPConnection"]) -> None:
+        if conn is not None and self.pool is not None and self.pool.full():
+            self._stats.record_discarded_connection()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class _InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _InstrumentedPoolManager(PoolManager):
+    def __init__(self, stats: ConnectionPoolStats, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._stats = stats
+        self.pool_classes_by_scheme = {"http": _InstrumentedHTTPConnectionPool, "https": _InstrumentedHTTPSConnectionPool}
+
+    def _new_pool(self, scheme: str, host: str, port: int, request_context: Optional[Dict[str, Any]] = None) -> HTTPConnectionPool:
+        pool = super()._new_pool(scheme, host, port, request_context)
+        # The pools are created from pool_classes_by_scheme so they are all instrumented
+        cast(_InstrumentedPoolMixin, pool)._stats = self._stats
+        return pool
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools are instrumented and configured with the socket options of the transport. It is mounted on the
+    sessions of several streams so closing one of these sessions does not close the pools, only the transport does.
+    """
+
+    def __init__(self, stats: ConnectionPoolStats, socket_options: List[SocketOption], **kwargs: Any) -> None:
+        self._stats = stats
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = DEFAULT_POOLBLOCK, **pool_kwargs: Any) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _InstrumentedPoolManager(
+            self._stats, num_pools=connections, maxsize=maxsize, block=block, socket_options=self._socket_options, **pool_kwargs
+        )
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> PoolManager:
+        if not proxy.lower().startswith("socks"):
+            proxy_kwargs.setdefault("socket_options", self._socket_options)
+        proxy_manager: PoolManager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        return proxy_manager
+
+    def close(self) -> None:
+        pass
+
+    def close_pools(self) -> None:
+        super().close()
+
+
+def _keep_alive_socket_options(idle_seconds: int, interval_seconds: int, probes: int) -> List[SocketOption]:
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # The name of the options defining when and how often the probes are sent depend on the platform
+    idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle_seconds))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval_seconds))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, probes))
+    return options
+
+
+class HttpTransport:
+    """
+    Connection pools shared by the sessions of the HTTP streams of a source.
+
+    Each stream keeps its own requests.Session, and therefore its own authentication, headers and cookies, but the transport adapter
+    mounted on these sessions is shared. Streams hitting the same host, like the parent and children of substreams or the streams read
+    concurrently, then reuse the warm connections instead of opening a new connection and doing a TLS handshake for every stream.
+
+    TCP keep-alive probes are enabled by default so that idle connections are not silently dropped by proxies and load balancers while
+    records are being processed.
+
+    requests only supports HTTP/1.1. Another backend, like one supporting HTTP/2, can be plugged in by providing an `adapter_factory`
+    returning a requests transport adapter. The connection pool statistics are only collected by the default adapter.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_idle_seconds: int = DEFAULT_KEEP_ALIVE_IDLE_SECONDS,
+        keep_alive_interval_seconds: int = DEFAULT_KEEP_ALIVE_INTERVAL_SECONDS,
+        keep_alive_probes: int = DEFAULT_KEEP_ALIVE_PROBES,
+        adapter_factory: Optional[Callable[[], BaseAdapter]] = None,
+    ) -> None:
+        """
+        :param pool_connections: Number of hosts for which a pool of connections is kept
+        :param pool_maxsize: Maximum number of connections kept in the pool of a host
+        :param pool_block: If True, requests wait for a connection to be available instead of opening connections above pool_maxsize
+        :param keep_alive: If True, TCP keep-alive probes are sent on idle connections
+        :param keep_alive_idle_seconds: Time a connection is idle before the first keep-alive probe is sent
+        :param keep_alive_interval_seconds: Time between two keep-alive probes
+        :param keep_alive_probes: Number of unanswered keep-alive probes before the connection is considered dead
+        :param adapter_factory: Function creating the transport adapter to use instead of the default one
+        """
+        self.stats = ConnectionPoolStats()
+        if adapter_factory:
+            self._adapter = adapter_factory()
+        else:
+            socket_options = list(HTTPConnection.default_socket_options)
+            if keep_alive:
+                socket_options += _keep_alive_socket_options(keep_alive_idle_seconds, keep_alive_interval_seconds, keep_alive_probes)
+            self._adapter = _SharedHTTPAdapter(
+                self.stats,
+                socket_options,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+
+    @property
+    def adapter(self) -> BaseAdapter:
+        return self._adapter
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """
+        Make the session send its requests through the connection pools of the transport
+
+        :param session: The session of a stream
+        :return: The session
+        """
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Close the connections of the transport. Sessions using the transport can still send requests after, new connections are opened.
+        """
+        if isinstance(self._adapter, _SharedHTTPAdapter):
+            self._adapter.close_pools()
+        else:
+            self._adapter.close()
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """
+    :return: The transport used by the HTTP streams and requesters which are not given one explicitly
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
+
+
+def set_default_transport(transport: HttpTransport) -> None:
+    """
+    Replace the transport used by the HTTP streams and requesters which are not given one explicitly, for instance to change the size of
+    the connection pools. Streams which were already created keep using the previous transport.
+
+    :param transport: The new default transport
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
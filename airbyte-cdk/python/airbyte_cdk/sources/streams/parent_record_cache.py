@@ -0,0 +1,305 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from queue import Full, Queue
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.core import Stream, StreamData
+
+DEFAULT_MEMORY_BUDGET_BYTES = 64 * 1024 * 1024
+DEFAULT_PREFETCH_BUFFER_SIZE = 1000
+_QUEUE_POLL_SECONDS = 0.1
+
+T = TypeVar("T")
+_CacheKey = Tuple[str, Optional[str], str, str, str]
+# Records kept in memory, or the byte range of the records spilled to disk
+_CacheEntry = Union[List[Mapping[str, Any]], Tuple[int, int]]
+
+
+class _PendingEntry:
+    """
+    Records of a slice being read. They are kept in memory while the memory budget allows it and written to a file of their own after
+    """
+
+    def __init__(self) -> None:
+        self.records: List[Mapping[str, Any]] = []
+        self.memory_size = 0
+        self.file: Optional[IO[bytes]] = None
+
+
+class ParentRecordCache:
+    """
+    Records of the parent streams read by the substreams during a sync, keyed by parent stream and slice.
+
+    Several children of the same parent, and the availability check of each child, read the same parent slices. Keeping the records once a
+    slice was fully read means each parent page is requested once per sync. Records are kept in memory until their estimated size reaches
+    the memory budget, after which they are written to a temporary file. The size is checked as the records are read so a large slice is
+    written to disk while it is read instead of being held in memory until its end.
+
+    Parent streams are identified by their class, namespace, name and config so that different streams sharing a name don't share records.
+    Only slices whose records are all mappings are cached. Other stream data, like log messages, is only emitted by the first read.
+    """
+
+    def __init__(self, memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES, spill_directory: Optional[str] = None):
+        """
+        :param memory_budget_bytes: Estimated size of the records kept in memory above which records are written to disk
+        :param spill_directory: Directory of the files records are written to. Defaults to the temporary directory of the platform.
+        """
+        self._memory_budget_bytes = memory_budget_bytes
+        self._spill_directory = spill_directory
+        self._lock = threading.Lock()
+        self._entries: Dict[_CacheKey, _CacheEntry] = {}
+        self._memory_size = 0
+        self._spill_file: Optional[IO[bytes]] = None
+
+    def read_records(self, stream: Stream, stream_slice: Any, read_records: Callable[[], Iterable[StreamData]]) -> Iterable[StreamData]:
+        """
+        Yield the records of the slice from the cache, or from `read_records` if the slice was not read yet
+
+        :param stream: The parent stream
+        :param stream_slice: Everything identifying the records read, usually the slice and the arguments of read_records
+        :param read_records: Function reading the records of the slice from the parent stream
+        """
+        key = self._key(stream, stream_slice)
+        if key is None:
+            yield from read_records()
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            yield from self._read_entry(entry)
+            return
+
+        pending: Optional[_PendingEntry] = _PendingEntry()
+        stream_data_iterator = iter(read_records())
+        is_complete = False
+        try:
+            for stream_data in stream_data_iterator:
+                if pending is not None and not self._append(pending, stream_data):
+                    self._discard(pending)
+                    pending = None
+                yield stream_data
+            is_complete = True
+        finally:
+            # Stop reading ahead if the consumer stops before the end of the slice
+            if hasattr(stream_data_iterator, "close"):
+                stream_data_iterator.close()
+            if pending is not None and is_complete:
+                self._store(key, pending)
+            elif pending is not None:
+                self._discard(pending)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory_size = 0
+            if self._spill_file:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def _append(self, pending: _PendingEntry, stream_data: StreamData) -> bool:
+        """
+        :return: False if the slice can't be cached
+        """
+        if not isinstance(stream_data, Mapping):
+            return False
+        # Declarative records wrap their data
+        record = getattr(stream_data, "data", stream_data)
+        try:
+            serialized_record = json.dumps(record).encode("utf-8")
+        except (TypeError, ValueError):
+            # Records which can't be spilled to disk are not cached
+            return False
+        if pending.file is None:
+            with self._lock:
+                fits_in_memory = self._memory_size + len(serialized_record) <= self._memory_budget_bytes
+                if fits_in_memory:
+                    self._memory_size += len(serialized_record)
+            if fits_in_memory:
+                pending.records.append(record)
+                pending.memory_size += len(serialized_record)
+                return True
+            # The file is deleted as soon as it is closed
+            pending.file = tempfile.TemporaryFile(dir=self._spill_directory, prefix="parent_records_")
+            for kept_record in pending.records:
+                pending.file.write(json.dumps(kept_record).encode("utf-8") + b"\n")
+            self._release(pending)
+        pending.file.write(serialized_record + b"\n")
+        return True
+
+    def _store(self, key: _CacheKey, pending: _PendingEntry) -> None:
+        with self._lock:
+            if key in self._entries:
+                # Another reader cached the slice first
+                pass
+            elif pending.file is None:
+                self._entries[key] = pending.records
+                return
+            else:
+                pending_file = pending.file
+                if not self._spill_file:
+                    # The file is deleted as soon as it is closed
+                    self._spill_file = tempfile.TemporaryFile(dir=self._spill_directory, prefix="parent_records_")
+                self._spill_file.seek(0, os.SEEK_END)
+                start = self._spill_file.tell()
+                pending_file.seek(0)
+                shutil.copyfileobj(pending_file, self._spill_file)
+                self._spill_file.flush()
+                self._entries[key] = (start, self._spill_file.tell())
+        self._discard(pending)
+
+    def _discard(self, pending: _PendingEntry) -> None:
+        self._release(pending)
+        if pending.file:
+            pending.file.close()
+            pending.file = None
+
+    def _release(self, pending: _PendingEntry) -> None:
+        with self._lock:
+            # The cache could have been cleared while the records were read
+            self._memory_size = max(0, self._memory_size - pending.memory_size)
+        pending.records = []
+        pending.memory_size = 0
+
+    def _read_entry(self, entry: _CacheEntry) -> Iterable[Mapping[str, Any]]:
+        if isinstance(entry, list):
+            yield from entry
+            return
+        start, end = entry
+        with self._lock:
+            if not self._spill_file:
+                return
+            self._spill_file.seek(start)
+            content = self._spill_file.read(end - start)
+        for line in content.splitlines():
+            yield json.loads(line)
+
+    @staticmethod
+    def _key(stream: Stream, stream_slice: Any) -> Optional[_CacheKey]:
+        stream_class = type(stream)
+        try:
+            return (
+                f"{stream_class.__module__}.{stream_class.__qualname__}",
+                stream.namespace,
+                stream.name,
+                json.dumps(getattr(stream, "config", None), sort_keys=True),
+                json.dumps(stream_slice, sort_keys=True),
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+def prefetch(items: Iterable[T], buffer_size: int = DEFAULT_PREFETCH_BUFFER_SIZE) -> Iterator[T]:
+    """
+    Iterate over the items on a background thread so that the next items are being produced while the current ones are processed.
+
+    The first item is produced on the calling thread and the background thread is only started when the second item is requested, so
+    taking a single item, like the availability check does, doesn't read ahead. The background thread stops once the returned iterator is
+    closed or garbage collected. Errors raised while producing the items are raised by the returned iterator.
+
+    :param items: The items to produce, only iterated over by one thread at a time
+    :param buffer_size: Maximum number of items produced ahead of the consumer
+    """
+    iterator = iter(items)
+    try:
+        first_item = next(iterator)
+    except StopIteration:
+        return
+    yield first_item
+
+    queue: "Queue[Tuple[bool, Any]]" = Queue(maxsize=buffer_size)
+    stop_event = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                if not _put(queue, (False, item), stop_event):
+                    return
+            _put(queue, (True, None), stop_event)
+        except BaseException as error:  # noqa: B902 errors are raised on the consumer thread
+            _put(queue, (True, error), stop_event)
+        finally:
+            if stop_event.is_set() and hasattr(iterator, "close"):
+                iterator.close()
+
+    thread = threading.Thread(target=produce, name="prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            is_done, value = queue.get()
+            if is_done:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stop_event.set()
+
+
+def _put(queue: "Queue[Tuple[bool, Any]]", item: Tuple[bool, Any], stop_event: threading.Event) -> bool:
+    while not stop_event.is_set():
+        try:
+            queue.put(item, timeout=_QUEUE_POLL_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def read_parent_records(
+    parent: Stream,
+    stream_slice: Optional[Mapping[str, Any]],
+    cursor_field: Optional[List[str]] = None,
+    stream_state: Optional[Mapping[str, Any]] = None,
+) -> Iterable[StreamData]:
+    """
+    Read the records of a parent stream slice in full refresh mode. The records are prefetched on a background thread. During a sync, they
+    are read from the cache if another substream already read this slice, and cached otherwise.
+
+    :param parent: The parent stream
+    :param stream_slice: The slice of the parent stream
+    :param cursor_field: The cursor field given to the parent stream
+    :param stream_state: The state given to the parent stream
+    """
+
+    def read_records() -> Iterable[StreamData]:
+        return prefetch(
+            parent.read_records(
+                sync_mode=SyncMode.full_refresh, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+            )
+        )
+
+    parent_record_cache = _parent_record_cache
+    if parent_record_cache is None:
+        return read_records()
+    cache_key = {"stream_slice": stream_slice, "cursor_field": cursor_field, "stream_state": stream_state}
+    return parent_record_cache.read_records(parent, cache_key, read_records)
+
+
+_parent_record_cache: Optional[ParentRecordCache] = None
+
+
+@contextmanager
+def parent_record_cache_scope(memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES) -> Iterator[ParentRecordCache]:
+    """
+    Cache the parent records read by the substreams until the context exits. The records are only shared within a sync as the parent
+    records can change between syncs, and a stream name only identifies a stream within a source.
+
+    :param memory_budget_bytes: Estimated size of the records kept in memory above which records are written to disk
+    """
+    global _parent_record_cache
+    parent_record_cache = ParentRecordCache(memory_budget_bytes=memory_budget_bytes)
+    _parent_record_cache = parent_record_cache
+    try:
+        yield parent_record_cache
+    finally:
+        _parent_record_cache = None
+        parent_record_cache.clear()
@@ -9,6 +9,7 @@ from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordM
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.utils.instrumentation import Stage, get_instrumentation
 
 
 def stream_data_to_airbyte_message(
@@ -27,9 +28,11 @@ def stream_data_to_airbyte_message(
         # need it to normalize values against json schema. By default no action
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
-        transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        with get_instrumentation().measure(Stage.NORMALIZATION, stream_name):
+            transformer.transform(data, schema, stream_name)  # type: ignore
+        # The fields are already of the expected types so the messages are constructed without validation as this is done for every record
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
     elif isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
@@ -3,11 +3,15 @@
 #
 
 import logging
+import numbers
+import threading
+from collections import deque
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolver, TypeChecker, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
@@ -35,9 +39,211 @@ class TransformConfig(Flag):
     CustomSchemaNormalization = auto()
 
 
+class _UnsupportedSchema(Exception):
+    """
+    Raised when compiling a schema using constructs that are not supported by _CompiledSchema
+    """
+
+
+_TYPE_CHECKERS: Dict[str, Callable[[Any], bool]] = {
+    # Same as the type checker of the validator created by TypeTransformer
+    "string": lambda instance: isinstance(instance, str),
+    "object": lambda instance: isinstance(instance, dict),
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: isinstance(instance, numbers.Number) and not isinstance(instance, bool),
+    "integer": lambda instance: isinstance(instance, int) and not isinstance(instance, bool),
+}
+
+# Python types matching each json type without further checks, to avoid calling the type checkers for most values
+_EXACT_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "object": (dict,),
+    "array": (list,),
+    "boolean": (bool,),
+    "null": (type(None),),
+    "number": (int, float),
+    "integer": (int,),
+}
+
+_TYPE, _PROPERTIES, _ITEMS, _TUPLE_ITEMS, _REF = range(5)
+
+
+def _types_msg(instance: Any, types: Any) -> str:
+    """
+    Same message as the one of the errors raised by the type validator of jsonschema
+    """
+    types = [types] if isinstance(types, str) else types
+    reprs = []
+    for type_name in types:
+        try:
+            reprs.append(repr(type_name["name"]))
+        except Exception:
+            reprs.append(repr(type_name))
+    return f"{instance!r} is not of type {', '.join(reprs)}"
+
+Normalizer = Callable[[Any], Any]
+
+
+class _SchemaNode:
+    """
+    Operations to apply on a value for a subschema, in the order the keywords are defined in the subschema
+    """
+
+    __slots__ = ("operations",)
+
+    def __init__(self) -> None:
+        self.operations: List[Tuple[Any, ...]] = []
+
+
+class _CompiledSchema:
+    """
+    Plan normalizing records the same way the TypeTransformer's jsonschema validator does: values are normalized by their parent's
+    `properties` and `items` keywords before being type checked against their own subschema. The schema is traversed and every `$ref`
+    is resolved once when compiling so that transforming a record only walks through the record.
+    """
+
+    def __init__(
+        self, schema: Mapping[str, Any], create_normalizer: Callable[[Dict[str, Any]], Optional[Normalizer]], type_checker: TypeChecker
+    ) -> None:
+        self._create_normalizer = create_normalizer
+        self._type_checker = type_checker
+        self._resolver = RefResolver.from_schema(schema)
+        self._nodes: Dict[int, _SchemaNode] = {}
+        self._root = self._compile(schema, is_root=True)
+
+    def transform(self, record: Any, on_error: Callable[[ValidationError], None]) -> None:
+        """
+        :param record: The record to normalize in place
+        :param on_error: Called for each value not matching its schema once normalized, as soon as it is found
+        """
+        self._apply(self._root, record, [], on_error)
+
+    def _apply(self, node: _SchemaNode, instance: Any, path: List[Any], on_error: Callable[[ValidationError], None]) -> None:
+        for operation in node.operations:
+            kind = operation[0]
+            if kind == _TYPE:
+                _, types, exact_types, checkers = operation
+                if type(instance) not in exact_types and not any(is_type(instance) for is_type in checkers):
+                    on_error(
+                        ValidationError(
+                            _types_msg(instance, types), validator="type", validator_value=types, instance=instance, path=deque(path)
+                        )
+                    )
+            elif kind == _PROPERTIES:
+                if isinstance(instance, dict):
+                    properties = operation[1]
+                    for key, normalize, _ in properties:
+                        if normalize is not None and key in instance:
+                            instance[key] = normalize(instance[key])
+                    for key, _, child in properties:
+                        if key in instance:
+                            path.append(key)
+                            self._apply(child, instance[key], path, on_error)
+                            path.pop()
+            elif kind == _ITEMS:
+                if isinstance(instance, list):
+                    _, normalize, child = operation
+                    if normalize is not None:
+                        for index, item in enumerate(instance):
+                            instance[index] = normalize(item)
+                    for index, item in enumerate(instance):
+                        path.append(index)
+                        self._apply(child, item, path, on_error)
+                        path.pop()
+            elif kind == _TUPLE_ITEMS:
+                if isinstance(instance, list):
+                    _, normalize, children = operation
+                    if normalize is not None:
+                        for index, item in enumerate(instance):
+                            instance[index] = normalize(item)
+                    for (index, item), child in zip(enumerate(instance), children):
+                        path.append(index)
+                        self._apply(child, item, path, on_error)
+                        path.pop()
+            else:
+                self._apply(operation[1], instance, path, on_error)
+
+    def _compile(self, schema: Any, is_root: bool = False) -> _SchemaNode:
+        if not isinstance(schema, dict):
+            raise _UnsupportedSchema(f"Subschema {schema} is not an object")
+        if not is_root and Draft7Validator.ID_OF(schema):
+            raise _UnsupportedSchema("Subschemas changing the resolution scope are not supported")
+
+        node = self._nodes.get(id(schema))
+        if node is not None:
+            # The subschema was already compiled or is being compiled because it references itself
+            return node
+        node = self._nodes[id(schema)] = _SchemaNode()
+
+        ref = schema.get("$ref")
+        if ref is not None:
+            # As with the jsonschema validator, the other keywords are ignored when a subschema has a $ref
+            url, resolved = self._resolve(ref)
+            self._resolver.push_scope(url)
+            try:
+                node.operations.append((_REF, self._compile(resolved)))
+            finally:
+                self._resolver.pop_scope()
+            return node
+
+        for keyword, value in schema.items():
+            if keyword == "type":
+                type_names = self._get_type_names(value)
+                exact_types = frozenset(exact_type for type_name in type_names for exact_type in _EXACT_TYPES.get(type_name, ()))
+                node.operations.append((_TYPE, value, exact_types, self._compile_type_checkers(type_names)))
+            elif keyword == "properties":
+                if not isinstance(value, dict):
+                    raise _UnsupportedSchema(f"Properties {value} are not an object")
+                node.operations.append(
+                    (
+                        _PROPERTIES,
+                        [
+                            (key, self._create_normalizer(self._resolve_once(subschema)), self._compile(subschema))
+                            for key, subschema in value.items()
+                        ],
+                    )
+                )
+            elif keyword == "items":
+                if isinstance(value, list):
+                    node.operations.append((_TUPLE_ITEMS, self._create_normalizer(value), [self._compile(subschema) for subschema in value]))  # type: ignore[arg-type]  # the list is passed as is, like the jsonschema validator does
+                else:
+                    node.operations.append((_ITEMS, self._create_normalizer(self._resolve_once(value)), self._compile(value)))
+        return node
+
+    @staticmethod
+    def _get_type_names(types: Any) -> List[str]:
+        types = [types] if isinstance(types, str) else types
+        if not isinstance(types, list) or not all(isinstance(type_name, str) for type_name in types):
+            raise _UnsupportedSchema(f"Type {types} is not supported")
+        return types
+
+    def _compile_type_checkers(self, types: List[str]) -> Tuple[Callable[[Any], bool], ...]:
+        # Unknown types are checked at runtime by the jsonschema type checker which raises an UnknownType error
+        return tuple(_TYPE_CHECKERS.get(type_name) or partial(self._type_checker.is_type, type=type_name) for type_name in types)
+
+    def _resolve_once(self, subschema: Any) -> Any:
+        # Values are normalized against their subschema after resolving a single $ref like the jsonschema validator does
+        if isinstance(subschema, dict) and "$ref" in subschema:
+            return self._resolve(subschema["$ref"])[1]
+        return subschema
+
+    def _resolve(self, ref: str) -> Tuple[str, Any]:
+        try:
+            return self._resolver.resolve(ref)  # type: ignore[no-any-return]
+        except Exception as exception:
+            raise _UnsupportedSchema(f"Could not resolve {ref}") from exception
+
+
 class TypeTransformer:
     """
     Class for transforming object before output.
+
+    Each schema is compiled once into a plan normalizing the records without going through the jsonschema validator. The compiled schema
+    is cached for each stream and reused as long as the stream gives the same schema, even if the stream builds a new schema for every
+    record, so the schema should not be modified once records have been transformed with it. Schemas using constructs that cannot be
+    compiled are processed by the jsonschema validator.
     """
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
@@ -57,6 +263,9 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # The schema compiled for each stream, or for the transformations without a stream under the None key
+        self._compiled_schemas: Dict[Optional[str], Tuple[Mapping[str, Any], Optional[_CompiledSchema]]] = {}
+        self._compiled_schemas_lock = threading.Lock()
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -70,6 +279,8 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        with self._compiled_schemas_lock:
+            self._compiled_schemas.clear()
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -172,14 +383,20 @@ class TypeTransformer:
 
         return normalizator
 
-    def transform(self, record: Dict[str, Any], schema: Mapping[str, Any]):
+    def transform(self, record: Dict[str, Any], schema: Mapping[str, Any], stream_name: Optional[str] = None):
         """
         Normalize and validate according to config.
         :param record: record instance for normalization/transformation. All modification are done by modifying existent object.
         :param schema: object's jsonschema for normalization.
+        :param stream_name: name of the stream the record belongs to, under which the compiled schema is cached.
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_schema = self._get_compiled_schema(schema, stream_name)
+        if compiled_schema is not None:
+            compiled_schema.transform(record, lambda e: logger.warning(self.get_error_message(e)))
+            return
+
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,6 +405,100 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any], stream_name: Optional[str]) -> Optional[_CompiledSchema]:
+        """
+        :return: The compiled schema or None if the schema can't be compiled
+        """
+        cached = self._compiled_schemas.get(stream_name)
+        # Streams like the HttpStream build a new schema for every record so the schema is compiled again only if it changed
+        if cached is not None and (cached[0] is schema or cached[0] == schema):
+            return cached[1]
+
+        with self._compiled_schemas_lock:
+            compiled_schema = None
+            try:
+                compiled_schema = _CompiledSchema(schema, self.__create_normalizer, self._normalizer.TYPE_CHECKER)
+            except _UnsupportedSchema as exception:
+                logger.debug(f"Schema can't be compiled, records will be transformed by the jsonschema validator: {exception}")
+            self._compiled_schemas[stream_name] = (schema, compiled_schema)
+        return compiled_schema
+
+    def __create_normalizer(self, subschema: Dict[str, Any]) -> Optional[Normalizer]:
+        """
+        Create a function applying the same transformations as __normalize for a given subschema.
+        :param subschema part of the jsonschema containing field type/format data.
+        :return The normalization function or None if values are left untouched.
+        """
+        normalizers: List[Normalizer] = []
+        if TransformConfig.DefaultSchemaNormalization in self._config:
+            default_normalizer = self.__create_default_converter(subschema)
+            if default_normalizer is not None:
+                normalizers.append(default_normalizer)
+        custom_normalizer = self._custom_normalizer
+        if custom_normalizer:
+            normalizers.append(lambda original_item: custom_normalizer(original_item, subschema))  # type: ignore[misc]
+
+        if not normalizers:
+            return None
+        if len(normalizers) == 1:
+            return normalizers[0]
+        first_normalizer, second_normalizer = normalizers
+        return lambda original_item: second_normalizer(first_normalizer(original_item))
+
+    def __create_default_converter(self, subschema: Dict[str, Any]) -> Optional[Normalizer]:
+        """
+        Specialize default_convert for a given subschema so that the subschema is not inspected for every value.
+        :return The conversion function or None if values are left untouched.
+        """
+        default_convert = self.default_convert
+        if type(self).default_convert is not TypeTransformer.default_convert:
+            return lambda original_item: default_convert(original_item, subschema)
+
+        try:
+            target_type = subschema.get("type", [])
+            null_allowed = "null" in target_type
+            if isinstance(target_type, list):
+                target_type = [t for t in target_type if t != "null"]
+                if len(target_type) != 1:
+                    return None
+                target_type = target_type[0]
+            if target_type == "array":
+                item_types = set(subschema.get("items", {}).get("type", set()))
+                wrap_in_array = item_types.issubset(json_to_python_simple)
+        except Exception:
+            # The subschema is not valid so the default conversion is applied as is
+            return lambda original_item: default_convert(original_item, subschema)
+
+        if target_type == "string":
+            conversion: Optional[Tuple[type, Callable[[Any], Any]]] = (str, str)
+        elif target_type == "number":
+            conversion = (float, float)
+        elif target_type == "integer":
+            conversion = (int, int)
+        elif target_type == "boolean":
+            conversion = (bool, lambda item: strtobool(item) == 1 if isinstance(item, str) else bool(item))
+        elif target_type == "array" and wrap_in_array:
+            conversion = (list, lambda item: [item] if type(item) in json_to_python_simple.values() else item)
+        else:
+            conversion = None
+
+        if conversion is None:
+            return None
+        converted_type, convert = conversion
+
+        def convert_value(original_item: Any) -> Any:
+            if type(original_item) is converted_type:
+                # Converting a value to its own type is a no-op
+                return original_item
+            if original_item is None and null_allowed:
+                return None
+            try:
+                return convert(original_item)
+            except (ValueError, TypeError):
+                return original_item
+
+        return convert_value
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
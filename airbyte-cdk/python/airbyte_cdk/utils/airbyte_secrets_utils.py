@@ -2,10 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Pattern, Tuple
 
 import dpath.util
 
+SECRET_MASK = "****"
+# Bounds the number of patterns kept for the combinations of secrets found in the filtered strings
+_MAX_CACHED_PATTERNS = 64
+
 
 def get_secret_paths(spec: Mapping[str, Any]) -> List[List[str]]:
     paths = []
@@ -53,20 +58,42 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
     return result
 
 
+class _SecretsMatcher:
+    """
+    Masks the secrets found in a string in a single pass, the longest secret first so that a secret containing another one is masked
+    as a whole.
+
+    Checking if a secret is in a string is much faster than matching a regular expression, so the pattern is only used for the strings
+    which contain secrets, and it only contains the secrets found. The patterns are cached by combination of secrets found.
+    """
+
+    def __init__(self, secrets: Iterable[Any]) -> None:
+        self._secrets = sorted({str(secret) for secret in secrets if secret}, key=len, reverse=True)
+        self._patterns: Dict[Tuple[str, ...], Pattern[str]] = {}
+
+    def mask(self, string: str) -> str:
+        secrets_found = tuple(secret for secret in self._secrets if secret in string)
+        if not secrets_found:
+            return string
+        pattern = self._patterns.get(secrets_found)
+        if pattern is None:
+            if len(self._patterns) >= _MAX_CACHED_PATTERNS:
+                self._patterns.clear()
+            pattern = self._patterns[secrets_found] = re.compile("|".join(re.escape(secret) for secret in secrets_found))
+        return pattern.sub(SECRET_MASK, string)
+
+
 __SECRETS_FROM_CONFIG: List[str] = []
+__SECRETS_MATCHER = _SecretsMatcher([])
 
 
-def update_secrets(secrets: List[str]):
+def update_secrets(secrets: List[str]) -> None:
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
+    global __SECRETS_FROM_CONFIG, __SECRETS_MATCHER
     __SECRETS_FROM_CONFIG = secrets
+    __SECRETS_MATCHER = _SecretsMatcher(secrets)
 
 
 def filter_secrets(string: str) -> str:
     """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    return __SECRETS_MATCHER.mask(string)
@@ -3,3 +3,8 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+ENV_INSTRUMENTATION_ENABLED = "AIRBYTE_CDK_INSTRUMENTATION"
+ENV_INSTRUMENTATION_SAMPLE_EVERY = "AIRBYTE_CDK_INSTRUMENTATION_SAMPLE_EVERY"
+ENV_INSTRUMENTATION_REPORT_INTERVAL_SECONDS = "AIRBYTE_CDK_INSTRUMENTATION_REPORT_INTERVAL_SECONDS"
+ENV_INSTRUMENTATION_PROMETHEUS_PATH = "AIRBYTE_CDK_INSTRUMENTATION_PROMETHEUS_PATH"
+ENV_CSV_ENGINE = "AIRBYTE_CDK_CSV_ENGINE"
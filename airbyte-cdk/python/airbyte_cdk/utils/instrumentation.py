@@ -0,0 +1,342 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import os
+import threading
+import time
+from enum import Enum
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.utils.constants import (
+    ENV_INSTRUMENTATION_ENABLED,
+    ENV_INSTRUMENTATION_PROMETHEUS_PATH,
+    ENV_INSTRUMENTATION_REPORT_INTERVAL_SECONDS,
+    ENV_INSTRUMENTATION_SAMPLE_EVERY,
+)
+
+DEFAULT_SAMPLE_EVERY = 16
+DEFAULT_REPORT_INTERVAL_SECONDS = 60.0
+# Upper bounds of the histogram buckets, in seconds. Per record stages take microseconds while requests and backoffs take seconds.
+DEFAULT_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0, 60.0)
+
+REPORT_MESSAGE_PREFIX = "CDK instrumentation report: "
+
+T = TypeVar("T")
+
+
+class Stage(str, Enum):
+    """
+    Stages of the path from the API to stdout that are instrumented
+    """
+
+    HTTP_REQUEST = "http_request"
+    BACKOFF = "backoff"
+    # Python streams decode, select and transform the records of a response in `parse_response`
+    PARSE_RESPONSE = "parse_response"
+    # Decoding the response and extracting the records of declarative streams
+    DECODE = "decode"
+    RECORD_FILTER = "record_filter"
+    TRANSFORMATION = "transformation"
+    NORMALIZATION = "normalization"
+    CHECKPOINT = "checkpoint"
+    SERIALIZATION = "serialization"
+
+
+class StageHistogram:
+    """
+    Number of times a stage ran for a stream and distribution of the durations of the sampled runs
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.calls = 0
+        self.sampled = 0
+        self.sampled_seconds = 0.0
+        self.max_seconds = 0.0
+        # The last count is for the durations above the last bucket
+        self.bucket_counts = [0] * (len(buckets) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.sampled += 1
+        self.sampled_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for index, upper_bound in enumerate(self.buckets):
+            if seconds <= upper_bound:
+                self.bucket_counts[index] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    @property
+    def estimated_total_seconds(self) -> float:
+        """
+        Total duration of the stage extrapolated from the sampled runs
+        """
+        return self.sampled_seconds / self.sampled * self.calls if self.sampled else 0.0
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return {
+            "calls": self.calls,
+            "sampled": self.sampled,
+            "mean_seconds": self.sampled_seconds / self.sampled if self.sampled else 0.0,
+            "max_seconds": self.max_seconds,
+            "estimated_total_seconds": self.estimated_total_seconds,
+        }
+
+
+class _Measurement:
+    __slots__ = ("_histogram", "_lock", "_start")
+
+    def __init__(self, histogram: StageHistogram, lock: threading.Lock) -> None:
+        self._histogram = histogram
+        self._lock = lock
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]) -> None:
+        duration = time.perf_counter() - self._start
+        with self._lock:
+            self._histogram.observe(duration)
+
+
+class _NoMeasurement:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]) -> None:
+        pass
+
+
+_NO_MEASUREMENT = _NoMeasurement()
+
+
+class Instrumentation:
+    """
+    Counts how many times each stage of a sync runs for each stream and how long it takes, to find where the time of a slow sync goes.
+
+    Every run of a stage is counted but only one run out of `sample_every` is timed, the first one included, so that instrumenting
+    the stages which run for every record costs little. The total duration of a stage is extrapolated from the sampled runs. When the
+    instrumentation is disabled, measuring a stage does nothing.
+
+    The counters are cumulative over the sync. They are reported as log messages every `report_interval_seconds` and at the end of
+    the sync, and written to a file in the Prometheus text format if `prometheus_path` is defined.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+        report_interval_seconds: float = DEFAULT_REPORT_INTERVAL_SECONDS,
+        prometheus_path: Optional[str] = None,
+    ) -> None:
+        """
+        :param enabled: If False, nothing is measured nor reported
+        :param sample_every: One run of a stage out of `sample_every` is timed
+        :param report_interval_seconds: Minimum time between two reports
+        :param prometheus_path: If defined, the counters are written to this file in the Prometheus text format on every report
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every should be at least 1 but was {sample_every}")
+        self.enabled = enabled
+        self.sample_every = sample_every
+        self.report_interval_seconds = report_interval_seconds
+        self.prometheus_path = prometheus_path
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], StageHistogram] = {}
+        self._last_report_time = time.monotonic()
+
+    @classmethod
+    def from_environment(cls, environment: Optional[Mapping[str, str]] = None) -> "Instrumentation":
+        """
+        :param environment: Variables configuring the instrumentation. Defaults to the environment of the process.
+        :return: The instrumentation configured by the AIRBYTE_CDK_INSTRUMENTATION* variables. It is disabled unless
+          AIRBYTE_CDK_INSTRUMENTATION is set to true.
+        """
+        environment = os.environ if environment is None else environment
+        return cls(
+            enabled=environment.get(ENV_INSTRUMENTATION_ENABLED, "").lower() in ("1", "true"),
+            sample_every=int(environment.get(ENV_INSTRUMENTATION_SAMPLE_EVERY, DEFAULT_SAMPLE_EVERY)),
+            report_interval_seconds=float(environment.get(ENV_INSTRUMENTATION_REPORT_INTERVAL_SECONDS, DEFAULT_REPORT_INTERVAL_SECONDS)),
+            prometheus_path=environment.get(ENV_INSTRUMENTATION_PROMETHEUS_PATH) or None,
+        )
+
+    def measure(self, stage: Stage, stream_name: str) -> Any:
+        """
+        Count a run of a stage and time it if it is sampled:
+
+            with instrumentation.measure(Stage.NORMALIZATION, stream_name):
+                transformer.transform(record, schema)
+
+        :param stage: The stage which runs in the context
+        :param stream_name: The stream the stage runs for
+        :return: A context manager timing the run
+        """
+        if not self.enabled:
+            return _NO_MEASUREMENT
+        with self._lock:
+            histogram = self._get_histogram(stage, stream_name)
+            histogram.calls += 1
+            if (histogram.calls - 1) % self.sample_every:
+                return _NO_MEASUREMENT
+        return _Measurement(histogram, self._lock)
+
+    def measure_iterable(self, stage: Stage, stream_name: str, iterable: Iterable[T]) -> Iterable[T]:
+        """
+        :param stage: The stage producing the items of the iterable
+        :param stream_name: The stream the stage runs for
+        :param iterable: Lazy iterable, like a generator, whose items are produced by the stage
+        :return: The iterable, counting and timing the production of every item as a run of the stage
+        """
+        if not self.enabled:
+            return iterable
+        return self._measure_iterator(stage, stream_name, iter(iterable))
+
+    def _measure_iterator(self, stage: Stage, stream_name: str, iterator: Iterator[T]) -> Iterator[T]:
+        while True:
+            with self.measure(stage, stream_name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def observe(self, stage: Stage, stream_name: str, seconds: float) -> None:
+        """
+        Record a run of a stage whose duration is already known, like a backoff. It is always sampled.
+
+        :param stage: The stage which ran
+        :param stream_name: The stream the stage ran for
+        :param seconds: Duration of the run
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._get_histogram(stage, stream_name)
+            histogram.calls += 1
+            histogram.observe(seconds)
+
+    def _get_histogram(self, stage: Stage, stream_name: str) -> StageHistogram:
+        key = (stream_name, stage.value)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = StageHistogram()
+        return histogram
+
+    def snapshot(self) -> Mapping[str, Mapping[str, Mapping[str, Any]]]:
+        """
+        :return: The counters of every stage which ran, by stream then by stage
+        """
+        snapshot: Dict[str, Dict[str, Mapping[str, Any]]] = {}
+        with self._lock:
+            for (stream_name, stage), histogram in sorted(self._histograms.items()):
+                snapshot.setdefault(stream_name, {})[stage] = histogram.as_dict()
+        return snapshot
+
+    def is_report_due(self) -> bool:
+        return self.enabled and time.monotonic() - self._last_report_time >= self.report_interval_seconds
+
+    def report(self) -> AirbyteMessage:
+        """
+        Write the counters to the Prometheus file if there is one.
+
+        :return: A log message with the counters of every stage
+        """
+        self._last_report_time = time.monotonic()
+        if self.prometheus_path:
+            self.write_prometheus_file(self.prometheus_path)
+        return AirbyteMessage(
+            type=MessageType.LOG,
+            log=AirbyteLogMessage(level=Level.INFO, message=REPORT_MESSAGE_PREFIX + json.dumps(self.snapshot())),
+        )
+
+    def to_prometheus_text(self) -> str:
+        """
+        :return: The counters in the Prometheus text exposition format
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            lines = [
+                "# HELP airbyte_cdk_stage_calls_total Number of times a stage ran",
+                "# TYPE airbyte_cdk_stage_calls_total counter",
+            ]
+            lines.extend(
+                f"airbyte_cdk_stage_calls_total{_labels(stream_name, stage)} {histogram.calls}"
+                for (stream_name, stage), histogram in histograms
+            )
+            lines.extend(
+                [
+                    "# HELP airbyte_cdk_stage_duration_seconds Duration of the sampled runs of a stage",
+                    "# TYPE airbyte_cdk_stage_duration_seconds histogram",
+                ]
+            )
+            for (stream_name, stage), histogram in histograms:
+                lines.extend(_histogram_lines(stream_name, stage, histogram))
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus_file(self, path: str) -> None:
+        """
+        Write the counters to a file, replacing it atomically so that a collector never reads a partially written file.
+
+        :param path: The file to write
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as prometheus_file:
+            prometheus_file.write(self.to_prometheus_text())
+        os.replace(temporary_path, path)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(stream_name: str, stage: str, **extra_labels: str) -> str:
+    labels = {"stream": stream_name, "stage": stage, **extra_labels}
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def _histogram_lines(stream_name: str, stage: str, histogram: StageHistogram) -> List[str]:
+    lines = []
+    cumulative_count = 0
+    for upper_bound, count in zip(histogram.buckets, histogram.bucket_counts):
+        cumulative_count += count
+        lines.append(f"airbyte_cdk_stage_duration_seconds_bucket{_labels(stream_name, stage, le=repr(upper_bound))} {cumulative_count}")
+    lines.append(f"airbyte_cdk_stage_duration_seconds_bucket{_labels(stream_name, stage, le='+Inf')} {histogram.sampled}")
+    lines.append(f"airbyte_cdk_stage_duration_seconds_sum{_labels(stream_name, stage)} {histogram.sampled_seconds}")
+    lines.append(f"airbyte_cdk_stage_duration_seconds_count{_labels(stream_name, stage)} {histogram.sampled}")
+    return lines
+
+
+_instrumentation: Optional[Instrumentation] = None
+_instrumentation_lock = threading.Lock()
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    :return: The instrumentation of the process, configured by the environment unless it was replaced using `set_instrumentation`
+    """
+    global _instrumentation
+    # Not locking once the instrumentation is created as it is looked up for every record
+    instrumentation = _instrumentation
+    if instrumentation is not None:
+        return instrumentation
+    with _instrumentation_lock:
+        if _instrumentation is None:
+            _instrumentation = Instrumentation.from_environment()
+        return _instrumentation
+
+
+def set_instrumentation(instrumentation: Instrumentation) -> None:
+    """
+    :param instrumentation: The instrumentation measuring the stages from now on
+    """
+    global _instrumentation
+    with _instrumentation_lock:
+        _instrumentation = instrumentation
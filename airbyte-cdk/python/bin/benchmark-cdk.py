@@ -0,0 +1,619 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmarks of the CDK, run without live APIs. Every benchmark prints one JSON object per line, which can be appended to a file with
+--output to track the results over time.
+
+throughput: measure the throughput, request latency and memory of connectors run end-to-end through the entrypoint. The built-in
+scenarios run a Python connector (HttpStream with schema normalization, JSON and CSV payloads) and a manifest connector
+(SimpleRetriever, JSON payloads) against a local stand-in server serving synthetic paginated payloads, which can add latency to every
+response and answer some requests with 429. Each scenario runs in its own process so its peak RSS is not affected by the others. Any
+connector can also be benchmarked by recording its traffic against the real API once, and replaying it as many times as needed.
+
+interpolation: compare the number of evaluations per second of JinjaInterpolation against parsing and compiling the template on every
+evaluation, as done for every record by a RecordFilter condition.
+
+serialization: compare the number of records per second serialized by the entrypoint against the pydantic-based serialization.
+
+Usage:
+    python bin/benchmark-cdk.py throughput [--scenarios python_json,python_csv,manifest_json] [--pages 50] [--records-per-page 500]
+        [--latency-ms 0] [--rate-limit-every 0] [--output results.jsonl]
+    python bin/benchmark-cdk.py throughput --source source_x.source:SourceX --config config.json --catalog catalog.json --record traffic.jsonl
+    python bin/benchmark-cdk.py throughput --source source_x.source:SourceX --config config.json --catalog catalog.json --replay traffic.jsonl
+    python bin/benchmark-cdk.py throughput --manifest source_x/manifest.yaml --config config.json --catalog catalog.json --replay traffic.jsonl
+    python bin/benchmark-cdk.py interpolation [--evaluations 100000] [--output results.jsonl]
+    python bin/benchmark-cdk.py serialization [--records 100000] [--fields 20] [--output results.jsonl]
+"""
+import argparse
+import ast
+import contextlib
+import csv
+import datetime
+import importlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib import metadata
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+import yaml
+from airbyte_cdk.entrypoint import AirbyteEntrypoint, launch
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    ConnectorSpecification,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from airbyte_cdk.sources import AbstractSource, Source
+from airbyte_cdk.sources.declarative.interpolation.filters import filters
+from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
+from airbyte_cdk.sources.declarative.interpolation.macros import macros
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.replay import RecordingAdapter, ReplayAdapter
+from airbyte_cdk.sources.streams.http.transport import HttpTransport, set_default_transport
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from jinja2 import meta
+from jinja2.sandbox import Environment
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+SCENARIOS = ["python_json", "python_csv", "manifest_json"]
+# Every message is written on its own line, and the record messages are the only ones starting with this
+RECORD_MESSAGE_START = '\n{"type": "RECORD"'
+RETRY_AFTER_SECONDS = "0.05"
+
+CONNECTION_SPECIFICATION = {"type": "object", "required": ["url_base"], "properties": {"url_base": {"type": "string"}}}
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "updated_at": {"type": "string", "format": "date-time"},
+        "name": {"type": "string"},
+        "amount": {"type": "number"},
+        "active": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "address": {"type": "object", "properties": {"city": {"type": "string"}, "zip": {"type": "string"}}},
+    },
+}
+
+
+def generate_page(page: int, records_per_page: int) -> List[Dict[str, Any]]:
+    start = (page - 1) * records_per_page
+    return [
+        {
+            "id": str(record_id),
+            "updated_at": (datetime.datetime(2023, 1, 1) + datetime.timedelta(seconds=record_id)).isoformat() + "Z",
+            "name": f"record {record_id} ünicode",
+            "amount": str(record_id * 1.5),
+            "active": record_id % 2 == 0,
+            "tags": [f"tag_{tag}" for tag in range(record_id % 5)],
+            "address": {"city": f"city {record_id % 100}", "zip": f"{record_id % 100000:05d}"},
+        }
+        for record_id in range(start, start + records_per_page)
+    ]
+
+
+class StandInServer:
+    """
+    Local HTTP server serving `pages` pages of synthetic records as JSON on /json and as CSV on /csv. The page is selected with the
+    `page` query parameter and the next page is given in the `next_page` field of the JSON payloads and in the X-Next-Page header.
+    """
+
+    def __init__(self, pages: int, records_per_page: int, latency_seconds: float = 0.0, rate_limit_every: int = 0):
+        self._pages = pages
+        self._latency_seconds = latency_seconds
+        self._rate_limit_every = rate_limit_every
+        self._request_count = 0
+        self._lock = threading.Lock()
+        # Payloads are generated once so the server uses as little CPU as possible while the connector runs
+        self._payloads: Dict[Tuple[str, int], bytes] = {}
+        for page in range(1, pages + 1):
+            records = generate_page(page, records_per_page)
+            next_page = page + 1 if page < pages else None
+            self._payloads[("/json", page)] = json.dumps({"data": records, "next_page": next_page}).encode("utf-8")
+            self._payloads[("/csv", page)] = self._to_csv(records).encode("utf-8")
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url_base(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def _to_csv(records: List[Dict[str, Any]]) -> str:
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=["id", "updated_at", "name", "amount", "active"], extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+        return output.getvalue()
+
+    def _respond(self, path: str, page: int) -> Tuple[int, Mapping[str, str], bytes]:
+        with self._lock:
+            self._request_count += 1
+            is_rate_limited = self._rate_limit_every and self._request_count % self._rate_limit_every == 0
+        if self._latency_seconds:
+            time.sleep(self._latency_seconds)
+        if is_rate_limited:
+            return 429, {"Retry-After": RETRY_AFTER_SECONDS}, b""
+        payload = self._payloads.get((path, page))
+        if payload is None:
+            return 404, {}, b""
+        headers = {"Content-Type": "application/json" if path == "/json" else "text/csv; charset=utf-8"}
+        if page < self._pages:
+            headers["X-Next-Page"] = str(page + 1)
+        return 200, headers, payload
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                page = int(parse_qs(url.query).get("page", ["1"])[0])
+                status, headers, body = server._respond(url.path, page)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+class BenchmarkStream(HttpStream):
+    primary_key = "id"
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    def __init__(self, url_base: str, payload_format: str):
+        super().__init__()
+        self._url_base = url_base
+        self._payload_format = payload_format
+
+    @property
+    def name(self) -> str:
+        return f"python_{self._payload_format}"
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def path(self, **kwargs: Any) -> str:
+        return self._payload_format
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> MutableMapping[str, Any]:
+        return {"page": next_page_token["page"] if next_page_token else 1}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.headers.get("X-Next-Page")
+        return {"page": int(next_page)} if next_page else None
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        if self._payload_format == "json":
+            yield from response.json()["data"]
+        else:
+            yield from csv.DictReader(io.StringIO(response.text))
+
+    def backoff_time(self, response: requests.Response) -> Optional[float]:
+        retry_after = response.headers.get("Retry-After")
+        return float(retry_after) if retry_after else None
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return SCHEMA
+
+
+class BenchmarkSource(AbstractSource):
+    def spec(self, logger: Any) -> ConnectorSpecification:
+        return ConnectorSpecification(connectionSpecification=CONNECTION_SPECIFICATION)
+
+    def check_connection(self, logger: Any, config: Mapping[str, Any]) -> Tuple[bool, Any]:
+        return True, None
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        return [BenchmarkStream(config["url_base"], "json"), BenchmarkStream(config["url_base"], "csv")]
+
+
+def manifest() -> Mapping[str, Any]:
+    return {
+        "version": "0.29.0",
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "name": "manifest_json",
+                "primary_key": "id",
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": SCHEMA},
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {
+                        "type": "HttpRequester",
+                        "url_base": "{{ config['url_base'] }}",
+                        "path": "json",
+                        "error_handler": {
+                            "type": "DefaultErrorHandler",
+                            "backoff_strategies": [{"type": "WaitTimeFromHeader", "header": "Retry-After"}],
+                        },
+                    },
+                    "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["data"]}},
+                    "paginator": {
+                        "type": "DefaultPaginator",
+                        "page_token_option": {"type": "RequestOption", "inject_into": "request_parameter", "field_name": "page"},
+                        "pagination_strategy": {
+                            "type": "CursorPagination",
+                            "cursor_value": "{{ response.next_page }}",
+                            "stop_condition": "{{ not response.next_page }}",
+                        },
+                    },
+                },
+            }
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["manifest_json"]},
+        "spec": {"type": "Spec", "connection_specification": CONNECTION_SPECIFICATION},
+    }
+
+
+class TimingAdapter(BaseAdapter):
+    """
+    Transport adapter measuring the time spent sending the requests and waiting for their responses
+    """
+
+    def __init__(self, adapter: BaseAdapter):
+        super().__init__()
+        self._adapter = adapter
+        self._lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.rate_limited_responses = 0
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        start = time.perf_counter()
+        response = self._adapter.send(request, **kwargs)
+        if not kwargs.get("stream"):
+            # Make sure the time to download the body is measured
+            response.content
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.latencies.append(latency)
+            self.rate_limited_responses += response.status_code == 429
+        return response
+
+    def close(self) -> None:
+        self._adapter.close()
+
+
+def percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    sorted_values = sorted(values)
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))]
+
+
+def create_source(spec: Mapping[str, Any]) -> Source:
+    if spec.get("source"):
+        module_name, class_name = spec["source"].split(":")
+        return getattr(importlib.import_module(module_name), class_name)()  # type: ignore[no-any-return]
+    if spec.get("manifest"):
+        with open(spec["manifest"]) as manifest_file:
+            return ManifestDeclarativeSource(yaml.safe_load(manifest_file))
+    if spec["scenario"].startswith("manifest"):
+        return ManifestDeclarativeSource(manifest())
+    return BenchmarkSource()
+
+
+def create_catalog(stream_name: str) -> Mapping[str, Any]:
+    stream = AirbyteStream(name=stream_name, json_schema=SCHEMA, supported_sync_modes=[SyncMode.full_refresh])
+    configured_stream = ConfiguredAirbyteStream(
+        stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite
+    )
+    return json.loads(ConfiguredAirbyteCatalog(streams=[configured_stream]).json(exclude_unset=True))  # type: ignore[no-any-return]
+
+
+class RecordCountingOutput(io.TextIOBase):
+    """
+    Stdout replacement discarding the messages written by the entrypoint, and counting the records among them
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = 0
+        self._at_line_start = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if s:
+            self.records += (("\n" if self._at_line_start else "") + s).count(RECORD_MESSAGE_START)
+            self._at_line_start = s.endswith("\n")
+        return len(s)
+
+
+def run_scenario(spec: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Read the scenario through the entrypoint, discarding the messages, and measure it. Runs in the process of the scenario.
+    """
+    if spec.get("replay"):
+        adapter: BaseAdapter = ReplayAdapter(spec["replay"])
+    elif spec.get("record"):
+        adapter = RecordingAdapter(spec["record"])
+    else:
+        adapter = HTTPAdapter()
+    timing_adapter = TimingAdapter(adapter)
+    set_default_transport(HttpTransport(adapter_factory=lambda: timing_adapter))
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path, catalog_path = spec.get("config"), spec.get("catalog")
+        if not config_path:
+            config_path = os.path.join(directory, "config.json")
+            with open(config_path, "w") as config_file:
+                json.dump({"url_base": spec["url_base"]}, config_file)
+        if not catalog_path:
+            catalog_path = os.path.join(directory, "catalog.json")
+            with open(catalog_path, "w") as catalog_file:
+                json.dump(create_catalog(spec["scenario"]), catalog_file)
+
+        source = create_source(spec)
+        output = RecordCountingOutput()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(output):
+            launch(source, ["read", "--config", config_path, "--catalog", catalog_path])
+        duration = time.perf_counter() - start
+
+    latencies = timing_adapter.latencies
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak_rss_mb = peak_rss / 1024 / 1024 if platform.system() == "Darwin" else peak_rss / 1024
+    return {
+        "scenario": spec["scenario"],
+        "records": output.records,
+        "requests": len(latencies),
+        "rate_limited_responses": timing_adapter.rate_limited_responses,
+        "duration_seconds": round(duration, 3),
+        "records_per_second": round(output.records / duration, 1) if duration else 0.0,
+        "request_latency_ms": {
+            name: round(percentile(latencies, percent) * 1000, 3) for name, percent in (("p50", 50), ("p90", 90), ("p99", 99))
+        },
+        # Time spent in the CDK and the connector for every request, rather than waiting for the API. Includes the backoff sleeps.
+        "cdk_time_per_request_ms": round((duration - sum(latencies)) * 1000 / len(latencies), 3) if latencies else None,
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    }
+
+
+def run_in_subprocess(spec: Mapping[str, Any]) -> Mapping[str, Any]:
+    completed_process = subprocess.run(
+        [sys.executable, __file__, "throughput", "--run-scenario", json.dumps(spec)],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    return json.loads(completed_process.stdout.strip().splitlines()[-1])  # type: ignore[no-any-return]
+
+
+def benchmark_throughput(args: argparse.Namespace, parser: argparse.ArgumentParser) -> List[Mapping[str, Any]]:
+    if args.source or args.manifest:
+        if not (args.config and args.catalog):
+            parser.error("--config and --catalog are required to benchmark a source")
+        spec = {
+            "scenario": args.source or args.manifest,
+            "source": args.source,
+            "manifest": args.manifest and os.path.abspath(args.manifest),
+            "config": os.path.abspath(args.config),
+            "catalog": os.path.abspath(args.catalog),
+            "record": args.record and os.path.abspath(args.record),
+            "replay": args.replay and os.path.abspath(args.replay),
+        }
+        return [run_in_subprocess(spec)]
+
+    parameters = {
+        "pages": args.pages,
+        "records_per_page": args.records_per_page,
+        "latency_ms": args.latency_ms,
+        "rate_limit_every": args.rate_limit_every,
+    }
+    with StandInServer(args.pages, args.records_per_page, args.latency_ms / 1000, args.rate_limit_every) as server:
+        return [
+            {**parameters, **run_in_subprocess({"scenario": scenario, "url_base": server.url_base})}
+            for scenario in args.scenarios.split(",")
+        ]
+
+
+TEMPLATES = {
+    "record_filter": "{{ record['updated_at'] >= stream_slice['start_time'] and record['status'] != 'deleted' }}",
+    "static_string": "https://api.example.com/v1/items",
+    "literal": "100",
+}
+
+
+def create_uncached_eval() -> Callable[[str, Mapping[str, Any]], Any]:
+    """
+    Return a function evaluating a template the way JinjaInterpolation does, but parsing and compiling it on every evaluation
+    """
+    environment = Environment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+
+    def uncached_eval(s: str, context: Mapping[str, Any]) -> Any:
+        undeclared = meta.find_undeclared_variables(environment.parse(s))
+        if any(variable not in context for variable in undeclared):
+            raise ValueError(f"Undeclared variables in {s}")
+        result = environment.from_string(s).render(context)
+        try:
+            return ast.literal_eval(result)
+        except (ValueError, SyntaxError):
+            return result
+
+    return uncached_eval
+
+
+def evaluations_per_second(evaluate: Callable[[], Any], number_of_evaluations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number_of_evaluations):
+        evaluate()
+    return round(number_of_evaluations / (time.perf_counter() - start), 1)
+
+
+def benchmark_interpolation(args: argparse.Namespace, parser: argparse.ArgumentParser) -> List[Mapping[str, Any]]:
+    interpolation = JinjaInterpolation()
+    uncached_eval = create_uncached_eval()
+    config: Mapping[str, Any] = {}
+    parameters = {
+        "record": {"updated_at": "2023-01-02", "status": "active"},
+        "stream_slice": {"start_time": "2023-01-01"},
+    }
+    context = {"config": config, **parameters}
+    results: List[Mapping[str, Any]] = []
+    for template_name, template in TEMPLATES.items():
+        if interpolation.eval(template, config, **parameters) != uncached_eval(template, context):
+            raise ValueError(f"Cached and uncached evaluations of {template} differ")
+        uncached = evaluations_per_second(lambda: uncached_eval(template, context), args.evaluations)
+        cached = evaluations_per_second(lambda: interpolation.eval(template, config, **parameters), args.evaluations)
+        results.append(
+            {
+                "template": template_name,
+                "evaluations": args.evaluations,
+                "uncached_evaluations_per_second": uncached,
+                "cached_evaluations_per_second": cached,
+                "speedup": round(cached / uncached, 1),
+            }
+        )
+    return results
+
+
+def generate_records(number_of_records: int, number_of_fields: int) -> List[Mapping[str, Any]]:
+    return [
+        {
+            "id": i,
+            "updated_at": datetime.datetime(2023, 1, 1).isoformat(),
+            "nested": {"values": list(range(5)), "name": f"name {i}"},
+            **{f"field_{field}": f"value {field} ünicode" for field in range(number_of_fields)},
+        }
+        for i in range(number_of_records)
+    ]
+
+
+def pydantic_serialization(records: Iterable[Mapping[str, Any]]) -> None:
+    for record in records:
+        message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=dict(record), emitted_at=1))
+        print(message.json(exclude_unset=True))
+
+
+def entrypoint_serialization(records: Iterable[Mapping[str, Any]]) -> None:
+    for record in records:
+        print(AirbyteEntrypoint.airbyte_message_to_string(stream_data_to_airbyte_message("stream", record)))
+
+
+def serialize(serialization: Callable[[Iterable[Mapping[str, Any]]], None], records: List[Mapping[str, Any]]) -> Tuple[float, List[str]]:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter()
+        serialization(records)
+        elapsed_time = time.perf_counter() - start
+    # emitted_at differs between the two serializations as it is the time the record was read
+    lines = [line.rsplit('"emitted_at": ', 1)[0] for line in output.getvalue().splitlines()]
+    return round(len(records) / elapsed_time, 1), lines
+
+
+def benchmark_serialization(args: argparse.Namespace, parser: argparse.ArgumentParser) -> List[Mapping[str, Any]]:
+    records = generate_records(args.records, args.fields)
+    pydantic_records_per_second, expected_lines = serialize(pydantic_serialization, records)
+    entrypoint_records_per_second, actual_lines = serialize(entrypoint_serialization, records)
+    if expected_lines != actual_lines:
+        raise ValueError("The entrypoint serialization does not produce the same output as the pydantic serialization")
+    return [
+        {
+            "records": args.records,
+            "fields": args.fields,
+            "pydantic_records_per_second": pydantic_records_per_second,
+            "entrypoint_records_per_second": entrypoint_records_per_second,
+            "speedup": round(entrypoint_records_per_second / pydantic_records_per_second, 1),
+        }
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    throughput_parser = subparsers.add_parser("throughput", help="Read connectors end-to-end through the entrypoint")
+    throughput_parser.set_defaults(run=benchmark_throughput)
+    throughput_parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help=f"Comma separated scenarios among {', '.join(SCENARIOS)}"
+    )
+    throughput_parser.add_argument("--pages", type=int, default=50)
+    throughput_parser.add_argument("--records-per-page", type=int, default=500)
+    throughput_parser.add_argument("--latency-ms", type=float, default=0.0, help="Time the stand-in server waits before every response")
+    throughput_parser.add_argument("--rate-limit-every", type=int, default=0, help="Answer every n-th request with 429")
+    throughput_parser.add_argument("--source", help="Benchmark this source instead of the scenarios, as module:SourceClass")
+    throughput_parser.add_argument("--manifest", help="Benchmark the source defined by this manifest instead of the scenarios")
+    throughput_parser.add_argument("--config", help="Config of the source given with --source or --manifest")
+    throughput_parser.add_argument("--catalog", help="Configured catalog of the source given with --source or --manifest")
+    throughput_parser.add_argument("--record", help="Record the traffic of the source to this file")
+    throughput_parser.add_argument("--replay", help="Replay the traffic recorded to this file instead of sending the requests")
+    throughput_parser.add_argument("--run-scenario", help=argparse.SUPPRESS)
+
+    interpolation_parser = subparsers.add_parser("interpolation", help="Evaluate Jinja templates with and without caching")
+    interpolation_parser.set_defaults(run=benchmark_interpolation)
+    interpolation_parser.add_argument("--evaluations", type=int, default=100_000)
+
+    serialization_parser = subparsers.add_parser("serialization", help="Serialize record messages with the entrypoint and pydantic")
+    serialization_parser.set_defaults(run=benchmark_serialization)
+    serialization_parser.add_argument("--records", type=int, default=100_000)
+    serialization_parser.add_argument("--fields", type=int, default=20)
+
+    for subparser in (throughput_parser, interpolation_parser, serialization_parser):
+        subparser.add_argument("--output", help="Append the results to this file, one JSON object per line")
+    args = parser.parse_args()
+
+    if getattr(args, "run_scenario", None):
+        print(json.dumps(run_scenario(json.loads(args.run_scenario))))
+        return
+
+    context = {
+        "benchmark": args.benchmark,
+        "cdk_version": metadata.version("airbyte_cdk"),
+        "python_version": platform.python_version(),
+        "started_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+    results = [{**context, **result} for result in args.run(args, parser)]
+    for result in results:
+        print(json.dumps(result))
+    if args.output:
+        with open(args.output, "a") as output:
+            for result in results:
+                output.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -136,6 +136,63 @@ class OrderedIterableMatcher(Iterable):
         return list(self) == list(other)
 
 
+class TestParseInputStream:
+    @pytest.mark.parametrize("validate_input_messages", [True, False])
+    @pytest.mark.parametrize(
+        "message",
+        [
+            pytest.param(_wrapped(_record("s1", {"k1": "v1", "nested": {"list": [1, None]}})), id="test_record"),
+            pytest.param(
+                AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="s1", namespace="ns", data={}, emitted_at=1)),
+                id="test_record_with_namespace",
+            ),
+            pytest.param(_wrapped(_state({"k1": "v1"})), id="test_state"),
+        ],
+    )
+    def test_given_valid_message_when_parse_input_stream_then_parse_message(
+        self, destination: Destination, validate_input_messages: bool, message: AirbyteMessage
+    ):
+        destination.validate_input_messages = validate_input_messages
+        input_stream = io.StringIO(message.json(exclude_unset=True) + "\n")
+
+        parsed_messages = list(destination._parse_input_stream(input_stream))
+
+        assert parsed_messages == [message]
+        assert parsed_messages[0].json(exclude_unset=True) == message.json(exclude_unset=True)
+
+    @pytest.mark.parametrize("validate_input_messages", [True, False])
+    @pytest.mark.parametrize(
+        "line",
+        [
+            pytest.param("not json", id="test_not_json"),
+            pytest.param("[]", id="test_not_an_object"),
+            pytest.param('{"type": "RECORD", "record": {"stream": "s1", "emitted_at": 0}}', id="test_record_without_data"),
+            pytest.param('{"type": "RECORD", "record": {"stream": "s1", "data": {}, "emitted_at": "a"}}', id="test_invalid_emitted_at"),
+            pytest.param('{"type": "UNKNOWN"}', id="test_unknown_type"),
+        ],
+    )
+    def test_given_invalid_message_when_parse_input_stream_then_ignore_message(
+        self, destination: Destination, validate_input_messages: bool, line: str
+    ):
+        destination.validate_input_messages = validate_input_messages
+        input_stream = io.StringIO(line + "\n" + _wrapped(_state({"k1": "v1"})).json(exclude_unset=True))
+
+        assert list(destination._parse_input_stream(input_stream)) == [_wrapped(_state({"k1": "v1"}))]
+
+    def test_given_record_envelope_needs_coercion_when_parse_input_stream_then_coerce_envelope(self, destination: Destination):
+        input_stream = io.StringIO('{"type": "RECORD", "record": {"stream": "s1", "data": {}, "emitted_at": 1.0}}')
+
+        assert list(destination._parse_input_stream(input_stream)) == [_wrapped(AirbyteRecordMessage(stream="s1", data={}, emitted_at=1))]
+
+    def test_given_strict_validation_when_parse_input_stream_then_validate_record_data(self, destination: Destination):
+        destination.validate_input_messages = True
+        input_stream = io.StringIO('{"type": "RECORD", "record": {"stream": "s1", "data": {}, "emitted_at": 1}}')
+
+        message = list(destination._parse_input_stream(input_stream))[0]
+
+        assert message.record.__fields_set__ == {"stream", "data", "emitted_at"}
+
+
 class TestRun:
     def test_run_initializes_exception_handler(self, mocker, destination: Destination):
         mocker.patch.object(destination_module, "init_uncaught_exception_handler")
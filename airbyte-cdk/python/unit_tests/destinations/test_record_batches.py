@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.destinations import RecordBatch, batch_input_messages
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Type
+
+
+def _record(stream: str, record_id: int, namespace: str = None) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, namespace=namespace, data={"id": record_id}, emitted_at=0)
+    )
+
+
+def _state() -> AirbyteMessage:
+    return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={}))
+
+
+def test_given_batch_size_reached_when_batch_input_messages_then_emit_batch():
+    messages = [_record("s1", i) for i in range(5)]
+
+    batches = list(batch_input_messages(messages, batch_size=2))
+
+    assert batches == [
+        RecordBatch("s1", None, [messages[0].record, messages[1].record]),
+        RecordBatch("s1", None, [messages[2].record, messages[3].record]),
+        RecordBatch("s1", None, [messages[4].record]),
+    ]
+
+
+def test_given_multiple_streams_when_batch_input_messages_then_batch_records_per_stream():
+    messages = [_record("s1", 1), _record("s2", 2), _record("s1", 3), _record("s1", 4, namespace="ns")]
+
+    batches = list(batch_input_messages(messages, batch_size=10))
+
+    assert batches == [
+        RecordBatch("s1", None, [messages[0].record, messages[2].record]),
+        RecordBatch("s2", None, [messages[1].record]),
+        RecordBatch("s1", "ns", [messages[3].record]),
+    ]
+
+
+def test_given_state_message_when_batch_input_messages_then_emit_pending_batches_before_state():
+    state = _state()
+    messages = [_record("s1", 1), _record("s2", 2), state, _record("s1", 3)]
+
+    batches = list(batch_input_messages(messages, batch_size=10))
+
+    assert batches == [
+        RecordBatch("s1", None, [messages[0].record]),
+        RecordBatch("s2", None, [messages[1].record]),
+        state,
+        RecordBatch("s1", None, [messages[3].record]),
+    ]
+
+
+def test_given_invalid_batch_size_when_batch_input_messages_then_raise_error():
+    with pytest.raises(ValueError):
+        list(batch_input_messages([], batch_size=0))
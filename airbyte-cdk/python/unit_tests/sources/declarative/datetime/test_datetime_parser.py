@@ -57,3 +57,62 @@ def test_format_datetime(test_name, input_dt, datetimeformat, expected_output):
     parser = DatetimeParser()
     output_date = parser.format(input_dt, datetimeformat)
     assert expected_output == output_date
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-01-01T00:00:00Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-01-01T00:00:00.123Z", "%Y-%m-%dT%H:%M:%S.%fZ"),
+        ("2021-01-01t00:00:00z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-01-01T00:00:00Z", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01T00:00:00-05:30", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01T00:00:00+05:30:15.5", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-1-2 3:4:5", "%Y-%m-%d %H:%M:%S"),
+        ("2021-01-02 \t03:04:05", "%Y-%m-%d %H:%M:%S"),
+        ("02/01/2021 100%", "%d/%m/%Y 100%%"),
+        ("Jan 02 2021", "%b %d %Y"),
+    ],
+)
+def test_given_format_when_parse_then_return_same_datetime_as_strptime(input_date, date_format):
+    expected_output_date = datetime.datetime.strptime(input_date, date_format)
+    if expected_output_date.tzinfo is None:
+        expected_output_date = expected_output_date.replace(tzinfo=datetime.timezone.utc)
+
+    output_date = DatetimeParser().parse(input_date, date_format)
+
+    assert output_date == expected_output_date
+    assert output_date.utcoffset() == expected_output_date.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-13-01", "%Y-%m-%d"),
+        ("2021-02-30", "%Y-%m-%d"),
+        ("2021-01-01T00:00:00", "%Y-%m-%d"),
+        ("2021-01-01T00:00:00+0530:15", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01", "%Y-%m-%d%"),
+    ],
+)
+def test_given_date_not_matching_format_when_parse_then_raise_error(input_date, date_format):
+    with pytest.raises(ValueError):
+        DatetimeParser().parse(input_date, date_format)
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format, expected_result",
+    [
+        ("2021-01-01T00:00:00.000000Z", "%Y-%m-%dT%H:%M:%S.%fZ", True),
+        ("2021-01-01", "%Y-%m-%d", True),
+        ("20210101", "%Y%m%d", True),
+        ("2021-1-1", "%Y-%m-%d", False),
+        ("2021-01-01T00:00:00.0Z", "%Y-%m-%dT%H:%M:%S.%fZ", False),
+        ("2021-01-01T00:00:00+00:00", "%Y-%m-%dT%H:%M:%S%z", False),
+        ("01/01/2021", "%d/%m/%Y", False),
+        ("1609459200", "%s", False),
+        (1609459200, "%Y", False),
+    ],
+)
+def test_is_lexicographically_ordered(input_date, date_format, expected_result):
+    assert DatetimeParser().is_lexicographically_ordered(input_date, date_format) == expected_result
@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import json
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
+
+
+def _response(content: bytes, encoding=None) -> requests.Response:
+    response = requests.Response()
+    response._content = content
+    response.encoding = encoding
+    return response
+
+
+def _streamed_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.raw = io.BytesIO(content)
+    return response
+
+
+@pytest.mark.parametrize(
+    "response_body, expected_json",
+    (
+        ("", {}),
+        ('{"healthcheck": {"status": "ok"}}', {"healthcheck": {"status": "ok"}}),
+        ("[1, 2]", [1, 2]),
+        ('{"healthcheck": "ok"} {}', {}),
+    ),
+)
+def test_decode(requests_mock, response_body, expected_json):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
+    response = requests.get("https://airbyte.io/")
+    assert StreamingJsonDecoder(parameters={}).decode(response) == expected_json
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+@pytest.mark.parametrize(
+    "document",
+    [
+        pytest.param({"data": [{"id": 123456789, "value": 1.5e10}, {"id": -2, "value": None}], "next": 1234}, id="numbers"),
+        pytest.param({"data": [{"name": "café ☃ \U0001F600"}], "next": "é"}, id="multibyte_characters"),
+        pytest.param({"data": [{"escaped": 'a "quoted" \\ value'}], "next": None}, id="escaped_characters"),
+        pytest.param({"data": [], "next": None}, id="no_records"),
+    ],
+)
+def test_given_values_spanning_several_chunks_when_iterate_records_then_records_are_parsed(document, chunk_size):
+    decoder = StreamingJsonDecoder(chunk_size=chunk_size, parameters={})
+    response = _response(json.dumps(document, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    assert list(decoder.iterate_records(response, ["data"])) == document["data"]
+    assert decoder.decode(response) == {"next": document["next"]}
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-32"])
+def test_given_response_not_encoded_in_utf8_when_iterate_records_then_encoding_is_detected(encoding):
+    document = {"data": [{"name": "café"}]}
+    response = _response(json.dumps(document).encode(encoding))
+
+    assert list(StreamingJsonDecoder(chunk_size=5, parameters={}).iterate_records(response, ["data"])) == document["data"]
+
+
+def test_given_records_were_iterated_when_decode_with_another_decoder_then_reuse_the_document():
+    response = _response(b'{"data": [{"id": 1}], "pagination": {"next": "cursor"}}')
+    list(StreamingJsonDecoder(parameters={}).iterate_records(response, ["data"]))
+    # The paginator could not parse the body again if it was streamed
+    response._content = b""
+
+    assert StreamingJsonDecoder(parameters={}).decode(response) == {"pagination": {"next": "cursor"}}
+
+
+def test_given_records_at_the_root_were_iterated_when_decode_then_document_is_empty():
+    response = _response(b'[{"id": 1}, {"id": 2}]')
+    list(StreamingJsonDecoder(parameters={}).iterate_records(response, []))
+
+    assert StreamingJsonDecoder(parameters={}).decode(response) == {}
+
+
+def test_given_streamed_response_not_fully_read_when_decode_then_document_is_empty():
+    response = _streamed_response(b'{"data": [{"id": 1}, {"id": 2}], "next": "cursor"}')
+    records = iter(StreamingJsonDecoder(chunk_size=4, parameters={}).iterate_records(response, ["data"]))
+    next(records)
+    records.close()
+
+    assert StreamingJsonDecoder(parameters={}).decode(response) == {}
+
+
+def test_given_streamed_response_when_iterate_records_then_body_is_read_incrementally():
+    body = json.dumps({"data": [{"id": index, "padding": "x" * 100} for index in range(1000)]}).encode("utf-8")
+    response = _streamed_response(body)
+
+    records = StreamingJsonDecoder(chunk_size=1024, parameters={}).iterate_records(response, ["data"])
+
+    assert next(iter(records)) == {"id": 0, "padding": "x" * 100}
+    assert response.raw.tell() < len(body) / 10
+
+
+def test_given_invalid_document_when_iterate_records_then_raise_error():
+    response = _response(b'{"data": [{"id": 1} {"id": 2}]}')
+
+    with pytest.raises(json.JSONDecodeError):
+        list(StreamingJsonDecoder(parameters={}).iterate_records(response, ["data"]))
@@ -2,19 +2,24 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
 
 decoder = JsonDecoder(parameters={})
+# A small chunk size makes sure values spanning several chunks are handled
+streaming_decoder = StreamingJsonDecoder(chunk_size=4, parameters={})
 
 
+@pytest.mark.parametrize("decoder", [pytest.param(decoder, id="json"), pytest.param(streaming_decoder, id="streaming_json")])
 @pytest.mark.parametrize(
     "test_name, field_path, body, expected_records",
     [
@@ -31,6 +36,12 @@ decoder = JsonDecoder(parameters={})
             [{"id": 1}, {"id": 2}],
         ),
         ("test_field_does_not_exist", ["record"], {"id": 1}, []),
+        ("test_field_is_empty", ["data"], {"data": {}}, []),
+        ("test_field_is_null", ["data"], {"data": None}, []),
+        ("test_field_is_a_scalar", ["data"], {"data": 123456}, [123456]),
+        ("test_path_through_a_scalar", ["data", "records"], {"data": "value"}, []),
+        ("test_path_through_a_list", ["data", "0", "records"], {"data": [{"records": [{"id": 1}]}]}, [{"id": 1}]),
+        ("test_fields_around_records", ["data"], {"before": [1, 2], "data": [{"id": 1}], "next": "cursor"}, [{"id": 1}]),
         ("test_nested_list", ["list", "*", "item"], {"list": [{"item": {"id": "1"}}]}, [{"id": "1"}]),
         (
             "test_complex_nested_list",
@@ -40,13 +51,62 @@ decoder = JsonDecoder(parameters={})
         ),
     ],
 )
-def test_dpath_extractor(test_name, field_path, body, expected_records):
+def test_dpath_extractor(test_name, field_path, body, expected_records, decoder):
     extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder, parameters=parameters)
 
     response = create_response(body)
     actual_records = extractor.extract_records(response)
 
-    assert actual_records == expected_records
+    assert list(actual_records) == expected_records
+
+
+@pytest.mark.parametrize("decoder", [pytest.param(decoder, id="json"), pytest.param(streaming_decoder, id="streaming_json")])
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b'{"data": {"id": 1', id="truncated"),
+        pytest.param(b'{"data": []} {}', id="extra_data"),
+    ],
+)
+def test_given_invalid_json_when_extract_records_then_return_no_records(decoder, body):
+    extractor = DpathExtractor(field_path=["data"], config=config, decoder=decoder, parameters=parameters)
+    response = requests.Response()
+    response._content = body
+
+    assert list(extractor.extract_records(response)) == []
+
+
+@pytest.mark.parametrize(
+    "field_path, body",
+    [
+        pytest.param(["data"], b'{"data": [{"id": 1}, {"id": 2}', id="truncated"),
+        pytest.param([], b'[{"a":1},{"a":2},{"a":3,"x":tru}]', id="invalid_record"),
+    ],
+)
+def test_given_streaming_decoder_and_invalid_json_after_some_records_when_extract_records_then_raise_error(field_path, body):
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=streaming_decoder, parameters=parameters)
+    response = requests.Response()
+    response._content = body
+
+    with pytest.raises(ValueError):
+        list(extractor.extract_records(response))
+
+
+def test_given_streaming_decoder_when_extract_records_then_response_is_read_as_records_are_iterated():
+    extractor = DpathExtractor(
+        field_path=["data"], config=config, decoder=StreamingJsonDecoder(chunk_size=16, parameters={}), parameters=parameters
+    )
+    body = json.dumps({"data": [{"id": i} for i in range(1000)]}).encode("utf-8")
+    response = requests.Response()
+    response.raw = io.BytesIO(body)
+
+    records = iter(extractor.extract_records(response))
+    assert response.raw.tell() == 0
+
+    assert next(records) == {"id": 0}
+    assert response.raw.tell() < len(body) / 10
+    assert list(records) == [{"id": i} for i in range(1, 1000)]
 
 
 def create_response(body):
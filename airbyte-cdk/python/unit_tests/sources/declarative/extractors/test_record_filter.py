@@ -53,3 +53,19 @@ def test_record_filter(test_name, filter_template, records, expected_records):
         records, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
     )
     assert actual_records == expected_records
+
+
+@pytest.mark.parametrize(
+    "condition, expected_ids",
+    [
+        pytest.param("{{ config['keep'] }}", [1, 2], id="test_condition_not_using_record_keeps_every_record"),
+        pytest.param("{{ config['drop'] }}", [], id="test_condition_not_using_record_drops_every_record"),
+        pytest.param("{{ record['id'] in config['ids'] }}", [2], id="test_condition_using_record"),
+    ],
+)
+def test_record_filter_on_a_page_of_records(condition, expected_ids):
+    record_filter = RecordFilter(config={"keep": True, "drop": False, "ids": [2]}, condition=condition, parameters={})
+
+    actual_records = record_filter.filter_records([{"id": 1}, {"id": 2}], stream_state={})
+
+    assert [record["id"] for record in actual_records] == expected_ids
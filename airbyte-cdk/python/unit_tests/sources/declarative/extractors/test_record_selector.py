@@ -3,7 +3,7 @@
 #
 
 import json
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 import requests
@@ -87,12 +87,44 @@ def test_record_filter(test_name, field_path, filter_template, body, expected_da
         response=response, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
     )
     assert actual_records == [Record(data, stream_slice) for data in expected_data]
-    calls = []
-    for record in expected_data:
-        calls.append(call(record, config=config, stream_state=stream_state, stream_slice=stream_slice))
     for transformation in transformations:
-        assert transformation.transform.call_count == len(expected_data)
-        transformation.transform.assert_has_calls(calls)
+        transformation.transform_records.assert_called_once_with(
+            expected_data, config=config, stream_state=stream_state, stream_slice=stream_slice
+        )
+
+
+def test_transformations_are_applied_to_the_whole_page_in_order():
+    class AppendToField(RecordTransformation):
+        def __init__(self, value):
+            self._value = value
+
+        def transform(self, record, config=None, stream_state=None, stream_slice=None):
+            record["applied"] = record.get("applied", "") + self._value
+            return record
+
+    extractor = DpathExtractor(field_path=["data"], decoder=JsonDecoder(parameters={}), config={}, parameters={})
+    record_selector = RecordSelector(
+        extractor=extractor, transformations=[AppendToField("a"), AppendToField("b")], config={}, parameters={}
+    )
+
+    actual_records = record_selector.select_records(
+        response=create_response({"data": [{"id": 1}, {"id": 2}]}), stream_state={}, stream_slice={}
+    )
+
+    assert actual_records == [Record({"id": 1, "applied": "ab"}, {}), Record({"id": 2, "applied": "ab"}, {})]
+
+
+def test_given_more_records_than_chunk_size_when_select_records_then_records_are_filtered_and_transformed_by_chunk():
+    transformation = Mock(spec=RecordTransformation)
+    extractor = DpathExtractor(field_path=["data"], decoder=JsonDecoder(parameters={}), config={}, parameters={})
+    record_selector = RecordSelector(extractor=extractor, transformations=[transformation], config={}, parameters={}, chunk_size=2)
+
+    actual_records = record_selector.select_records(
+        response=create_response({"data": [{"id": 1}, {"id": 2}, {"id": 3}]}), stream_state={}, stream_slice={}
+    )
+
+    assert actual_records == [Record({"id": 1}, {}), Record({"id": 2}, {}), Record({"id": 3}, {})]
+    assert [call.args[0] for call in transformation.transform_records.call_args_list] == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
 
 
 def create_response(body):
@@ -4,6 +4,7 @@
 
 import datetime
 import unittest
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
@@ -772,5 +773,64 @@ def test_given_no_cursor_value_for_first_than_second_then_return_false():
     assert not cursor.is_greater_than_or_equal(Record({}, {}), Record({"cursor_field": "2021-01-01"}, {}))
 
 
+@pytest.mark.parametrize(
+    "test_name, cursor_datetime_formats, first_cursor_value, second_cursor_value, expected_result",
+    [
+        (
+            "test_lexicographically_ordered_format",
+            ["%Y-%m-%dT%H:%M:%S.%fZ"],
+            "2023-01-01T00:00:00.000000Z",
+            "2023-01-01T00:00:00.000001Z",
+            False,
+        ),
+        ("test_equal_values", ["%Y-%m-%dT%H:%M:%S.%fZ"], "2023-01-01T00:00:00.000000Z", "2023-01-01T00:00:00.000000Z", True),
+        ("test_different_timezones", ["%Y-%m-%dT%H:%M:%S%z"], "2023-01-01T01:00:00+02:00", "2023-01-01T00:00:00Z", False),
+        ("test_values_not_zero_padded", ["%Y-%m-%d"], "2023-1-9", "2023-1-10", False),
+        ("test_values_of_different_formats", ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"], "2023-01-01", "2022-12-31T23:59:59", True),
+        ("test_timestamps", ["%s"], "999", "1000", False),
+    ],
+)
+def test_is_greater_than_or_equal(test_name, cursor_datetime_formats, first_cursor_value, second_cursor_value, expected_result):
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("3000-01-01", parameters={}),
+        cursor_field="cursor_field",
+        datetime_format="%Y-%m-%d",
+        cursor_datetime_formats=cursor_datetime_formats,
+        config=config,
+        parameters={},
+    )
+    first = Record({"cursor_field": first_cursor_value}, {})
+    second = Record({"cursor_field": second_cursor_value}, {})
+    assert cursor.is_greater_than_or_equal(first, second) == expected_result
+
+
+def test_given_lexicographically_ordered_format_when_is_greater_than_or_equal_then_do_not_parse_values():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("3000-01-01", parameters={}),
+        cursor_field="cursor_field",
+        datetime_format="%Y-%m-%dT%H:%M:%SZ",
+        config=config,
+        parameters={},
+    )
+    with patch.object(cursor, "parse_date", side_effect=AssertionError("values should be compared as strings")):
+        assert cursor.is_greater_than_or_equal(
+            Record({"cursor_field": "2023-01-02T00:00:00Z"}, {}), Record({"cursor_field": "2023-01-01T00:00:00Z"}, {})
+        )
+
+
+def test_given_value_parsed_before_when_parse_date_then_do_not_parse_again():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("3000-01-01", parameters={}),
+        cursor_field="cursor_field",
+        datetime_format="%Y-%m-%d",
+        config=config,
+        parameters={},
+    )
+    parsed_date = cursor.parse_date("2023-01-01")
+
+    with patch.object(cursor._parser, "parse", side_effect=AssertionError("value should not be parsed again")):
+        assert cursor.parse_date("2023-01-01") is parsed_date
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -290,3 +290,145 @@ def test_when_is_greater_than_or_equal_then_return_underlying_cursor_response(mo
 
     assert result == underlying_cursor.is_greater_than_or_equal.return_value
     underlying_cursor.is_greater_than_or_equal.assert_called_once_with(first_record, second_record)
+
+
+class _StateCursorFactory:
+    """
+    Creates mocked cursors keeping the state they are initialized with and comparing states on CURSOR_STATE_KEY
+    """
+
+    def __init__(self):
+        self.initial_states = []
+        self.cursors = []
+
+    def create(self):
+        cursor = MockedCursorBuilder().with_stream_slices([{}]).build()
+        self.cursors.append(cursor)
+        cursor.set_initial_state.side_effect = lambda state: self._set_state(cursor, state)
+        cursor.is_greater_than_or_equal.side_effect = lambda first, second: first[CURSOR_STATE_KEY] >= second[CURSOR_STATE_KEY]
+        return cursor
+
+    def _set_state(self, cursor, state):
+        self.initial_states.append(state)
+        cursor.get_stream_state.return_value = state
+
+
+def _partition(index):
+    return {"partition key": f"partition {index}"}
+
+
+def _state(partition_and_cursor_values, global_state=None, evicted_partitions=()):
+    state = {
+        "states": [
+            {"partition": _partition(index), "cursor": {CURSOR_STATE_KEY: value}} for index, value in partition_and_cursor_values.items()
+        ]
+    }
+    if global_state:
+        state["state"] = {CURSOR_STATE_KEY: global_state}
+        state["evicted_partitions"] = [_partition(index) for index in evicted_partitions]
+    return state
+
+
+def test_given_max_partitions_lower_than_one_when_create_then_raise_error(mocked_cursor_factory, mocked_partition_router):
+    with pytest.raises(ValueError):
+        PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, max_partitions=0)
+
+
+def test_given_more_partitions_than_max_when_stream_slices_then_least_recently_sliced_partitions_are_evicted(mocked_partition_router):
+    mocked_partition_router.stream_slices.return_value = [_partition(1), _partition(2)]
+    cursor = PerPartitionCursor(_StateCursorFactory(), mocked_partition_router, max_partitions=2)
+    cursor.set_initial_state(_state({0: "2023-01-03", 1: "2023-01-01"}))
+
+    list(cursor.stream_slices())
+
+    # partition 2 has no state yet as none of its slices were closed
+    assert cursor.get_stream_state() == _state({1: "2023-01-01"}, global_state="2023-01-03", evicted_partitions=[0])
+
+
+def test_given_no_max_partitions_when_stream_slices_then_no_partition_is_evicted(mocked_partition_router):
+    mocked_partition_router.stream_slices.return_value = [_partition(index) for index in range(100)]
+    cursor = PerPartitionCursor(_StateCursorFactory(), mocked_partition_router)
+    cursor.set_initial_state(_state({0: "2023-01-03"}))
+
+    list(cursor.stream_slices())
+
+    assert cursor.get_stream_state() == _state({0: "2023-01-03"})
+
+
+def test_given_several_partitions_evicted_when_get_stream_state_then_global_state_is_the_earliest_state(mocked_partition_router):
+    cursor = PerPartitionCursor(_StateCursorFactory(), mocked_partition_router, max_partitions=1)
+
+    cursor.set_initial_state(_state({0: "2023-01-02", 1: "2023-01-01", 2: "2023-01-03", 3: "2023-01-04"}))
+
+    assert cursor.get_stream_state() == _state({3: "2023-01-04"}, global_state="2023-01-01", evicted_partitions=[0, 1, 2])
+
+
+def test_given_partition_evicted_without_state_when_get_stream_state_then_no_global_state(mocked_partition_router):
+    cursor = PerPartitionCursor(_StateCursorFactory(), mocked_partition_router, max_partitions=1)
+    cursor.set_initial_state(_state({0: "2023-01-03"}))
+    mocked_partition_router.stream_slices.return_value = [_partition(1), _partition(2)]
+
+    list(cursor.stream_slices())
+
+    assert cursor.get_stream_state() == _state({})
+
+
+def test_given_global_state_when_stream_slices_then_only_evicted_partitions_start_from_global_state(mocked_partition_router):
+    cursor_factory = _StateCursorFactory()
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router)
+    cursor.set_initial_state(_state({0: "2023-01-03"}, global_state="2023-01-01", evicted_partitions=[1]))
+    mocked_partition_router.stream_slices.return_value = [_partition(0), _partition(1), _partition(2)]
+
+    list(cursor.stream_slices())
+
+    # partition 2 was never seen before so it starts without state
+    assert cursor_factory.initial_states == [{CURSOR_STATE_KEY: "2023-01-03"}, {CURSOR_STATE_KEY: "2023-01-01"}, {}]
+    assert cursor.get_stream_state() == _state({0: "2023-01-03", 1: "2023-01-01"}, global_state="2023-01-01")
+
+
+def test_given_first_sync_with_more_partitions_than_max_when_stream_slices_then_only_evicted_partitions_start_from_global_state(
+    mocked_partition_router,
+):
+    cursor_factory = _StateCursorFactory()
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router, max_partitions=1)
+    mocked_partition_router.stream_slices.return_value = [_partition(0), _partition(1), _partition(2), _partition(0)]
+    stream_slices = iter(cursor.stream_slices())
+
+    for cursor_value in ["2023-01-05", "2023-01-04", "2023-01-06"]:
+        next(stream_slices)
+        # the slice is read and closed before the next partition is sliced
+        cursor_factory.cursors[-1].get_stream_state.return_value = {CURSOR_STATE_KEY: cursor_value}
+    list(stream_slices)
+
+    assert cursor_factory.initial_states == [{}, {}, {}, {CURSOR_STATE_KEY: "2023-01-04"}]
+
+
+def test_given_no_slice_closed_since_last_checkpoint_when_get_stream_state_then_cursor_state_is_not_recomputed(
+    mocked_cursor_factory, mocked_partition_router
+):
+    underlying_cursor = MockedCursorBuilder().with_stream_slices([{}]).with_stream_state(CURSOR_STATE).build()
+    mocked_cursor_factory.create.side_effect = [underlying_cursor]
+    mocked_partition_router.stream_slices.return_value = [_partition(0)]
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router)
+    stream_slice = list(cursor.stream_slices())[0]
+
+    cursor.get_stream_state()
+    cursor.get_stream_state()
+    assert underlying_cursor.get_stream_state.call_count == 1
+
+    underlying_cursor.get_stream_state.return_value = {CURSOR_STATE_KEY: "a new state value"}
+    cursor.close_slice(stream_slice, None)
+    assert cursor.get_stream_state() == {"states": [{"partition": _partition(0), "cursor": {CURSOR_STATE_KEY: "a new state value"}}]}
+
+
+def test_given_compressed_state_when_set_initial_state_then_state_is_restored(mocked_partition_router):
+    state = _state({0: "2023-01-03"}, global_state="2023-01-01", evicted_partitions=[1])
+    cursor = PerPartitionCursor(_StateCursorFactory(), mocked_partition_router, compress_state=True)
+    cursor.set_initial_state(state)
+
+    compressed_state = cursor.get_stream_state()
+    restored_cursor = PerPartitionCursor(_StateCursorFactory(), mocked_partition_router)
+    restored_cursor.set_initial_state(compressed_state)
+
+    assert set(compressed_state.keys()) == {"compressed_states", "state", "compressed_evicted_partitions"}
+    assert restored_cursor.get_stream_state() == state
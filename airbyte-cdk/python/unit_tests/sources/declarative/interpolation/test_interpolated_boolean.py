@@ -38,3 +38,13 @@ config = {
 def test_interpolated_boolean(test_name, template, expected_result):
     interpolated_bool = InterpolatedBoolean(condition=template, parameters={"from_parameters": "come_find_me"})
     assert interpolated_bool.eval(config) == expected_result
+
+
+def test_eval_for_records():
+    interpolated_bool = InterpolatedBoolean(condition="{{ record['id'] > parameters['min_id'] }}", parameters={"min_id": 1})
+
+    assert interpolated_bool.eval_for_records(config, [{"id": 0}, {"id": 2}, {"id": 1}]) == [False, True, False]
+
+
+def test_given_boolean_condition_when_eval_for_records_then_return_condition_for_every_record():
+    assert InterpolatedBoolean(condition=True, parameters={}).eval_for_records(config, [{"id": 0}, {"id": 2}]) == [True, True]
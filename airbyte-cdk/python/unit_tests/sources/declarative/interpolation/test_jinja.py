@@ -3,6 +3,9 @@
 #
 
 import datetime
+import gc
+import weakref
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
@@ -224,3 +227,94 @@ def test_macros_examples(template_string, expected_value):
     # If you change the expected output, you must also change the expected output in declarative_component_schema.yaml
     now_utc = interpolation.eval(template_string, {})
     assert now_utc == expected_value
+
+
+@pytest.mark.parametrize(
+    "s, expected_value",
+    [
+        pytest.param("a static string", "a static string", id="test_static_string"),
+        pytest.param("{ not a template }", "{ not a template }", id="test_braces_are_not_a_template"),
+        pytest.param("trailing newline\n", "trailing newline", id="test_trailing_newline_is_stripped"),
+        pytest.param("windows\r\nnewline", "windows\nnewline", id="test_newlines_are_normalized"),
+        pytest.param("a {# comment #}", "a ", id="test_comment_is_removed"),
+    ],
+)
+def test_static_strings_are_rendered_like_templates(s, expected_value):
+    assert interpolation.eval(s, {}) == expected_value
+
+
+def test_template_is_compiled_once():
+    jinja_interpolation = JinjaInterpolation()
+    s = "{{ record['id'] > 1 }}"
+
+    with patch.object(jinja_interpolation._environment, "parse", wraps=jinja_interpolation._environment.parse) as parse:
+        assert jinja_interpolation.eval(s, {}, record={"id": 2}) is True
+        assert jinja_interpolation.eval(s, {}, record={"id": 0}) is False
+
+    parse.assert_called_once_with(s)
+
+
+def test_given_templates_compiled_when_interpolation_is_not_referenced_anymore_then_it_can_be_collected():
+    jinja_interpolation = JinjaInterpolation()
+    jinja_interpolation.eval("{{ config['key'] }}", {"key": "value"})
+    reference = weakref.ref(jinja_interpolation)
+
+    del jinja_interpolation
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_given_cached_template_when_variable_not_in_context_then_raise_error():
+    jinja_interpolation = JinjaInterpolation()
+    s = "{{ record['id'] }}"
+    jinja_interpolation.eval(s, {}, record={"id": 1})
+
+    with pytest.raises(ValueError):
+        jinja_interpolation.eval(s, {})
+
+
+def test_given_cache_full_when_compile_template_then_evict_least_recently_used_template():
+    jinja_interpolation = JinjaInterpolation()
+    with patch("airbyte_cdk.sources.declarative.interpolation.jinja._CACHE_SIZE", 2):
+        jinja_interpolation.eval("{{ config['first'] }}", {"first": 1})
+        jinja_interpolation.eval("{{ config['second'] }}", {"second": 2})
+        jinja_interpolation.eval("{{ config['first'] }}", {"first": 1})
+        jinja_interpolation.eval("{{ config['third'] }}", {"third": 3})
+
+    assert list(jinja_interpolation._compiled_templates) == ["{{ config['first'] }}", "{{ config['third'] }}"]
+
+
+def test_given_literal_is_mutable_when_eval_then_return_a_new_value_every_time():
+    first_value = interpolation.eval("{{ [1, 2] }}", {})
+    first_value.append(3)
+
+    assert interpolation.eval("{{ [1, 2] }}", {}) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "s, default, expected_values",
+    [
+        pytest.param("{{ record['id'] * 2 }}", None, [2, 4], id="test_template_using_record"),
+        pytest.param("{{ config['key'] }}", None, ["value", "value"], id="test_template_not_using_record"),
+        pytest.param("a static string", None, ["a static string", "a static string"], id="test_static_string"),
+        pytest.param("{{ record['missing'] }}", "{{ record['id'] }}", [1, 2], id="test_default_using_record"),
+        pytest.param("{{ config['missing'] }}", "default", ["default", "default"], id="test_default_not_using_record"),
+    ],
+)
+def test_eval_for_records(s, default, expected_values):
+    records = [{"id": 1}, {"id": 2}]
+
+    assert interpolation.eval_for_records(s, {"key": "value"}, records, default=default) == expected_values
+    assert [interpolation.eval(s, {"key": "value"}, default=default, record=record) for record in records] == expected_values
+
+
+def test_given_no_records_when_eval_for_records_then_return_empty_list():
+    assert interpolation.eval_for_records("{{ config['key'] }}", {"key": "value"}, []) == []
+
+
+def test_given_mutable_value_when_eval_for_records_then_return_a_new_value_for_every_record():
+    values = interpolation.eval_for_records("{{ [config['key']] }}", {"key": "value"}, [{}, {}])
+
+    assert values == [["value"], ["value"]]
+    assert values[0] is not values[1]
@@ -19,7 +19,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import SessionTokenProv
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -718,6 +718,93 @@ incremental_sync:
         )
 
 
+def test_create_record_selector_with_streaming_json_decoder():
+    content = """
+    selector:
+      type: RecordSelector
+      extractor:
+        type: DpathExtractor
+        field_path: ["data"]
+        decoder:
+          type: StreamingJsonDecoder
+          chunk_size: 1024
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    selector_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["selector"], {})
+
+    selector = factory.create_component(
+        model_type=RecordSelectorModel, component_definition=selector_manifest, transformations=[], config=input_config
+    )
+
+    assert isinstance(selector.extractor.decoder, StreamingJsonDecoder)
+    assert selector.extractor.decoder.chunk_size == 1024
+
+
+_STREAMING_DECODER = {"type": "StreamingJsonDecoder"}
+
+
+@pytest.mark.parametrize(
+    "extractor_decoder, paginator, expected_stream_response",
+    [
+        pytest.param(None, None, False, id="test_json_decoder"),
+        pytest.param(_STREAMING_DECODER, None, True, id="test_streaming_decoder_without_paginator"),
+        pytest.param(
+            _STREAMING_DECODER,
+            {"type": "DefaultPaginator", "pagination_strategy": {"type": "PageIncrement", "page_size": 10}},
+            True,
+            id="test_streaming_decoder_with_page_increment",
+        ),
+        pytest.param(
+            _STREAMING_DECODER,
+            {
+                "type": "DefaultPaginator",
+                "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response.next }}", "decoder": _STREAMING_DECODER},
+            },
+            True,
+            id="test_streaming_decoder_with_streaming_cursor_pagination",
+        ),
+        pytest.param(
+            _STREAMING_DECODER,
+            {"type": "DefaultPaginator", "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response.next }}"}},
+            False,
+            id="test_streaming_decoder_with_cursor_pagination_decoding_the_whole_response",
+        ),
+        pytest.param(
+            _STREAMING_DECODER,
+            {"type": "DefaultPaginator", "pagination_strategy": {"type": "OffsetIncrement", "page_size": 10}},
+            False,
+            id="test_streaming_decoder_with_offset_increment",
+        ),
+    ],
+)
+def test_simple_retriever_streams_response_only_if_every_component_reads_it_incrementally(
+    extractor_decoder, paginator, expected_stream_response
+):
+    extractor = {"type": "DpathExtractor", "field_path": ["data"]}
+    if extractor_decoder:
+        extractor["decoder"] = extractor_decoder
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "record_selector": {"type": "RecordSelector", "extractor": extractor},
+        "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+    }
+    if paginator:
+        simple_retriever_model["paginator"] = paginator
+
+    retriever = factory.create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition=simple_retriever_model,
+        config={},
+        name="Test",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    assert retriever.requester.stream_response == expected_stream_response
+
+
 @pytest.mark.parametrize(
     "test_name, record_selector, expected_runtime_selector",
     [("test_static_record_selector", "result", "result"), ("test_options_record_selector", "{{ parameters['name'] }}", "lists")],
@@ -1545,6 +1632,32 @@ def test_merge_incremental_and_partition_router(incremental, partition_router, e
         assert len(stream.retriever.stream_slicer.stream_slicerS) == len(partition_router)
 
 
+def test_given_max_partitions_and_compress_state_when_create_stream_then_per_partition_cursor_is_configured():
+    stream_model = {
+        "type": "DeclarativeStream",
+        "max_partitions": 100,
+        "compress_state": True,
+        "incremental_sync": {
+            "type": "DatetimeBasedCursor",
+            "datetime_format": "%Y-%m-%dT%H:%M:%S.%f%z",
+            "start_datetime": "{{ config['start_time'] }}",
+            "cursor_field": "created",
+        },
+        "retriever": {
+            "type": "SimpleRetriever",
+            "partition_router": {"type": "ListPartitionRouter", "values": "{{config['repos']}}", "cursor_field": "a_key"},
+            "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": []}},
+            "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+        },
+    }
+
+    stream = factory.create_component(model_type=DeclarativeStreamModel, component_definition=stream_model, config=input_config)
+
+    assert stream.retriever.stream_slicer._max_partitions == 100
+    assert stream.retriever.stream_slicer._compress_state
+
+
+
 def test_simple_retriever_emit_log_messages():
     simple_retriever_model = {
         "type": "SimpleRetriever",
@@ -10,6 +10,7 @@ from airbyte_cdk.sources.declarative.partition_routers.substream_partition_route
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.types import Record
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.streams.parent_record_cache import parent_record_cache_scope
 
 parent_records = [{"id": 1, "data": "data1"}, {"id": 2, "data": "data2"}]
 more_records = [{"id": 10, "data": "data10", "slice": "second_parent"}, {"id": 20, "data": "data20", "slice": "second_parent"}]
@@ -321,3 +322,40 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
 
     slices = list(partition_router.stream_slices())
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
+
+
+def test_given_children_sharing_a_parent_during_sync_when_stream_slices_then_parent_is_read_once():
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    read_records = parent_stream.read_records
+    read_slices = []
+
+    def read_records_spy(**kwargs):
+        read_slices.append(kwargs["stream_slice"])
+        return read_records(**kwargs)
+
+    parent_stream.read_records = read_records_spy
+    partition_routers = [
+        SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(stream=parent_stream, parent_key="id", partition_field="first_stream_id", parameters={}, config={})
+            ],
+            parameters={},
+            config={},
+        )
+        for _ in range(3)
+    ]
+
+    with parent_record_cache_scope():
+        slices = [list(partition_router.stream_slices()) for partition_router in partition_routers]
+
+    assert (
+        slices[0]
+        == slices[1]
+        == slices[2]
+        == [
+            {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+            {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+            {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
+        ]
+    )
+    assert read_slices == parent_slices
@@ -19,7 +19,9 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.error_handler imp
 from airbyte_cdk.sources.declarative.requesters.http_requester import HttpMethod, HttpRequester
 from airbyte_cdk.sources.declarative.requesters.request_options import InterpolatedRequestOptionsProvider
 from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.streams.call_rate import APIBudget, get_default_api_budget, set_default_api_budget
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
+from airbyte_cdk.sources.streams.http.transport import HttpTransport, get_default_transport
 from requests import PreparedRequest
 
 
@@ -849,3 +851,44 @@ def test_log_requests(should_log, status_code, should_throw):
     if should_log:
         assert repository.log_message.call_args_list[0].args[1]() == "formatted_response"
         formatter.assert_called_once_with(response)
+
+
+def test_given_no_transport_when_create_requester_then_use_default_transport():
+    requester = HttpRequester(name="name", url_base="https://test_base_url.com", path="/", config={}, parameters={})
+
+    assert requester._session.get_adapter("https://test_base_url.com") is get_default_transport().adapter
+
+
+def test_given_transport_when_create_requester_then_use_transport():
+    transport = HttpTransport()
+
+    requester = HttpRequester(name="name", url_base="https://test_base_url.com", path="/", config={}, parameters={}, transport=transport)
+
+    assert requester._session.get_adapter("https://test_base_url.com") is transport.adapter
+
+
+def test_given_api_budget_when_send_request_then_acquire_call_before_sending(requests_mock):
+    requests_mock.get("https://test_base_url.com/", headers={"X-RateLimit-Remaining": "10"})
+    api_budget = MagicMock(spec=APIBudget)
+    requester = HttpRequester(name="name", url_base="https://test_base_url.com", path="/", config={}, parameters={}, api_budget=api_budget)
+
+    requester.send_request()
+
+    assert [name for name, _, _ in api_budget.mock_calls] == ["acquire_call", "update_from_response"]
+    request, response = api_budget.update_from_response.call_args.args
+    assert request.url == "https://test_base_url.com/"
+    assert response.headers["X-RateLimit-Remaining"] == "10"
+
+
+def test_given_no_api_budget_when_send_request_then_use_default_api_budget(requests_mock):
+    requests_mock.get("https://test_base_url.com/")
+    previous_api_budget = get_default_api_budget()
+    api_budget = MagicMock(spec=APIBudget)
+    requester = HttpRequester(name="name", url_base="https://test_base_url.com", path="/", config={}, parameters={})
+    try:
+        set_default_api_budget(api_budget)
+        requester.send_request()
+    finally:
+        set_default_api_budget(previous_api_budget)
+
+    api_budget.acquire_call.assert_called_once()
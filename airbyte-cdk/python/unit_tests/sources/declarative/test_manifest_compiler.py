@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.sources.declarative.compiled_manifest import CompiledManifest, get_compiled_manifest_path
+from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+from airbyte_cdk.sources.declarative.manifest_compiler import compile_manifest_file, main
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+
+MANIFEST = """
+version: "0.29.3"
+definitions:
+  requester:
+    url_base: "https://api.sendgrid.com"
+    path: "/v3/marketing/lists"
+    authenticator:
+      type: "BearerAuthenticator"
+      api_token: "{{ config.apikey }}"
+streams:
+  - type: DeclarativeStream
+    $parameters:
+      name: "lists"
+      primary_key: id
+    schema_loader:
+      name: "{{ parameters.stream_name }}"
+      file_path: "./source_sendgrid/schemas/{{ parameters.name }}.yaml"
+    retriever:
+      requester:
+        $ref: "#/definitions/requester"
+      record_selector:
+        extractor:
+          field_path: ["result"]
+check:
+  type: CheckStream
+  stream_names: ["lists"]
+"""
+
+
+class FileYamlDeclarativeSource(YamlDeclarativeSource):
+    """
+    Reads the files from the file system instead of the package of the connector
+    """
+
+    def _read_file(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+
+@pytest.fixture
+def path_to_yaml(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    path.write_text(MANIFEST)
+    return str(path)
+
+
+def test_compiled_manifest_path():
+    assert get_compiled_manifest_path("source_sendgrid/manifest.yaml") == "source_sendgrid/manifest.compiled.json"
+    assert get_compiled_manifest_path("manifest.yml") == "manifest.compiled.json"
+
+
+def test_given_manifest_file_when_compile_then_write_resolved_manifest_next_to_it(path_to_yaml):
+    output_path = compile_manifest_file(path_to_yaml)
+
+    assert output_path == get_compiled_manifest_path(path_to_yaml)
+    with open(output_path) as f:
+        compiled_manifest = CompiledManifest.loads(f.read())
+    assert compiled_manifest.manifest == FileYamlDeclarativeSource(path_to_yaml).resolved_manifest
+    assert compiled_manifest.is_up_to_date()
+
+
+def test_given_output_path_when_main_then_write_compiled_manifest_to_output_path(path_to_yaml, tmp_path):
+    output_path = str(tmp_path / "compiled.json")
+
+    main([path_to_yaml, "--output", output_path])
+
+    with open(output_path) as f:
+        assert CompiledManifest.loads(f.read()).is_up_to_date()
+
+
+def test_given_compiled_manifest_when_create_source_then_do_not_resolve_and_validate_manifest(path_to_yaml):
+    compile_manifest_file(path_to_yaml)
+
+    with patch.object(ManifestDeclarativeSource, "_resolve_manifest") as resolve_manifest, patch.object(
+        ManifestDeclarativeSource, "_validate_source"
+    ) as validate_source:
+        source = FileYamlDeclarativeSource(path_to_yaml)
+
+    resolve_manifest.assert_not_called()
+    validate_source.assert_not_called()
+    streams = source.streams({"apikey": "key"})
+    assert len(streams) == 1
+    assert isinstance(streams[0], DeclarativeStream)
+    assert streams[0].name == "lists"
+
+
+def test_given_manifest_changed_after_compilation_when_create_source_then_use_manifest(path_to_yaml):
+    compile_manifest_file(path_to_yaml)
+    with open(path_to_yaml, "w") as f:
+        f.write(MANIFEST.replace('name: "lists"', 'name: "updated_lists"'))
+
+    source = FileYamlDeclarativeSource(path_to_yaml)
+
+    assert source.streams({"apikey": "key"})[0].name == "updated_lists"
+
+
+def test_given_manifest_compiled_with_another_cdk_version_when_create_source_then_use_manifest(path_to_yaml):
+    compiled_manifest_path = compile_manifest_file(path_to_yaml)
+    with open(compiled_manifest_path) as f:
+        compiled_manifest = json.load(f)
+    compiled_manifest["cdk_version"] = "0.0.0"
+    compiled_manifest["manifest"]["streams"] = []
+    with open(compiled_manifest_path, "w") as f:
+        json.dump(compiled_manifest, f)
+
+    source = FileYamlDeclarativeSource(path_to_yaml)
+
+    assert len(source.streams({"apikey": "key"})) == 1
+
+
+@pytest.mark.parametrize(
+    "compiled_manifest_content",
+    [
+        pytest.param("{", id="test_invalid_json"),
+        pytest.param("[]", id="test_not_an_object"),
+        pytest.param(json.dumps({"format_version": 0}), id="test_unsupported_format_version"),
+        pytest.param(json.dumps({"format_version": 1, "cdk_version": "0.0.0"}), id="test_missing_fields"),
+        pytest.param("\udcff", id="test_invalid_encoding"),
+    ],
+)
+def test_given_corrupted_compiled_manifest_when_create_source_then_use_manifest(path_to_yaml, compiled_manifest_content, caplog):
+    with open(get_compiled_manifest_path(path_to_yaml), "w", errors="surrogateescape") as f:
+        f.write(compiled_manifest_content)
+
+    with caplog.at_level(logging.WARNING):
+        source = FileYamlDeclarativeSource(path_to_yaml)
+
+    assert source.streams({"apikey": "key"})[0].name == "lists"
+    assert "could not be read" in caplog.text
+
+
+def test_given_outdated_compiled_manifest_when_create_manifest_declarative_source_then_raise_error(path_to_yaml):
+    compiled_manifest = FileYamlDeclarativeSource(path_to_yaml).compile()
+
+    with pytest.raises(ValueError):
+        ManifestDeclarativeSource(CompiledManifest(compiled_manifest.manifest, "0.0.0", compiled_manifest.schema_digest))
+
+
+def test_given_compiled_manifest_when_check_then_use_compiled_manifest(path_to_yaml):
+    compiled_manifest = CompiledManifest.loads(FileYamlDeclarativeSource(path_to_yaml).compile().dumps())
+    source = ManifestDeclarativeSource(compiled_manifest)
+
+    with patch.object(DeclarativeStream, "read_records", return_value=iter([{"id": 1}])):
+        status = source.check(logging.getLogger("airbyte"), {"apikey": "key"})
+
+    assert status.status.value == "SUCCEEDED"
+
+
+def test_given_unsupported_format_version_when_loads_then_raise_error():
+    with pytest.raises(ValueError):
+        CompiledManifest.loads(json.dumps({"format_version": 0, "manifest": {}}))
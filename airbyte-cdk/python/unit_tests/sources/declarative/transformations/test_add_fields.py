@@ -108,3 +108,42 @@ def test_add_fields(
 ):
     inputs = [AddedFieldDefinition(path=v[0], value=v[1], parameters={}) for v in field]
     assert AddFields(fields=inputs, parameters={"alas": "i live"}).transform(input_record, **kwargs) == expected
+
+
+def test_add_fields_to_a_page_of_records():
+    inputs = [
+        AddedFieldDefinition(path=["nested", "double"], value="{{ record['id'] * 2 }}", parameters={}),
+        AddedFieldDefinition(path=["from_config"], value="{{ config['key'] }}", parameters={}),
+        AddedFieldDefinition(path=["from_previous_field"], value="{{ record['nested']['double'] + 1 }}", parameters={}),
+        AddedFieldDefinition(path=["list"], value="{{ [record['id']] }}", parameters={}),
+    ]
+    records = [{"id": 1}, {"id": 2}]
+
+    AddFields(fields=inputs, parameters={}).transform_records(records, config={"key": "value"})
+
+    assert records == [
+        {"id": 1, "nested": {"double": 2}, "from_config": "value", "from_previous_field": 3, "list": [1]},
+        {"id": 2, "nested": {"double": 4}, "from_config": "value", "from_previous_field": 5, "list": [2]},
+    ]
+
+
+def test_given_constant_mutable_value_when_transform_records_then_records_do_not_share_the_value():
+    records = [{}, {}]
+
+    AddFields(fields=[AddedFieldDefinition(path=["k"], value="{{ [1] }}", parameters={})], parameters={}).transform_records(records)
+
+    assert records == [{"k": [1]}, {"k": [1]}]
+    assert records[0]["k"] is not records[1]["k"]
+
+
+@pytest.mark.parametrize(
+    ["input_record", "path", "expected"],
+    [
+        pytest.param({"k": [{}]}, ["k", 0, "added"], {"k": [{"added": "v"}]}, id="path going through a list"),
+        pytest.param({"k": {}}, "k/added", {"k": {"added": "v"}}, id="path as a string"),
+    ],
+)
+def test_add_fields_on_paths_not_made_of_objects(input_record: Mapping[str, Any], path: Any, expected: Mapping[str, Any]):
+    transformation = AddFields(fields=[AddedFieldDefinition(path=path, value="v", parameters={})], parameters={})
+
+    assert transformation.transform(input_record) == expected
@@ -46,3 +46,27 @@ from airbyte_cdk.sources.declarative.types import FieldPointer
 def test_remove_fields(input_record: Mapping[str, Any], field_pointers: List[FieldPointer], expected: Mapping[str, Any]):
     transformation = RemoveFields(field_pointers=field_pointers, parameters={})
     assert transformation.transform(input_record) == expected
+
+
+@pytest.mark.parametrize(
+    ["input_record", "field_pointers", "expected"],
+    [
+        pytest.param({"k1": "v", "k2": "v", "x": "v"}, [["k*"]], {"x": "v"}, id="remove fields matching a glob"),
+        pytest.param({".": {"k1": "v", "k2": "v"}}, [["*", "k?"]], {".": {}}, id="remove nested fields matching a glob"),
+        pytest.param({".": "v"}, [[".", "k1"]], {".": "v"}, id="remove a field nested in a value that is not an object"),
+        pytest.param({0: "v", "k1": "v"}, [["k1"]], {0: "v", "k1": None}, id="remove field of an object having a 0 key"),
+    ],
+)
+def test_remove_fields_matches_dpath_behavior(
+    input_record: Mapping[str, Any], field_pointers: List[FieldPointer], expected: Mapping[str, Any]
+):
+    transformation = RemoveFields(field_pointers=field_pointers, parameters={})
+    assert transformation.transform(input_record) == expected
+
+
+def test_remove_fields_from_a_page_of_records():
+    records = [{"k1": "v", "k2": {"k3": "v", "k4": "v"}}, {"k1": "v"}, {"k2": "v"}]
+
+    RemoveFields(field_pointers=[["k1"], ["k2", "k3"]], parameters={}).transform_records(records)
+
+    assert records == [{"k2": {"k4": "v"}}, {}, {"k2": "v"}]
@@ -8,7 +8,8 @@ import io
 import logging
 import unittest
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from functools import partial
+from typing import Any, Dict, Generator, Iterable, List, Set
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
@@ -25,7 +26,7 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import DIALECT_NAME, CsvParser, _ArrowCsvReader, _CsvReader
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -153,6 +154,36 @@ def test_to_nullable(row, strings_can_be_null, expected_output):
     assert nulled_row == expected_output
 
 
+def test_given_values_which_cannot_be_cast_when_to_records_then_keep_values_and_log_warnings_by_row() -> None:
+    batch = {"id": ["1", "two", "3"], "is_cool": ["yes", "maybe", "null"], "not_in_schema": ["a", "b", "c"]}
+    property_types = {"id": "integer", "is_cool": "boolean"}
+    csv_format = CsvFormat(null_values={"null"})
+    logger = Mock(spec=logging.Logger)
+
+    records = list(CsvParser._to_records(batch, property_types, csv_format, logger, cast_values=True))
+
+    assert records == [{"id": 1, "is_cool": True}, {"id": "two", "is_cool": "maybe"}, {"id": 3, "is_cool": None}]
+    assert logger.warning.call_args_list == [
+        mock.call(
+            "Could not cast the value to the expected type.: id: value=two,expected_type=integer,is_cool: value=maybe,expected_type=boolean"
+        ),
+        mock.call("Could not cast the value to the expected type.: is_cool: value=null,expected_type=boolean"),
+    ]
+
+
+def test_given_no_cast_when_to_records_then_only_nullify_values() -> None:
+    batch = {"id": ["1", "null"], "name": ["null", "bob"]}
+    csv_format = CsvFormat(null_values={"null"}, strings_can_be_null=False)
+
+    records = list(CsvParser._to_records(batch, {"name": "string"}, csv_format, logger, cast_values=False))
+
+    assert records == [{"id": "1", "name": "null"}, {"id": None, "name": "bob"}]
+
+
+def test_given_no_column_in_schema_when_to_records_then_yield_empty_records() -> None:
+    assert list(CsvParser._to_records({"id": ["1", "2"]}, {"other": "string"}, CsvFormat(), logger, cast_values=True)) == [{}, {}]
+
+
 _DEFAULT_TRUE_VALUES = {"1", "yes", "yeah", "right"}
 _DEFAULT_FALSE_VALUES = {"0", "no", "nop", "wrong"}
 
@@ -506,6 +537,148 @@ class CsvReaderTest(unittest.TestCase):
         return data_generator
 
 
+def _read_batches(
+    csv_reader: _CsvReader, csv_format: CsvFormat, data: str, open_as_text: bool = False
+) -> Generator[Dict[str, List[str]], None, None]:
+    config = FileBasedStreamConfig(name="test", validation_policy="Emit Record", file_type="csv", format=csv_format)
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(data.encode(csv_format.encoding))
+        if mode == FileReadMode.READ_BINARY and not open_as_text
+        # Like the files opened by smart_open, the line endings are translated
+        else io.TextIOWrapper(io.BytesIO(data.encode(csv_format.encoding)), encoding=csv_format.encoding)
+    )
+    file = RemoteFile(uri="a uri", last_modified=datetime.now())
+    return csv_reader.read_batches(config, file, stream_reader, logger, FileReadMode.READ, 2)
+
+
+def _to_rows(batches: Iterable[Dict[str, List[str]]]) -> Generator[Dict[str, str], None, None]:
+    for batch in batches:
+        for row in zip(*batch.values()):
+            yield dict(zip(batch.keys(), row))
+
+
+@pytest.mark.parametrize(
+    "csv_format, data",
+    [
+        pytest.param(CsvFormat(), "header1,header2\na,b\nc,\n,d\n", id="test_default"),
+        pytest.param(CsvFormat(skip_rows_before_header=2), "first line\nsecond line\nheader\na value\n", id="test_skip_rows_before_header"),
+        pytest.param(CsvFormat(skip_rows_after_header=1), "header\nskipped\na value\n", id="test_skip_rows_after_header"),
+        pytest.param(
+            CsvFormat(header_definition=CsvHeaderAutogenerated(), skip_rows_before_header=1, skip_rows_after_header=1),
+            "skip before\nskip after\n0,1,2\n3,4,5\n",
+            id="test_autogenerated_headers",
+        ),
+        pytest.param(
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["first", "second"])),
+            "0,1\n2,3\n",
+            id="test_user_provided_headers",
+        ),
+        pytest.param(CsvFormat(), 'header1,header2\n"a, quoted value",b\n', id="test_quoted_delimiter"),
+        pytest.param(CsvFormat(quote_char="|", delimiter=";"), "header1;header2\n|a; value|;b\n", id="test_quote_char"),
+        pytest.param(CsvFormat(escape_char="\\"), 'header1,header2\n"a \\"value\\"",b\\,c\n', id="test_escape_char"),
+        pytest.param(CsvFormat(double_quote=False), 'header1,header2\n"a ""value""",b\n', id="test_double_quote_off"),
+        pytest.param(CsvFormat(), 'header1,header2\r\n"multi\r\nline",b\r\n\r\nc,d\r\n', id="test_multiline_values_and_empty_lines"),
+        pytest.param(CsvFormat(), "header,header\na,b\n", id="test_duplicate_headers"),
+        pytest.param(CsvFormat(encoding="latin-1"), "header\ncafé\n", id="test_encoding"),
+    ],
+)
+def test_given_csv_when_read_batches_with_arrow_then_read_the_same_rows(csv_format: CsvFormat, data: str) -> None:
+    assert list(_to_rows(_read_batches(_ArrowCsvReader(), csv_format, data))) == list(
+        _to_rows(_read_batches(_CsvReader(), csv_format, data))
+    )
+
+
+def test_given_row_with_too_many_values_when_read_batches_with_arrow_then_yield_previous_rows_and_raise_error() -> None:
+    rows = _to_rows(_read_batches(_ArrowCsvReader(), CsvFormat(), "header\nvalue1\nvalue2\nvalue3\ntoo many,values\nvalue4\n"))
+
+    assert [next(rows) for _ in range(3)] == [{"header": "value1"}, {"header": "value2"}, {"header": "value3"}]
+    with pytest.raises(RecordParseError) as exception:
+        next(rows)
+    assert "lineno=5" in str(exception.value)
+    assert f"test{DIALECT_NAME}" not in csv.list_dialects()
+
+
+def test_given_stream_reader_opening_files_as_text_when_read_batches_with_arrow_then_read_with_csv_module() -> None:
+    assert list(_read_batches(_ArrowCsvReader(), CsvFormat(), "header\na\nb\nc\n", open_as_text=True)) == [
+        {"header": ["a", "b"]},
+        {"header": ["c"]},
+    ]
+
+
+@pytest.mark.parametrize(
+    "csv_format, data",
+    [
+        pytest.param(CsvFormat(), "header1,header2\na,b\nc,\n,d\n", id="test_default"),
+        pytest.param(CsvFormat(skip_rows_before_header=2), "first line\nsecond line\nheader\na value\n", id="test_skip_rows_before_header"),
+        pytest.param(CsvFormat(skip_rows_after_header=1), "header\nskipped\na value\nanother value", id="test_skip_rows_after_header"),
+        pytest.param(
+            CsvFormat(header_definition=CsvHeaderAutogenerated(), skip_rows_before_header=1),
+            "skip before\n0,1,2\n3,4,5\n",
+            id="test_autogenerated_headers",
+        ),
+        pytest.param(
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["first", "second"])),
+            "0,1\r\n2,3\r\n",
+            id="test_user_provided_headers",
+        ),
+        pytest.param(CsvFormat(encoding="latin-1"), "header\ncafé\nthé\n", id="test_encoding"),
+    ],
+)
+@pytest.mark.parametrize("range_size", [1, 5, 13, 1000])
+def test_given_contiguous_ranges_when_read_data_in_range_then_read_the_rows_of_the_file_once(
+    csv_format: CsvFormat, data: str, range_size: int
+) -> None:
+    config = FileBasedStreamConfig(name="test", validation_policy="Emit Record", file_type="csv", format=csv_format)
+    content = data.encode(csv_format.encoding)
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda *args: io.StringIO(data)
+    stream_reader.open_file_range.side_effect = lambda file, start, logger: io.BytesIO(content[start:])
+    stream_reader.read_lines_in_range.side_effect = partial(AbstractFileBasedStreamReader.read_lines_in_range, stream_reader)
+    file = RemoteFile(uri="a uri", last_modified=datetime.now(), size=len(content))
+
+    rows = [
+        row
+        for start in range(0, len(content), range_size)
+        for row in _CsvReader().read_data_in_range(config, file, stream_reader, logger, FileReadMode.READ, start, start + range_size)
+    ]
+
+    assert rows == list(_CsvReader().read_data(config, file, stream_reader, logger, FileReadMode.READ))
+    assert f"test{DIALECT_NAME}" not in csv.list_dialects()
+
+
+@pytest.mark.parametrize(
+    "encoding, values_contain_no_line_breaks, expected_can_parse_byte_ranges",
+    [
+        pytest.param("utf8", True, True, id="test_utf8"),
+        pytest.param("utf-8-sig", True, True, id="test_utf8_with_bom"),
+        pytest.param("latin-1", True, True, id="test_latin1"),
+        pytest.param("utf-16", True, False, id="test_utf16"),
+        pytest.param("utf8", False, False, id="test_values_can_contain_line_breaks"),
+    ],
+)
+def test_can_parse_byte_ranges(encoding: str, values_contain_no_line_breaks: bool, expected_can_parse_byte_ranges: bool) -> None:
+    config = FileBasedStreamConfig(
+        name="test",
+        validation_policy="Emit Record",
+        file_type="csv",
+        format=CsvFormat(encoding=encoding, values_contain_no_line_breaks=values_contain_no_line_breaks),
+    )
+    assert CsvParser().can_parse_byte_ranges(config) == expected_can_parse_byte_ranges
+
+
+@pytest.mark.parametrize(
+    "environment, expected_reader_type",
+    [
+        pytest.param({}, _CsvReader, id="test_csv_module_by_default"),
+        pytest.param({"AIRBYTE_CDK_CSV_ENGINE": "arrow"}, _ArrowCsvReader, id="test_arrow"),
+    ],
+)
+def test_csv_engine_from_environment(environment: Dict[str, str], expected_reader_type: type) -> None:
+    with mock.patch.dict("os.environ", environment, clear=True):
+        assert type(CsvParser()._csv_reader) is expected_reader_type
+
+
 def test_encoding_is_passed_to_stream_reader() -> None:
     parser = CsvParser()
     encoding = "ascii"
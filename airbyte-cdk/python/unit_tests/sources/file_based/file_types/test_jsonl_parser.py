@@ -5,8 +5,9 @@
 import asyncio
 import io
 import json
+from functools import partial
 from typing import Any, Dict
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
@@ -156,3 +157,71 @@ def test_given_unparsable_json_when_parse_records_then_raise_error(stream_reader
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+def test_given_multiline_json_object_with_brackets_in_strings_when_parse_records_then_parse_record_once_complete(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = [
+        "{\n",
+        '  "a": "} ] \\" {",\n',
+        '  "b": ["[", "\\\\"]\n',
+        "}\n",
+        '{"c": 1}\n',
+    ]
+
+    with patch("airbyte_cdk.sources.file_based.file_types.jsonl_parser.json.loads", wraps=json.loads) as loads:
+        records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == [{"a": '} ] " {', "b": ["[", "\\"]}, {"c": 1}]
+    # The first line is parsed by itself, then the multiline record is only parsed once complete
+    assert loads.call_count == 3
+
+
+def test_given_empty_lines_between_records_when_parse_records_then_return_records(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b'{"a": 1}\n\n{"a": 2}\n\n')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 1}, {"a": 2}]
+
+
+def test_given_invalid_line_after_records_when_parse_records_then_stop_parsing_file(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b'{"a": 1}\n{"a": }\n{"a": 2}\n')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 1}]
+
+
+def test_given_multiline_record_over_max_size_when_parse_records_then_raise_error(stream_reader: MagicMock, monkeypatch) -> None:
+    monkeypatch.setattr(JsonlParser, "MAX_BYTES_PER_MULTILINE_RECORD", 30)
+    stream_reader.open_file.return_value.__enter__.return_value = JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS + [b'{"never": "complete",'] * 5
+
+    with pytest.raises(RecordParseError) as exception:
+        list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert "lineno=10" in str(exception.value)
+
+
+def _ranged_stream_reader(content: bytes) -> MagicMock:
+    stream_reader = MagicMock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file_range.side_effect = lambda file, start, logger: io.BytesIO(content[start:])
+    stream_reader.read_lines_in_range.side_effect = partial(AbstractFileBasedStreamReader.read_lines_in_range, stream_reader)
+    return stream_reader
+
+
+@pytest.mark.parametrize("range_size", [1, 7, 20, 1000])
+def test_given_contiguous_ranges_when_parse_records_in_range_then_return_every_record_once(range_size: int) -> None:
+    content = b'{"a": 1, "b": "1"}\n\n{"a": 2, "b": "2"}\r\n{"a": 3, "b": "line\\nbreak"}'
+    stream_reader = _ranged_stream_reader(content)
+
+    records = [
+        record
+        for start in range(0, len(content), range_size)
+        for record in JsonlParser().parse_records_in_range(Mock(), Mock(), stream_reader, Mock(), None, start, start + range_size)
+    ]
+
+    assert records == [{"a": 1, "b": "1"}, {"a": 2, "b": "2"}, {"a": 3, "b": "line\nbreak"}]
+
+
+def test_given_multiline_record_when_parse_records_in_range_then_raise_error() -> None:
+    stream_reader = _ranged_stream_reader(b"\n".join(JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS))
+
+    with pytest.raises(RecordParseError):
+        list(JsonlParser().parse_records_in_range(Mock(), Mock(), stream_reader, Mock(), None, 0, 1000))
@@ -4,11 +4,13 @@
 
 import asyncio
 import datetime
+import io
 import math
 from typing import Any, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -173,12 +175,15 @@ def test_type_mapping(parquet_type: pa.DataType, expected_type: Mapping[str, str
 def test_value_transformation(
     pyarrow_type: pa.DataType, parquet_format: ParquetFormat, parquet_object: Scalar, expected_value: Any
 ) -> None:
-    pyarrow_value = pa.array([parquet_object], type=pyarrow_type)[0]
-    py_value = ParquetParser._to_output_value(pyarrow_value, parquet_format)
+    pyarrow_array = pa.array([parquet_object], type=pyarrow_type)
+    py_value = ParquetParser._to_output_value(pyarrow_array[0], parquet_format)
+    py_values = ParquetParser._to_output_values(pyarrow_array, parquet_format)
     if isinstance(py_value, float):
         assert math.isclose(py_value, expected_value, abs_tol=0.01)
+        assert math.isclose(py_values[0], expected_value, abs_tol=0.01)
     else:
         assert py_value == expected_value
+        assert py_values == [expected_value]
 
 
 def test_value_dictionary() -> None:
@@ -199,6 +204,110 @@ def test_value_none_binary() -> None:
         assert False, "`None` type binary should be handled properly"
 
 
+def test_value_none_values() -> None:
+    values = pa.array([None], type=pa.timestamp("s"))
+    assert ParquetParser._to_output_values(values, _default_parquet_format) == [None]
+
+
+def _parse_records(
+    table: pa.Table,
+    discovered_schema: Any,
+    uri: str = "s3://mybucket/test.parquet",
+    schemaless: bool = False,
+    validation_policy: ValidationPolicy = ValidationPolicy.emit_record,
+) -> Any:
+    parquet_file = io.BytesIO()
+    pq.write_table(table, parquet_file, row_group_size=3)
+    parquet_file.seek(0)
+    config = FileBasedStreamConfig(
+        name="test.parquet",
+        file_type="parquet",
+        format=_default_parquet_format,
+        validation_policy=validation_policy,
+        schemaless=schemaless,
+    )
+    stream_reader = Mock()
+    stream_reader.open_file.return_value = parquet_file
+    file = RemoteFile(uri=uri, last_modified=datetime.datetime.now())
+    return list(ParquetParser().parse_records(config, file, stream_reader, Mock(), discovered_schema))
+
+
+def test_given_batches_smaller_than_row_groups_when_parse_records_then_yield_every_row(monkeypatch) -> None:
+    monkeypatch.setattr(ParquetParser, "BATCH_SIZE", 2)
+    table = pa.table(
+        {
+            "id": list(range(7)),
+            "created_at": [datetime.datetime(2023, 1, 1, i) if i % 2 else None for i in range(7)],
+            "amount": pa.array([12 if i % 2 else None for i in range(7)], type=pa.decimal128(5, 3)),
+        }
+    )
+
+    records = _parse_records(table, None, uri="s3://mybucket/year=2023/test.parquet")
+
+    assert records == [
+        {
+            "id": i,
+            "created_at": f"2023-01-01T{i:02d}:00:00" if i % 2 else None,
+            "amount": "12.000" if i % 2 else None,
+            "year": "2023",
+        }
+        for i in range(7)
+    ]
+
+
+@pytest.mark.parametrize("range_size", [100, 400, 1000, 100_000])
+def test_given_contiguous_ranges_when_parse_records_in_range_then_return_every_row_once(range_size: int) -> None:
+    parquet_file = io.BytesIO()
+    pq.write_table(pa.table({"id": list(range(10))}), parquet_file, row_group_size=3)
+    content = parquet_file.getvalue()
+    config = FileBasedStreamConfig(name="test.parquet", file_type="parquet", format=_default_parquet_format)
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda *args: io.BytesIO(content)
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now(), size=len(content))
+
+    records = [
+        record
+        for start in range(0, len(content), range_size)
+        for record in ParquetParser().parse_records_in_range(config, file, stream_reader, Mock(), None, start, start + range_size)
+    ]
+
+    assert records == [{"id": i} for i in range(10)]
+
+
+@pytest.mark.parametrize(
+    "discovered_schema, schemaless, expected_records",
+    [
+        pytest.param({"type": "object", "properties": {"id": {"type": "integer"}}}, False, [{"id": 1}], id="test_project_catalog_columns"),
+        pytest.param(None, False, [{"id": 1, "name": "a"}], id="test_read_all_columns_without_catalog"),
+        pytest.param(
+            {"type": "object", "properties": {"other": {"type": "integer"}}},
+            False,
+            [{"id": 1, "name": "a"}],
+            id="test_read_all_columns_without_catalog_column",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {"data": {"type": "object"}}},
+            True,
+            [{"id": 1, "name": "a"}],
+            id="test_read_all_columns_when_schemaless",
+        ),
+    ],
+)
+def test_column_projection(discovered_schema: Any, schemaless: bool, expected_records: Any) -> None:
+    table = pa.table({"id": [1], "name": ["a"]})
+    assert _parse_records(table, discovered_schema, schemaless=schemaless) == expected_records
+
+
+@pytest.mark.parametrize("validation_policy", [ValidationPolicy.skip_record, ValidationPolicy.wait_for_discover])
+def test_given_validation_policy_checking_the_schema_when_parse_records_then_read_all_columns(validation_policy: ValidationPolicy) -> None:
+    table = pa.table({"id": [1], "name": ["a"]})
+    discovered_schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+    records = _parse_records(table, discovered_schema, validation_policy=validation_policy)
+
+    assert records == [{"id": 1, "name": "a"}]
+
+
 @pytest.mark.parametrize(
     "file_format",
     [
@@ -257,6 +257,13 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                                     "airbyte_hidden": True,
                                                     "enum": ["None", "Primitive Types Only"],
                                                 },
+                                                "values_contain_no_line_breaks": {
+                                                    "title": "Values Contain No Line Breaks",
+                                                    "description": "Whether every value of the files fits on a single line. Files are only split into byte ranges when this is true, as a quoted value containing a line break could be split across two ranges.",
+                                                    "default": False,
+                                                    "airbyte_hidden": True,
+                                                    "type": "boolean",
+                                                },
                                             },
                                         },
                                         {
@@ -292,6 +299,29 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                     "default": False,
                                     "type": "boolean",
                                 },
+                                "partitions_to_prefetch": {
+                                    "title": "Partitions To Prefetch",
+                                    "description": "The number of file partitions read and parsed ahead of the partition whose records are being synced. A file is a single partition unless it is split according to Bytes Per File Partition. Files are read one after the other when 0. Prefetching requires the stream reader to be safe to use from several threads.",
+                                    "default": 0,
+                                    "minimum": 0,
+                                    "airbyte_hidden": True,
+                                    "type": "integer",
+                                },
+                                "max_prefetched_records": {
+                                    "title": "Max Prefetched Records",
+                                    "description": "The maximum number of records held in memory for the files, or file partitions, being read when files are prefetched.",
+                                    "default": 10000,
+                                    "exclusiveMinimum": 0,
+                                    "airbyte_hidden": True,
+                                    "type": "integer",
+                                },
+                                "bytes_per_file_partition": {
+                                    "title": "Bytes Per File Partition",
+                                    "description": "Files larger than this number of bytes are split into partitions of about this size, which are prefetched like files. CSV and JSONL files are split on line breaks so their records should not span multiple lines, and CSV files are only split if their format states that values contain no line breaks. Files are not split if not set.",
+                                    "exclusiveMinimum": 0,
+                                    "airbyte_hidden": True,
+                                    "type": "integer",
+                                },
                             },
                             "required": ["name", "format"],
                         },
@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import time
 import unittest
 from datetime import datetime, timezone
 from typing import Any, Iterable, Iterator, Mapping
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from airbyte_cdk.models import Level
@@ -71,6 +72,8 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         self._stream_config = Mock()
         self._stream_config.format = MockFormat()
         self._stream_config.name = "a stream name"
+        self._stream_config.partitions_to_prefetch = 0
+        self._stream_config.bytes_per_file_partition = None
         self._catalog_schema = Mock()
         self._stream_reader = Mock(spec=AbstractFileBasedStreamReader)
         self._availability_strategy = Mock(spec=AbstractFileBasedAvailabilityStrategy)
@@ -159,6 +162,102 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         }
         assert self._parser.infer_schema.call_count == 3
 
+    def test_given_partitions_to_prefetch_when_read_records_from_slices_then_return_records_and_add_files_in_order(self) -> None:
+        stream = self._stream_with_prefetching(partitions_to_prefetch=2)
+        files = [RemoteFile(uri=f"file{i}", last_modified=datetime(2022, 10, 22, i, tzinfo=timezone.utc)) for i in range(5)]
+        self._cursor.get_files_to_sync.return_value = list(reversed(files))
+        self._stream_reader.get_matching_files.return_value = files
+
+        def parse_records(config: Any, file: RemoteFile, *args: Any) -> Iterator[Mapping[str, Any]]:
+            if file.uri == "file0":
+                # Gives the next files the time to be parsed before the records of the first one are read
+                time.sleep(0.1)
+            for i in range(3):
+                yield {"file": file.uri, "line": i}
+
+        self._parser.parse_records.side_effect = parse_records
+        slices = stream.compute_slices()
+        messages = [message for stream_slice in slices for message in stream.read_records_from_slice(stream_slice)]  # type: ignore
+
+        assert [message.record.data["data"] for message in messages] == [{"file": file.uri, "line": i} for file in files for i in range(3)]
+        assert [call.args[0] for call in self._cursor.add_file.call_args_list] == files
+
+    def test_given_partitions_to_prefetch_and_exception_when_read_records_from_slice_then_do_process_other_files(self) -> None:
+        stream = self._stream_with_prefetching(partitions_to_prefetch=1)
+        self._parser.parse_records.side_effect = [self._iter([self._A_RECORD, ValueError("An error")]), [self._A_RECORD]]
+
+        messages = list(
+            stream.read_records_from_slice(
+                {
+                    "files": [
+                        RemoteFile(uri="invalid_file", last_modified=self._NOW),
+                        RemoteFile(uri="valid_file", last_modified=self._NOW),
+                    ]
+                }
+            )
+        )
+
+        assert messages[0].record.data["data"] == self._A_RECORD
+        assert messages[1].log.level == Level.ERROR
+        assert "line_no=1" in messages[1].log.message
+        assert messages[2].record.data["data"] == self._A_RECORD
+        self._cursor.add_file.assert_called_once_with(RemoteFile(uri="valid_file", last_modified=self._NOW))
+
+    def test_given_partitions_to_prefetch_when_read_records_stops_before_the_end_then_stop_prefetching(self) -> None:
+        stream = self._stream_with_prefetching(partitions_to_prefetch=2)
+        files = [RemoteFile(uri=f"file{i}", last_modified=datetime(2022, 10, 22, i, tzinfo=timezone.utc)) for i in range(5)]
+        self._cursor.get_files_to_sync.return_value = files
+        self._stream_reader.get_matching_files.return_value = files
+        self._parser.parse_records.side_effect = lambda config, file, *args: [{"file": file.uri, "line": i} for i in range(3)]
+        slices = stream.compute_slices()
+
+        with patch.object(stream._prefetcher, "cancel", wraps=stream._prefetcher.cancel) as cancel:
+            messages = stream.read_records_from_slice(slices[0])  # type: ignore
+            next(messages)
+            messages.close()  # type: ignore
+
+        cancel.assert_called_once()
+        assert not stream._prefetcher._prefetched_partitions  # type: ignore
+
+    def test_given_bytes_per_file_partition_when_read_records_from_slice_then_parse_ranges_of_large_files_and_add_files_once(self) -> None:
+        self._stream_config.bytes_per_file_partition = 4
+        self._stream_config.schemaless = True
+        self._stream_reader.can_read_byte_ranges.return_value = True
+        self._parser.can_parse_byte_ranges.return_value = True
+        self._parser.parse_records.side_effect = lambda config, file, *args: [{"file": file.uri}]
+        self._parser.parse_records_in_range.side_effect = lambda config, file, reader, logger, schema, start, end: [
+            {"file": file.uri, "start": start, "end": end}
+        ]
+        large_file = RemoteFile(uri="large_file", last_modified=self._NOW, size=10)
+        small_file = RemoteFile(uri="small_file", last_modified=self._NOW, size=4)
+
+        for stream in [self._stream, self._stream_with_prefetching(partitions_to_prefetch=2)]:
+            self._cursor.reset_mock()
+            messages = list(stream.read_records_from_slice({"files": [large_file, small_file]}))
+
+            assert [message.record.data["data"] for message in messages] == [
+                {"file": "large_file", "start": 0, "end": 4},
+                {"file": "large_file", "start": 4, "end": 8},
+                {"file": "large_file", "start": 8, "end": 10},
+                {"file": "small_file"},
+            ]
+            assert [call.args[0] for call in self._cursor.add_file.call_args_list] == [large_file, small_file]
+
+    def _stream_with_prefetching(self, partitions_to_prefetch: int) -> DefaultFileBasedStream:
+        self._stream_config.partitions_to_prefetch = partitions_to_prefetch
+        self._stream_config.max_prefetched_records = 2
+        self._stream_config.schemaless = True
+        return DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=self._catalog_schema,
+            stream_reader=self._stream_reader,
+            availability_strategy=self._availability_strategy,
+            discovery_policy=self._discovery_policy,
+            parsers={MockFormat: self._parser},
+            validation_policy=self._validation_policy,
+            cursor=self._cursor,
+        )
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from airbyte_cdk.sources.file_based.remote_file import FilePartition, RemoteFile
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
+
+_PARTITIONS = [FilePartition(file=RemoteFile(uri=f"file{i}", last_modified=datetime(2023, 6, 5, 3, 54, i))) for i in range(4)]
+
+
+def _records(partition: FilePartition, n_records: int = 3) -> List[Dict[str, Any]]:
+    return [{"file": partition.file.uri, "line": line} for line in range(n_records)]
+
+
+def test_given_partitions_scheduled_when_parse_records_then_parse_next_partitions_while_the_records_of_the_partition_are_read() -> None:
+    last_partition_parsed = threading.Event()
+
+    def parse_partition(partition: FilePartition) -> Iterator[Dict[str, Any]]:
+        if partition == _PARTITIONS[0]:
+            # The records of the first partition are only returned once the partitions after it were parsed concurrently
+            assert last_partition_parsed.wait(timeout=5)
+        if partition == _PARTITIONS[2]:
+            last_partition_parsed.set()
+        yield from _records(partition)
+
+    prefetcher = FilePrefetcher(parse_partition, partitions_to_prefetch=2, max_prefetched_records=100)
+    prefetcher.schedule(_PARTITIONS[:3])
+
+    assert [record for partition in _PARTITIONS[:3] for record in prefetcher.parse_records(partition)] == [
+        record for partition in _PARTITIONS[:3] for record in _records(partition)
+    ]
+
+
+def test_given_budget_smaller_than_partition_when_parse_records_then_return_all_records() -> None:
+    prefetcher = FilePrefetcher(
+        lambda partition: iter(_records(partition, n_records=1_000)), partitions_to_prefetch=3, max_prefetched_records=10
+    )
+    prefetcher.schedule(_PARTITIONS)
+
+    assert [record for partition in _PARTITIONS for record in prefetcher.parse_records(partition)] == [
+        record for partition in _PARTITIONS for record in _records(partition, n_records=1_000)
+    ]
+
+
+def test_given_partition_skipped_when_parse_records_then_do_not_return_records_of_skipped_partition() -> None:
+    parsed_partitions = []
+
+    def parse_partition(partition: FilePartition) -> Iterator[Dict[str, Any]]:
+        parsed_partitions.append(partition)
+        yield from _records(partition)
+
+    prefetcher = FilePrefetcher(parse_partition, partitions_to_prefetch=1, max_prefetched_records=100)
+    prefetcher.schedule(_PARTITIONS)
+
+    assert list(prefetcher.parse_records(_PARTITIONS[0])) == _records(_PARTITIONS[0])
+    assert list(prefetcher.parse_records(_PARTITIONS[2])) == _records(_PARTITIONS[2])
+    assert list(prefetcher.parse_records(_PARTITIONS[3])) == _records(_PARTITIONS[3])
+    assert _PARTITIONS[0] in parsed_partitions and _PARTITIONS[3] in parsed_partitions
+
+
+def test_given_exception_when_parse_records_then_return_records_parsed_before_and_raise() -> None:
+    def parse_partition(partition: FilePartition) -> Iterator[Dict[str, Any]]:
+        yield from _records(partition)
+        raise ValueError("An error")
+
+    prefetcher = FilePrefetcher(parse_partition, partitions_to_prefetch=1, max_prefetched_records=100)
+    prefetcher.schedule(_PARTITIONS)
+    records = []
+
+    with pytest.raises(ValueError):
+        for record in prefetcher.parse_records(_PARTITIONS[0]):
+            records.append(record)
+    assert records == _records(_PARTITIONS[0])
+
+
+def test_given_no_partition_to_prefetch_when_create_then_raise_error() -> None:
+    with pytest.raises(ValueError):
+        FilePrefetcher(lambda partition: [], partitions_to_prefetch=0, max_prefetched_records=100)
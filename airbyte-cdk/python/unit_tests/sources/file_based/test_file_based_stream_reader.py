@@ -2,12 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
+import logging
+from datetime import datetime
 from io import IOBase
 from typing import Any, Iterable, List, Mapping, Optional, Set
 
 import pytest
 from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
-from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from pydantic import AnyUrl
 from unit_tests.sources.file_based.helpers import make_remote_files
@@ -270,3 +273,45 @@ def test_globs_and_prefixes_from_globs(
     reader.config = TestSpec(**config)
     assert set([f.uri for f in reader.filter_files_by_globs_and_start_date(FILES, globs)]) == expected_matches
     assert set(reader.get_prefixes_from_globs(globs)) == expected_path_prefixes
+
+
+class BytesStreamReader(TestStreamReader):
+    def __init__(self, content: bytes):
+        super().__init__()
+        self._content = content
+
+    def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:  # type: ignore[override]
+        return io.BytesIO(self._content)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"first line\nsecond\n\nfourth line after an empty one\r\nlast line without line break", id="lines"),
+        pytest.param(b"\n\n\n", id="only_line_breaks"),
+        pytest.param(b"a single line", id="single_line"),
+    ],
+)
+def test_given_contiguous_ranges_when_read_lines_in_range_then_read_every_line_once(content: bytes) -> None:
+    reader = BytesStreamReader(content)
+    file = RemoteFile(uri="a.jsonl", last_modified=datetime(2023, 6, 5), size=len(content))
+
+    for range_size in range(1, len(content) + 1):
+        lines = [
+            line
+            for start in range(0, len(content), range_size)
+            for line in reader.read_lines_in_range(file, start, min(start + range_size, len(content)), logging.getLogger())
+        ]
+        assert lines == io.BytesIO(content).readlines(), f"range_size={range_size}"
+
+
+@pytest.mark.parametrize(
+    "file, expected_can_read_byte_ranges",
+    [
+        pytest.param(RemoteFile(uri="a.csv", last_modified=datetime(2023, 6, 5), size=10), True, id="file_with_size"),
+        pytest.param(RemoteFile(uri="a.csv", last_modified=datetime(2023, 6, 5)), False, id="file_without_size"),
+        pytest.param(RemoteFile(uri="a.csv.GZ", last_modified=datetime(2023, 6, 5), size=10), False, id="compressed_file"),
+    ],
+)
+def test_can_read_byte_ranges(file: RemoteFile, expected_can_read_byte_ranges: bool) -> None:
+    assert TestStreamReader().can_read_byte_ranges(file) == expected_can_read_byte_ranges
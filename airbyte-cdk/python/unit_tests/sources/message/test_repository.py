@@ -9,6 +9,7 @@ from airbyte_cdk.models import (
     AirbyteControlConnectorConfigMessage,
     AirbyteControlMessage,
     AirbyteMessage,
+    AirbyteRecordMessage,
     AirbyteStateMessage,
     Level,
     OrchestratorType,
@@ -74,10 +75,16 @@ class TestInMemoryMessageRepository:
         second_message_generator = repo.consume_queue()
         assert list(second_message_generator) == [second_message]
 
-    def test_given_message_is_not_control_nor_log_message_when_emit_message_then_raise_error(self):
+    def test_given_message_type_is_not_supported_when_emit_message_then_raise_error(self):
         repo = InMemoryMessageRepository()
         with pytest.raises(ValueError):
-            repo.emit_message(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"state": "state value"})))
+            repo.emit_message(AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=0)))
+
+    def test_given_state_message_when_emit_message_then_message_can_be_consumed(self):
+        repo = InMemoryMessageRepository()
+        state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"state": "state value"}))
+        repo.emit_message(state_message)
+        assert list(repo.consume_queue()) == [state_message]
 
     def test_given_log_level_is_severe_enough_when_log_message_then_allow_message_to_be_consumed(self):
         repo = InMemoryMessageRepository(Level.DEBUG)
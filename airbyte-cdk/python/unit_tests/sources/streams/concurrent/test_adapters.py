@@ -78,6 +78,28 @@ def test_stream_partition_generator(sync_mode):
     assert slices == stream_slices
 
 
+def test_stream_partition_generator_incremental_passes_state_to_stream():
+    stream = Mock()
+    stream.stream_slices.return_value = [{"slice": 1}]
+    stream.read_records.return_value = [{"data": 1}]
+    stream.transformer = TypeTransformer(TransformConfig.NoTransform)
+    cursor_field = ["cursor"]
+    state = {"cursor": 1}
+
+    cursor = Mock()
+    cursor.state = state
+
+    partition_generator = StreamPartitionGenerator(stream, Mock(), cursor_field, cursor)
+    partitions = list(partition_generator.generate(SyncMode.incremental))
+    records = list(partitions[0].read())
+
+    stream.stream_slices.assert_called_once_with(sync_mode=SyncMode.incremental, cursor_field=cursor_field, stream_state=state)
+    stream.read_records.assert_called_once_with(
+        sync_mode=SyncMode.incremental, cursor_field=cursor_field, stream_slice={"slice": 1}, stream_state=state
+    )
+    assert records[0].partition == partitions[0]
+
+
 @pytest.mark.parametrize(
     "transformer, expected_records",
     [
@@ -222,6 +244,19 @@ class StreamFacadeTest(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             list(self._facade.read_records(SyncMode.incremental, None, None, None))
 
+    def test_read_records_incremental_with_cursor(self):
+        cursor = Mock()
+        cursor.state = {"cursor": 2}
+        facade = StreamFacade(self._abstract_stream, cursor)
+        expected_stream_data = [{"data": 1}, {"data": 2}]
+        self._abstract_stream.read.return_value = [Record(data) for data in expected_stream_data]
+
+        actual_stream_data = list(facade.read_records(SyncMode.incremental, None, None, None))
+
+        assert actual_stream_data == expected_stream_data
+        assert facade.supports_incremental
+        assert facade.get_updated_state({}, expected_stream_data[-1]) == {"cursor": 2}
+
     def test_create_from_stream_stream(self):
         stream = Mock()
         stream.name = "stream"
@@ -286,6 +321,27 @@ class StreamFacadeTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             StreamFacade.create_from_stream(stream, self._source, self._logger, self._max_workers)
 
+    def test_create_from_stream_with_cursor(self):
+        stream = Mock()
+        stream.name = "stream"
+        stream.primary_key = "id"
+        stream.cursor_field = "cursor"
+        cursor = Mock()
+
+        facade = StreamFacade.create_from_stream(stream, self._source, self._logger, self._max_workers, cursor)
+
+        assert facade.supports_incremental
+        assert facade._abstract_stream._cursor == cursor
+
+    def test_set_initial_state_is_delegated_to_the_cursor(self):
+        cursor = Mock()
+        state_manager = Mock()
+        facade = StreamFacade(self._abstract_stream, cursor)
+
+        facade.set_initial_state({"cursor": 1}, state_manager, True)
+
+        cursor.set_initial_state.assert_called_once_with({"cursor": 1}, state_manager, True)
+
     def test_create_from_stream_with_cursor_field_as_list(self):
         stream = Mock()
         stream.name = "stream"
@@ -0,0 +1,148 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.models import AirbyteStateBlob
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+
+_A_STREAM_NAME = "a stream name"
+_A_STREAM_NAMESPACE = "a stream namespace"
+_A_CURSOR_FIELD = "updated_at"
+
+
+def _partition() -> Partition:
+    return Mock(spec=Partition)
+
+
+def _record(cursor_value: int, partition: Partition) -> Record:
+    return Record({"id": 1, _A_CURSOR_FIELD: cursor_value}, partition)
+
+
+class ConcurrentCursorTest(TestCase):
+    def setUp(self) -> None:
+        self._message_repository = InMemoryMessageRepository()
+        self._state_manager = ConnectorStateManager({}, [])
+
+    def _cursor(self, stream_state=None) -> ConcurrentCursor:
+        cursor = ConcurrentCursor(_A_STREAM_NAME, _A_STREAM_NAMESPACE, self._message_repository, _A_CURSOR_FIELD)
+        cursor.set_initial_state(stream_state or {}, self._state_manager, True)
+        return cursor
+
+    def _emitted_states(self):
+        return [
+            message.state.stream.stream_state.dict()
+            for message in self._message_repository.consume_queue()
+            if message.type == MessageType.STATE
+        ]
+
+    def test_given_partition_closed_when_close_partition_then_emit_most_recent_cursor_value(self) -> None:
+        cursor = self._cursor()
+        partition = _partition()
+        cursor.register_partition(partition)
+        cursor.observe(_record(2, partition))
+        cursor.observe(_record(1, partition))
+
+        cursor.close_partition(partition)
+
+        assert self._emitted_states() == [{_A_CURSOR_FIELD: 2}]
+        assert cursor.state == {_A_CURSOR_FIELD: 2}
+        assert self._state_manager.get_stream_state(_A_STREAM_NAME, _A_STREAM_NAMESPACE) == {_A_CURSOR_FIELD: 2}
+
+    def test_given_partition_closed_before_previous_partitions_when_close_partition_then_do_not_emit_state(self) -> None:
+        cursor = self._cursor({_A_CURSOR_FIELD: 0, "other": "value"})
+        first_partition, second_partition = _partition(), _partition()
+        cursor.register_partition(first_partition)
+        cursor.register_partition(second_partition)
+        cursor.observe(_record(2, second_partition))
+
+        cursor.close_partition(second_partition)
+
+        assert self._emitted_states() == []
+        assert cursor.state == {_A_CURSOR_FIELD: 0, "other": "value"}
+
+    def test_given_low_water_mark_partition_closed_when_close_partition_then_emit_state_of_every_contiguous_partition(self) -> None:
+        cursor = self._cursor()
+        first_partition, second_partition, third_partition = _partition(), _partition(), _partition()
+        for partition in [first_partition, second_partition, third_partition]:
+            cursor.register_partition(partition)
+        cursor.observe(_record(1, first_partition))
+        cursor.observe(_record(2, second_partition))
+        cursor.observe(_record(3, third_partition))
+
+        cursor.close_partition(second_partition)
+        cursor.close_partition(first_partition)
+
+        assert self._emitted_states() == [{_A_CURSOR_FIELD: 2}]
+
+    def test_given_cursor_value_not_more_recent_than_state_when_close_partition_then_do_not_emit_state(self) -> None:
+        cursor = self._cursor({_A_CURSOR_FIELD: 10})
+        partition = _partition()
+        cursor.register_partition(partition)
+        cursor.observe(_record(5, partition))
+
+        cursor.close_partition(partition)
+
+        assert self._emitted_states() == []
+        assert cursor.state == {_A_CURSOR_FIELD: 10}
+
+    def test_given_record_without_cursor_value_when_observe_then_ignore_record(self) -> None:
+        cursor = self._cursor()
+        partition = _partition()
+        cursor.register_partition(partition)
+        cursor.observe(Record({"id": 1}, partition))
+
+        cursor.close_partition(partition)
+
+        assert self._emitted_states() == []
+
+    def test_given_partition_not_registered_when_close_partition_then_raise_error(self) -> None:
+        with pytest.raises(ValueError):
+            self._cursor().close_partition(_partition())
+
+    def test_given_record_from_unknown_partition_when_observe_then_raise_error(self) -> None:
+        with pytest.raises(ValueError):
+            self._cursor().observe(_record(1, _partition()))
+
+    def test_emitted_state_is_a_per_stream_state(self) -> None:
+        cursor = self._cursor()
+        partition = _partition()
+        cursor.register_partition(partition)
+        cursor.observe(_record(1, partition))
+        cursor.close_partition(partition)
+
+        state_message = list(self._message_repository.consume_queue())[0]
+        assert state_message.state.stream.stream_descriptor.name == _A_STREAM_NAME
+        assert state_message.state.stream.stream_descriptor.namespace == _A_STREAM_NAMESPACE
+        assert state_message.state.stream.stream_state == AirbyteStateBlob.parse_obj({_A_CURSOR_FIELD: 1})
+
+    def test_given_state_already_emitted_by_state_manager_when_close_partition_then_do_not_emit_state_again(self) -> None:
+        cursor = self._cursor()
+        partition = _partition()
+        cursor.register_partition(partition)
+        cursor.observe(_record(1, partition))
+        self._state_manager.update_state_for_stream(_A_STREAM_NAME, _A_STREAM_NAMESPACE, {_A_CURSOR_FIELD: 1})
+        self._state_manager.create_state_message_if_changed(_A_STREAM_NAME, _A_STREAM_NAMESPACE, send_per_stream_state=True)
+
+        cursor.close_partition(partition)
+
+        assert self._emitted_states() == []
+
+    def test_given_no_state_manager_when_close_partition_then_only_update_state(self) -> None:
+        cursor = ConcurrentCursor(_A_STREAM_NAME, _A_STREAM_NAMESPACE, self._message_repository, _A_CURSOR_FIELD)
+        partition = _partition()
+        cursor.register_partition(partition)
+        cursor.observe(_record(1, partition))
+
+        cursor.close_partition(partition)
+
+        assert self._emitted_states() == []
+        assert cursor.state == {_A_CURSOR_FIELD: 1}
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from queue import Empty, Full
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.streams.concurrent.metrics import ConcurrentStreamMetrics, MeteredQueue, QueueClosed
+
+
+def test_given_queue_depths_observed_when_as_dict_then_report_average_and_max_depth():
+    metrics = ConcurrentStreamMetrics(max_workers=2, max_queue_size=10)
+    for depth in [0, 4, 2]:
+        metrics.observe_queue_depth(depth)
+
+    report = metrics.as_dict()
+
+    assert report["max_queue_depth"] == 4
+    assert report["average_queue_depth"] == 2
+    assert report["max_workers"] == 2
+    assert report["max_queue_size"] == 10
+
+
+def test_worker_utilization_is_capped_to_one():
+    metrics = ConcurrentStreamMetrics(max_workers=1, max_queue_size=10)
+    metrics.add_worker_busy_time(10_000)
+    metrics.stop()
+
+    assert metrics.worker_utilization == 1.0
+    assert metrics.tasks_completed == 1
+
+
+def test_given_queue_full_when_put_without_blocking_then_raise_full():
+    queue = MeteredQueue(1, ConcurrentStreamMetrics(1, 1))
+    queue.put(Mock())
+
+    with pytest.raises(Full):
+        queue.put(Mock(), block=False)
+
+
+def test_given_queue_full_when_put_with_timeout_then_raise_full_and_record_stall_time():
+    metrics = ConcurrentStreamMetrics(1, 1)
+    queue = MeteredQueue(1, metrics)
+    queue.put(Mock())
+
+    with pytest.raises(Full):
+        queue.put(Mock(), timeout=0.01)
+    assert metrics.producer_stall_time > 0
+
+
+def test_given_queue_empty_when_get_with_timeout_then_raise_empty_and_record_wait_time():
+    metrics = ConcurrentStreamMetrics(1, 1)
+    queue = MeteredQueue(1, metrics)
+
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+    assert metrics.consumer_wait_time > 0
+
+
+def test_given_producer_blocked_when_close_then_raise_queue_closed():
+    queue = MeteredQueue(1, ConcurrentStreamMetrics(1, 1))
+    queue.put(Mock())
+    errors = []
+
+    def _put() -> None:
+        try:
+            queue.put(Mock())
+        except QueueClosed as exception:
+            errors.append(exception)
+
+    producer = threading.Thread(target=_put)
+    producer.start()
+    queue.close()
+    producer.join(timeout=5)
+
+    assert not producer.is_alive()
+    assert len(errors) == 1
+
+
+def test_given_queue_closed_when_put_then_raise_queue_closed():
+    queue = MeteredQueue(1, ConcurrentStreamMetrics(1, 1))
+    queue.close()
+
+    with pytest.raises(QueueClosed):
+        queue.put(Mock())
@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
+import threading
 import unittest
 from unittest.mock import Mock, call
 
@@ -44,6 +46,26 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
         json_schema = self._stream.get_json_schema()
         assert json_schema == self._json_schema
 
+    def test_given_sleep_time_when_create_stream_then_sleep_time_is_ignored_with_a_warning(self):
+        logger = Mock()
+        stream = ThreadBasedConcurrentStream(
+            self._partition_generator,
+            self._max_workers,
+            self._name,
+            self._json_schema,
+            self._availability_strategy,
+            self._primary_key,
+            self._cursor_field,
+            self._slice_logger,
+            logger,
+            self._message_repository,
+            sleep_time=0.5,
+            namespace="namespace",
+        )
+
+        assert stream.as_airbyte_stream().namespace == "namespace"
+        logger.warning.assert_called_once()
+
     def test_check_availability(self):
         self._availability_strategy.check_availability.return_value = STREAM_AVAILABLE
         availability = self._stream.check_availability()
@@ -54,6 +76,7 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
         futures = [Mock() for _ in range(3)]
         for f in futures:
             f.exception.return_value = None
+            f.cancelled.return_value = False
 
         self._stream._check_for_errors(futures)
 
@@ -61,6 +84,7 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
         futures = [Mock() for _ in range(3)]
         for f in futures:
             f.exception.return_value = None
+            f.cancelled.return_value = False
         futures[0].exception.return_value = Exception("error")
 
         with self.assertRaises(Exception):
@@ -70,6 +94,7 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
         futures = [Mock() for _ in range(3)]
         for f in futures:
             f.exception.return_value = None
+            f.cancelled.return_value = False
         futures[0].done.return_value = False
 
         with self.assertRaises(Exception):
@@ -103,18 +128,122 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
 
         self._message_repository.emit_message.assert_called_once_with(slice_log_message)
 
-    def test_wait_while_task_queue_is_full(self):
-        f1 = Mock()
-        f2 = Mock()
+    def test_read_incremental_updates_cursor(self):
+        partition = Mock(spec=Partition)
+        records = [Record({"id": 1}, partition), Record({"id": "2"}, partition)]
+        partition.read.return_value = records
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = [partition]
+        cursor = Mock()
+        stream = ThreadBasedConcurrentStream(
+            self._partition_generator,
+            self._max_workers,
+            self._name,
+            self._json_schema,
+            self._availability_strategy,
+            self._primary_key,
+            "id",
+            self._slice_logger,
+            self._logger,
+            self._message_repository,
+            1,
+            2,
+            cursor=cursor,
+        )
+
+        actual_records = list(stream.read())
+
+        assert actual_records == records
+        self._partition_generator.generate.assert_called_once_with(sync_mode=SyncMode.incremental)
+        cursor.register_partition.assert_called_once_with(partition)
+        cursor.observe.assert_has_calls([call(record) for record in records])
+        cursor.close_partition.assert_called_once_with(partition)
 
-        # Verify that the done() method will be called until only one future is still running
-        f1.done.side_effect = [False, False]
-        f2.done.side_effect = [False, True]
-        futures = [f1, f2]
-        self._stream._wait_while_too_many_pending_futures(futures)
+    def test_given_more_partitions_than_max_concurrent_tasks_when_read_then_read_all_partitions(self):
+        partitions = [Mock(spec=Partition) for _ in range(5)]
+        for i, partition in enumerate(partitions):
+            partition.read.return_value = [Record({"id": i}, partition)]
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = partitions
+        stream = self._stream_with(max_workers=2, max_concurrent_tasks=2, max_queue_size=2)
+
+        actual_records = list(stream.read())
+
+        assert sorted(record.data["id"] for record in actual_records) == list(range(5))
+        assert stream.metrics.tasks_completed == 6  # 5 partitions and the partition generation
+        assert stream.metrics.max_queue_depth <= 2
+
+    def test_given_partition_raises_when_read_then_raise_exception(self):
+        partition = Mock(spec=Partition)
+        partition.read.side_effect = ValueError("error")
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = [partition]
+
+        with self.assertRaises(RuntimeError):
+            list(self._stream.read())
 
-        f1.done.assert_has_calls([call(), call()])
-        f2.done.assert_has_calls([call(), call()])
+    def test_given_partition_generation_raises_when_read_then_raise_exception(self):
+        self._partition_generator.generate.side_effect = ValueError("error")
+
+        with self.assertRaises(RuntimeError):
+            list(self._stream.read())
+
+    def test_given_consumer_stops_when_queue_is_full_then_release_workers(self):
+        partition = Mock(spec=Partition)
+        partition.read.return_value = [Record({"id": i}, partition) for i in range(100)]
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = [partition]
+        stream = self._stream_with(max_workers=1, max_concurrent_tasks=1, max_queue_size=1)
+
+        records = stream.read()
+        next(records)
+        records.close()
+
+        stream._threadpool.shutdown(wait=True)
+        assert not stream._pending_futures
+
+    def test_given_partition_raises_while_other_partition_is_blocked_on_full_queue_when_read_then_raise_exception(self):
+        blocked_partition = Mock(spec=Partition)
+        blocked_partition.read.side_effect = lambda: (Record({"id": i}, blocked_partition) for i in itertools.count())
+        failing_partition = Mock(spec=Partition)
+        failing_partition.read.side_effect = ValueError("error")
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = [blocked_partition, failing_partition]
+        stream = self._stream_with(max_workers=2, max_concurrent_tasks=2, max_queue_size=1)
+        errors = []
+
+        def read() -> None:
+            try:
+                for _ in stream.read():
+                    pass
+            except RuntimeError as error:
+                errors.append(error)
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+        reader.join(timeout=10)
+
+        assert not reader.is_alive()
+        assert len(errors) == 1 and "error" in str(errors[0])
+        stream._threadpool.shutdown(wait=True)
+        assert not stream._pending_futures
+
+    def _stream_with(self, max_workers: int, max_concurrent_tasks: int, max_queue_size: int) -> ThreadBasedConcurrentStream:
+        return ThreadBasedConcurrentStream(
+            self._partition_generator,
+            max_workers,
+            self._name,
+            self._json_schema,
+            self._availability_strategy,
+            self._primary_key,
+            self._cursor_field,
+            self._slice_logger,
+            self._logger,
+            self._message_repository,
+            timeout_seconds=5,
+            max_concurrent_tasks=max_concurrent_tasks,
+            max_queue_size=max_queue_size,
+        )
 
     def test_as_airbyte_stream(self):
         expected_airbyte_stream = AirbyteStream(
@@ -151,7 +280,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             2,
-            0,
         )
 
         expected_airbyte_stream = AirbyteStream(
@@ -188,7 +316,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             2,
-            0,
         )
 
         expected_airbyte_stream = AirbyteStream(
@@ -226,7 +353,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             2,
-            0,
         )
 
         expected_airbyte_stream = AirbyteStream(
@@ -256,7 +382,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             2,
-            0,
             namespace="test",
         )
         expected_airbyte_stream = AirbyteStream(
@@ -11,11 +11,14 @@ from unittest.mock import ANY, MagicMock, patch
 import pytest
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.call_rate import APIBudget, get_default_api_budget, set_default_api_budget
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.sources.streams.http.transport import HttpTransport, get_default_transport
+from airbyte_cdk.sources.streams.parent_record_cache import parent_record_cache_scope
 
 
 class StubBasicReadHttpStream(HttpStream):
@@ -42,6 +45,47 @@ class StubBasicReadHttpStream(HttpStream):
         return self._deduplicate_query_params
 
 
+def test_given_no_transport_when_create_stream_then_use_default_transport():
+    stream = StubBasicReadHttpStream()
+
+    assert stream._session.get_adapter(stream.url_base) is get_default_transport().adapter
+
+
+def test_given_transport_when_create_stream_then_use_transport():
+    transport = HttpTransport()
+
+    stream = StubBasicReadHttpStream(transport=transport)
+
+    assert stream._session.get_adapter(stream.url_base) is transport.adapter
+
+
+def test_given_api_budget_when_read_records_then_acquire_call_before_sending_each_request(requests_mock):
+    requests_mock.get("https://test_base_url.com/", headers={"X-RateLimit-Remaining": "10"})
+    api_budget = MagicMock(spec=APIBudget)
+    stream = StubBasicReadHttpStream(api_budget=api_budget)
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert [name for name, _, _ in api_budget.mock_calls] == ["acquire_call", "update_from_response"]
+    request, response = api_budget.update_from_response.call_args.args
+    assert request.url == "https://test_base_url.com/"
+    assert response.headers["X-RateLimit-Remaining"] == "10"
+
+
+def test_given_default_api_budget_set_after_stream_creation_when_read_records_then_use_default_api_budget(requests_mock):
+    requests_mock.get("https://test_base_url.com/")
+    stream = StubBasicReadHttpStream()
+    previous_api_budget = get_default_api_budget()
+    api_budget = MagicMock(spec=APIBudget)
+    try:
+        set_default_api_budget(api_budget)
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    finally:
+        set_default_api_budget(previous_api_budget)
+
+    api_budget.acquire_call.assert_called_once()
+
+
 def test_default_authenticator():
     stream = StubBasicReadHttpStream()
     assert isinstance(stream.authenticator, NoAuth)
@@ -615,3 +659,112 @@ def test_duplicate_request_params_are_deduped(deduplicate_query_params, path, pa
     else:
         prepared_request = stream._create_prepared_request(path=path, params=params)
         assert prepared_request.url == expected_url
+
+
+class StubParentHttpStream(StubBasicReadHttpStream):
+    def path(self, **kwargs) -> str:
+        return "parents"
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()
+
+
+class StubChildHttpSubStream(HttpSubStream):
+    url_base = "https://test_base_url.com"
+    primary_key = ""
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def path(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> str:
+        return f"parents/{stream_slice['parent']['id']}/children"
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()
+
+
+def test_given_availability_checked_when_read_records_then_reuse_first_response(requests_mock):
+    requests_mock.get("https://test_base_url.com/", json={"data": 1})
+    stream = StubBasicReadHttpStream()
+
+    assert stream.check_availability(MagicMock()) == (True, None)
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert records == [{"data": 2}]
+    assert requests_mock.call_count == 1
+
+
+def test_given_response_reused_when_read_records_again_then_send_request():
+    stream = StubBasicReadHttpStream()
+    with patch.object(stream, "_send_request", return_value=requests.Response()) as send_request_mock:
+        stream.check_availability(MagicMock())
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert send_request_mock.call_count == 2
+
+
+def test_given_read_sends_another_request_when_read_records_then_do_not_reuse_response(requests_mock):
+    requests_mock.get("https://test_base_url.com/", json={})
+    requests_mock.get("https://test_base_url.com/?updated_since=2023", json={})
+    stream = StubBasicReadHttpStream()
+    stream.check_availability(MagicMock())
+
+    with patch.object(stream, "request_params", return_value={"updated_since": "2023"}):
+        list(stream.read_records(sync_mode=SyncMode.incremental))
+
+    assert [request.url for request in requests_mock.request_history] == [
+        "https://test_base_url.com/",
+        "https://test_base_url.com/?updated_since=2023",
+    ]
+
+
+def test_given_reuse_disabled_when_read_records_then_send_request_again(requests_mock):
+    requests_mock.get("https://test_base_url.com/", json={})
+    stream = StubBasicReadHttpStream()
+    stream.reuse_availability_check_response = False
+
+    stream.check_availability(MagicMock())
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert requests_mock.call_count == 2
+
+
+def test_given_streamed_response_when_read_records_then_send_request_again(requests_mock):
+    requests_mock.get("https://test_base_url.com/", json={})
+    stream = StubBasicReadHttpStream()
+
+    with patch.object(stream, "request_kwargs", return_value={"stream": True}):
+        stream.check_availability(MagicMock())
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert requests_mock.call_count == 2
+
+
+def test_given_substream_availability_checked_when_read_then_reuse_parent_and_child_first_responses(requests_mock):
+    requests_mock.get("https://test_base_url.com/parents", json=[{"id": 1}, {"id": 2}])
+    requests_mock.get("https://test_base_url.com/parents/1/children", json=[{"id": 10}])
+    requests_mock.get("https://test_base_url.com/parents/2/children", json=[{"id": 20}])
+    stream = StubChildHttpSubStream(parent=StubParentHttpStream())
+
+    assert stream.check_availability(MagicMock()) == (True, None)
+    records = [
+        record
+        for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh)
+        for record in stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice)
+    ]
+
+    assert records == [{"id": 10}, {"id": 20}]
+    assert [request.path for request in requests_mock.request_history] == ["/parents", "/parents/1/children", "/parents/2/children"]
+
+
+def test_given_substreams_sharing_a_parent_during_sync_when_stream_slices_then_parent_is_requested_once(requests_mock):
+    requests_mock.get("https://test_base_url.com/parents", json=[{"id": 1}, {"id": 2}])
+    parent = StubParentHttpStream()
+    substreams = [StubChildHttpSubStream(parent=parent), StubChildHttpSubStream(parent=parent)]
+
+    with parent_record_cache_scope():
+        slices = [list(substream.stream_slices(sync_mode=SyncMode.full_refresh)) for substream in substreams]
+
+    assert slices[0] == slices[1] == [{"parent": {"id": 1}}, {"parent": {"id": 2}}]
+    assert requests_mock.call_count == 1
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+import requests_mock
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.replay import (
+    RecordingAdapter,
+    ReplayAdapter,
+    UnrecordedRequestError,
+    record_http_traffic,
+    replay_http_traffic,
+)
+from airbyte_cdk.sources.streams.http.transport import get_default_transport
+
+URL = "https://api.test/records"
+
+
+class PaginatedStream(HttpStream):
+    url_base = "https://api.test/"
+    primary_key = "id"
+
+    def path(self, **kwargs: Any) -> str:
+        return "records"
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Mapping[str, Any]:
+        return next_page_token or {}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json().get("next_page")
+        return {"page": next_page} if next_page else None
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        yield from response.json()["data"]
+
+
+def _recording_adapter(path: str) -> RecordingAdapter:
+    adapter = requests_mock.Adapter()
+    adapter.register_uri("GET", URL, json={"data": [{"id": 1}], "next_page": 2}, headers={"Content-Encoding": "identity"})
+    adapter.register_uri("GET", f"{URL}?page=2", json={"data": [{"id": 2}]})
+    adapter.register_uri("POST", URL, content=b"\xff\xfe", status_code=201)
+    return RecordingAdapter(path, adapter)
+
+
+def _send(adapter: Any, method: str, url: str, body: Optional[str] = None) -> requests.Response:
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session.request(method, url, data=body)
+
+
+def test_given_requests_recorded_when_replay_then_return_recorded_responses(tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    recording_adapter = _recording_adapter(path)
+    recorded_responses = [_send(recording_adapter, "GET", URL), _send(recording_adapter, "POST", URL, "body")]
+
+    replay_adapter = ReplayAdapter(path)
+    replayed_responses = [_send(replay_adapter, "POST", URL, "body"), _send(replay_adapter, "GET", URL)]
+
+    assert [(response.status_code, response.content) for response in replayed_responses] == [
+        (recorded_response.status_code, recorded_response.content) for recorded_response in reversed(recorded_responses)
+    ]
+    assert replayed_responses[1].json() == {"data": [{"id": 1}], "next_page": 2}
+
+
+def test_when_record_then_do_not_record_request_headers_and_content_encoding(tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    session = requests.Session()
+    session.mount("https://", _recording_adapter(path))
+
+    session.get(URL, headers={"Authorization": "Bearer secret"})
+
+    with open(path) as recording:
+        interaction = json.loads(recording.readline())
+    assert "secret" not in json.dumps(interaction)
+    assert "Content-Encoding" not in interaction["response"]["headers"]
+
+
+def test_given_request_recorded_several_times_when_replay_then_replay_responses_in_order_and_repeat_the_last_one(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    path.write_text(
+        "\n".join(
+            json.dumps({"request": {"method": "GET", "url": URL, "body": None}, "response": {"status": status, "headers": {}, "body": ""}})
+            for status in (429, 200)
+        )
+    )
+    replay_adapter = ReplayAdapter(str(path))
+
+    assert [_send(replay_adapter, "GET", URL).status_code for _ in range(3)] == [429, 200, 200]
+
+
+def test_given_request_not_recorded_when_replay_then_raise_error(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    path.write_text("")
+
+    with pytest.raises(UnrecordedRequestError):
+        _send(ReplayAdapter(str(path)), "GET", URL)
+
+
+def test_given_stream_traffic_recorded_when_read_with_replayed_traffic_then_read_records_without_sending_requests(tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    recording_adapter = _recording_adapter(path)
+    _send(recording_adapter, "GET", URL)
+    _send(recording_adapter, "GET", f"{URL}?page=2")
+    previous_transport = get_default_transport()
+
+    with replay_http_traffic(path) as transport:
+        assert get_default_transport() is transport
+        records = list(PaginatedStream().read_records(SyncMode.full_refresh))
+
+    assert get_default_transport() is previous_transport
+    assert records == [{"id": 1}, {"id": 2}]
+
+
+def test_when_record_http_traffic_then_set_recording_transport_and_restore_previous_transport(tmp_path):
+    previous_transport = get_default_transport()
+
+    with record_http_traffic(str(tmp_path / "traffic.jsonl")) as transport:
+        assert get_default_transport() is transport
+        assert isinstance(PaginatedStream()._session.get_adapter(URL), RecordingAdapter)
+
+    assert get_default_transport() is previous_transport
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.transport import HttpTransport, get_default_transport, set_default_transport
+from requests.adapters import BaseAdapter
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _session(transport: HttpTransport) -> requests.Session:
+    return transport.mount(requests.Session())
+
+
+def test_given_sessions_sharing_a_transport_when_send_requests_then_connection_is_reused(server_url):
+    transport = HttpTransport()
+
+    _session(transport).get(server_url)
+    _session(transport).get(server_url)
+
+    assert transport.stats.as_dict() == {
+        "requests": 2,
+        "connections_created": 1,
+        "connections_reused": 1,
+        "connections_discarded": 0,
+        "reuse_ratio": 0.5,
+    }
+    transport.close()
+
+
+def test_given_session_closed_when_send_request_with_another_session_then_connection_is_reused(server_url):
+    transport = HttpTransport()
+    session = _session(transport)
+    session.get(server_url)
+
+    session.close()
+    _session(transport).get(server_url)
+
+    assert transport.stats.connections_reused == 1
+    transport.close()
+
+
+def test_given_transport_closed_when_send_request_then_open_new_connection(server_url):
+    transport = HttpTransport()
+    session = _session(transport)
+    session.get(server_url)
+
+    transport.close()
+    session.get(server_url)
+
+    assert transport.stats.connections_created == 2
+
+
+def test_given_more_concurrent_requests_than_pool_size_when_release_connections_then_record_discarded_connections(server_url):
+    transport = HttpTransport(pool_maxsize=1)
+    session = _session(transport)
+
+    responses = [session.get(server_url, stream=True), session.get(server_url, stream=True)]
+    for response in responses:
+        response.close()
+
+    assert transport.stats.connections_created == 2
+    assert transport.stats.connections_discarded == 1
+    transport.close()
+
+
+def test_keep_alive_is_enabled_by_default():
+    socket_options = HttpTransport().adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+
+
+def test_given_keep_alive_disabled_then_keep_alive_option_is_not_set():
+    socket_options = HttpTransport(keep_alive=False).adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in socket_options
+
+
+def test_given_adapter_factory_when_mount_then_session_uses_the_adapter():
+    adapter = Mock(spec=BaseAdapter)
+    transport = HttpTransport(adapter_factory=lambda: adapter)
+
+    session = _session(transport)
+
+    assert session.get_adapter("https://airbyte.io") is adapter
+    assert session.get_adapter("http://airbyte.io") is adapter
+
+
+def test_set_default_transport():
+    previous_transport = get_default_transport()
+    transport = HttpTransport()
+    try:
+        set_default_transport(transport)
+        assert get_default_transport() is transport
+    finally:
+        set_default_transport(previous_transport)
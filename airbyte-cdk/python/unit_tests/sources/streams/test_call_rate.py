@@ -0,0 +1,319 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from datetime import timedelta
+from typing import List
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.call_rate import (
+    APIBudget,
+    CallRateLimitHit,
+    FixedWindowCallRatePolicy,
+    HttpAPIBudget,
+    HttpRequestMatcher,
+    MovingWindowCallRatePolicy,
+    Rate,
+    TokenBucketCallRatePolicy,
+    UnlimitedCallRatePolicy,
+)
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000 + self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time(mocker):
+    fake_time = FakeTime()
+    mocker.patch("airbyte_cdk.sources.streams.call_rate.time", fake_time)
+    return fake_time
+
+
+def _request(url: str = "https://api.airbyte.io/v1/users", method: str = "GET", **kwargs) -> requests.PreparedRequest:
+    return requests.Request(method, url, **kwargs).prepare()
+
+
+def _response(status_code: int = 200, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.mark.parametrize(
+    "matcher, request_, expected_match",
+    [
+        pytest.param(HttpRequestMatcher(), _request(), True, id="no_criteria"),
+        pytest.param(HttpRequestMatcher(method="get"), _request(), True, id="same_method"),
+        pytest.param(HttpRequestMatcher(method="POST"), _request(), False, id="other_method"),
+        pytest.param(HttpRequestMatcher(url_pattern=r"https://api\.airbyte\.io/v1/.*"), _request(), True, id="url_matching_pattern"),
+        pytest.param(HttpRequestMatcher(url_pattern=r"https://api\.airbyte\.io/v1"), _request(), False, id="url_partially_matching"),
+        pytest.param(
+            HttpRequestMatcher(url_pattern=r"https://api\.airbyte\.io/v1/users"),
+            _request(params={"page": 2}),
+            True,
+            id="url_pattern_ignores_query",
+        ),
+        pytest.param(HttpRequestMatcher(params={"page": 2}), _request(params={"page": 2, "size": 10}), True, id="params_subset"),
+        pytest.param(HttpRequestMatcher(params={"page": 2}), _request(params={"page": 3}), False, id="other_params"),
+        pytest.param(HttpRequestMatcher(headers={"x-api": "v2"}), _request(headers={"X-Api": "v2"}), True, id="headers_case_insensitive"),
+        pytest.param(HttpRequestMatcher(headers={"X-Api": "v2"}), _request(), False, id="missing_header"),
+    ],
+)
+def test_http_request_matcher(matcher, request_, expected_match):
+    assert matcher(request_) == expected_match
+
+
+def test_fixed_window_policy(fake_time):
+    policy = FixedWindowCallRatePolicy(period=timedelta(seconds=10), call_limit=2)
+    policy.try_acquire(_request())
+    policy.try_acquire(_request())
+
+    fake_time.now += 4
+    with pytest.raises(CallRateLimitHit) as limit_hit:
+        policy.try_acquire(_request())
+    assert limit_hit.value.time_to_wait == 6
+
+    fake_time.now += 6
+    policy.try_acquire(_request())
+
+
+def test_given_windows_without_calls_when_try_acquire_then_window_is_aligned_on_period(fake_time):
+    policy = FixedWindowCallRatePolicy(period=timedelta(seconds=10), call_limit=1)
+
+    fake_time.now += 25
+    policy.try_acquire(_request())
+
+    with pytest.raises(CallRateLimitHit) as limit_hit:
+        policy.try_acquire(_request())
+    assert limit_hit.value.time_to_wait == 5
+
+
+def test_moving_window_policy(fake_time):
+    policy = MovingWindowCallRatePolicy(rates=[Rate(limit=2, interval=timedelta(seconds=10))])
+    policy.try_acquire(_request())
+    fake_time.now += 4
+    policy.try_acquire(_request())
+
+    fake_time.now += 4
+    with pytest.raises(CallRateLimitHit) as limit_hit:
+        policy.try_acquire(_request())
+    assert limit_hit.value.time_to_wait == 2
+
+    fake_time.now += 2
+    policy.try_acquire(_request())
+    with pytest.raises(CallRateLimitHit) as limit_hit:
+        policy.try_acquire(_request())
+    assert limit_hit.value.time_to_wait == 4
+
+
+def test_given_several_rates_when_try_acquire_then_wait_for_the_most_restrictive_rate(fake_time):
+    policy = MovingWindowCallRatePolicy(
+        rates=[Rate(limit=1, interval=timedelta(seconds=1)), Rate(limit=2, interval=timedelta(seconds=60))],
+    )
+    policy.try_acquire(_request())
+    fake_time.now += 1
+    policy.try_acquire(_request())
+
+    fake_time.now += 1
+    with pytest.raises(CallRateLimitHit) as limit_hit:
+        policy.try_acquire(_request())
+    assert limit_hit.value.time_to_wait == 58
+
+
+def test_given_call_refused_when_try_acquire_then_call_is_not_counted_by_other_rates(fake_time):
+    policy = MovingWindowCallRatePolicy(
+        rates=[Rate(limit=1, interval=timedelta(seconds=1)), Rate(limit=2, interval=timedelta(seconds=60))],
+    )
+    policy.try_acquire(_request())
+    with pytest.raises(CallRateLimitHit):
+        policy.try_acquire(_request())
+
+    fake_time.now += 1
+    policy.try_acquire(_request())
+
+
+def test_token_bucket_policy(fake_time):
+    policy = TokenBucketCallRatePolicy(rate=2, capacity=3)
+    for _ in range(3):
+        policy.try_acquire(_request())
+
+    with pytest.raises(CallRateLimitHit) as limit_hit:
+        policy.try_acquire(_request())
+    assert limit_hit.value.time_to_wait == 0.5
+
+    fake_time.now += 10
+    for _ in range(3):
+        policy.try_acquire(_request())
+    with pytest.raises(CallRateLimitHit):
+        policy.try_acquire(_request())
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        pytest.param(FixedWindowCallRatePolicy(period=timedelta(seconds=1), call_limit=1), id="fixed_window"),
+        pytest.param(MovingWindowCallRatePolicy(rates=[Rate(limit=1, interval=timedelta(seconds=1))]), id="moving_window"),
+        pytest.param(TokenBucketCallRatePolicy(rate=1, capacity=1), id="token_bucket"),
+    ],
+)
+def test_given_weight_greater_than_limit_when_try_acquire_then_raise_value_error(policy):
+    with pytest.raises(ValueError):
+        policy.try_acquire(_request(), weight=2)
+
+
+@pytest.mark.parametrize(
+    "policy_factory",
+    [
+        pytest.param(lambda: FixedWindowCallRatePolicy(period=timedelta(seconds=60), call_limit=10), id="fixed_window"),
+        pytest.param(lambda: MovingWindowCallRatePolicy(rates=[Rate(limit=10, interval=timedelta(seconds=60))]), id="moving_window"),
+        pytest.param(lambda: TokenBucketCallRatePolicy(rate=0.1, capacity=10), id="token_bucket"),
+    ],
+)
+def test_given_api_reports_fewer_calls_left_when_update_then_policy_allows_fewer_calls(fake_time, policy_factory):
+    policy = policy_factory()
+
+    policy.update(available_calls=1, reset_in_seconds=None)
+
+    policy.try_acquire(_request())
+    with pytest.raises(CallRateLimitHit):
+        policy.try_acquire(_request())
+
+
+@pytest.mark.parametrize(
+    "policy_factory",
+    [
+        pytest.param(lambda: UnlimitedCallRatePolicy(), id="unlimited"),
+        pytest.param(lambda: MovingWindowCallRatePolicy(rates=[Rate(limit=10, interval=timedelta(seconds=1))]), id="moving_window"),
+        pytest.param(lambda: TokenBucketCallRatePolicy(rate=10, capacity=10), id="token_bucket"),
+    ],
+)
+def test_given_no_calls_left_when_update_then_block_until_reset(fake_time, policy_factory):
+    policy = policy_factory()
+
+    policy.update(available_calls=0, reset_in_seconds=30)
+
+    with pytest.raises(CallRateLimitHit) as limit_hit:
+        policy.try_acquire(_request())
+    assert limit_hit.value.time_to_wait == 30
+    fake_time.now += 30
+    policy.try_acquire(_request())
+
+
+def test_given_reset_when_update_fixed_window_then_window_ends_at_reset(fake_time):
+    policy = FixedWindowCallRatePolicy(period=timedelta(seconds=60), call_limit=10)
+
+    policy.update(available_calls=0, reset_in_seconds=5)
+
+    fake_time.now += 5
+    for _ in range(10):
+        policy.try_acquire(_request())
+
+
+def test_given_no_matching_policy_when_acquire_call_then_do_not_limit(fake_time):
+    budget = APIBudget(
+        policies=[FixedWindowCallRatePolicy(period=timedelta(seconds=1), call_limit=1, matchers=[HttpRequestMatcher(method="POST")])]
+    )
+
+    for _ in range(10):
+        budget.acquire_call(_request())
+
+    assert fake_time.sleeps == []
+
+
+def test_given_several_matching_policies_when_acquire_call_then_use_the_first_one(fake_time):
+    users_policy = UnlimitedCallRatePolicy(matchers=[HttpRequestMatcher(url_pattern=".*/users")])
+    default_policy = FixedWindowCallRatePolicy(period=timedelta(seconds=1), call_limit=1)
+    budget = APIBudget(policies=[users_policy, default_policy])
+
+    assert budget.get_matching_policy(_request()) is users_policy
+    assert budget.get_matching_policy(_request("https://api.airbyte.io/v1/groups")) is default_policy
+
+
+def test_given_limit_reached_when_acquire_call_then_wait(fake_time):
+    budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(limit=2, interval=timedelta(seconds=1))])])
+
+    for _ in range(6):
+        budget.acquire_call(_request())
+
+    assert fake_time.sleeps == [1, 1]
+
+
+def test_given_limit_reached_and_not_blocking_when_acquire_call_then_raise(fake_time):
+    budget = APIBudget(policies=[FixedWindowCallRatePolicy(period=timedelta(seconds=1), call_limit=1)])
+    budget.acquire_call(_request())
+
+    with pytest.raises(CallRateLimitHit):
+        budget.acquire_call(_request(), block=False)
+
+
+def test_given_wait_longer_than_timeout_when_acquire_call_then_raise(fake_time):
+    budget = APIBudget(policies=[FixedWindowCallRatePolicy(period=timedelta(seconds=10), call_limit=1)])
+    budget.acquire_call(_request())
+
+    with pytest.raises(CallRateLimitHit):
+        budget.acquire_call(_request(), timeout=5)
+    budget.acquire_call(_request(), timeout=10)
+    assert fake_time.sleeps == [10]
+
+
+def test_given_threads_sharing_a_budget_when_acquire_call_then_each_call_is_counted_once():
+    policy = FixedWindowCallRatePolicy(period=timedelta(hours=1), call_limit=100)
+    budget = APIBudget(policies=[policy])
+    threads = [threading.Thread(target=lambda: [budget.acquire_call(_request()) for _ in range(20)]) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with pytest.raises(CallRateLimitHit):
+        budget.acquire_call(_request(), block=False)
+
+
+@pytest.mark.parametrize(
+    "headers, status_code, expected_available_calls, expected_reset_in_seconds",
+    [
+        pytest.param({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "30"}, 200, 5, 30, id="reset_in_seconds"),
+        pytest.param({"x-ratelimit-remaining": "5", "x-ratelimit-reset": str(1_700_000_000 + 1030)}, 200, 5, 30, id="reset_timestamp"),
+        pytest.param({"X-RateLimit-Remaining": "5"}, 200, 5, None, id="no_reset"),
+        pytest.param({"X-RateLimit-Reset": "30"}, 429, 0, 30, id="rate_limit_hit"),
+        pytest.param({"X-RateLimit-Remaining": "invalid"}, 200, None, None, id="invalid_header"),
+        pytest.param({}, 200, None, None, id="no_headers"),
+    ],
+)
+def test_http_api_budget_update_from_response(fake_time, mocker, headers, status_code, expected_available_calls, expected_reset_in_seconds):
+    policy = UnlimitedCallRatePolicy()
+    update_mock = mocker.patch.object(policy, "update")
+    budget = HttpAPIBudget(policies=[policy])
+
+    budget.update_from_response(_request(), _response(status_code, headers))
+
+    if expected_available_calls is None and expected_reset_in_seconds is None:
+        update_mock.assert_not_called()
+    else:
+        update_mock.assert_called_once_with(expected_available_calls, expected_reset_in_seconds)
+
+
+def test_given_custom_headers_when_update_from_response_then_read_custom_headers(fake_time):
+    policy = UnlimitedCallRatePolicy()
+    budget = HttpAPIBudget(policies=[policy], ratelimit_remaining_header="Quota-Left", ratelimit_reset_header="Quota-Reset")
+
+    budget.update_from_response(_request(), _response(headers={"Quota-Left": "0", "Quota-Reset": "3"}))
+    budget.acquire_call(_request())
+
+    assert fake_time.sleeps == [3]
@@ -0,0 +1,241 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from typing import Any, Iterable, List, Mapping, Optional
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode, Type
+from airbyte_cdk.sources.declarative.types import Record
+from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.streams.parent_record_cache import ParentRecordCache, parent_record_cache_scope, prefetch, read_parent_records
+
+
+class ParentStream(Stream):
+    primary_key = "id"
+
+    def __init__(self, records_by_slice: Mapping[str, List[Any]]):
+        self._records_by_slice = records_by_slice
+        self.read_count = 0
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: Optional[List[str]] = None,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> Iterable[Any]:
+        self.read_count += 1
+        yield from self._records_by_slice[stream_slice["slice"]]
+
+
+def _read(stream: Stream, stream_slice: Mapping[str, Any]) -> List[Any]:
+    return list(read_parent_records(stream, stream_slice))
+
+
+def test_given_slice_read_during_sync_when_read_again_then_records_are_read_from_cache():
+    parent = ParentStream({"a": [{"id": 1}, {"id": 2}], "b": [{"id": 3}]})
+
+    with parent_record_cache_scope():
+        assert _read(parent, {"slice": "a"}) == [{"id": 1}, {"id": 2}]
+        assert _read(parent, {"slice": "b"}) == [{"id": 3}]
+        assert _read(parent, {"slice": "a"}) == [{"id": 1}, {"id": 2}]
+
+    assert parent.read_count == 2
+
+
+def test_given_no_sync_when_read_parent_records_then_records_are_not_cached():
+    parent = ParentStream({"a": [{"id": 1}]})
+
+    _read(parent, {"slice": "a"})
+    _read(parent, {"slice": "a"})
+
+    assert parent.read_count == 2
+
+
+def test_given_sync_is_over_when_read_parent_records_then_records_are_read_again():
+    parent = ParentStream({"a": [{"id": 1}]})
+
+    with parent_record_cache_scope():
+        _read(parent, {"slice": "a"})
+    with parent_record_cache_scope():
+        _read(parent, {"slice": "a"})
+
+    assert parent.read_count == 2
+
+
+def test_given_slice_partially_read_when_read_again_then_records_are_read_from_parent():
+    parent = ParentStream({"a": [{"id": 1}, {"id": 2}]})
+
+    with parent_record_cache_scope():
+        next(iter(read_parent_records(parent, {"slice": "a"})))
+        assert _read(parent, {"slice": "a"}) == [{"id": 1}, {"id": 2}]
+
+    assert parent.read_count == 2
+
+
+def test_given_slice_with_messages_when_read_again_then_records_are_read_from_parent():
+    log_message = AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="log"))
+    parent = ParentStream({"a": [{"id": 1}, log_message]})
+
+    with parent_record_cache_scope():
+        _read(parent, {"slice": "a"})
+        assert _read(parent, {"slice": "a"}) == [{"id": 1}, log_message]
+
+    assert parent.read_count == 2
+
+
+def test_given_records_wrapping_their_data_when_read_from_cache_then_return_data():
+    record = Record({"id": 1}, associated_slice={"slice": "a"})
+    parent = ParentStream({"a": [record]})
+
+    with parent_record_cache_scope():
+        _read(parent, {"slice": "a"})
+        assert _read(parent, {"slice": "a"}) == [{"id": 1}]
+
+
+def test_given_parents_with_different_state_when_read_then_records_are_cached_separately():
+    parent = ParentStream({"a": [{"id": 1}]})
+
+    with parent_record_cache_scope():
+        list(read_parent_records(parent, {"slice": "a"}, stream_state={"updated_at": 1}))
+        list(read_parent_records(parent, {"slice": "a"}, stream_state={"updated_at": 2}))
+
+    assert parent.read_count == 2
+
+
+def test_given_memory_budget_exceeded_when_read_from_cache_then_records_are_read_from_disk(tmp_path):
+    cache = ParentRecordCache(memory_budget_bytes=30, spill_directory=str(tmp_path))
+    parent = ParentStream({})
+    first_records = [{"id": 1, "name": "first"}]
+    spilled_records = [{"id": 2, "name": "second"}, {"id": 3, "name": "é\n"}]
+
+    list(cache.read_records(parent, "first", lambda: first_records))
+    list(cache.read_records(parent, "spilled", lambda: spilled_records))
+
+    assert [isinstance(entry, list) for entry in cache._entries.values()] == [True, False]
+    assert list(cache.read_records(parent, "spilled", lambda: [])) == spilled_records
+    assert list(cache.read_records(parent, "first", lambda: [])) == first_records
+
+
+def test_given_slice_larger_than_memory_budget_when_read_then_records_are_written_to_disk_while_read(tmp_path):
+    cache = ParentRecordCache(memory_budget_bytes=30, spill_directory=str(tmp_path))
+    records = [{"id": i, "name": "record"} for i in range(10)]
+
+    read_records = iter(cache.read_records(ParentStream({}), "slice", lambda: records))
+    next(read_records)
+    assert cache._memory_size > 0
+    next(read_records)
+    next(read_records)
+    assert cache._memory_size == 0
+    list(read_records)
+
+    assert not isinstance(cache._entries[cache._key(ParentStream({}), "slice")], list)
+    assert list(cache.read_records(ParentStream({}), "slice", lambda: [])) == records
+
+
+def test_given_slice_partially_read_when_read_records_then_memory_is_released():
+    cache = ParentRecordCache()
+    read_records = cache.read_records(ParentStream({}), "slice", lambda: [{"id": 1}, {"id": 2}])
+
+    next(iter(read_records))
+    read_records.close()
+
+    assert cache._memory_size == 0
+    assert not cache._entries
+
+
+class OtherParentStream(ParentStream):
+    pass
+
+
+def test_given_parents_of_different_classes_sharing_a_name_when_read_then_records_are_cached_separately():
+    parent = ParentStream({"a": [{"id": 1}]})
+    other_parent = OtherParentStream({"a": [{"id": 2}]})
+
+    with parent_record_cache_scope():
+        assert _read(parent, {"slice": "a"}) == [{"id": 1}]
+        assert _read(other_parent, {"slice": "a"}) == [{"id": 2}]
+
+
+def test_given_parents_with_different_config_when_read_then_records_are_cached_separately():
+    parent = ParentStream({"a": [{"id": 1}]})
+    parent.config = {"account": "first"}
+    other_parent = ParentStream({"a": [{"id": 2}]})
+    other_parent.config = {"account": "second"}
+
+    with parent_record_cache_scope():
+        assert _read(parent, {"slice": "a"}) == [{"id": 1}]
+        assert _read(other_parent, {"slice": "a"}) == [{"id": 2}]
+
+
+def test_given_cache_cleared_when_read_records_then_spill_file_is_closed(tmp_path):
+    cache = ParentRecordCache(memory_budget_bytes=0, spill_directory=str(tmp_path))
+    list(cache.read_records(ParentStream({}), "slice", lambda: [{"id": 1}]))
+    spill_file = cache._spill_file
+
+    cache.clear()
+
+    assert spill_file.closed
+    assert list(cache.read_records(ParentStream({}), "slice", lambda: [{"id": 2}])) == [{"id": 2}]
+
+
+def test_prefetch_reads_items_on_another_thread():
+    threads = []
+
+    def items():
+        for item in range(5):
+            threads.append(threading.current_thread())
+            yield item
+
+    assert list(prefetch(items(), buffer_size=2)) == [0, 1, 2, 3, 4]
+    assert threads[0] is threading.current_thread()
+    assert all(thread is not threading.current_thread() for thread in threads[1:])
+
+
+def test_given_only_first_item_taken_when_prefetch_then_do_not_read_ahead():
+    produced = []
+
+    def items():
+        for item in range(5):
+            produced.append(item)
+            yield item
+
+    iterator = prefetch(items())
+    assert next(iterator) == 0
+    iterator.close()
+
+    assert produced == [0]
+
+
+def test_given_error_while_producing_when_prefetch_then_raise_error_to_consumer():
+    def items():
+        yield 1
+        yield 2
+        raise ValueError("parent failed")
+
+    iterator = prefetch(items())
+
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+    with pytest.raises(ValueError, match="parent failed"):
+        next(iterator)
+
+
+def test_given_consumer_stops_when_prefetch_then_producer_stops():
+    finished = threading.Event()
+
+    def items():
+        try:
+            for item in range(100):
+                yield item
+        finally:
+            finished.set()
+
+    iterator = prefetch(items(), buffer_size=1)
+    next(iterator)
+    next(iterator)
+    iterator.close()
+
+    assert finished.wait(timeout=5)
@@ -3,15 +3,33 @@
 #
 
 import logging
+import threading
 from typing import Any, Iterable, List, Mapping, Optional, Union
 from unittest.mock import Mock
 
 import pytest
-from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode
+from airbyte_cdk.models import (
+    AirbyteLogMessage,
+    AirbyteMessage,
+    AirbyteStateBlob,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    AirbyteStreamStatus,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    Level,
+    StreamDescriptor,
+    SyncMode,
+)
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import InMemoryMessageRepository
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
+from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
@@ -25,6 +43,10 @@ class _MockStream(Stream):
     def __init__(self, slice_to_records: Mapping[str, List[Mapping[str, Any]]]):
         self._slice_to_records = slice_to_records
 
+    @property
+    def name(self) -> str:
+        return _STREAM_NAME
+
     @property
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
         return None
@@ -163,6 +185,166 @@ def test_full_refresh_read_a_two_slices(constructor):
     assert len(expected_records) == len(actual_records)
 
 
+def test_incremental_read_two_slices_emits_state_once_each_slice_is_complete():
+    logger = _mock_logger()
+    slice_logger = DebugSliceLogger()
+    message_repository = InMemoryMessageRepository(Level.INFO)
+    records_partition_1 = [{"id": 1, "partition": 1, "cursor": 1}, {"id": 2, "partition": 1, "cursor": 2}]
+    records_partition_2 = [{"id": 3, "partition": 2, "cursor": 3}]
+    source = Mock()
+    source._slice_logger = slice_logger
+    source.message_repository = message_repository
+    mock_stream = _MockStream({1: records_partition_1, 2: records_partition_2})
+    state_manager = ConnectorStateManager({_STREAM_NAME: mock_stream}, [])
+    cursor = ConcurrentCursor(_STREAM_NAME, None, message_repository, "cursor")
+    stream = StreamFacade.create_from_stream(mock_stream, source, logger, 1, cursor)
+    stream.set_initial_state({"cursor": 0}, state_manager, True)
+
+    records = []
+    for record in stream.read_records(SyncMode.incremental, ["cursor"], None, {"cursor": 0}):
+        records.append(record)
+    states = [message.state.stream.stream_state.dict() for message in message_repository.consume_queue()]
+
+    assert records == [*records_partition_1, *records_partition_2]
+    assert states == [{"cursor": 2}, {"cursor": 3}]
+    assert stream.get_updated_state({}, records[-1]) == {"cursor": 3}
+
+
+class _MockSource(AbstractSource):
+    def __init__(self, message_repository):
+        self._message_repository = message_repository
+        self._streams = []
+
+    def check_connection(self, logger, config):
+        return True, None
+
+    def streams(self, config):
+        return self._streams
+
+    @property
+    def message_repository(self):
+        return self._message_repository
+
+
+def test_given_facade_with_concurrent_cursor_when_source_reads_incrementally_then_state_is_emitted_once_per_change():
+    message_repository = InMemoryMessageRepository(Level.INFO)
+    records_partition_1 = [{"id": 1, "partition": 1, "cursor": 1}, {"id": 2, "partition": 1, "cursor": 2}]
+    records_partition_2 = [{"id": 3, "partition": 2, "cursor": 3}]
+    source = _MockSource(message_repository)
+    stream = StreamFacade.create_from_stream(
+        _MockStream({1: records_partition_1, 2: records_partition_2}),
+        source,
+        logging.getLogger("test"),
+        1,
+        ConcurrentCursor(_STREAM_NAME, None, message_repository, "cursor"),
+    )
+    source._streams = [stream]
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=stream.as_airbyte_stream(), sync_mode=SyncMode.incremental, destination_sync_mode=DestinationSyncMode.overwrite
+            )
+        ]
+    )
+    incoming_state = [
+        AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(
+                stream_descriptor=StreamDescriptor(name=_STREAM_NAME), stream_state=AirbyteStateBlob.parse_obj({"cursor": 2})
+            ),
+        )
+    ]
+
+    messages = list(source.read(logging.getLogger("test"), {}, catalog, incoming_state))
+
+    # the first partition does not move the incoming state forward
+    assert [message.state.stream.stream_state.dict() for message in messages if message.type == MessageType.STATE] == [{"cursor": 3}]
+    assert [message.record.data for message in messages if message.type == MessageType.RECORD] == [
+        *records_partition_1,
+        *records_partition_2,
+    ]
+
+
+class _ConcurrentMockSource(_MockSource):
+    @property
+    def max_concurrent_streams(self) -> int:
+        return 2
+
+
+class _CursorWaitingAfterStateIsQueued(ConcurrentCursor):
+    def __init__(self, state_queued: threading.Event, resume: threading.Event, *args: Any):
+        super().__init__(*args)
+        self._state_queued = state_queued
+        self._resume = resume
+
+    def close_partition(self, partition) -> None:
+        super().close_partition(partition)
+        self._state_queued.set()
+        self._resume.wait(timeout=10)
+
+
+class _StreamReadOnceOtherStateIsQueued(Stream):
+    primary_key = None
+
+    def __init__(self, state_queued: threading.Event, queue_drained: threading.Event):
+        self._state_queued = state_queued
+        self._queue_drained = queue_drained
+
+    @property
+    def name(self) -> str:
+        return "other"
+
+    def read_records(self, *args: Any, **kwargs: Any) -> Iterable[StreamData]:
+        self._state_queued.wait(timeout=10)
+        # The source drains the message repository before emitting this record
+        yield {"id": "other"}
+        self._queue_drained.set()
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+def test_given_facade_state_queued_while_another_stream_is_read_concurrently_when_read_then_state_is_emitted_by_the_facade():
+    message_repository = InMemoryMessageRepository(Level.INFO)
+    state_queued, other_stream_drained_queue = threading.Event(), threading.Event()
+    records = [{"id": 1, "partition": 1, "cursor": 1}]
+    source = _ConcurrentMockSource(message_repository)
+    facade = StreamFacade.create_from_stream(
+        _MockStream({1: records}),
+        source,
+        logging.getLogger("test"),
+        1,
+        _CursorWaitingAfterStateIsQueued(state_queued, other_stream_drained_queue, _STREAM_NAME, None, message_repository, "cursor"),
+    )
+    other_stream = _StreamReadOnceOtherStateIsQueued(state_queued, other_stream_drained_queue)
+    source._streams = [facade, other_stream]
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=stream.as_airbyte_stream(), sync_mode=sync_mode, destination_sync_mode=DestinationSyncMode.overwrite
+            )
+            for stream, sync_mode in [(facade, SyncMode.incremental), (other_stream, SyncMode.full_refresh)]
+        ]
+    )
+
+    messages = list(source.read(logging.getLogger("test"), {}, catalog, []))
+
+    state_index = next(i for i, message in enumerate(messages) if message.type == MessageType.STATE)
+    other_record_index = next(
+        i for i, message in enumerate(messages) if message.type == MessageType.RECORD and message.record.stream == "other"
+    )
+    facade_complete_index = next(
+        i
+        for i, message in enumerate(messages)
+        if message.type == MessageType.TRACE
+        and message.trace.stream_status.stream_descriptor.name == _STREAM_NAME
+        and message.trace.stream_status.status == AirbyteStreamStatus.COMPLETE
+    )
+    # The state drained by the worker of the other stream is emitted by the worker of the facade, before the facade completes
+    assert other_record_index < state_index < facade_complete_index
+    assert messages[state_index].state.stream.stream_state.dict() == {"cursor": 1}
+
+
 def _read(stream, logger, slice_logger, message_repository):
     records = []
     for record in stream.read_full_refresh(_A_CURSOR_FIELD, logger, slice_logger):
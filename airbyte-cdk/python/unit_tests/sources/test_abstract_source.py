@@ -4,6 +4,7 @@
 
 import copy
 import datetime
+import json
 import logging
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
@@ -40,6 +41,7 @@ from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams import IncrementalMixin, Stream
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils.instrumentation import REPORT_MESSAGE_PREFIX, Instrumentation, get_instrumentation, set_instrumentation
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pytest import fixture
 
@@ -264,7 +266,7 @@ def test_read_stream_emits_repository_message_before_record(mocker, message_repo
     stream = MockStream(name="my_stream")
     mocker.patch.object(MockStream, "get_json_schema", return_value={})
     mocker.patch.object(MockStream, "read_records", side_effect=[[{"a record": "a value"}, {"another record": "another value"}]])
-    message_repository.consume_queue.side_effect = [[message for message in [MESSAGE_FROM_REPOSITORY]], []]
+    message_repository.consume_queue.side_effect = [[message for message in [MESSAGE_FROM_REPOSITORY]], [], []]
 
     source = MockSource(streams=[stream], message_repository=message_repository)
 
@@ -442,6 +444,76 @@ def test_valid_full_refresh_read_with_slices(mocker):
     assert expected == messages
 
 
+class MockConcurrentSource(MockSource):
+    def __init__(self, max_concurrent_streams: int, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._max_concurrent_streams = max_concurrent_streams
+
+    @property
+    def max_concurrent_streams(self) -> int:
+        return self._max_concurrent_streams
+
+
+def _messages_by_stream(messages: List[AirbyteMessage]) -> Dict[str, List[AirbyteMessage]]:
+    messages_by_stream = defaultdict(list)
+    for message in messages:
+        if message.type == Type.RECORD:
+            messages_by_stream[message.record.stream].append(message)
+        elif message.type == Type.TRACE:
+            messages_by_stream[message.trace.stream_status.stream_descriptor.name].append(message)
+    return messages_by_stream
+
+
+def test_concurrent_full_refresh_read_keeps_the_order_of_each_stream(mocker):
+    """Tests that reading streams concurrently emits the same messages as a sequential read for each stream"""
+    slices = [{"1": "1"}, {"2": "2"}, {"3": "3"}]
+    streams = [MockStream([({"sync_mode": SyncMode.full_refresh, "stream_slice": s}, [s]) for s in slices], name=f"s{i}") for i in range(4)]
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+
+    expected = _messages_by_stream(_fix_emitted_at(list(MockSource(streams=streams).read(logger, {}, catalog))))
+    messages = _messages_by_stream(_fix_emitted_at(list(MockConcurrentSource(2, streams=streams).read(logger, {}, catalog))))
+
+    assert expected == messages
+    assert len(messages) == 4
+
+
+def test_concurrent_incremental_read_emits_the_state_of_each_stream(mocker):
+    state = {"cursor": "value"}
+    streams = [
+        MockStreamWithState([({"sync_mode": SyncMode.incremental, "stream_state": {}}, [{"a": 1}, {"a": 2}])], name=name, state=state)
+        for name in ["s1", "s2"]
+    ]
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    messages = list(MockConcurrentSource(2, streams=streams).read(logger, {}, catalog))
+
+    state_messages = [message for message in messages if message.type == Type.STATE]
+    assert {message.state.stream.stream_descriptor.name for message in state_messages} == {"s1", "s2"}
+    assert all(message.state.stream.stream_state == AirbyteStateBlob.parse_obj(state) for message in state_messages)
+
+
+def test_concurrent_read_stops_other_streams_on_error(mocker):
+    failing_stream = MockStream(name="failing")
+    stream = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k": "v"}])], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(failing_stream, "read_records", side_effect=RuntimeError("oh no!"))
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(failing_stream, SyncMode.full_refresh), _configured_stream(stream, SyncMode.full_refresh)]
+    )
+
+    messages = []
+    with pytest.raises(RuntimeError, match="oh no!"):
+        for message in MockConcurrentSource(2, streams=[failing_stream, stream]).read(logger, {}, catalog):
+            messages.append(message)
+
+    messages = _fix_emitted_at(messages)
+    assert _fix_emitted_at([_as_stream_status("failing", AirbyteStreamStatus.INCOMPLETE)])[0] in messages
+    assert _fix_emitted_at([_as_stream_status("failing", AirbyteStreamStatus.COMPLETE)])[0] not in messages
+
+
 @pytest.mark.parametrize(
     "slices",
     [[{"1": "1"}, {"2": "2"}], [{"date": datetime.date(year=2023, month=1, day=1)}, {"date": datetime.date(year=2023, month=1, day=1)}]],
@@ -646,7 +718,6 @@ class TestIncrementalRead:
                 _as_state({"s1": state}, "s1", state) if per_stream_enabled else _as_state({"s1": state}),
                 _as_record("s1", stream_output[1]),
                 _as_state({"s1": state}, "s1", state) if per_stream_enabled else _as_state({"s1": state}),
-                _as_state({"s1": state}, "s1", state) if per_stream_enabled else _as_state({"s1": state}),
                 _as_stream_status("s1", AirbyteStreamStatus.COMPLETE),
                 _as_stream_status("s2", AirbyteStreamStatus.STARTED),
                 _as_stream_status("s2", AirbyteStreamStatus.RUNNING),
@@ -654,7 +725,6 @@ class TestIncrementalRead:
                 _as_state({"s1": state, "s2": state}, "s2", state) if per_stream_enabled else _as_state({"s1": state, "s2": state}),
                 _as_record("s2", stream_output[1]),
                 _as_state({"s1": state, "s2": state}, "s2", state) if per_stream_enabled else _as_state({"s1": state, "s2": state}),
-                _as_state({"s1": state, "s2": state}, "s2", state) if per_stream_enabled else _as_state({"s1": state, "s2": state}),
                 _as_stream_status("s2", AirbyteStreamStatus.COMPLETE),
             ]
         )
@@ -1147,11 +1217,36 @@ def test_checkpoint_state_from_stream_instance():
 
     # The stream_state passed to checkpoint_state() should be ignored since stream implements state function
     teams_stream.state = {"updated_at": "2022-09-11"}
-    actual_message = src._checkpoint_state(teams_stream, {"ignored": "state"}, state_manager)
-    assert actual_message == _as_state({"teams": {"updated_at": "2022-09-11"}}, "teams", {"updated_at": "2022-09-11"})
+    actual_messages = list(src._checkpoint_state(teams_stream, {"ignored": "state"}, state_manager))
+    assert actual_messages == [_as_state({"teams": {"updated_at": "2022-09-11"}}, "teams", {"updated_at": "2022-09-11"})]
 
     # The stream_state passed to checkpoint_state() should be used since the stream does not implement state function
-    actual_message = src._checkpoint_state(managers_stream, {"updated": "expected_here"}, state_manager)
-    assert actual_message == _as_state(
-        {"teams": {"updated_at": "2022-09-11"}, "managers": {"updated": "expected_here"}}, "managers", {"updated": "expected_here"}
-    )
+    actual_messages = list(src._checkpoint_state(managers_stream, {"updated": "expected_here"}, state_manager))
+    assert actual_messages == [
+        _as_state(
+            {"teams": {"updated_at": "2022-09-11"}, "managers": {"updated": "expected_here"}}, "managers", {"updated": "expected_here"}
+        )
+    ]
+
+    # The state is not emitted again if it did not change and no record was emitted since it was
+    assert list(src._checkpoint_state(managers_stream, {"updated": "expected_here"}, state_manager)) == []
+
+
+def test_given_instrumentation_enabled_when_read_then_emit_report_after_messages(mocker):
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    instrumentation = Instrumentation(sample_every=1)
+    previous_instrumentation = get_instrumentation()
+    set_instrumentation(instrumentation)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+
+    try:
+        messages = list(MockSource(streams=[s1]).read(logger, {}, catalog))
+    finally:
+        set_instrumentation(previous_instrumentation)
+
+    assert [message.record.data for message in messages if message.type == Type.RECORD] == stream_output
+    assert messages[-1].type == Type.LOG
+    assert messages[-1].log.message == f"{REPORT_MESSAGE_PREFIX}{json.dumps(instrumentation.snapshot())}"
+    assert instrumentation.snapshot()["s1"]["normalization"]["calls"] == len(stream_output)
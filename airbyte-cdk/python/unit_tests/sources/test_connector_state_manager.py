@@ -2,13 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from contextlib import nullcontext as does_not_raise
 from typing import Any, Iterable, List, Mapping
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.models import AirbyteMessage, AirbyteStateBlob, AirbyteStateMessage, AirbyteStateType, AirbyteStreamState, StreamDescriptor
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager, HashableStreamDescriptor
+from airbyte_cdk.sources.connector_state_manager import RECORD_SIZE_SAMPLE_EVERY, ConnectorStateManager, HashableStreamDescriptor
 from airbyte_cdk.sources.streams import Stream
 
 
@@ -590,3 +592,121 @@ def test_do_not_set_stream_descriptor_namespace_when_none():
     actual_state_message = state_manager.create_state_message(stream_name="episodes", namespace=None, send_per_stream_state=True)
 
     assert actual_state_message.state.stream.stream_descriptor.dict(exclude_unset=True) == expected_stream_state_descriptor
+
+
+def test_given_checkpoint_interval_when_observe_record_then_checkpoint_every_interval_records():
+    state_manager = ConnectorStateManager({}, [])
+
+    should_checkpoint = []
+    for _ in range(4):
+        should_checkpoint.append(state_manager.observe_record("episodes", None, {"id": 1}, checkpoint_interval=2))
+        if should_checkpoint[-1]:
+            state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+
+    assert should_checkpoint == [False, True, False, True]
+
+
+def test_given_no_checkpoint_interval_when_observe_record_then_do_not_checkpoint_whatever_the_time_and_size():
+    state_manager = ConnectorStateManager({}, [], checkpoint_interval_seconds=0.001, checkpoint_interval_bytes=1)
+
+    with patch("airbyte_cdk.sources.connector_state_manager.time.monotonic", return_value=10**6):
+        assert not state_manager.observe_record("episodes", None, {"id": 1}, checkpoint_interval=None)
+
+
+def test_given_checkpoint_interval_seconds_when_observe_record_then_checkpoint_once_interval_elapsed():
+    with patch("airbyte_cdk.sources.connector_state_manager.time.monotonic", return_value=100):
+        state_manager = ConnectorStateManager({}, [], checkpoint_interval_seconds=60)
+        assert not state_manager.observe_record("episodes", None, {"id": 1}, checkpoint_interval=1000)
+
+    with patch("airbyte_cdk.sources.connector_state_manager.time.monotonic", return_value=160):
+        assert state_manager.observe_record("episodes", None, {"id": 1}, checkpoint_interval=1000)
+        state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+        assert not state_manager.observe_record("episodes", None, {"id": 1}, checkpoint_interval=1000)
+
+
+def test_given_checkpoint_interval_bytes_when_observe_record_then_checkpoint_once_estimated_size_reached():
+    record = {"id": "a" * 90}
+    record_size = len(json.dumps(record))
+    state_manager = ConnectorStateManager({}, [], checkpoint_interval_bytes=record_size * 3)
+
+    should_checkpoint = [state_manager.observe_record("episodes", None, record, checkpoint_interval=1000) for _ in range(3)]
+
+    assert should_checkpoint == [False, False, True]
+
+
+def test_given_records_larger_than_sampled_record_when_observe_record_then_estimate_size_from_sampled_record():
+    state_manager = ConnectorStateManager({}, [], checkpoint_interval_bytes=RECORD_SIZE_SAMPLE_EVERY * 20)
+
+    assert not state_manager.observe_record("episodes", None, {}, checkpoint_interval=10**6)
+    # The size of the records is only measured again after RECORD_SIZE_SAMPLE_EVERY records
+    for _ in range(RECORD_SIZE_SAMPLE_EVERY - 1):
+        assert not state_manager.observe_record("episodes", None, {"id": "a" * 100}, checkpoint_interval=10**6)
+
+
+def test_given_state_emitted_when_create_state_message_if_changed_then_only_emit_changed_state_or_state_following_records():
+    state_manager = ConnectorStateManager({}, [])
+    state_manager.update_state_for_stream("episodes", None, {"created_at": "2022_05_22"})
+
+    assert state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+    assert state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True) is None
+
+    state_manager.observe_record("episodes", None, {"id": 1}, checkpoint_interval=None)
+    assert state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+
+    state_manager.update_state_for_stream("episodes", None, {"created_at": "2022_05_23"})
+    message = state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+    assert message.state.stream.stream_state == AirbyteStateBlob.parse_obj({"created_at": "2022_05_23"})
+
+
+def test_given_nested_state_mutated_in_place_when_create_state_message_if_changed_then_emit_state():
+    state = {"partitions": {"a": "2022_05_22"}}
+    state_manager = ConnectorStateManager({}, [])
+    state_manager.update_state_for_stream("episodes", None, state)
+    state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+
+    state["partitions"]["a"] = "2022_05_23"
+    state_manager.update_state_for_stream("episodes", None, state)
+
+    assert state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+
+
+def test_given_state_mutated_after_update_when_create_state_message_then_emit_state_as_updated():
+    state = {"partitions": {"a": "2022_05_22"}}
+    state_manager = ConnectorStateManager({}, [])
+    state_manager.update_state_for_stream("episodes", None, state)
+
+    state["partitions"]["a"] = "2022_05_23"
+    message = state_manager.create_state_message("episodes", None, send_per_stream_state=True)
+
+    assert message.state.stream.stream_state == AirbyteStateBlob.parse_obj({"partitions": {"a": "2022_05_22"}})
+    assert message.state.data == {"episodes": {"partitions": {"a": "2022_05_22"}}}
+    assert state_manager.get_stream_state("episodes", None) == {"partitions": {"a": "2022_05_22"}}
+
+
+def test_given_legacy_state_when_get_legacy_state_then_return_read_only_view():
+    state_manager = ConnectorStateManager({}, [])
+    state_manager.update_state_for_stream("episodes", None, {"created_at": "2022_05_22"})
+
+    with pytest.raises(TypeError):
+        state_manager._get_legacy_state()["episodes"] = {}  # type: ignore[index]
+
+
+def test_given_state_not_serializable_when_create_state_message_if_changed_then_always_emit_state():
+    state_manager = ConnectorStateManager({}, [])
+    state_manager.update_state_for_stream("episodes", None, {"cursor": object()})
+
+    assert state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+    assert state_manager.create_state_message_if_changed("episodes", None, send_per_stream_state=True)
+
+
+def test_given_streams_with_same_name_in_different_namespaces_when_create_state_message_if_changed_then_compare_state_of_each_stream():
+    state_manager = ConnectorStateManager({}, [])
+    state_manager.update_state_for_stream("episodes", "public", {"created_at": "2022_05_22"})
+    assert state_manager.create_state_message_if_changed("episodes", "public", send_per_stream_state=True)
+
+    state_manager.update_state_for_stream("episodes", "archive", {"created_at": "2021_01_01"})
+
+    assert state_manager.create_state_message_if_changed("episodes", "public", send_per_stream_state=True) is None
+    message = state_manager.create_state_message_if_changed("episodes", "archive", send_per_stream_state=True)
+    assert message.state.stream.stream_descriptor == StreamDescriptor(name="episodes", namespace="archive")
+    assert message.state.stream.stream_state == AirbyteStateBlob.parse_obj({"created_at": "2021_01_01"})
@@ -42,7 +42,7 @@ def test_data_or_record_to_airbyte_record(test_name, data, expected_message):
     message.record.emitted_at = NOW
 
     if isinstance(data, dict):
-        transformer.transform.assert_called_with(data, schema)
+        transformer.transform.assert_called_with(data, schema, STREAM_NAME)
     else:
         assert not transformer.transform.called
     assert expected_message == message
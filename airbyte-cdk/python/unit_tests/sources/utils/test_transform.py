@@ -5,7 +5,7 @@
 import json
 
 import pytest
-from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.sources.utils.transform import _TYPE_CHECKERS, TransformConfig, TypeTransformer
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -264,3 +264,99 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+def test_given_same_schema_when_transform_then_compile_schema_once(mocker):
+    compiled_schema_class = mocker.patch("airbyte_cdk.sources.utils.transform._CompiledSchema")
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    t.transform({"value": 1}, SIMPLE_SCHEMA)
+    t.transform({"value": 2}, SIMPLE_SCHEMA)
+    t.transform({"value": 3}, json.loads(json.dumps(SIMPLE_SCHEMA)))
+
+    assert compiled_schema_class.call_count == 1
+    assert compiled_schema_class.return_value.transform.call_count == 3
+
+
+def test_given_new_equal_schema_for_every_record_of_a_stream_when_transform_then_compile_schema_once(mocker):
+    compiled_schema_class = mocker.patch("airbyte_cdk.sources.utils.transform._CompiledSchema")
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    for value in range(3):
+        t.transform({"value": value}, json.loads(json.dumps(SIMPLE_SCHEMA)), "stream")
+
+    assert compiled_schema_class.call_count == 1
+
+
+def test_given_schema_of_stream_changes_when_transform_then_compile_new_schema(mocker):
+    compiled_schema_class = mocker.patch("airbyte_cdk.sources.utils.transform._CompiledSchema")
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    other_schema = {"type": "object", "properties": {"value": {"type": "integer"}}}
+
+    t.transform({"value": 1}, SIMPLE_SCHEMA, "stream")
+    t.transform({"value": 1}, other_schema, "stream")
+    t.transform({"value": 1}, other_schema, "stream")
+
+    assert compiled_schema_class.call_count == 2
+
+
+def test_given_streams_sharing_a_transformer_when_transform_then_compile_schema_of_each_stream_once(mocker):
+    compiled_schema_class = mocker.patch("airbyte_cdk.sources.utils.transform._CompiledSchema")
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    other_schema = {"type": "object", "properties": {"value": {"type": "integer"}}}
+
+    for _ in range(2):
+        t.transform({"value": 1}, SIMPLE_SCHEMA, "stream")
+        t.transform({"value": 1}, other_schema, "other_stream")
+
+    assert compiled_schema_class.call_count == 2
+
+
+def test_given_custom_transform_registered_after_transform_when_transform_then_apply_custom_transform():
+    t = TypeTransformer(TransformConfig.CustomSchemaNormalization)
+    t.transform({"value": 1}, SIMPLE_SCHEMA)
+
+    t.registerCustomTransform(lambda instance, schema: "transformed")
+    record = {"value": 1}
+    t.transform(record, SIMPLE_SCHEMA)
+
+    assert record == {"value": "transformed"}
+
+
+def test_given_recursive_schema_when_transform_then_transform_every_level():
+    schema = {
+        "definitions": {"node": {"type": "object", "properties": {"value": {"type": "string"}, "child": {"$ref": "#/definitions/node"}}}},
+        "$ref": "#/definitions/node",
+    }
+    record = {"value": 1, "child": {"value": 2, "child": {"value": 3}}}
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, schema)
+
+    assert record == {"value": "1", "child": {"value": "2", "child": {"value": "3"}}}
+
+
+def test_given_schema_that_cannot_be_compiled_when_transform_then_transform_with_jsonschema_validator(caplog):
+    schema = {
+        "type": "object",
+        "properties": {"value": {"$id": "http://example.com/value", "type": "string"}, "other": {"type": "integer"}},
+    }
+    record = {"value": 1, "other": []}
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, schema)
+
+    assert record == {"value": "1", "other": []}
+    assert [r.message for r in caplog.records if r.levelname == "WARNING"] == [
+        "Failed to transform value [] of type 'array' to 'integer', key path: '.other'"
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, True, False, 0, 1, 1.0, 1.5, "1", [], {}, ["a"]],
+)
+@pytest.mark.parametrize("type_name", ["string", "number", "integer", "boolean", "null", "object", "array"])
+def test_compiled_type_checks_match_jsonschema_validator(value, type_name):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    type_checker = t._normalizer.TYPE_CHECKER
+
+    assert _TYPE_CHECKERS[type_name](value) == type_checker.is_type(value, type_name)
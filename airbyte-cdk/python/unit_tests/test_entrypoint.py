@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
 import os
 from argparse import Namespace
 from copy import deepcopy
+from decimal import Decimal
 from typing import Any, List, Mapping, MutableMapping, Union
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -296,3 +298,96 @@ def test_filter_internal_requests(deployment_mode, url, expected_error):
         else:
             actual_response = session.send(request=prepared_request)
             assert isinstance(actual_response, requests.Response)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", namespace=None, data={"id": 1}, emitted_at=1)),
+            id="test_record_with_namespace_explicitly_set",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1, extra_field="extra"),
+            ),
+            id="test_record_with_extra_field",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(
+                    stream="stream",
+                    data={
+                        "unicode": "é 😀",
+                        "nested": {"list": [1, 2.5, None, True], "tuple": (1, 2)},
+                        "datetime": datetime.datetime(2023, 1, 1, 12, 30, tzinfo=datetime.timezone.utc),
+                        "date": datetime.date(2023, 1, 1),
+                        "decimal": Decimal("1.10"),
+                        "model": AirbyteStream(name="a stream", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                        "enum": SyncMode.incremental,
+                        "float": float("nan"),
+                        1: "integer key",
+                    },
+                    emitted_at=1,
+                ),
+            ),
+            id="test_record_with_values_not_natively_json_serializable",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage.construct(stream="stream", data={"id": 1}, emitted_at=1)),
+            id="test_constructed_record",
+        ),
+        pytest.param(
+            AirbyteMessage.construct(
+                type=Type.RECORD, record=AirbyteRecordMessage.construct(stream="stream", data={"id": 1}, emitted_at=1)
+            ),
+            id="test_constructed_message",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1), state=None),
+            id="test_record_message_with_other_fields_set",
+        ),
+        pytest.param(MESSAGE_FROM_REPOSITORY, id="test_non_record_message"),
+    ],
+)
+def test_airbyte_message_to_string_is_identical_to_pydantic_serialization(message: AirbyteMessage):
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+def test_launch_writes_every_message_in_order(mocker, capsys):
+    record_message = AirbyteEntrypoint.airbyte_message_to_string(
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1))
+    )
+    state_message = '{"type": "STATE", "state": {"data": {}}}'
+    messages = [record_message] * 3 + [state_message] + [record_message] * 2
+    mocker.patch.object(entrypoint_module, "OUTPUT_BUFFER_SIZE", 2 * len(record_message))
+    mocker.patch.object(AirbyteEntrypoint, "parse_args")
+    mocker.patch.object(AirbyteEntrypoint, "run", return_value=iter(messages))
+
+    entrypoint_module.launch(MockSource(), ["read"])
+
+    assert capsys.readouterr().out == "".join(f"{message}\n" for message in messages)
+
+
+def test_given_error_when_launch_then_write_buffered_messages_before_raising(mocker, capsys):
+    record_message = AirbyteEntrypoint.airbyte_message_to_string(
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1))
+    )
+
+    def _messages():
+        yield record_message
+        raise ValueError("error")
+
+    mocker.patch.object(AirbyteEntrypoint, "parse_args")
+    mocker.patch.object(AirbyteEntrypoint, "run", return_value=_messages())
+
+    with pytest.raises(ValueError):
+        entrypoint_module.launch(MockSource(), ["read"])
+
+    assert capsys.readouterr().out == f"{record_message}\n"
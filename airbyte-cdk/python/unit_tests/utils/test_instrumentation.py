@@ -0,0 +1,141 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.models import Level, Type
+from airbyte_cdk.utils.instrumentation import (
+    REPORT_MESSAGE_PREFIX,
+    Instrumentation,
+    Stage,
+    get_instrumentation,
+    set_instrumentation,
+)
+
+
+@pytest.fixture
+def instrumentation():
+    previous_instrumentation = get_instrumentation()
+    instrumentation = Instrumentation(sample_every=2)
+    set_instrumentation(instrumentation)
+    yield instrumentation
+    set_instrumentation(previous_instrumentation)
+
+
+def test_given_sample_every_when_measure_then_count_every_run_and_time_sampled_runs(instrumentation):
+    for _ in range(5):
+        with instrumentation.measure(Stage.NORMALIZATION, "users"):
+            pass
+
+    stats = instrumentation.snapshot()["users"]["normalization"]
+    assert stats["calls"] == 5
+    assert stats["sampled"] == 3
+    assert stats["estimated_total_seconds"] == pytest.approx(stats["mean_seconds"] * 5)
+
+
+def test_given_disabled_when_measure_then_do_not_record_anything():
+    instrumentation = Instrumentation(enabled=False)
+    records = iter([{"id": 1}])
+
+    with instrumentation.measure(Stage.HTTP_REQUEST, "users"):
+        pass
+    instrumentation.observe(Stage.BACKOFF, "users", 1.0)
+
+    assert instrumentation.measure_iterable(Stage.PARSE_RESPONSE, "users", records) is records
+    assert instrumentation.snapshot() == {}
+    assert not instrumentation.is_report_due()
+
+
+def test_when_measure_iterable_then_count_every_item_produced(instrumentation):
+    instrumentation.sample_every = 1
+
+    assert list(instrumentation.measure_iterable(Stage.PARSE_RESPONSE, "users", iter([{"id": 1}, {"id": 2}]))) == [{"id": 1}, {"id": 2}]
+
+    # The last run is the one finding out the iterable is exhausted
+    assert instrumentation.snapshot()["users"]["parse_response"]["calls"] == 3
+
+
+def test_when_observe_then_record_duration(instrumentation):
+    instrumentation.observe(Stage.BACKOFF, "users", 2.0)
+    instrumentation.observe(Stage.BACKOFF, "users", 4.0)
+
+    assert instrumentation.snapshot()["users"]["backoff"] == {
+        "calls": 2,
+        "sampled": 2,
+        "mean_seconds": 3.0,
+        "max_seconds": 4.0,
+        "estimated_total_seconds": 6.0,
+    }
+
+
+def test_when_report_then_return_log_message_with_snapshot(instrumentation):
+    instrumentation.observe(Stage.CHECKPOINT, "users", 0.5)
+
+    message = instrumentation.report()
+
+    assert message.type == Type.LOG
+    assert message.log.level == Level.INFO
+    assert message.log.message.startswith(REPORT_MESSAGE_PREFIX)
+    assert json.loads(message.log.message[len(REPORT_MESSAGE_PREFIX) :]) == instrumentation.snapshot()
+
+
+def test_given_report_interval_when_is_report_due_then_return_true_once_interval_elapsed():
+    with patch("airbyte_cdk.utils.instrumentation.time.monotonic", return_value=100.0):
+        instrumentation = Instrumentation(report_interval_seconds=10)
+
+    with patch("airbyte_cdk.utils.instrumentation.time.monotonic", return_value=105.0):
+        assert not instrumentation.is_report_due()
+    with patch("airbyte_cdk.utils.instrumentation.time.monotonic", return_value=110.0):
+        assert instrumentation.is_report_due()
+
+
+def test_given_prometheus_path_when_report_then_write_prometheus_file(tmp_path):
+    path = tmp_path / "metrics.prom"
+    instrumentation = Instrumentation(prometheus_path=str(path))
+    instrumentation.observe(Stage.BACKOFF, 'stream "quoted"', 2.0)
+
+    instrumentation.report()
+
+    lines = path.read_text().splitlines()
+    labels = 'stream="stream \\"quoted\\"",stage="backoff"'
+    assert f"airbyte_cdk_stage_calls_total{{{labels}}} 1" in lines
+    assert f'airbyte_cdk_stage_duration_seconds_bucket{{{labels},le="1.0"}} 0' in lines
+    assert f'airbyte_cdk_stage_duration_seconds_bucket{{{labels},le="10.0"}} 1' in lines
+    assert f'airbyte_cdk_stage_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f"airbyte_cdk_stage_duration_seconds_sum{{{labels}}} 2.0" in lines
+    assert f"airbyte_cdk_stage_duration_seconds_count{{{labels}}} 1" in lines
+    assert not (tmp_path / "metrics.prom.tmp").exists()
+
+
+@pytest.mark.parametrize(
+    "environment, expected_enabled, expected_sample_every, expected_prometheus_path",
+    [
+        pytest.param({}, False, 16, None, id="test_disabled_by_default"),
+        pytest.param({"AIRBYTE_CDK_INSTRUMENTATION": "true"}, True, 16, None, id="test_enabled"),
+        pytest.param(
+            {
+                "AIRBYTE_CDK_INSTRUMENTATION": "1",
+                "AIRBYTE_CDK_INSTRUMENTATION_SAMPLE_EVERY": "4",
+                "AIRBYTE_CDK_INSTRUMENTATION_PROMETHEUS_PATH": "/tmp/metrics.prom",
+            },
+            True,
+            4,
+            "/tmp/metrics.prom",
+            id="test_configured",
+        ),
+    ],
+)
+def test_from_environment(environment, expected_enabled, expected_sample_every, expected_prometheus_path):
+    instrumentation = Instrumentation.from_environment(environment)
+
+    assert instrumentation.enabled == expected_enabled
+    assert instrumentation.sample_every == expected_sample_every
+    assert instrumentation.prometheus_path == expected_prometheus_path
+
+
+def test_given_sample_every_lower_than_one_when_create_then_raise_error():
+    with pytest.raises(ValueError):
+        Instrumentation(sample_every=0)
@@ -121,3 +121,37 @@ def test_secret_filtering():
     update_secrets([SECRET_STRING_VALUE, SECRET_STRING_2_VALUE])
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE} **** ****"
+
+
+@pytest.mark.parametrize(
+    "secrets",
+    [
+        pytest.param(["x", "xk"], id="test_shorter_secret_first"),
+        pytest.param(["xk", "x"], id="test_longer_secret_first"),
+    ],
+)
+def test_given_secret_containing_another_secret_when_filter_secrets_then_mask_longest_secret(secrets):
+    update_secrets(secrets)
+
+    assert filter_secrets("xk x xy") == "**** **** ****y"
+
+
+def test_given_non_string_secret_when_filter_secrets_then_mask_its_string_representation():
+    update_secrets([SECRET_INT_VALUE])
+
+    assert filter_secrets(f"value={SECRET_INT_VALUE}") == "value=****"
+
+
+def test_given_secret_with_regex_characters_when_filter_secrets_then_mask_secret_literally():
+    update_secrets(["a.b*c"])
+
+    assert filter_secrets("a.b*c axbbc") == "**** axbbc"
+
+
+def test_given_secrets_updated_when_filter_secrets_then_only_mask_new_secrets():
+    update_secrets([SECRET_STRING_VALUE])
+    assert filter_secrets(f"{SECRET_STRING_VALUE} {SECRET_STRING_2_VALUE}") == f"**** {SECRET_STRING_2_VALUE}"
+
+    update_secrets([SECRET_STRING_2_VALUE])
+    assert filter_secrets(f"{SECRET_STRING_VALUE} {SECRET_STRING_2_VALUE}") == f"{SECRET_STRING_VALUE} ****"
+    update_secrets([])